@@ -0,0 +1,90 @@
+"""Add full-text search vectors and trigram name indexes
+
+Adds generated tsvector columns (with GIN indexes) to the searchable entity
+tables and to embedding_index (used for custom asset text search), and
+trigram GIN indexes on entity names for fuzzy matching. These replace the
+unindexable ILIKE '%q%' scans in EmbeddingsService.text_search.
+
+Adding a STORED generated column rewrites the table, so expect this
+migration to take a while on large tenants.
+
+Revision ID: 20261016_000000
+Revises: 20260126_001000
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_000000"
+down_revision: str | None = "20260126_001000"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Generated column expressions - must match the Computed() definitions on the ORM models
+SEARCH_VECTORS: dict[str, str] = {
+    "passwords": (
+        "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('simple', coalesce(username, '') || ' ' || coalesce(url, '')), 'B') || "
+        "setweight(to_tsvector('simple', coalesce(notes, '')), 'C')"
+    ),
+    "documents": (
+        "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('simple', coalesce(path, '')), 'B') || "
+        "setweight(to_tsvector('simple', left(coalesce(content, ''), 500000)), 'C')"
+    ),
+    "configurations": (
+        "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('simple', coalesce(serial_number, '') || ' ' || "
+        "coalesce(asset_tag, '') || ' ' || coalesce(manufacturer, '') || ' ' || "
+        "coalesce(model, '') || ' ' || coalesce(ip_address, '') || ' ' || "
+        "coalesce(mac_address, '')), 'B') || "
+        "setweight(to_tsvector('simple', coalesce(notes, '')), 'C')"
+    ),
+    "locations": (
+        "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('simple', coalesce(notes, '')), 'C')"
+    ),
+    "embedding_index": "to_tsvector('simple', left(searchable_text, 500000))",
+}
+
+# Tables whose name column gets a trigram index for fuzzy matching
+TRIGRAM_NAME_TABLES = ["passwords", "documents", "configurations", "locations"]
+
+
+def upgrade() -> None:
+    """Add search_vector columns, GIN indexes, and trigram name indexes."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for table, expression in SEARCH_VECTORS.items():
+        op.execute(f"""
+            ALTER TABLE {table}
+            ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS ({expression}) STORED
+        """)
+        op.execute(f"""
+            CREATE INDEX ix_{table}_search_vector
+            ON {table}
+            USING gin (search_vector)
+        """)
+
+    for table in TRIGRAM_NAME_TABLES:
+        op.execute(f"""
+            CREATE INDEX ix_{table}_name_trgm
+            ON {table}
+            USING gin (name gin_trgm_ops)
+        """)
+
+
+def downgrade() -> None:
+    """Drop trigram and full-text indexes and search_vector columns."""
+    for table in TRIGRAM_NAME_TABLES:
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_name_trgm")
+
+    for table in SEARCH_VECTORS:
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_search_vector")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector")
+
+    # Note: We don't drop the pg_trgm extension as other objects might use it
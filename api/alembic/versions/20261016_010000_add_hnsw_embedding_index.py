@@ -0,0 +1,50 @@
+"""Replace the ivfflat embedding index with HNSW
+
+ivfflat probes a fixed number of lists and applies the organization filter
+afterwards, so single-organization searches often return fewer rows than
+requested. HNSW supports iterative scans (pgvector 0.8+), which keep walking
+the graph until enough rows pass the filter, and gives better recall without
+periodic rebuilds as data grows.
+
+Both indexes are built and dropped CONCURRENTLY so searches and indexing keep
+working while the HNSW graph is built; on large tables the build can take a
+long time and benefits from a larger maintenance_work_mem.
+
+Revision ID: 20261016_010000
+Revises: 20261016_000000
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_010000"
+down_revision: str | None = "20261016_000000"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Build the HNSW index, then drop the ivfflat index it replaces."""
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_embedding_index_embedding_hnsw
+            ON embedding_index
+            USING hnsw (embedding vector_cosine_ops)
+            WITH (m = 16, ef_construction = 64)
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_embedding_index_embedding")
+
+
+def downgrade() -> None:
+    """Restore the ivfflat index and drop the HNSW index."""
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_embedding_index_embedding
+            ON embedding_index
+            USING ivfflat (embedding vector_cosine_ops)
+            WITH (lists = 100)
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_embedding_index_embedding_hnsw")
@@ -0,0 +1,44 @@
+"""Add composite indexes for keyset pagination of entity lists
+
+List endpoints page by (sort column, id) within an organization. These
+indexes let the default sort (name) and the custom asset default (id) read
+each page straight from the index instead of sorting the organization's rows.
+
+Built CONCURRENTLY so writes aren't blocked on large tables.
+
+Revision ID: 20261016_020000
+Revises: 20261016_010000
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_020000"
+down_revision: str | None = "20261016_010000"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEXES = [
+    ("ix_passwords_organization_name", "passwords", "organization_id, name, id"),
+    ("ix_locations_organization_name", "locations", "organization_id, name, id"),
+    ("ix_documents_organization_name", "documents", "organization_id, name, id"),
+    ("ix_configurations_organization_name", "configurations", "organization_id, name, id"),
+    ("ix_custom_assets_type_organization", "custom_assets", "custom_asset_type_id, organization_id, id"),
+]
+
+
+def upgrade() -> None:
+    """Create the pagination indexes."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})")
+
+
+def downgrade() -> None:
+    """Drop the pagination indexes."""
+    with op.get_context().autocommit_block():
+        for name, _, _ in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,40 @@
+"""Add content hash to attachments for deduplicated storage
+
+Attachments uploaded with a SHA-256 share one S3 object per organization and
+content, so s3_key is no longer unique. The S3 object is deleted when the
+last attachment referencing it is deleted.
+
+Revision ID: 20261016_030000
+Revises: 20261016_020000
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_030000"
+down_revision: str | None = "20261016_020000"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add content_hash and allow attachments to share an S3 key."""
+    op.add_column("attachments", sa.Column("content_hash", sa.String(length=64), nullable=True))
+    op.drop_constraint("attachments_s3_key_key", "attachments", type_="unique")
+    op.create_index(
+        "ix_attachments_content_hash",
+        "attachments",
+        ["organization_id", "content_hash"],
+    )
+
+
+def downgrade() -> None:
+    """Remove content_hash (fails if attachments still share an S3 key)."""
+    op.drop_index("ix_attachments_content_hash", table_name="attachments")
+    op.create_unique_constraint("attachments_s3_key_key", "attachments", ["s3_key"])
+    op.drop_column("attachments", "content_hash")
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark for index job enqueue latency.
+
+Two modes:
+
+    enqueue  Compares enqueueing index jobs with a fresh arq pool per call
+             (the previous behaviour) against the shared application pool.
+             Needs only Redis.
+
+    http     Measures end-to-end latency of POST /api/organizations/{org_id}/passwords
+             against a running API. Run it once against a build without the
+             shared pool and once against a build with it to compare p99.
+
+Usage:
+    python -m scripts.bench_enqueue enqueue --requests 500
+    python -m scripts.bench_enqueue http --api-url http://localhost:8000 \\
+        --org-id <uuid> --token <api key or JWT> --requests 500 --concurrency 10
+
+Jobs enqueued in "enqueue" mode target a random entity ID; the worker will
+find nothing to index and drop them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    """Return the pct-th percentile (nearest rank) of samples in milliseconds."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index] * 1000
+
+
+def _report(label: str, samples: list[float]) -> None:
+    print(
+        f"{label:<22} n={len(samples):<5} "
+        f"mean={statistics.mean(samples) * 1000:7.2f}ms "
+        f"p50={_percentile(samples, 50):7.2f}ms "
+        f"p95={_percentile(samples, 95):7.2f}ms "
+        f"p99={_percentile(samples, 99):7.2f}ms"
+    )
+
+
+async def _measure(
+    call: Callable[[], Awaitable[None]],
+    requests: int,
+    concurrency: int,
+) -> list[float]:
+    """Run call `requests` times with bounded concurrency, returning per-call latencies."""
+    semaphore = asyncio.Semaphore(concurrency)
+    samples: list[float] = []
+
+    async def one() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await call()
+            samples.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return samples
+
+
+async def bench_enqueue(requests: int, concurrency: int) -> None:
+    """Compare per-call pool creation with the shared arq pool."""
+    from arq import create_pool
+    from arq.connections import RedisSettings
+
+    from src.config import get_settings
+    from src.services.indexing_queue import close_arq_pool, enqueue_index_entity
+
+    settings = get_settings()
+    org_id = str(uuid.uuid4())
+
+    async def per_call_pool() -> None:
+        # Previous behaviour: new pool per enqueue, never closed
+        redis = await create_pool(RedisSettings.from_dsn(settings.redis_url))
+        await redis.enqueue_job("index_entity_task", "password", str(uuid.uuid4()), org_id)
+
+    async def shared_pool() -> None:
+        await enqueue_index_entity("password", str(uuid.uuid4()), org_id)
+
+    _report("per-call pool", await _measure(per_call_pool, requests, concurrency))
+    # Warm the shared pool so connection setup isn't counted against one request
+    await shared_pool()
+    _report("shared pool", await _measure(shared_pool, requests, concurrency))
+    await close_arq_pool()
+
+
+async def bench_http(
+    api_url: str,
+    org_id: str,
+    token: str,
+    requests: int,
+    concurrency: int,
+) -> None:
+    """Measure password creation latency against a running API."""
+    import httpx
+
+    url = f"{api_url.rstrip('/')}/api/organizations/{org_id}/passwords"
+    headers = {"Authorization": f"Bearer {token}"}
+
+    async with httpx.AsyncClient(headers=headers, timeout=30) as client:
+
+        async def create_password() -> None:
+            response = await client.post(
+                url,
+                json={"name": f"bench-{uuid.uuid4()}", "password": "bench-password"},
+            )
+            response.raise_for_status()
+
+        await create_password()  # warm up
+        _report("POST passwords", await _measure(create_password, requests, concurrency))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("mode", choices=["enqueue", "http"])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--api-url", default="http://localhost:8000")
+    parser.add_argument("--org-id")
+    parser.add_argument("--token")
+    args = parser.parse_args()
+
+    if args.mode == "enqueue":
+        asyncio.run(bench_enqueue(args.requests, args.concurrency))
+    else:
+        if not args.org_id or not args.token:
+            parser.error("http mode requires --org-id and --token")
+        asyncio.run(bench_http(args.api_url, args.org_id, args.token, args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
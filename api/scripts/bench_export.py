@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the export CSV stage.
+
+Creates synthetic organizations (named bench-export-NNNN) with rows of every
+exported entity type, then times writing all five CSVs two ways:
+
+    per-org      the previous approach: entity types one after another, one
+                 query per organization, each result fully materialized
+    streaming    export_entities_to_csv: one server-side cursor query per
+                 entity type across all organizations, all types at once,
+                 each on its own connection
+
+Both write CSV in memory and discard it, so the numbers cover the database
+and CSV work only (S3 uploads and progress publishing are left out).
+
+Usage:
+    python -m scripts.bench_export setup --orgs 500 --rows-per-org 50
+    python -m scripts.bench_export run --repeat 3
+    python -m scripts.bench_export teardown
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import io
+import time
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import delete, insert, select
+
+ORG_PREFIX = "bench-export-"
+ASSET_TYPE_NAME = "bench-export"
+
+
+class _DiscardUpload:
+    """Multipart upload stand-in that only counts bytes."""
+
+    def __init__(self) -> None:
+        self.bytes_uploaded = 0
+
+    async def upload_part(self, data: bytes) -> None:
+        self.bytes_uploaded += len(data)
+
+
+async def _no_progress(*_args: Any, **_kwargs: Any) -> None:
+    pass
+
+
+async def setup(orgs: int, rows_per_org: int) -> None:
+    """Create the synthetic organizations and their entities."""
+    from src.core.database import get_db_context
+    from src.models.orm.configuration import Configuration
+    from src.models.orm.custom_asset import CustomAsset
+    from src.models.orm.custom_asset_type import CustomAssetType
+    from src.models.orm.document import Document
+    from src.models.orm.location import Location
+    from src.models.orm.organization import Organization
+    from src.models.orm.password import Password
+
+    started = time.perf_counter()
+    async with get_db_context() as db:
+        asset_type = CustomAssetType(
+            name=ASSET_TYPE_NAME,
+            fields=[{"key": "name", "name": "Name", "type": "text", "show_in_list": True}],
+        )
+        db.add(asset_type)
+        await db.flush()
+        asset_type_id = asset_type.id
+
+    filler = "lorem ipsum dolor sit amet " * 80
+    for n in range(orgs):
+        async with get_db_context() as db:
+            org = Organization(name=f"{ORG_PREFIX}{n:04d}")
+            db.add(org)
+            await db.flush()
+            org_id = org.id
+
+            rows = range(rows_per_org)
+            await db.execute(
+                insert(Password),
+                [
+                    {"organization_id": org_id, "name": f"password {i}", "username": f"user{i}",
+                     "password_encrypted": "x" * 64, "notes": filler[:200]}
+                    for i in rows
+                ],
+            )
+            await db.execute(
+                insert(Configuration),
+                [{"organization_id": org_id, "name": f"host-{i}", "notes": filler[:200]} for i in rows],
+            )
+            await db.execute(
+                insert(Location),
+                [{"organization_id": org_id, "name": f"site {i}", "notes": filler[:200]} for i in rows],
+            )
+            await db.execute(
+                insert(Document),
+                [{"organization_id": org_id, "path": "/", "name": f"doc {i}", "content": filler} for i in rows],
+            )
+            await db.execute(
+                insert(CustomAsset),
+                [
+                    {"organization_id": org_id, "custom_asset_type_id": asset_type_id,
+                     "values": {"name": f"asset {i}", "notes": filler[:200]}}
+                    for i in rows
+                ],
+            )
+        if (n + 1) % 50 == 0:
+            print(f"created {n + 1}/{orgs} organizations ({time.perf_counter() - started:.0f}s)")
+
+
+async def _bench_org_ids() -> list[UUID]:
+    from src.core.database import get_db_context
+    from src.models.orm.organization import Organization
+
+    async with get_db_context() as db:
+        result = await db.execute(
+            select(Organization.id).where(Organization.name.startswith(ORG_PREFIX))
+        )
+        return list(result.scalars().all())
+
+
+async def _per_org(org_ids: list[UUID]) -> int:
+    """Previous approach: sequential types, one materialized query per organization."""
+    from src.core.database import get_db_context
+    from src.services.export_service import ENTITY_EXPORTS
+
+    written = 0
+    async with get_db_context() as db:
+        for entity in ENTITY_EXPORTS:
+            output = io.StringIO()
+            writer = csv.writer(output)
+            writer.writerow(entity.columns)
+            for org_id in org_ids:
+                result = await db.execute(
+                    select(entity.model)
+                    .where(entity.model.organization_id == org_id)
+                    .order_by(*entity.order_by)
+                )
+                for item in result.scalars().all():
+                    writer.writerow(entity.row(item))
+            written += len(output.getvalue().encode("utf-8"))
+    return written
+
+
+async def _streaming(org_ids: list[UUID]) -> int:
+    """Current approach: one streamed query per type, all types concurrently."""
+    from src.core.database import get_db_context
+    from src.services.export_service import ENTITY_EXPORTS, CsvUpload, export_entities_to_csv
+
+    async def export_one(entity: Any) -> int:
+        upload = _DiscardUpload()
+        async with get_db_context() as db:
+            out = CsvUpload(upload, 8 * 1024 * 1024)  # type: ignore[arg-type]
+            await export_entities_to_csv(db, entity, org_ids, UUID(int=0), out)
+            await out.close()
+        return upload.bytes_uploaded
+
+    sizes = await asyncio.gather(*(export_one(entity) for entity in ENTITY_EXPORTS))
+    return sum(sizes)
+
+
+async def run(repeat: int) -> None:
+    """Time both approaches, reporting the best of repeat runs."""
+    from src.services import export_service
+
+    # Progress goes to Redis in production; leave it out of the timings
+    export_service.publish_export_progress = _no_progress  # type: ignore[assignment]
+
+    org_ids = await _bench_org_ids()
+    if not org_ids:
+        raise SystemExit("No benchmark organizations found - run setup first")
+    print(f"organizations: {len(org_ids)}")
+
+    results: dict[str, float] = {}
+    for name, strategy in (("per-org", _per_org), ("streaming", _streaming)):
+        timings: list[float] = []
+        written = 0
+        for _ in range(repeat):
+            started = time.perf_counter()
+            written = await strategy(org_ids)
+            timings.append(time.perf_counter() - started)
+        results[name] = min(timings)
+        print(
+            f"  {name:<10} best={min(timings):7.2f}s "
+            f"runs={' '.join(f'{t:.2f}' for t in timings)} csv={written / 1024 / 1024:.1f}MiB"
+        )
+
+    print(f"  speedup    {results['per-org'] / results['streaming']:.1f}x")
+
+
+async def teardown() -> None:
+    """Delete the synthetic organizations and everything in them."""
+    from src.core.database import get_db_context
+    from src.models.orm.custom_asset_type import CustomAssetType
+    from src.models.orm.organization import Organization
+    from src.services.export_service import ENTITY_EXPORTS
+
+    org_ids = await _bench_org_ids()
+    async with get_db_context() as db:
+        for entity in ENTITY_EXPORTS:
+            await db.execute(delete(entity.model).where(entity.model.organization_id.in_(org_ids)))
+        await db.execute(delete(Organization).where(Organization.id.in_(org_ids)))
+        await db.execute(delete(CustomAssetType).where(CustomAssetType.name == ASSET_TYPE_NAME))
+    print(f"deleted {len(org_ids)} organizations")
+
+
+async def _main(args: argparse.Namespace) -> None:
+    from src.core.database import close_db
+
+    try:
+        match args.mode:
+            case "setup":
+                await setup(args.orgs, args.rows_per_org)
+            case "run":
+                await run(args.repeat)
+            case "teardown":
+                await teardown()
+    finally:
+        await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("mode", choices=["setup", "run", "teardown"])
+    parser.add_argument("--orgs", type=int, default=500)
+    parser.add_argument("--rows-per-org", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Benchmark for HNSW semantic search recall and latency.
+
+Builds a scratch table shaped like embedding_index (it never touches real
+data), fills it with synthetic vectors spread unevenly across organizations,
+and compares the approximate search used by EmbeddingsService.search against
+exact results for three scopes:
+
+    all        every organization (global search bar)
+    large-org  the organization holding the most vectors
+    small-org  the organization holding the fewest vectors
+
+For each hnsw.ef_search value, with iterative scan off and relaxed_order, it
+reports recall@k and latency percentiles. Uniform random vectors are close to
+a worst case for ANN recall, so real embeddings usually score higher.
+
+Usage:
+    python -m scripts.bench_vector_search setup --rows 1000000 --orgs 200
+    python -m scripts.bench_vector_search run --queries 100 --ef-search 40 100 200 400
+    python -m scripts.bench_vector_search teardown
+
+Building the index over 1M 1536-dimension vectors needs several GB of disk
+and is much faster with maintenance_work_mem raised (see --maintenance-work-mem).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import Any
+
+from sqlalchemy import text
+
+TABLE = "bench_embedding_index"
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    """Return the pct-th percentile (nearest rank) of samples in milliseconds."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index] * 1000
+
+
+def _random_vector(dims: int) -> str:
+    return "[" + ",".join(f"{random.uniform(-1, 1):.6f}" for _ in range(dims)) + "]"
+
+
+async def setup(
+    engine: Any,
+    rows: int,
+    orgs: int,
+    dims: int,
+    chunk: int,
+    maintenance_work_mem: str,
+) -> None:
+    """Create and fill the scratch table, then build its indexes."""
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+        await conn.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+        await conn.execute(
+            text(
+                f"CREATE TABLE {TABLE} ("
+                "id bigserial PRIMARY KEY, organization_id integer NOT NULL, "
+                f"embedding vector({dims}) NOT NULL)"
+            )
+        )
+
+    inserted = 0
+    started = time.perf_counter()
+    while inserted < rows:
+        batch = min(chunk, rows - inserted)
+        async with engine.begin() as conn:
+            # random()^2 skews rows towards low organization IDs, giving a mix
+            # of large and small organizations
+            await conn.execute(
+                text(
+                    f"INSERT INTO {TABLE} (organization_id, embedding) "
+                    "SELECT floor(:orgs * power(random(), 2))::integer, "
+                    "(SELECT array_agg(random() * 2 - 1) FROM generate_series(1, :dims) "
+                    "WHERE g.n > 0)::vector "
+                    "FROM generate_series(1, :batch) AS g(n)"
+                ),
+                {"orgs": orgs, "dims": dims, "batch": batch},
+            )
+        inserted += batch
+        print(f"inserted {inserted}/{rows} ({time.perf_counter() - started:.0f}s)")
+
+    started = time.perf_counter()
+    async with engine.begin() as conn:
+        await conn.execute(text(f"SET LOCAL maintenance_work_mem = '{maintenance_work_mem}'"))
+        await conn.execute(text(f"CREATE INDEX ON {TABLE} (organization_id)"))
+        await conn.execute(
+            text(
+                f"CREATE INDEX ON {TABLE} USING hnsw (embedding vector_cosine_ops) "
+                "WITH (m = 16, ef_construction = 64)"
+            )
+        )
+        await conn.execute(text(f"ANALYZE {TABLE}"))
+    print(f"built indexes in {time.perf_counter() - started:.0f}s")
+
+
+async def _scopes(engine: Any) -> dict[str, list[int] | None]:
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            text(f"SELECT organization_id, count(*) FROM {TABLE} GROUP BY 1 ORDER BY 2 DESC")
+        )
+        counts = result.all()
+    print("organizations: " + ", ".join(f"{org}={count}" for org, count in (counts[0], counts[-1])))
+    return {"all": None, "large-org": [counts[0][0]], "small-org": [counts[-1][0]]}
+
+
+async def _search(
+    engine: Any,
+    vector: str,
+    org_ids: list[int] | None,
+    k: int,
+    exact: bool,
+    ef_search: int = 40,
+    iterative_scan: str = "off",
+) -> tuple[list[int], float]:
+    """Run one search, returning result IDs and elapsed seconds."""
+    where = "WHERE organization_id = ANY(:org_ids)" if org_ids is not None else ""
+    if exact:
+        sql = (
+            f"WITH candidates AS MATERIALIZED (SELECT id, embedding <=> CAST(:q AS vector) AS distance "
+            f"FROM {TABLE} {where}) SELECT id FROM candidates ORDER BY distance LIMIT :k"
+        )
+    else:
+        sql = f"SELECT id FROM {TABLE} {where} ORDER BY embedding <=> CAST(:q AS vector) LIMIT :k"
+
+    params: dict[str, Any] = {"q": vector, "k": k}
+    if org_ids is not None:
+        params["org_ids"] = org_ids
+
+    async with engine.connect() as conn, conn.begin():
+        await conn.execute(
+            text(
+                "SELECT set_config('hnsw.ef_search', :ef_search, true), "
+                "set_config('hnsw.iterative_scan', :iterative_scan, true)"
+            ),
+            {"ef_search": str(ef_search), "iterative_scan": iterative_scan},
+        )
+        started = time.perf_counter()
+        result = await conn.execute(text(sql), params)
+        ids = [row[0] for row in result.all()]
+        return ids, time.perf_counter() - started
+
+
+async def run(engine: Any, queries: int, k: int, ef_values: list[int], dims: int) -> None:
+    """Measure recall@k and latency against exact search."""
+    scopes = await _scopes(engine)
+    vectors = [_random_vector(dims) for _ in range(queries)]
+
+    for scope, org_ids in scopes.items():
+        truth = [set((await _search(engine, v, org_ids, k, exact=True))[0]) for v in vectors]
+        print(f"\n{scope}")
+        for iterative_scan in ("off", "relaxed_order"):
+            for ef_search in ef_values:
+                recalls: list[float] = []
+                latencies: list[float] = []
+                for vector, expected in zip(vectors, truth, strict=True):
+                    ids, elapsed = await _search(
+                        engine, vector, org_ids, k, exact=False,
+                        ef_search=ef_search, iterative_scan=iterative_scan,
+                    )
+                    latencies.append(elapsed)
+                    recalls.append(len(expected & set(ids)) / len(expected) if expected else 1.0)
+                print(
+                    f"  iterative={iterative_scan:<13} ef_search={ef_search:<4} "
+                    f"recall@{k}={statistics.mean(recalls):.3f} "
+                    f"p50={_percentile(latencies, 50):7.2f}ms "
+                    f"p95={_percentile(latencies, 95):7.2f}ms "
+                    f"p99={_percentile(latencies, 99):7.2f}ms"
+                )
+
+
+async def teardown(engine: Any) -> None:
+    """Drop the scratch table."""
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+
+
+async def _main(args: argparse.Namespace) -> None:
+    from src.core.database import close_db, get_engine
+
+    engine = get_engine()
+    try:
+        match args.mode:
+            case "setup":
+                await setup(engine, args.rows, args.orgs, args.dims, args.chunk, args.maintenance_work_mem)
+            case "run":
+                await run(engine, args.queries, args.k, args.ef_search, args.dims)
+            case "teardown":
+                await teardown(engine)
+    finally:
+        await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("mode", choices=["setup", "run", "teardown"])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--orgs", type=int, default=200)
+    parser.add_argument("--dims", type=int, default=1536)
+    parser.add_argument("--chunk", type=int, default=10_000)
+    parser.add_argument("--maintenance-work-mem", default="2GB")
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=20)
+    parser.add_argument("--ef-search", type=int, nargs="+", default=[40, 100, 200, 400])
+    args = parser.parse_args()
+
+    random.seed(0)
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Load test for WebSocket fan-out in ConnectionManager.
+
+Connects simulated subscribers to one channel in-process and broadcasts a
+stream of messages to them, measuring the time from broadcast to each
+healthy subscriber's send completing. A healthy subscriber's send is a
+buffered write that completes straight away; a fraction of subscribers are
+slow (a browser on a bad VPN) and take --slow-delay seconds per send.
+
+Two strategies are compared:
+
+    sequential   the previous _broadcast_local: await each subscriber's
+                 send_text in turn
+    queued       the current ConnectionManager: per-connection bounded
+                 queues and writer tasks, slow clients evicted
+
+Latency should stay flat for "queued" as subscribers grow and regardless of
+slow clients; "sequential" grows with the subscriber count and stalls on
+every slow client. Sequential runs are capped with --sequential-max and
+--sequential-messages so the test finishes.
+
+No network or Redis is involved; this isolates the manager's fan-out.
+
+Usage:
+    python -m scripts.bench_websocket_fanout --subscribers 500 1000 5000 --messages 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from uuid import uuid4
+
+CHANNEL = "bench:fanout"
+
+
+class SimulatedWebSocket:
+    """WebSocket stand-in recording when each message finished sending."""
+
+    def __init__(self, delay: float, slow: bool) -> None:
+        self.delay = delay
+        self.slow = slow
+        self.received: list[tuple[str, float]] = []
+        self.closed = False
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, data: str) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.received.append((data, time.perf_counter()))
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None:
+        self.closed = True
+
+
+def _sockets(count: int, slow_fraction: float, slow_delay: float) -> list[SimulatedWebSocket]:
+    slow_count = int(count * slow_fraction)
+    return [
+        SimulatedWebSocket(slow_delay, slow=True)
+        if i < slow_count
+        else SimulatedWebSocket(0, slow=False)
+        for i in range(count)
+    ]
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def _run(
+    strategy: str,
+    sockets: list[SimulatedWebSocket],
+    messages: int,
+    interval: float,
+    send_timeout: float,
+) -> tuple[list[float], list[float], int]:
+    """Broadcast messages; return delivery latencies, broadcast call times and evictions."""
+    from src.core.pubsub import ConnectionManager, MessageType, WebSocketMessage
+
+    manager = ConnectionManager(send_queue_size=256, send_timeout=send_timeout)
+    connection_ids = []
+    for websocket in sockets:
+        connection_id = str(uuid4())
+        await manager.connect(websocket, connection_id, uuid4(), [CHANNEL])  # type: ignore[arg-type]
+        connection_ids.append(connection_id)
+
+    async def sequential(message: WebSocketMessage) -> None:
+        # The previous implementation: one send after another
+        json_message = message.to_json()
+        for connection_id in list(manager._channel_subscribers.get(CHANNEL, ())):
+            info = manager._connections.get(connection_id)
+            if info:
+                await info.websocket.send_text(json_message)
+
+    sent_at: dict[str, float] = {}
+    broadcast_times: list[float] = []
+    for n in range(messages):
+        message = WebSocketMessage(type=MessageType.PROGRESS, channel=CHANNEL, data={"seq": n})
+        started = time.perf_counter()
+        sent_at[message.to_json()] = started
+        if strategy == "sequential":
+            # Sends go straight to the sockets, bypassing the writer tasks
+            await sequential(message)
+        else:
+            await manager._broadcast_local(CHANNEL, message)
+        broadcast_times.append(time.perf_counter() - started)
+        await asyncio.sleep(interval)
+
+    # Let queued messages drain
+    deadline = time.perf_counter() + 10
+    healthy = [ws for ws in sockets if not ws.slow]
+    while time.perf_counter() < deadline and any(len(ws.received) < messages for ws in healthy):
+        await asyncio.sleep(0.05)
+
+    latencies = [
+        received_at - sent_at[data]
+        for ws in healthy
+        for data, received_at in ws.received
+        if data in sent_at
+    ]
+    evicted = sum(1 for ws in sockets if ws.closed)
+
+    for connection_id in connection_ids:
+        await manager.disconnect(connection_id)
+    return latencies, broadcast_times, evicted
+
+
+async def _main(args: argparse.Namespace) -> None:
+    print(
+        f"messages={args.messages} interval={args.interval * 1000:.0f}ms "
+        f"slow={args.slow_fraction:.1%} slow_delay={args.slow_delay}s send_timeout={args.send_timeout}s"
+    )
+    for count in args.subscribers:
+        for strategy in ("sequential", "queued"):
+            if strategy == "sequential" and count > args.sequential_max:
+                continue
+            sockets = _sockets(count, args.slow_fraction, args.slow_delay)
+            started = time.perf_counter()
+            messages = args.messages if strategy == "queued" else min(args.messages, args.sequential_messages)
+            latencies, broadcast_times, evicted = await _run(
+                strategy, sockets, messages, args.interval, args.send_timeout
+            )
+            elapsed = time.perf_counter() - started
+            print(
+                f"  subscribers={count:<5} {strategy:<10} "
+                f"p50={statistics.median(latencies) * 1000:8.1f}ms "
+                f"p99={_percentile(latencies, 0.99) * 1000:8.1f}ms "
+                f"max={max(latencies) * 1000:8.1f}ms "
+                f"broadcast_p99={_percentile(broadcast_times, 0.99) * 1000:8.1f}ms "
+                f"evicted={evicted:<4} messages={messages} total={elapsed:.1f}s"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[500, 1000, 2500, 5000])
+    parser.add_argument("--messages", type=int, default=50)
+    parser.add_argument("--interval", type=float, default=0.02, help="Seconds between broadcasts")
+    parser.add_argument("--slow-fraction", type=float, default=0.01)
+    parser.add_argument("--slow-delay", type=float, default=2.0, help="Seconds per send for slow clients")
+    parser.add_argument("--send-timeout", type=float, default=1.0)
+    parser.add_argument(
+        "--sequential-max",
+        type=int,
+        default=500,
+        help="Largest subscriber count to run the sequential strategy for",
+    )
+    parser.add_argument(
+        "--sequential-messages",
+        type=int,
+        default=5,
+        help="Messages broadcast in sequential runs (each one waits on every slow client)",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -213,6 +213,32 @@ class Settings(BaseSettings):
         default=3600, description="Download URL expiry in seconds (default 1 hour)"
     )
 
+    s3_download_url_cache_ttl: int = Field(
+        default=300,
+        ge=0,
+        description="Seconds a presigned download URL is reused for the same file before a "
+        "new one is signed (0 disables; capped at half of s3_download_url_expiry)",
+    )
+
+    s3_max_pool_connections: int = Field(
+        default=50,
+        ge=1,
+        description="Max pooled HTTP connections held by each process's shared S3 client",
+    )
+
+    s3_connect_timeout: float = Field(
+        default=10.0,
+        gt=0,
+        description="Timeout in seconds for opening a connection to S3",
+    )
+
+    s3_multipart_part_size: int = Field(
+        default=8 * 1024 * 1024,
+        ge=5 * 1024 * 1024,
+        description="Part size in bytes for multipart uploads (S3 minimum 5 MiB); "
+        "bounds how much of a streamed upload is held in memory",
+    )
+
     @computed_field
     @property
     def s3_configured(self) -> bool:
@@ -231,6 +257,190 @@ class Settings(BaseSettings):
         description="OpenAI embedding model (default: text-embedding-ada-002)",
     )
 
+    # ==========================================================================
+    # Search
+    # ==========================================================================
+    text_search_mode: Literal["fulltext", "ilike"] = Field(
+        default="fulltext",
+        description="Text search implementation: 'fulltext' (tsvector + trigram indexes) "
+        "or 'ilike' (legacy unindexed matching)",
+    )
+
+    vector_ef_search: int = Field(
+        default=100,
+        ge=1,
+        le=1000,
+        description="HNSW candidate list size for semantic search (hnsw.ef_search); "
+        "higher improves recall at the cost of latency",
+    )
+
+    vector_iterative_scan: Literal["off", "relaxed_order", "strict_order"] = Field(
+        default="relaxed_order",
+        description="pgvector iterative index scan mode (hnsw.iterative_scan, pgvector 0.8+); "
+        "keeps scanning when the organization filter discards candidates",
+    )
+
+    vector_max_scan_tuples: int = Field(
+        default=20000,
+        ge=1,
+        description="Max tuples an iterative HNSW scan visits before giving up (hnsw.max_scan_tuples); "
+        "searches that come back short fall back to an exact scan",
+    )
+
+    hybrid_fusion: Literal["rrf", "weighted"] = Field(
+        default="rrf",
+        description="How hybrid search combines legs: 'rrf' (reciprocal rank fusion) "
+        "or 'weighted' (weighted sum of leg scores)",
+    )
+
+    hybrid_rrf_k: int = Field(
+        default=60,
+        ge=1,
+        description="RRF rank constant; larger values flatten the advantage of top-ranked hits",
+    )
+
+    hybrid_semantic_weight: float = Field(
+        default=0.5,
+        ge=0,
+        le=1,
+        description="Weight of the semantic leg in hybrid search (the text leg gets 1 - weight)",
+    )
+
+    hybrid_semantic_timeout_ms: int = Field(
+        default=0,
+        ge=0,
+        description="Deadline for the semantic leg of hybrid search; when missed, text results "
+        "are returned alone (0 disables)",
+    )
+
+    # ==========================================================================
+    # Search Indexing (worker)
+    # ==========================================================================
+    index_debounce_seconds: float = Field(
+        default=2.0,
+        ge=0,
+        description="Delay before an index job runs; repeat saves of an entity within it collapse into one job",
+    )
+
+    reindex_batch_size: int = Field(
+        default=100,
+        ge=1,
+        le=2048,
+        description="Entities embedded per OpenAI request during bulk reindex (API max 2048)",
+    )
+
+    reindex_requests_per_minute: int = Field(
+        default=300,
+        ge=1,
+        description="Max embeddings API requests per minute issued by a bulk reindex job",
+    )
+
+    reindex_progress_every_entities: int = Field(
+        default=1000,
+        ge=1,
+        description="Entities a bulk reindex processes between progress reports and "
+        "cancellation checks",
+    )
+
+    reindex_progress_interval_ms: int = Field(
+        default=1000,
+        ge=1,
+        description="Milliseconds after which a bulk reindex reports progress and checks for "
+        "cancellation even if fewer entities have been processed",
+    )
+
+    embedding_cache_size: int = Field(
+        default=2048,
+        ge=0,
+        description="Vectors kept in the per-process embedding cache keyed by content hash "
+        "(0 disables); each 1536-dimension vector takes about 6 KB, so the default is about 13 MB",
+    )
+
+    query_embedding_cache_ttl_seconds: int = Field(
+        default=86400,
+        ge=0,
+        description="How long query embeddings stay in the Redis cache after their last use (0 disables)",
+    )
+
+    # ==========================================================================
+    # System Config Cache
+    # ==========================================================================
+    system_config_cache_ttl_seconds: float = Field(
+        default=30.0,
+        ge=0,
+        description="How long AI and indexing settings are cached in-process (0 disables); "
+        "writes are also broadcast over Redis so replicas refresh immediately",
+    )
+
+    # ==========================================================================
+    # Sidebar Counts Cache
+    # ==========================================================================
+    sidebar_counts_cache_ttl_seconds: int = Field(
+        default=60,
+        ge=0,
+        description="How long per-organization sidebar counts stay cached in Redis (0 disables); "
+        "entity creates and deletes invalidate them immediately",
+    )
+
+    # ==========================================================================
+    # Exports
+    # ==========================================================================
+    export_batch_size: int = Field(
+        default=500,
+        ge=1,
+        description="Rows fetched per server-side cursor batch while writing export CSVs",
+    )
+
+    export_max_concurrent_jobs: int = Field(
+        default=2,
+        ge=1,
+        description="Exports processed at once by each export worker; each export streams its "
+        "entity types concurrently, holding one database connection per type",
+    )
+
+    export_max_tries: int = Field(
+        default=3,
+        ge=1,
+        description="Attempts per export; a retry resumes after the last entity type that finished",
+    )
+
+    # ==========================================================================
+    # WebSockets
+    # ==========================================================================
+    websocket_send_queue_size: int = Field(
+        default=256,
+        ge=1,
+        description="Outbound messages buffered per WebSocket connection; a client that falls "
+        "further behind is disconnected",
+    )
+
+    websocket_send_timeout: float = Field(
+        default=10.0,
+        gt=0,
+        description="Seconds a single WebSocket send may take before the client is treated as "
+        "stalled and disconnected",
+    )
+
+    search_delta_flush_chars: int = Field(
+        default=256,
+        ge=1,
+        description="Streamed AI search/chat text buffered before it is published as one delta",
+    )
+
+    search_delta_flush_interval: float = Field(
+        default=0.03,
+        gt=0,
+        description="Seconds streamed AI search/chat text may wait in the buffer before it is "
+        "published",
+    )
+
+    search_subscribe_timeout: float = Field(
+        default=5.0,
+        gt=0,
+        description="Seconds AI search/chat waits for the client to subscribe to its request channel "
+        "before streaming anyway",
+    )
+
     # ==========================================================================
     # Server
     # ==========================================================================
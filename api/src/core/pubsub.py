@@ -3,12 +3,31 @@ WebSocket Connection Manager with Redis Pub/Sub
 
 Manages WebSocket connections and enables multi-instance scaling via Redis pub/sub.
 Falls back to local-only broadcasting when Redis is unavailable.
+
+Each connection has a bounded outbound queue drained by its own writer task,
+so broadcasting only enqueues and one slow client can't hold up delivery to
+the others. A client whose queue fills up, or whose send doesn't finish
+within websocket_send_timeout, is disconnected (close code 1013, try again
+later) and reconnects.
+
+Each replica subscribes in Redis only to the channels its own connections
+have joined: the first local subscriber to a channel subscribes it and the
+last one to leave unsubscribes it. A replica therefore only receives and
+decodes messages someone on it is listening for. Joining a channel waits
+for Redis to confirm the subscription, so anything published after
+connect() or subscribe() returns is delivered.
+
+Joining a per-request channel (search:{request_id}) is also announced
+through a short-lived Redis list, so the task streaming the answer - which
+may run on another replica - can wait for the client with
+wait_for_subscriber() instead of sleeping.
 """
 
 import asyncio
 import json
 import logging
 from collections import defaultdict
+from collections.abc import Coroutine, Iterable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
@@ -16,11 +35,28 @@ from typing import Any
 from uuid import UUID
 
 from fastapi import WebSocket, WebSocketDisconnect
+from redis.asyncio.client import PubSub
 
+from src.config import get_settings
 from src.core.cache import get_redis
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait before reconnecting a dropped pub/sub connection
+_RECONNECT_DELAY = 1.0
+
+# Seconds each pub/sub read waits for a message
+_LISTEN_TIMEOUT = 1.0
+
+# Seconds to wait for Redis to confirm a channel subscription
+_SUBSCRIBE_TIMEOUT = 2.0
+
+# Seconds an unclaimed subscriber announcement is kept
+_ANNOUNCEMENT_TTL = 60
+
+# Close code for clients disconnected for falling behind (RFC 6455 "Try Again Later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
 
 class MessageType(str, Enum):
     """WebSocket message types."""
@@ -87,12 +123,18 @@ class ConnectionInfo:
         user_id: Authenticated user ID
         channels: Set of subscribed channels
         connected_at: When the connection was established
+        queue: Serialized messages waiting to be sent
+        writer_task: Task sending queued messages
+        send_started: Loop time the send in progress began (None when idle)
     """
 
     websocket: WebSocket
     user_id: UUID
     channels: set[str] = field(default_factory=set)
     connected_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    queue: asyncio.Queue[str] = field(default_factory=asyncio.Queue)
+    writer_task: asyncio.Task[None] | None = None
+    send_started: float | None = None
 
 
 class ConnectionManager:
@@ -106,7 +148,20 @@ class ConnectionManager:
     # Redis pub/sub channel prefix
     PUBSUB_CHANNEL_PREFIX = "ws:pubsub:"
 
-    def __init__(self) -> None:
+    # Redis list a replica pushes to when a client joins an announced channel
+    SUBSCRIBER_ANNOUNCEMENT_PREFIX = "ws:subscribed:"
+
+    # Channels whose publishers wait for the first subscriber
+    ANNOUNCED_CHANNEL_PREFIXES = ("search:",)
+
+    def __init__(
+        self,
+        send_queue_size: int | None = None,
+        send_timeout: float | None = None,
+    ) -> None:
+        settings = get_settings()
+        self._send_queue_size = send_queue_size or settings.websocket_send_queue_size
+        self._send_timeout = send_timeout or settings.websocket_send_timeout
         # Map of connection ID to ConnectionInfo
         self._connections: dict[str, ConnectionInfo] = {}
         # Map of channel to set of connection IDs
@@ -117,6 +172,20 @@ class ConnectionManager:
         self._redis_enabled = False
         # Lock for thread-safe operations
         self._lock = asyncio.Lock()
+        # Connected pub/sub session, None while (re)connecting or local-only
+        self._pubsub: PubSub | None = None
+        # Channels subscribed in Redis, kept in step with local interest
+        self._redis_channels: set[str] = set()
+        # Subscriptions sent but not yet confirmed by Redis
+        self._subscribe_acks: dict[str, asyncio.Future[None]] = {}
+        # Serializes changes to the Redis subscriptions
+        self._subscription_lock = asyncio.Lock()
+        # Local waiters for a channel's first subscriber
+        self._subscriber_waiters: dict[str, asyncio.Event] = {}
+        # Close handshakes and unsubscribes in flight for evicted clients
+        self._background: set[asyncio.Task[None]] = set()
+        # Evicts clients stuck in a send; runs while there are connections
+        self._watchdog_task: asyncio.Task[None] | None = None
 
     async def start_pubsub(self) -> None:
         """
@@ -152,35 +221,131 @@ class ConnectionManager:
             logger.info("WebSocket Redis pub/sub stopped")
 
     async def _listen_pubsub(self) -> None:
-        """Listen for messages from Redis pub/sub and broadcast locally."""
+        """
+        Forward messages from Redis to local subscribers.
+
+        Reconnects if the connection drops, resubscribing to every channel
+        that has local subscribers. Messages published in between are lost.
+        """
+        while True:
+            try:
+                redis = await get_redis()
+                pubsub = redis.pubsub()
+                try:
+                    await pubsub.connect()
+                    async with self._subscription_lock:
+                        # Set first: joins from here on wait for the lock and
+                        # then see this session
+                        self._pubsub = pubsub
+                        self._redis_channels = set(self._channel_subscribers)
+                        if self._redis_channels:
+                            await pubsub.subscribe(*map(self._redis_channel, self._redis_channels))
+                    self._redis_enabled = True
+
+                    while True:
+                        # get_message rather than listen(): listen() returns
+                        # as soon as no channel is subscribed
+                        message = await pubsub.get_message(timeout=_LISTEN_TIMEOUT)
+                        if message is not None:
+                            await self._handle_pubsub_message(message)
+                finally:
+                    self._pubsub = None
+                    self._redis_channels = set()
+                    # Release anyone waiting on a subscription that won't be confirmed
+                    for ack in self._subscribe_acks.values():
+                        if not ack.done():
+                            ack.set_result(None)
+                    self._subscribe_acks.clear()
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Redis pub/sub listener error: {e}")
+                # Publish locally until the listener is back
+                self._redis_enabled = False
+                await asyncio.sleep(_RECONNECT_DELAY)
+
+    async def _handle_pubsub_message(self, message: dict[str, Any]) -> None:
+        """Resolve subscription confirmations and broadcast channel messages."""
+        full_channel = message["channel"]
+        if isinstance(full_channel, bytes):
+            full_channel = full_channel.decode()
+        channel = full_channel[len(self.PUBSUB_CHANNEL_PREFIX) :]
+
+        if message["type"] == "subscribe":
+            ack = self._subscribe_acks.pop(channel, None)
+            if ack is not None and not ack.done():
+                ack.set_result(None)
+            return
+        if message["type"] != "message":
+            return
+
         try:
-            redis = await get_redis()
-            pubsub = redis.pubsub()
-            # Subscribe to wildcard channel pattern
-            await pubsub.psubscribe(f"{self.PUBSUB_CHANNEL_PREFIX}*")
-
-            async for message in pubsub.listen():
-                if message["type"] == "pmessage":
-                    try:
-                        # Extract channel name from pattern match
-                        full_channel = message["channel"]
-                        if isinstance(full_channel, bytes):
-                            full_channel = full_channel.decode()
-                        channel = full_channel[len(self.PUBSUB_CHANNEL_PREFIX) :]
-
-                        # Parse and broadcast message
-                        data = message["data"]
-                        if isinstance(data, bytes):
-                            data = data.decode()
-                        ws_message = WebSocketMessage.from_json(data)
-                        await self._broadcast_local(channel, ws_message)
-                    except Exception as e:
-                        logger.error(f"Error processing pub/sub message: {e}")
-        except asyncio.CancelledError:
-            raise
+            data = message["data"]
+            if isinstance(data, bytes):
+                data = data.decode()
+            ws_message = WebSocketMessage.from_json(data)
+            await self._broadcast_local(channel, ws_message)
         except Exception as e:
-            logger.error(f"Redis pub/sub listener error: {e}")
-            self._redis_enabled = False
+            logger.error(f"Error processing pub/sub message: {e}")
+
+    def _redis_channel(self, channel: str) -> str:
+        return f"{self.PUBSUB_CHANNEL_PREFIX}{channel}"
+
+    async def _sync_subscriptions(self, channels: Iterable[str]) -> None:
+        """
+        Bring the Redis subscriptions for channels in line with local interest.
+
+        Subscribes channels that gained their first local subscriber and
+        waits for Redis to confirm them; unsubscribes channels whose last
+        local subscriber left. Does nothing in local-only mode.
+
+        Args:
+            channels: Channels whose local subscribers may have changed
+        """
+        async with self._subscription_lock:
+            pubsub = self._pubsub
+            if pubsub is None:
+                return
+
+            # Decided under the lock from the current state, so a leave and a
+            # join racing each other end with the right subscription
+            channels = set(channels)
+            joined = {
+                c
+                for c in channels
+                if c in self._channel_subscribers and c not in self._redis_channels
+            }
+            left = {
+                c
+                for c in channels
+                if c not in self._channel_subscribers and c in self._redis_channels
+            }
+
+            try:
+                if left:
+                    self._redis_channels -= left
+                    await pubsub.unsubscribe(*map(self._redis_channel, left))
+                if joined:
+                    loop = asyncio.get_running_loop()
+                    for channel in joined:
+                        if channel not in self._subscribe_acks:
+                            self._subscribe_acks[channel] = loop.create_future()
+                    self._redis_channels |= joined
+                    await pubsub.subscribe(*map(self._redis_channel, joined))
+            except Exception as e:
+                # The listener reconnects and resubscribes
+                logger.warning(f"Failed to update Redis subscriptions: {e}")
+                return
+
+            acks = [self._subscribe_acks[c] for c in channels if c in self._subscribe_acks]
+
+        if acks:
+            # wait() rather than wait_for(): a timeout mustn't cancel the
+            # futures other joiners of the same channel are waiting on
+            _, pending = await asyncio.wait(acks, timeout=_SUBSCRIBE_TIMEOUT)
+            if pending:
+                logger.warning(f"{len(pending)} Redis subscription(s) not confirmed in time")
 
     async def connect(
         self,
@@ -206,13 +371,21 @@ class ConnectionManager:
                 websocket=websocket,
                 user_id=user_id,
                 channels=set(channels),
+                queue=asyncio.Queue(maxsize=self._send_queue_size),
             )
+            info.writer_task = asyncio.create_task(self._write_loop(connection_id, info))
             self._connections[connection_id] = info
 
             # Subscribe to channels
             for channel in channels:
                 self._channel_subscribers[channel].add(connection_id)
 
+            if self._watchdog_task is None or self._watchdog_task.done():
+                self._watchdog_task = asyncio.create_task(self._watch_sends())
+
+        await self._sync_subscriptions(channels)
+        await self._announce_subscriber(channels)
+
         logger.info(
             f"WebSocket connected: {connection_id} (user: {user_id}, channels: {channels})"
         )
@@ -225,22 +398,117 @@ class ConnectionManager:
             connection_id: Connection identifier to remove
         """
         async with self._lock:
-            if connection_id not in self._connections:
-                return
+            info = self._remove(connection_id)
+
+        if info is None:
+            return
+        if info.writer_task is not None:
+            info.writer_task.cancel()
+        await self._sync_subscriptions(info.channels)
 
-            info = self._connections[connection_id]
+        logger.info(f"WebSocket disconnected: {connection_id}")
 
-            # Unsubscribe from all channels
-            for channel in info.channels:
-                self._channel_subscribers[channel].discard(connection_id)
+    def _remove(self, connection_id: str) -> ConnectionInfo | None:
+        """Drop a connection and its subscriptions, returning it if it was registered."""
+        info = self._connections.pop(connection_id, None)
+        if info is None:
+            return None
+
+        # Unsubscribe from all channels
+        for channel in info.channels:
+            subscribers = self._channel_subscribers.get(channel)
+            if subscribers is not None:
+                subscribers.discard(connection_id)
                 # Clean up empty channel sets
-                if not self._channel_subscribers[channel]:
+                if not subscribers:
                     del self._channel_subscribers[channel]
+        return info
 
-            # Remove connection
-            del self._connections[connection_id]
+    async def _write_loop(self, connection_id: str, info: ConnectionInfo) -> None:
+        """Send a connection's queued messages in order until it goes away."""
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                json_message = await info.queue.get()
+                info.send_started = loop.time()
+                await info.websocket.send_text(json_message)
+                info.send_started = None
+        except asyncio.CancelledError:
+            raise
+        except WebSocketDisconnect:
+            # Connection closed, will be cleaned up by the endpoint
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to send to {connection_id}: {e}")
 
-        logger.info(f"WebSocket disconnected: {connection_id}")
+    async def _watch_sends(self) -> None:
+        """
+        Evict clients whose current send has run longer than the send timeout.
+
+        One periodic sweep instead of a timer per send, which would cost more
+        than the send itself at high fan-out. A stuck send is caught between
+        one and one and a half timeouts after it started.
+        """
+        loop = asyncio.get_running_loop()
+        while self._connections:
+            await asyncio.sleep(self._send_timeout / 2)
+            deadline = loop.time() - self._send_timeout
+            for connection_id, info in list(self._connections.items()):
+                if info.send_started is not None and info.send_started < deadline:
+                    self._evict(connection_id, "send timed out")
+
+    def _evict(self, connection_id: str, reason: str) -> None:
+        """
+        Disconnect a client that isn't keeping up with its messages.
+
+        Synchronous so broadcasts can evict without waiting; the close frame
+        is sent in the background.
+        """
+        info = self._remove(connection_id)
+        if info is None:
+            return
+
+        logger.warning(f"Evicting slow WebSocket client {connection_id}: {reason}")
+        if info.writer_task is not None:
+            info.writer_task.cancel()
+        self._run_in_background(self._close(info.websocket))
+        if self._pubsub is not None:
+            self._run_in_background(self._sync_subscriptions(info.channels))
+
+    def _run_in_background(self, coro: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coro)
+        # Keep a reference until the task finishes
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _close(self, websocket: WebSocket) -> None:
+        try:
+            await asyncio.wait_for(
+                websocket.close(code=SLOW_CONSUMER_CLOSE_CODE, reason="Too slow"),
+                timeout=self._send_timeout,
+            )
+        except Exception as e:
+            logger.debug(f"Error closing evicted WebSocket: {e}")
+
+    def _enqueue(self, connection_id: str, json_message: str) -> None:
+        """Queue a message for a connection, evicting it if its queue is full."""
+        info = self._connections.get(connection_id)
+        if info is None:
+            return
+        try:
+            info.queue.put_nowait(json_message)
+        except asyncio.QueueFull:
+            self._evict(connection_id, f"{info.queue.qsize()} messages queued")
+
+    def send(self, connection_id: str, message: WebSocketMessage) -> None:
+        """
+        Queue a message for one connection.
+
+        Args:
+            connection_id: Connection identifier
+            message: Message to send
+        """
+        self._enqueue(connection_id, message.to_json())
 
     async def subscribe(self, connection_id: str, channel: str) -> None:
         """
@@ -257,6 +525,9 @@ class ConnectionManager:
             self._connections[connection_id].channels.add(channel)
             self._channel_subscribers[channel].add(connection_id)
 
+        await self._sync_subscriptions([channel])
+        await self._announce_subscriber([channel])
+
         logger.debug(f"Connection {connection_id} subscribed to {channel}")
 
     async def unsubscribe(self, connection_id: str, channel: str) -> None:
@@ -277,8 +548,85 @@ class ConnectionManager:
             if not self._channel_subscribers[channel]:
                 del self._channel_subscribers[channel]
 
+        await self._sync_subscriptions([channel])
+
         logger.debug(f"Connection {connection_id} unsubscribed from {channel}")
 
+    async def _announce_subscriber(self, channels: Iterable[str]) -> None:
+        """Tell anyone in wait_for_subscriber() that a client joined these channels."""
+        for channel in channels:
+            if not channel.startswith(self.ANNOUNCED_CHANNEL_PREFIXES):
+                continue
+
+            event = self._subscriber_waiters.get(channel)
+            if event is not None:
+                event.set()
+
+            if self._redis_enabled:
+                try:
+                    redis = await get_redis()
+                    key = f"{self.SUBSCRIBER_ANNOUNCEMENT_PREFIX}{channel}"
+                    async with redis.pipeline(transaction=False) as pipe:
+                        pipe.rpush(key, "1")
+                        pipe.expire(key, _ANNOUNCEMENT_TTL)
+                        await pipe.execute()
+                except Exception as e:
+                    logger.warning(f"Failed to announce subscriber for {channel}: {e}")
+
+    async def wait_for_subscriber(self, channel: str, timeout: float) -> bool:
+        """
+        Wait until a client on any replica has subscribed to a channel.
+
+        Only channels matching ANNOUNCED_CHANNEL_PREFIXES are announced.
+        Subscriptions are confirmed by Redis before they are announced, so
+        anything published once this returns True is delivered.
+
+        Args:
+            channel: Channel to wait for
+            timeout: Seconds to wait at most
+
+        Returns:
+            True if a client subscribed, False if the timeout passed first
+        """
+        if self._channel_subscribers.get(channel):
+            return True
+
+        event = self._subscriber_waiters.setdefault(channel, asyncio.Event())
+        waits: list[asyncio.Task[bool]] = [asyncio.create_task(event.wait())]
+        if self._redis_enabled:
+            waits.append(asyncio.create_task(self._wait_for_announcement(channel, timeout)))
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        pending = set(waits)
+        try:
+            # A failed Redis wait mustn't end the local one early
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=max(0.0, deadline - loop.time()),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    return False
+                if any(task.result() for task in done):
+                    return True
+            return False
+        finally:
+            for task in waits:
+                task.cancel()
+            if self._subscriber_waiters.get(channel) is event:
+                del self._subscriber_waiters[channel]
+
+    async def _wait_for_announcement(self, channel: str, timeout: float) -> bool:
+        try:
+            redis = await get_redis()
+            key = f"{self.SUBSCRIBER_ANNOUNCEMENT_PREFIX}{channel}"
+            return await redis.blpop([key], timeout=timeout) is not None  # type: ignore[misc]
+        except Exception as e:
+            logger.warning(f"Failed to wait for subscriber announcement on {channel}: {e}")
+            return False
+
     async def broadcast(self, channel: str, message: WebSocketMessage) -> None:
         """
         Broadcast a message to all subscribers of a channel.
@@ -308,28 +656,21 @@ class ConnectionManager:
         """
         Broadcast a message to local subscribers only.
 
+        Only queues the message for each subscriber; it never waits on a send.
+
         Args:
             channel: Channel to broadcast to
             message: Message to send
         """
-        async with self._lock:
-            connection_ids = self._channel_subscribers.get(channel, set()).copy()
-
+        connection_ids = self._channel_subscribers.get(channel)
         if not connection_ids:
             return
 
         json_message = message.to_json()
 
-        for connection_id in connection_ids:
-            try:
-                info = self._connections.get(connection_id)
-                if info:
-                    await info.websocket.send_text(json_message)
-            except WebSocketDisconnect:
-                # Connection closed, will be cleaned up elsewhere
-                pass
-            except Exception as e:
-                logger.warning(f"Failed to send to {connection_id}: {e}")
+        # Copy: evicting a subscriber modifies the set
+        for connection_id in list(connection_ids):
+            self._enqueue(connection_id, json_message)
 
     async def send_to_user(self, user_id: UUID, message: WebSocketMessage) -> None:
         """
@@ -341,18 +682,14 @@ class ConnectionManager:
         """
         json_message = message.to_json()
 
-        async with self._lock:
-            connections = [
-                info
-                for info in self._connections.values()
-                if info.user_id == user_id
-            ]
+        connection_ids = [
+            connection_id
+            for connection_id, info in self._connections.items()
+            if info.user_id == user_id
+        ]
 
-        for info in connections:
-            try:
-                await info.websocket.send_text(json_message)
-            except Exception as e:
-                logger.warning(f"Failed to send to user {user_id}: {e}")
+        for connection_id in connection_ids:
+            self._enqueue(connection_id, json_message)
 
     def get_connection_count(self) -> int:
         """Get the number of active connections."""
@@ -529,6 +866,81 @@ async def publish_reindex_cancelled(
     await _publish_to_redis(channel, message)
 
 
+async def publish_export_progress(
+    export_id: UUID,
+    stage: str,
+    current: int,
+    total: int,
+    entity_type: str | None = None,
+    bytes_written: int | None = None,
+) -> None:
+    """
+    Publish export progress update.
+
+    Args:
+        export_id: Export job identifier
+        stage: Current stage (e.g., "passwords", "documents")
+        current: Current item number
+        total: Total items to process
+        entity_type: Type of entity being processed
+        bytes_written: Bytes of output produced so far in this stage
+    """
+    channel = f"export:{export_id}"
+    message = WebSocketMessage(
+        type=MessageType.PROGRESS,
+        channel=channel,
+        data={
+            "stage": stage,
+            "current": current,
+            "total": total,
+            "entity_type": entity_type,
+            "bytes_written": bytes_written,
+            "percent": round((current / total * 100) if total > 0 else 0, 1),
+        },
+    )
+    await _publish_to_redis(channel, message)
+
+
+async def publish_export_completed(export_id: UUID, file_size_bytes: int) -> None:
+    """
+    Publish export completion notification.
+
+    Args:
+        export_id: Export job identifier
+        file_size_bytes: Size of the generated ZIP file
+    """
+    channel = f"export:{export_id}"
+    message = WebSocketMessage(
+        type=MessageType.COMPLETED,
+        channel=channel,
+        data={
+            "stage": "complete",
+            "file_size_bytes": file_size_bytes,
+        },
+    )
+    await _publish_to_redis(channel, message)
+
+
+async def publish_export_failed(export_id: UUID, error: str) -> None:
+    """
+    Publish export failure notification.
+
+    Args:
+        export_id: Export job identifier
+        error: Error message
+    """
+    channel = f"export:{export_id}"
+    message = WebSocketMessage(
+        type=MessageType.FAILED,
+        channel=channel,
+        data={
+            "stage": "failed",
+            "error": error,
+        },
+    )
+    await _publish_to_redis(channel, message)
+
+
 async def publish_search_citations(
     request_id: str,
     citations: list[dict[str, Any]],
@@ -575,6 +987,81 @@ async def publish_search_delta(
     await manager.broadcast(f"search:{request_id}", message)
 
 
+class SearchDeltaCoalescer:
+    """
+    Publishes streamed AI text as fewer, larger search deltas.
+
+    LLMs stream a few characters per chunk; publishing each one costs a Redis
+    PUBLISH and a WebSocket frame. Text is buffered and published once
+    search_delta_flush_chars have built up or the oldest buffered text is
+    search_delta_flush_interval old, whichever comes first.
+
+    Use as an async context manager; leaving it publishes what is left.
+    Call flush() before publishing any other message for the request so
+    the client sees them in order.
+    """
+
+    def __init__(
+        self,
+        request_id: str,
+        max_chars: int | None = None,
+        max_delay: float | None = None,
+    ) -> None:
+        settings = get_settings()
+        self._request_id = request_id
+        self._max_chars = max_chars or settings.search_delta_flush_chars
+        self._max_delay = max_delay or settings.search_delta_flush_interval
+        self._buffer: list[str] = []
+        self._size = 0
+        self._timer: asyncio.Task[None] | None = None
+        # Keeps a timed flush and an explicit one from publishing out of order
+        self._publish_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "SearchDeltaCoalescer":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.flush()
+
+    async def add(self, content: str) -> None:
+        """
+        Buffer a chunk of streamed text.
+
+        Args:
+            content: Text content chunk
+        """
+        if not content:
+            return
+        self._buffer.append(content)
+        self._size += len(content)
+        if self._size >= self._max_chars:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def flush(self) -> None:
+        """Publish any buffered text now."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        await self._publish()
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._max_delay)
+        # Cleared first so flush() can't cancel this mid-publish
+        self._timer = None
+        await self._publish()
+
+    async def _publish(self) -> None:
+        async with self._publish_lock:
+            if not self._buffer:
+                return
+            content = "".join(self._buffer)
+            self._buffer.clear()
+            self._size = 0
+            await publish_search_delta(self._request_id, content)
+
+
 async def publish_search_done(request_id: str) -> None:
     """
     Publish AI search completion.
@@ -64,6 +64,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Handles startup and shutdown events.
     """
     from src.core.pubsub import get_connection_manager
+    from src.services.file_storage import get_file_storage_service
+    from src.services.indexing_queue import close_arq_pool, init_arq_pool
+    from src.services.system_config_cache import get_system_config_cache
 
     # Startup
     logger.info("Starting Bifrost Docs API...")
@@ -79,6 +82,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     manager = get_connection_manager()
     await manager.start_pubsub()
 
+    # Listen for AI/indexing settings changes made through other replicas
+    config_cache = get_system_config_cache()
+    await config_cache.start_listener()
+
+    # Initialize shared arq pool for enqueueing background jobs
+    logger.info("Initializing job queue pool...")
+    await init_arq_pool()
+
+    # Create the shared S3 client (presigning needs no per-request setup)
+    file_storage = get_file_storage_service()
+    await file_storage.start_client()
+
     # Create default admin user if configured
     if settings.default_user_email and settings.default_user_password:
         await create_default_user()
@@ -90,6 +105,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown
     logger.info("Shutting down Bifrost Docs API...")
     await manager.stop_pubsub()
+    await config_cache.stop_listener()
+    await close_arq_pool()
+    await file_storage.close_client()
     await close_db()
     logger.info("Bifrost Docs API shutdown complete")
 
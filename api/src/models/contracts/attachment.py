@@ -18,6 +18,11 @@ class AttachmentCreate(BaseModel):
     filename: str = Field(..., max_length=255, description="Original filename")
     content_type: str = Field(..., max_length=255, description="MIME type")
     size_bytes: int = Field(..., ge=0, description="File size in bytes")
+    sha256: str | None = Field(
+        None,
+        pattern=r"^[0-9a-f]{64}$",
+        description="Hex SHA-256 of the content; enables reuse of an identical upload",
+    )
 
 
 class AttachmentPublic(BaseModel):
@@ -34,6 +39,9 @@ class AttachmentPublic(BaseModel):
     content_type: str
     size_bytes: int
     created_at: datetime
+    download_url: str | None = Field(
+        default=None, description="Presigned GET URL (only when requested with include_urls)"
+    )
 
 
 class AttachmentUploadResponse(BaseModel):
@@ -41,7 +49,15 @@ class AttachmentUploadResponse(BaseModel):
 
     id: str = Field(..., description="Attachment ID")
     filename: str = Field(..., description="Original filename")
-    upload_url: str = Field(..., description="Presigned PUT URL for direct upload")
+    upload_url: str | None = Field(
+        ..., description="Presigned PUT URL for direct upload (None if deduplicated)"
+    )
+    upload_headers: dict[str, str] = Field(
+        default_factory=dict, description="Headers the PUT to upload_url must send"
+    )
+    deduplicated: bool = Field(
+        default=False, description="Identical content is already stored; skip the upload"
+    )
     expires_in: int = Field(default=600, description="URL expiration in seconds")
 
 
@@ -60,6 +76,34 @@ class AttachmentList(BaseModel):
 
     items: list[AttachmentPublic]
     total: int
+    urls_expire_in: int | None = Field(
+        default=None, description="Seconds the download URLs are valid for, at least"
+    )
+
+
+class AttachmentUrlsRequest(BaseModel):
+    """Request for presigned download URLs of several attachments."""
+
+    ids: list[UUID] = Field(..., min_length=1, max_length=1000, description="Attachment IDs")
+
+
+class AttachmentUrl(BaseModel):
+    """Presigned download URL for one attachment."""
+
+    id: str = Field(..., description="Attachment ID")
+    filename: str = Field(..., description="Original filename")
+    content_type: str = Field(..., description="MIME type")
+    size_bytes: int = Field(..., description="File size in bytes")
+    download_url: str = Field(..., description="Presigned GET URL for download")
+
+
+class AttachmentUrlsResponse(BaseModel):
+    """Presigned download URLs for several attachments."""
+
+    items: list[AttachmentUrl] = Field(
+        ..., description="URLs for the requested attachments that exist, in request order"
+    )
+    expires_in: int = Field(..., description="Seconds the URLs are valid for, at least")
 
 
 class DocumentImageCreate(BaseModel):
@@ -76,12 +120,25 @@ class DocumentImageCreate(BaseModel):
     document_id: UUID | None = Field(
         None, description="Optional document ID to associate with"
     )
+    sha256: str | None = Field(
+        None,
+        pattern=r"^[0-9a-f]{64}$",
+        description="Hex SHA-256 of the content; enables reuse of an identical upload",
+    )
 
 
 class DocumentImageUploadResponse(BaseModel):
     """Response for document image upload."""
 
     id: str = Field(..., description="Attachment ID")
-    upload_url: str = Field(..., description="Presigned PUT URL for direct upload")
+    upload_url: str | None = Field(
+        ..., description="Presigned PUT URL for direct upload (None if deduplicated)"
+    )
+    upload_headers: dict[str, str] = Field(
+        default_factory=dict, description="Headers the PUT to upload_url must send"
+    )
+    deduplicated: bool = Field(
+        default=False, description="Identical content is already stored; skip the upload"
+    )
     image_url: str = Field(..., description="URL to use in markdown after upload")
     expires_in: int = Field(default=600, description="Upload URL expiration in seconds")
@@ -33,9 +33,13 @@ class AuditLogListResponse(BaseModel):
     """Paginated response for audit log list."""
 
     items: list[AuditLogEntry]
-    total: int = Field(..., description="Total number of audit log entries matching the query")
+    total: int | None = Field(
+        ..., description="Total number of audit log entries matching the query (None when not counted)"
+    )
     page: int = Field(..., description="Current page number (1-indexed)")
     page_size: int = Field(..., description="Number of items per page")
+    total_is_estimate: bool = Field(default=False, description="Whether total is a planner estimate")
+    next_cursor: str | None = Field(default=None, description="Cursor for the next page, None on the last page")
 
 
 class AuditLogFilters(BaseModel):
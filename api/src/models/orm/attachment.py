@@ -2,6 +2,10 @@
 Attachment ORM model.
 
 Represents file attachments linked to various entities in Bifrost Docs.
+
+Uploads with a known SHA-256 are content-addressed within an organization:
+attachments with the same content share one S3 object (s3_key), and the
+object is deleted only when the last attachment referencing it goes away.
 """
 
 from datetime import UTC, datetime
@@ -34,7 +38,10 @@ class Attachment(Base):
     )
     entity_id: Mapped[UUID] = mapped_column(nullable=False)
     filename: Mapped[str] = mapped_column(String(255), nullable=False)
-    s3_key: Mapped[str] = mapped_column(String(1024), nullable=False, unique=True)
+    # Shared by every attachment in the organization with the same content_hash
+    s3_key: Mapped[str] = mapped_column(String(1024), nullable=False)
+    # Hex SHA-256 of the content, when the uploader supplied it
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
     content_type: Mapped[str] = mapped_column(String(255), nullable=False)
     size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
@@ -50,4 +57,5 @@ class Attachment(Base):
         Index("ix_attachments_organization_id", "organization_id"),
         Index("ix_attachments_entity", "organization_id", "entity_type", "entity_id"),
         Index("ix_attachments_s3_key", "s3_key"),
+        Index("ix_attachments_content_hash", "organization_id", "content_hash"),
     )
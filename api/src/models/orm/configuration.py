@@ -8,8 +8,8 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text, text
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Boolean, Computed, DateTime, ForeignKey, Index, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.orm.base import Base
@@ -48,6 +48,20 @@ class Configuration(Base):
     ip_address: Mapped[str | None] = mapped_column(String(45), nullable=True)  # IPv6 max
     mac_address: Mapped[str | None] = mapped_column(String(17), nullable=True)  # XX:XX:XX:XX:XX:XX
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Full-text search vector maintained by Postgres (see text_search)
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(serial_number, '') || ' ' || "
+            "coalesce(asset_tag, '') || ' ' || coalesce(manufacturer, '') || ' ' || "
+            "coalesce(model, '') || ' ' || coalesce(ip_address, '') || ' ' || "
+            "coalesce(mac_address, '')), 'B') || "
+            "setweight(to_tsvector('simple', coalesce(notes, '')), 'C')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(UTC),
@@ -85,4 +99,13 @@ class Configuration(Base):
         Index("ix_configurations_configuration_type_id", "configuration_type_id"),
         Index("ix_configurations_configuration_status_id", "configuration_status_id"),
         Index("ix_configurations_name", "name"),
+        # Keyset pagination of an organization's list, sorted by name
+        Index("ix_configurations_organization_name", "organization_id", "name", "id"),
+        Index("ix_configurations_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_configurations_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
     )
@@ -69,4 +69,6 @@ class CustomAsset(Base):
     __table_args__ = (
         Index("ix_custom_assets_organization_id", "organization_id"),
         Index("ix_custom_assets_custom_asset_type_id", "custom_asset_type_id"),
+        # Keyset pagination of a type's list within an organization
+        Index("ix_custom_assets_type_organization", "custom_asset_type_id", "organization_id", "id"),
     )
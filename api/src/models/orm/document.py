@@ -9,8 +9,8 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text, text
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Boolean, Computed, DateTime, ForeignKey, Index, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.orm.base import Base
@@ -38,6 +38,17 @@ class Document(Base):
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    # Full-text search vector maintained by Postgres (see text_search)
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(path, '')), 'B') || "
+            "setweight(to_tsvector('simple', left(coalesce(content, ''), 500000)), 'C')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(UTC),
@@ -65,4 +76,13 @@ class Document(Base):
         Index("ix_documents_organization_id", "organization_id"),
         Index("ix_documents_organization_path", "organization_id", "path"),
         Index("ix_documents_name", "name"),
+        # Keyset pagination of an organization's list, sorted by name
+        Index("ix_documents_organization_name", "organization_id", "name", "id"),
+        Index("ix_documents_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_documents_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
     )
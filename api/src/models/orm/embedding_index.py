@@ -10,7 +10,8 @@ from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import DateTime, ForeignKey, Index, String, Text, UniqueConstraint, text
+from sqlalchemy import Computed, DateTime, ForeignKey, Index, String, Text, UniqueConstraint, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.orm.base import Base
@@ -52,6 +53,12 @@ class EmbeddingIndex(Base):
         nullable=False,
         comment="The text that was embedded",
     )
+    # Full-text search vector maintained by Postgres (used for custom asset text search)
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('simple', left(searchable_text, 500000))", persisted=True),
+        deferred=True,
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(UTC),
@@ -74,6 +81,8 @@ class EmbeddingIndex(Base):
         Index("ix_embedding_index_organization_id", "organization_id"),
         # Index for filtering by entity type
         Index("ix_embedding_index_entity_type", "entity_type"),
+        # GIN index for full-text search over searchable_text
+        Index("ix_embedding_index_search_vector", "search_vector", postgresql_using="gin"),
         # Note: Vector index for similarity search is created in migration
-        # using ivfflat operator class for cosine distance
+        # using an HNSW index with the cosine distance operator class
     )
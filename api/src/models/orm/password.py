@@ -8,8 +8,8 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text, text
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Boolean, Computed, DateTime, ForeignKey, Index, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.orm.base import Base
@@ -33,6 +33,17 @@ class Password(Base):
     totp_secret_encrypted: Mapped[str | None] = mapped_column(Text, nullable=True)
     url: Mapped[str | None] = mapped_column(String(2048), nullable=True)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Full-text search vector maintained by Postgres (see text_search)
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(username, '') || ' ' || coalesce(url, '')), 'B') || "
+            "setweight(to_tsvector('simple', coalesce(notes, '')), 'C')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(UTC),
@@ -59,4 +70,13 @@ class Password(Base):
     __table_args__ = (
         Index("ix_passwords_organization_id", "organization_id"),
         Index("ix_passwords_name", "name"),
+        # Keyset pagination of an organization's list, sorted by name
+        Index("ix_passwords_organization_name", "organization_id", "name", "id"),
+        Index("ix_passwords_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_passwords_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
     )
@@ -3,11 +3,17 @@ Attachment Repository
 
 Provides database operations for Attachment model.
 Organization-scoped for multi-tenancy.
+
+Attachments with the same content hash share an S3 object, so an object may
+only be deleted once no attachment references its s3_key. Callers that
+reuse or release a shared object hold lock_content() for the hash until
+their transaction ends, so a new reference can't be added to an object
+that is being deleted.
 """
 
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.enums import EntityType
@@ -44,6 +50,84 @@ class AttachmentRepository(BaseRepository[Attachment]):
         )
         return result.scalar_one_or_none()
 
+    async def get_by_ids_and_org(
+        self, ids: list[UUID], organization_id: UUID
+    ) -> list[Attachment]:
+        """
+        Get several attachments by ID, scoped to organization.
+
+        Args:
+            ids: Attachment UUIDs
+            organization_id: Organization UUID for scoping
+
+        Returns:
+            Attachments found (unordered; missing IDs are skipped)
+        """
+        result = await self.session.execute(
+            select(Attachment).where(
+                Attachment.id.in_(ids),
+                Attachment.organization_id == organization_id,
+            )
+        )
+        return list(result.scalars().all())
+
+    async def lock_content(self, organization_id: UUID, content_hash: str) -> None:
+        """
+        Take a transaction-scoped lock on an organization's content hash.
+
+        Args:
+            organization_id: Organization UUID
+            content_hash: Hex SHA-256 of the content
+        """
+        await self.session.execute(
+            text("SELECT pg_advisory_xact_lock(hashtextextended(:key, 0))"),
+            {"key": f"attachment:{organization_id}:{content_hash}"},
+        )
+
+    async def get_by_content_hash(
+        self, organization_id: UUID, content_hash: str, size_bytes: int
+    ) -> Attachment | None:
+        """
+        Get the newest attachment in an organization with the given content.
+
+        Args:
+            organization_id: Organization UUID for scoping
+            content_hash: Hex SHA-256 of the content
+            size_bytes: Content size (must match as well as the hash)
+
+        Returns:
+            Attachment or None if no attachment has this content
+        """
+        result = await self.session.execute(
+            select(Attachment)
+            .where(
+                Attachment.organization_id == organization_id,
+                Attachment.content_hash == content_hash,
+                Attachment.size_bytes == size_bytes,
+            )
+            .order_by(Attachment.created_at.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def unreferenced_s3_keys(self, s3_keys: list[str]) -> list[str]:
+        """
+        Filter S3 keys down to those no attachment references any more.
+
+        Args:
+            s3_keys: S3 keys of deleted attachments
+
+        Returns:
+            Keys whose S3 objects can be deleted
+        """
+        if not s3_keys:
+            return []
+        result = await self.session.execute(
+            select(Attachment.s3_key).where(Attachment.s3_key.in_(s3_keys)).distinct()
+        )
+        referenced = set(result.scalars().all())
+        return [key for key in dict.fromkeys(s3_keys) if key not in referenced]
+
     async def get_by_entity(
         self,
         organization_id: UUID,
@@ -135,16 +219,19 @@ class AttachmentRepository(BaseRepository[Attachment]):
 
     async def get_by_s3_key(self, s3_key: str) -> Attachment | None:
         """
-        Get attachment by S3 key.
+        Get an attachment by S3 key.
 
         Args:
             s3_key: S3 storage key
 
         Returns:
-            Attachment or None if not found
+            Oldest attachment referencing the key, or None if not found
         """
         result = await self.session.execute(
-            select(Attachment).where(Attachment.s3_key == s3_key)
+            select(Attachment)
+            .where(Attachment.s3_key == s3_key)
+            .order_by(Attachment.created_at)
+            .limit(1)
         )
         return result.scalar_one_or_none()
 
@@ -165,7 +252,7 @@ class AttachmentRepository(BaseRepository[Attachment]):
             entity_id: Entity UUID
 
         Returns:
-            List of S3 keys that were deleted (for S3 cleanup)
+            S3 keys no longer referenced by any attachment (for S3 cleanup)
         """
         # Get all attachments first to collect S3 keys
         attachments = await self.get_by_entity(
@@ -174,13 +261,16 @@ class AttachmentRepository(BaseRepository[Attachment]):
 
         s3_keys = [att.s3_key for att in attachments]
 
+        for content_hash in sorted({att.content_hash for att in attachments if att.content_hash}):
+            await self.lock_content(organization_id, content_hash)
+
         # Delete from database
         for attachment in attachments:
             await self.session.delete(attachment)
 
         await self.session.flush()
 
-        return s3_keys
+        return await self.unreferenced_s3_keys(s3_keys)
 
     async def calculate_storage_for_org(self, organization_id: UUID) -> int:
         """
@@ -14,6 +14,7 @@ from sqlalchemy.orm import joinedload
 from src.models.orm.audit_log import AuditLog
 from src.models.orm.organization import Organization
 from src.models.orm.user import User
+from src.repositories.pagination import CountMode, Page, paginate
 
 
 class AuditRepository:
@@ -36,7 +37,9 @@ class AuditRepository:
         page: int = 1,
         page_size: int = 50,
         include_system: bool = True,
-    ) -> tuple[list[AuditLog], int]:
+        cursor: str | None = None,
+        count: CountMode = "exact",
+    ) -> Page[AuditLog]:
         """
         Get paginated audit logs with filters.
 
@@ -52,9 +55,11 @@ class AuditRepository:
             page: Page number (1-indexed)
             page_size: Items per page
             include_system: Include system-level events (org_id is NULL)
+            cursor: Cursor from a previous page (replaces page)
+            count: Total to compute: "exact", "estimated" or "none"
 
         Returns:
-            Tuple of (audit logs, total count)
+            Page of audit logs, newest first
         """
         filters = []
 
@@ -117,30 +122,31 @@ class AuditRepository:
             count_stmt = count_stmt.where(*filters)
         if search_filter is not None:
             count_stmt = count_stmt.where(search_filter)
-        count_result = await self.session.execute(count_stmt)
-        total = count_result.scalar_one()
 
         # Data query with eager loading
-        stmt = (
-            base_query
-            .options(
-                joinedload(AuditLog.organization),
-                joinedload(AuditLog.actor_user),
-                joinedload(AuditLog.actor_api_key),
-            )
-            .order_by(AuditLog.created_at.desc())
-            .offset((page - 1) * page_size)
-            .limit(page_size)
+        stmt = base_query.options(
+            joinedload(AuditLog.organization),
+            joinedload(AuditLog.actor_user),
+            joinedload(AuditLog.actor_api_key),
         )
         if filters:
             stmt = stmt.where(*filters)
         if search_filter is not None:
             stmt = stmt.where(search_filter)
 
-        result = await self.session.execute(stmt)
-        logs = list(result.scalars().unique().all())
-
-        return logs, total
+        return await paginate(
+            self.session,
+            stmt,
+            count_stmt,
+            sort_key="created_at",
+            sort_column=AuditLog.created_at,
+            id_column=AuditLog.id,
+            sort_dir="desc",
+            limit=page_size,
+            offset=(page - 1) * page_size,
+            cursor=cursor,
+            count=count,
+        )
 
     async def delete_older_than(self, cutoff: datetime) -> int:
         """
@@ -8,11 +8,12 @@ Uses SQLAlchemy async session for all operations.
 from typing import Any, Generic, TypeVar
 from uuid import UUID
 
-from sqlalchemy import asc, desc, func, or_, select
+from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.elements import ColumnElement
 
 from src.models.orm.base import Base
+from src.repositories.pagination import CountMode, Page, paginate
 
 ModelT = TypeVar("ModelT", bound=Base)
 
@@ -26,6 +27,12 @@ class BaseRepository(Generic[ModelT]):
 
     model: type[ModelT]
 
+    # Columns get_paginated may sort by, besides id; any other sort_by uses
+    # DEFAULT_SORT. The sort value is echoed in next_cursor, so never list
+    # secrets here.
+    SORT_COLUMNS: list[str] = []
+    DEFAULT_SORT = "id"
+
     def __init__(self, session: AsyncSession):
         """
         Initialize repository with database session.
@@ -137,22 +144,29 @@ class BaseRepository(Generic[ModelT]):
         limit: int = 100,
         offset: int = 0,
         options: list[Any] | None = None,
-    ) -> tuple[list[ModelT], int]:
+        cursor: str | None = None,
+        count: CountMode = "exact",
+    ) -> Page[ModelT]:
         """
         Get paginated results with optional search and sorting.
 
+        Results are ordered by sort_by then id. Pass the previous page's
+        next_cursor as cursor to page by keyset instead of offset.
+
         Args:
             filters: List of SQLAlchemy filter conditions
             search_columns: List of column names to search in
             search_term: Search term to match against search_columns
-            sort_by: Column name to sort by
+            sort_by: Column name to sort by (columns not in SORT_COLUMNS sort by DEFAULT_SORT)
             sort_dir: Sort direction ("asc" or "desc")
             limit: Maximum number of results
-            offset: Number of results to skip
+            offset: Number of results to skip (ignored when cursor is given)
             options: SQLAlchemy options (e.g., joinedload)
+            cursor: Cursor from a previous page
+            count: Total to compute: "exact", "estimated" or "none"
 
         Returns:
-            Tuple of (list of entities, total count)
+            Page of entities
         """
         query = select(self.model)
         count_query = select(func.count(self.model.id))  # type: ignore[attr-defined]
@@ -180,19 +194,20 @@ class BaseRepository(Generic[ModelT]):
                 query = query.where(combined)
                 count_query = count_query.where(combined)
 
-        # Apply sorting
-        if sort_by and hasattr(self.model, sort_by):
-            order_func = desc if sort_dir == "desc" else asc
-            query = query.order_by(order_func(getattr(self.model, sort_by)))
-
-        # Get total count before pagination
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar() or 0
-
-        # Apply pagination
-        query = query.limit(limit).offset(offset)
-
-        result = await self.session.execute(query)
-        items = list(result.unique().scalars().all())
-
-        return items, total
+        # Resolve sorting against the allow-list; id doubles as the tiebreaker
+        if sort_by not in ("id", *self.SORT_COLUMNS):
+            sort_by = self.DEFAULT_SORT
+
+        return await paginate(
+            self.session,
+            query,
+            count_query,
+            sort_key=sort_by,
+            sort_column=getattr(self.model, sort_by),
+            id_column=self.model.id,  # type: ignore[attr-defined]
+            sort_dir=sort_dir,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count=count,
+        )
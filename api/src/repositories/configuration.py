@@ -13,6 +13,7 @@ from sqlalchemy.orm import joinedload, selectinload
 
 from src.models.orm.configuration import Configuration
 from src.repositories.base import BaseRepository
+from src.repositories.pagination import CountMode, Page
 
 
 class ConfigurationRepository(BaseRepository[Configuration]):
@@ -31,6 +32,21 @@ class ConfigurationRepository(BaseRepository[Configuration]):
         "notes",
     ]
 
+    # Columns the list endpoints can sort by
+    SORT_COLUMNS = [
+        "name",
+        "serial_number",
+        "asset_tag",
+        "manufacturer",
+        "model",
+        "ip_address",
+        "mac_address",
+        "created_at",
+        "updated_at",
+        "is_enabled",
+    ]
+    DEFAULT_SORT = "name"
+
     def __init__(self, session: AsyncSession):
         super().__init__(session)
 
@@ -46,7 +62,9 @@ class ConfigurationRepository(BaseRepository[Configuration]):
         limit: int = 100,
         offset: int = 0,
         is_enabled: bool | None = None,
-    ) -> tuple[list[Configuration], int]:
+        cursor: str | None = None,
+        count: CountMode = "exact",
+    ) -> Page[Configuration]:
         """
         Get paginated configurations for an organization with filtering, search and sorting.
 
@@ -60,9 +78,11 @@ class ConfigurationRepository(BaseRepository[Configuration]):
             limit: Maximum number of results
             offset: Number of results to skip
             is_enabled: Filter by is_enabled status (None = no filter)
+            cursor: Cursor from a previous page (replaces offset)
+            count: Total to compute: "exact", "estimated" or "none"
 
         Returns:
-            Tuple of (list of configurations, total count)
+            Page of configurations
         """
         filters = [Configuration.organization_id == organization_id]
 
@@ -79,7 +99,7 @@ class ConfigurationRepository(BaseRepository[Configuration]):
             filters=filters,
             search_columns=self.SEARCH_COLUMNS,
             search_term=search,
-            sort_by=sort_by or "name",  # Default sort by name
+            sort_by=sort_by,
             sort_dir=sort_dir,
             limit=limit,
             offset=offset,
@@ -88,6 +108,8 @@ class ConfigurationRepository(BaseRepository[Configuration]):
                 joinedload(Configuration.configuration_status),
                 selectinload(Configuration.updated_by_user),
             ],
+            cursor=cursor,
+            count=count,
         )
 
     async def get_by_id_for_org(
@@ -203,6 +225,29 @@ class ConfigurationRepository(BaseRepository[Configuration]):
             return True
         return False
 
+    async def count_by_type(self, organization_id: UUID | None = None) -> dict[UUID, int]:
+        """
+        Count configurations per configuration type in one grouped query.
+
+        Args:
+            organization_id: Organization UUID, or None to count across all organizations
+
+        Returns:
+            Mapping of ConfigurationType UUID to count (types without configurations are absent)
+        """
+        from sqlalchemy import func
+
+        stmt = (
+            select(Configuration.configuration_type_id, func.count(Configuration.id))
+            .where(Configuration.configuration_type_id.is_not(None))
+            .group_by(Configuration.configuration_type_id)
+        )
+        if organization_id is not None:
+            stmt = stmt.where(Configuration.organization_id == organization_id)
+
+        result = await self.session.execute(stmt)
+        return {type_id: count for type_id, count in result.tuples().all() if type_id is not None}
+
     async def count_by_type_and_organization(
         self,
         configuration_type_id: UUID,
@@ -4,14 +4,32 @@ Custom Asset Repository.
 Provides database operations for CustomAsset model, scoped to organizations.
 """
 
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.elements import ColumnElement
 
 from src.models.orm.custom_asset import CustomAsset
 from src.repositories.base import BaseRepository
+from src.repositories.pagination import CountMode, Page, SortColumn, paginate
+
+
+def field_text(key: str) -> ColumnElement[str]:
+    """
+    values ->> key with the key inlined as a constant.
+
+    Postgres only uses the per-type field indexes (see
+    services/custom_asset_indexes.py) when the key is a constant in the query.
+    """
+    return CustomAsset.values[literal(key, literal_execute=True)].astext
+
+
+def type_filter(custom_asset_type_id: UUID) -> ColumnElement[bool]:
+    """Type predicate with the ID inlined, so partial per-type indexes match."""
+    return CustomAsset.custom_asset_type_id == literal(custom_asset_type_id, literal_execute=True)
 
 
 class CustomAssetRepository(BaseRepository[CustomAsset]):
@@ -19,6 +37,9 @@ class CustomAssetRepository(BaseRepository[CustomAsset]):
 
     model = CustomAsset
 
+    # Columns the list endpoints can sort by, besides "values.<key>" fields
+    SORT_COLUMNS = ["created_at", "updated_at", "is_enabled"]
+
     def __init__(self, session: AsyncSession):
         super().__init__(session)
 
@@ -34,7 +55,9 @@ class CustomAssetRepository(BaseRepository[CustomAsset]):
         limit: int = 100,
         offset: int = 0,
         is_enabled: bool | None = None,
-    ) -> tuple[list[CustomAsset], int]:
+        cursor: str | None = None,
+        count: CountMode = "exact",
+    ) -> Page[CustomAsset]:
         """
         Get paginated custom assets for a type within an organization with search and sorting.
 
@@ -50,18 +73,74 @@ class CustomAssetRepository(BaseRepository[CustomAsset]):
             limit: Maximum number of results
             offset: Number of results to skip
             is_enabled: Filter by is_enabled status (None = no filter)
+            cursor: Cursor from a previous page (replaces offset)
+            count: Total to compute: "exact", "estimated" or "none"
+
+        Returns:
+            Page of custom assets
+        """
+        return await self.get_paginated_by_type(
+            custom_asset_type_id,
+            organization_id=organization_id,
+            search=search,
+            search_field_key=search_field_key,
+            sort_by=sort_by,
+            sort_dir=sort_dir,
+            limit=limit,
+            offset=offset,
+            is_enabled=is_enabled,
+            cursor=cursor,
+            count=count,
+            options=[selectinload(CustomAsset.updated_by_user)],
+        )
+
+    async def get_paginated_by_type(
+        self,
+        custom_asset_type_id: UUID,
+        *,
+        organization_id: UUID | None = None,
+        search: str | None = None,
+        search_field_key: str | None = None,
+        sort_by: str | None = None,
+        sort_dir: str = "asc",
+        limit: int = 100,
+        offset: int = 0,
+        is_enabled: bool | None = None,
+        cursor: str | None = None,
+        count: CountMode = "exact",
+        options: list[Any] | None = None,
+    ) -> Page[CustomAsset]:
+        """
+        Get paginated custom assets for a type, optionally scoped to an organization.
+
+        Args:
+            custom_asset_type_id: CustomAssetType UUID
+            organization_id: Organization UUID (None = all organizations)
+            search: Optional search term
+            search_field_key: Key within values JSONB to search (e.g., "name", "title")
+            sort_by: Column to sort by (or JSONB key with "values." prefix)
+            sort_dir: Sort direction ("asc" or "desc")
+            limit: Maximum number of results
+            offset: Number of results to skip
+            is_enabled: Filter by is_enabled status (None = no filter)
+            cursor: Cursor from a previous page (replaces offset)
+            count: Total to compute: "exact", "estimated" or "none"
+            options: SQLAlchemy options (e.g., joinedload)
 
         Returns:
-            Tuple of (list of custom assets, total count)
+            Page of custom assets
         """
-        query = select(CustomAsset).options(selectinload(CustomAsset.updated_by_user))
+        query = select(CustomAsset)
         count_query = select(func.count(CustomAsset.id))
 
+        if options:
+            query = query.options(*options)
+
         # Base filters
-        base_filter = [
-            CustomAsset.custom_asset_type_id == custom_asset_type_id,
-            CustomAsset.organization_id == organization_id,
-        ]
+        base_filter = [type_filter(custom_asset_type_id)]
+
+        if organization_id is not None:
+            base_filter.append(CustomAsset.organization_id == organization_id)
 
         if is_enabled is not None:
             base_filter.append(CustomAsset.is_enabled == is_enabled)
@@ -73,34 +152,35 @@ class CustomAssetRepository(BaseRepository[CustomAsset]):
         # Search within JSONB values field
         if search and search_field_key:
             # Use JSONB ->> operator to extract text and perform case-insensitive search
-            search_condition = CustomAsset.values[search_field_key].astext.ilike(f"%{search}%")
+            search_condition = field_text(search_field_key).ilike(f"%{search}%")
             query = query.where(search_condition)
             count_query = count_query.where(search_condition)
 
-        # Sort by JSONB field if sort_by starts with "values."
-        if sort_by:
-            if sort_by.startswith("values."):
-                jsonb_key = sort_by[7:]  # Remove "values." prefix
-                if sort_dir == "desc":
-                    query = query.order_by(CustomAsset.values[jsonb_key].astext.desc())
-                else:
-                    query = query.order_by(CustomAsset.values[jsonb_key].astext.asc())
-            elif hasattr(CustomAsset, sort_by):
-                from sqlalchemy import asc, desc
-                order_func = desc if sort_dir == "desc" else asc
-                query = query.order_by(order_func(getattr(CustomAsset, sort_by)))
-
-        # Get total count
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar() or 0
-
-        # Apply pagination
-        query = query.limit(limit).offset(offset)
-
-        result = await self.session.execute(query)
-        items = list(result.scalars().all())
-
-        return items, total
+        # Sort by JSONB field if sort_by starts with "values.", otherwise by column;
+        # unknown or missing sorts fall back to id. Password and totp fields are
+        # stored as "<key>_encrypted" and must not reach next_cursor.
+        sort_column: SortColumn
+        if sort_by and sort_by.startswith("values.") and not sort_by.endswith("_encrypted"):
+            sort_column = field_text(sort_by[7:])
+        elif sort_by in self.SORT_COLUMNS:
+            sort_column = getattr(CustomAsset, sort_by)
+        else:
+            sort_by = "id"
+            sort_column = CustomAsset.id
+
+        return await paginate(
+            self.session,
+            query,
+            count_query,
+            sort_key=sort_by,
+            sort_column=sort_column,
+            id_column=CustomAsset.id,
+            sort_dir=sort_dir,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count=count,
+        )
 
     async def get_by_id_and_org(
         self, id: UUID, organization_id: UUID
@@ -210,6 +290,25 @@ class CustomAssetRepository(BaseRepository[CustomAsset]):
         )
         return list(result.scalars().all())
 
+    async def count_by_type(self, organization_id: UUID | None = None) -> dict[UUID, int]:
+        """
+        Count custom assets per custom asset type in one grouped query.
+
+        Args:
+            organization_id: Organization UUID, or None to count across all organizations
+
+        Returns:
+            Mapping of CustomAssetType UUID to count (types without assets are absent)
+        """
+        stmt = select(CustomAsset.custom_asset_type_id, func.count(CustomAsset.id)).group_by(
+            CustomAsset.custom_asset_type_id
+        )
+        if organization_id is not None:
+            stmt = stmt.where(CustomAsset.organization_id == organization_id)
+
+        result = await self.session.execute(stmt)
+        return dict(result.tuples().all())
+
     async def count_by_type_and_organization(
         self,
         custom_asset_type_id: UUID,
@@ -258,11 +357,11 @@ class CustomAssetRepository(BaseRepository[CustomAsset]):
         """
         query = select(CustomAsset).where(
             CustomAsset.organization_id == organization_id,
-            CustomAsset.values[field_key].astext.ilike(f"%{search_term}%"),
+            field_text(field_key).ilike(f"%{search_term}%"),
         )
 
         if custom_asset_type_id:
-            query = query.where(CustomAsset.custom_asset_type_id == custom_asset_type_id)
+            query = query.where(type_filter(custom_asset_type_id))
 
         query = query.order_by(CustomAsset.created_at.desc()).limit(limit)
 
@@ -13,6 +13,7 @@ from sqlalchemy.orm import selectinload
 
 from src.models.orm.document import Document
 from src.repositories.base import BaseRepository
+from src.repositories.pagination import CountMode, Page
 
 
 class DocumentRepository(BaseRepository[Document]):
@@ -23,6 +24,10 @@ class DocumentRepository(BaseRepository[Document]):
     # Columns to search in for text search
     SEARCH_COLUMNS = ["name", "path", "content"]
 
+    # Columns the list endpoints can sort by
+    SORT_COLUMNS = ["name", "path", "created_at", "updated_at", "is_enabled"]
+    DEFAULT_SORT = "name"
+
     def __init__(self, session: AsyncSession):
         super().__init__(session)
 
@@ -37,7 +42,9 @@ class DocumentRepository(BaseRepository[Document]):
         limit: int = 100,
         offset: int = 0,
         is_enabled: bool | None = None,
-    ) -> tuple[list[Document], int]:
+        cursor: str | None = None,
+        count: CountMode = "exact",
+    ) -> Page[Document]:
         """
         Get paginated documents for an organization with optional path filter, search and sorting.
 
@@ -50,9 +57,11 @@ class DocumentRepository(BaseRepository[Document]):
             limit: Maximum number of results
             offset: Number of results to skip
             is_enabled: Filter by is_enabled status (None = no filter)
+            cursor: Cursor from a previous page (replaces offset)
+            count: Total to compute: "exact", "estimated" or "none"
 
         Returns:
-            Tuple of (list of documents, total count)
+            Page of documents
         """
         filters = [Document.organization_id == organization_id]
 
@@ -66,11 +75,13 @@ class DocumentRepository(BaseRepository[Document]):
             filters=filters,
             search_columns=self.SEARCH_COLUMNS,
             search_term=search,
-            sort_by=sort_by or "name",  # Default sort by name
+            sort_by=sort_by,
             sort_dir=sort_dir,
             limit=limit,
             offset=offset,
             options=[selectinload(Document.updated_by_user)],
+            cursor=cursor,
+            count=count,
         )
 
     async def get_by_id_and_org(
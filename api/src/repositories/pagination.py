@@ -0,0 +1,284 @@
+"""
+Pagination helpers shared by repositories.
+
+List queries can page two ways:
+
+- Offset: LIMIT/OFFSET, as the list endpoints have always done. Deep pages
+  get slower because Postgres still walks every skipped row.
+- Keyset (cursor): each page ends with an opaque cursor holding the last
+  row's sort value and id; the next page starts with a WHERE on
+  (sort column, id), so every page costs the same as the first.
+
+Totals are optional. "exact" runs COUNT(*), "estimated" uses the planner's
+row estimate (from table statistics, so it is cheap but approximate) and
+"none" skips counting entirely.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Generic, Literal, TypeVar
+from uuid import UUID
+
+from sqlalchemy import and_, asc, desc, literal_column, or_, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import QueryableAttribute
+from sqlalchemy.sql.elements import ClauseElement, ColumnElement
+from sqlalchemy.sql.expression import Executable
+from sqlalchemy.sql.selectable import Select
+
+T = TypeVar("T")
+
+CountMode = Literal["exact", "estimated", "none"]
+
+# A mapped attribute (Password.name) or any SQL expression
+SortColumn = ColumnElement[Any] | QueryableAttribute[Any]
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of list results."""
+
+    items: list[T]
+    # None when counting was skipped (count mode "none")
+    total: int | None
+    total_is_estimate: bool = False
+    # Cursor for the following page, None on the last page
+    next_cursor: str | None = None
+
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) wrapper that keeps the statement's bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select[Any]):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Cannot encode {type(value).__name__} in a cursor")
+
+
+def encode_cursor(sort_key: str, sort_dir: str, value: Any, id: Any) -> str:
+    """
+    Encode the position after a row as an opaque cursor.
+
+    Args:
+        sort_key: Sort the page was ordered by (checked when decoding)
+        sort_dir: Sort direction ("asc" or "desc")
+        value: The row's sort column value
+        id: The row's id (tiebreaker)
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps(
+        {"s": sort_key, "d": sort_dir, "v": value, "id": id},
+        default=_json_default,
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_key: str, sort_dir: str) -> tuple[Any, Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page
+        sort_key: Sort the current request is ordered by
+        sort_dir: Sort direction of the current request
+
+    Returns:
+        Tuple of (sort value, id) as JSON values
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for a different sort
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        value, id = payload["v"], payload["id"]
+        issued_for = (payload["s"], payload["d"])
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+    if issued_for != (sort_key, sort_dir):
+        raise ValueError("Pagination cursor does not match the requested sort order")
+    return value, id
+
+
+def _coerce(column: SortColumn, value: Any) -> Any:
+    """Convert a JSON cursor value back to the column's Python type."""
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    try:
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        if python_type is date:
+            return date.fromisoformat(value)
+        if python_type is UUID:
+            return UUID(value)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+    return value
+
+
+def _is_nullable(column: SortColumn) -> bool:
+    return getattr(getattr(column, "expression", column), "nullable", True)
+
+
+def keyset_condition(
+    sort_column: SortColumn,
+    id_column: SortColumn,
+    sort_dir: str,
+    value: Any,
+    id: Any,
+) -> ColumnElement[bool]:
+    """
+    Build the WHERE clause selecting rows after (value, id).
+
+    Matches ORDER BY sort_column <dir>, id_column <dir> with Postgres' default
+    NULL placement (last when ascending, first when descending).
+    """
+    after = (lambda a, b: a < b) if sort_dir == "desc" else (lambda a, b: a > b)
+
+    if not _is_nullable(sort_column):
+        # Row comparison can be answered straight from a (sort, id) index
+        return after(tuple_(sort_column, id_column), tuple_(value, id))
+
+    if value is None:
+        tail = and_(sort_column.is_(None), after(id_column, id))
+        # Descending: NULLs came first, every non-NULL row is still ahead
+        return or_(tail, sort_column.is_not(None)) if sort_dir == "desc" else tail
+
+    ahead = or_(after(sort_column, value), and_(sort_column == value, after(id_column, id)))
+    # Ascending: NULLs sort last, so they are all still ahead
+    return or_(ahead, sort_column.is_(None)) if sort_dir == "asc" else ahead
+
+
+async def count_rows(
+    session: AsyncSession, count_query: Select[Any], mode: CountMode
+) -> tuple[int | None, bool]:
+    """
+    Count the rows matched by a list query.
+
+    Args:
+        session: Database session
+        count_query: SELECT count(...) with the list query's filters
+        mode: "exact", "estimated" or "none"
+
+    Returns:
+        Tuple of (total or None, whether the total is an estimate)
+    """
+    if mode == "none":
+        return None, False
+
+    if mode == "estimated":
+        # Plain rows rather than the aggregate, whose plan may be split
+        # across parallel workers that each report only their share
+        rows_query = count_query.with_only_columns(literal_column("1"), maintain_column_froms=True)
+        result = await session.execute(_Explain(rows_query))
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"]), True
+
+    result = await session.execute(count_query)
+    return result.scalar() or 0, False
+
+
+async def paginate(
+    session: AsyncSession,
+    query: Select[Any],
+    count_query: Select[Any],
+    *,
+    sort_key: str,
+    sort_column: SortColumn,
+    id_column: SortColumn,
+    sort_dir: str = "asc",
+    limit: int = 100,
+    offset: int = 0,
+    cursor: str | None = None,
+    count: CountMode = "exact",
+) -> Page[Any]:
+    """
+    Order, page and count a list query.
+
+    Rows are ordered by sort_column then id_column so pages are stable when
+    sort values tie. When cursor is given the page starts after it and offset
+    is ignored.
+
+    Args:
+        session: Database session
+        query: Filtered SELECT of the entity, without ORDER BY or LIMIT
+        count_query: SELECT count(...) with the same filters
+        sort_key: Name of the sort, stored in cursors
+        sort_column: Column (or expression) to sort by
+        id_column: Unique column used as the tiebreaker
+        sort_dir: Sort direction ("asc" or "desc")
+        limit: Maximum number of results
+        offset: Number of results to skip (offset paging only)
+        cursor: next_cursor from the previous page (keyset paging)
+        count: How to compute the total
+
+    Returns:
+        Page of entities
+    """
+    order_func = desc if sort_dir == "desc" else asc
+
+    if cursor:
+        value, id = decode_cursor(cursor, sort_key, sort_dir)
+        query = query.where(
+            keyset_condition(
+                sort_column,
+                id_column,
+                sort_dir,
+                _coerce(sort_column, value),
+                _coerce(id_column, id),
+            )
+        )
+        offset = 0
+
+    total, total_is_estimate = await count_rows(session, count_query, count)
+
+    # Select the sort value alongside each entity so the cursor holds exactly
+    # what the database compared, and fetch one extra row to detect a next page
+    query = (
+        query.add_columns(sort_column, id_column)
+        .order_by(order_func(sort_column), order_func(id_column))
+        .limit(limit + 1)
+        .offset(offset)
+    )
+    result = await session.execute(query)
+    rows = result.unique().all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        _, last_value, last_id = tuple(rows[-1])
+        next_cursor = encode_cursor(sort_key, sort_dir, last_value, last_id)
+
+    return Page(
+        items=[row[0] for row in rows],
+        total=total,
+        total_is_estimate=total_is_estimate,
+        next_cursor=next_cursor,
+    )
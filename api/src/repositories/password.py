@@ -12,6 +12,7 @@ from sqlalchemy.orm import selectinload
 
 from src.models.orm.password import Password
 from src.repositories.base import BaseRepository
+from src.repositories.pagination import CountMode, Page
 
 
 class PasswordRepository(BaseRepository[Password]):
@@ -22,6 +23,10 @@ class PasswordRepository(BaseRepository[Password]):
     # Columns to search in for text search
     SEARCH_COLUMNS = ["name", "username", "url", "notes"]
 
+    # Columns the list endpoints can sort by
+    SORT_COLUMNS = ["name", "username", "url", "created_at", "updated_at", "is_enabled"]
+    DEFAULT_SORT = "name"
+
     def __init__(self, session: AsyncSession):
         super().__init__(session)
 
@@ -35,7 +40,9 @@ class PasswordRepository(BaseRepository[Password]):
         limit: int = 100,
         offset: int = 0,
         is_enabled: bool | None = None,
-    ) -> tuple[list[Password], int]:
+        cursor: str | None = None,
+        count: CountMode = "exact",
+    ) -> Page[Password]:
         """
         Get paginated passwords for an organization with optional search and sorting.
 
@@ -47,9 +54,11 @@ class PasswordRepository(BaseRepository[Password]):
             limit: Maximum number of results
             offset: Number of results to skip
             is_enabled: Filter by is_enabled status (None = no filter)
+            cursor: Cursor from a previous page (replaces offset)
+            count: Total to compute: "exact", "estimated" or "none"
 
         Returns:
-            Tuple of (list of passwords, total count)
+            Page of passwords
         """
         filters = [Password.organization_id == organization_id]
 
@@ -60,11 +69,13 @@ class PasswordRepository(BaseRepository[Password]):
             filters=filters,
             search_columns=self.SEARCH_COLUMNS,
             search_term=search,
-            sort_by=sort_by or "name",  # Default sort by name
+            sort_by=sort_by,
             sort_dir=sort_dir,
             limit=limit,
             offset=offset,
             options=[selectinload(Password.updated_by_user)],
+            cursor=cursor,
+            count=count,
         )
 
     async def get_by_org(
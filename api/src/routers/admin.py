@@ -35,7 +35,7 @@ from src.models.orm.location import Location
 from src.models.orm.password import Password
 from src.models.orm.user import User
 from src.repositories.user import UserRepository
-from src.services.embeddings import EntityType
+from src.services.embeddings import EntityType, get_query_embedding_stats
 from src.services.reindex_state import ReindexStateService
 
 logger = logging.getLogger(__name__)
@@ -153,6 +153,8 @@ class IndexStatsResponse(BaseModel):
     total_entities: int
     total_unindexed: int
     last_indexed_at: str | None = None
+    query_cache_hits: int = 0
+    query_cache_misses: int = 0
 
 
 # =============================================================================
@@ -565,24 +567,18 @@ async def _enqueue_reindex(
 
     The worker handles the entire reindex operation including progress updates.
     """
-    from arq import create_pool
-    from arq.connections import RedisSettings
-
-    settings = get_settings()
+    from src.services.indexing_queue import get_arq_pool
 
     try:
-        redis_pool = await create_pool(RedisSettings.from_dsn(settings.redis_url))
-        try:
-            await redis_pool.enqueue_job(
-                "reindex_task",
-                job_id,
-                entity_type,
-                str(organization_id) if organization_id else None,
-                total,
-            )
-            logger.info(f"Enqueued reindex job {job_id}", extra={"job_id": job_id, "total": total})
-        finally:
-            await redis_pool.close()
+        redis_pool = await get_arq_pool()
+        await redis_pool.enqueue_job(
+            "reindex_task",
+            job_id,
+            entity_type,
+            str(organization_id) if organization_id else None,
+            total,
+        )
+        logger.info(f"Enqueued reindex job {job_id}", extra={"job_id": job_id, "total": total})
 
     except Exception as e:
         logger.error(f"Failed to enqueue reindex job: {e}", exc_info=True)
@@ -890,9 +886,13 @@ async def get_index_stats(
     )
     last_indexed = last_result.scalar()
 
+    query_cache_stats = await get_query_embedding_stats()
+
     return IndexStatsResponse(
         total_indexed=total_indexed,
         total_entities=total_entities,
         total_unindexed=total_entities - total_indexed,
         last_indexed_at=last_indexed.isoformat() if last_indexed else None,
+        query_cache_hits=query_cache_stats["hits"],
+        query_cache_misses=query_cache_stats["misses"],
     )
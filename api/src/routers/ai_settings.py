@@ -36,6 +36,7 @@ from src.models.contracts.ai_settings import (
     TestConnectionResponse,
 )
 from src.repositories.system_config import SystemConfigRepository
+from src.services.system_config_cache import publish_config_invalidation
 
 logger = logging.getLogger(__name__)
 
@@ -349,6 +350,9 @@ async def update_completions_config(
 
     # Save config
     await repo.set_config(LLM_CATEGORY, COMPLETIONS_CONFIG_KEY, config)
+    # Commit before broadcasting so other processes reload the new value
+    await db.commit()
+    await publish_config_invalidation(COMPLETIONS_CONFIG_KEY)
 
     logger.info(
         "Completions config updated",
@@ -401,6 +405,9 @@ async def update_embeddings_config(
 
     # Save config
     await repo.set_config(LLM_CATEGORY, EMBEDDINGS_CONFIG_KEY, config)
+    # Commit before broadcasting so other processes reload the new value
+    await db.commit()
+    await publish_config_invalidation(EMBEDDINGS_CONFIG_KEY)
 
     logger.info(
         "Embeddings config updated",
@@ -464,6 +471,9 @@ async def update_indexing_config(
 
     # Save config
     await repo.set_config(LLM_CATEGORY, INDEXING_CONFIG_KEY, config)
+    # Commit before broadcasting so other processes reload the new value
+    await db.commit()
+    await publish_config_invalidation(INDEXING_CONFIG_KEY)
 
     logger.info(
         "Indexing config updated",
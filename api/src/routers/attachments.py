@@ -3,8 +3,8 @@ Attachments Router
 
 Provides endpoints for file attachments including:
 - Upload (presigned URL generation)
-- Download (presigned URL generation)
-- List attachments for entities
+- Download (presigned URL generation, singly or for a batch)
+- List attachments for entities (optionally with download URLs)
 - Delete attachments
 - Document image uploads for markdown embedding
 """
@@ -24,19 +24,95 @@ from src.models.contracts.attachment import (
     AttachmentList,
     AttachmentPublic,
     AttachmentUploadResponse,
+    AttachmentUrl,
+    AttachmentUrlsRequest,
+    AttachmentUrlsResponse,
     DocumentImageCreate,
     DocumentImageUploadResponse,
 )
 from src.models.enums import EntityType
 from src.models.orm.attachment import Attachment
 from src.repositories.attachment import AttachmentRepository
-from src.services.file_storage import get_file_storage_service
+from src.services.file_storage import FileStorageService, get_file_storage_service
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/organizations/{org_id}", tags=["attachments"])
 
 
+def _require_storage() -> None:
+    if not get_settings().s3_configured:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="File storage is not configured",
+        )
+
+
+async def _create_with_upload(
+    db: DbSession,
+    org_id: UUID,
+    entity_type: EntityType,
+    entity_id: UUID,
+    filename: str,
+    content_type: str,
+    size_bytes: int,
+    sha256: str | None,
+) -> tuple[Attachment, str | None]:
+    """
+    Create an attachment record and presign its upload.
+
+    When sha256 matches content already stored in the organization, the new
+    attachment references the existing S3 object and no upload is needed.
+
+    Returns:
+        The attachment and its presigned upload URL (None if deduplicated)
+    """
+    repo = AttachmentRepository(db)
+    file_storage = get_file_storage_service()
+
+    existing = None
+    if sha256:
+        # Held until commit so the object can't be deleted before we reference it
+        await repo.lock_content(org_id, sha256)
+        existing = await repo.get_by_content_hash(org_id, sha256, size_bytes)
+        if existing is not None and not await file_storage.file_exists(existing.s3_key):
+            # Upload still in progress or abandoned; store this copy separately
+            existing = None
+
+    attachment = Attachment(
+        organization_id=org_id,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        filename=filename,
+        content_type=content_type,
+        size_bytes=size_bytes,
+        s3_key=existing.s3_key if existing else "",  # Set after generating otherwise
+        content_hash=sha256,
+    )
+
+    # Create first to get ID
+    attachment = await repo.create(attachment)
+    if existing is not None:
+        return attachment, None
+
+    # Generate S3 key with attachment ID
+    attachment.s3_key = file_storage.generate_s3_key(
+        organization_id=org_id,
+        entity_type=entity_type.value,
+        entity_id=entity_id,
+        attachment_id=attachment.id,
+        filename=filename,
+    )
+    await repo.update(attachment)
+
+    upload_url = await file_storage.generate_upload_url(
+        s3_key=attachment.s3_key,
+        content_type=content_type,
+        sha256=sha256,
+    )
+    return attachment, upload_url
+
+
 @router.get("/attachments", response_model=AttachmentList)
 async def list_attachments(
     org_id: UUID,
@@ -46,11 +122,14 @@ async def list_attachments(
     entity_id: UUID | None = Query(None, description="Filter by entity ID"),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    include_urls: bool = Query(False, description="Include presigned download URLs"),
 ) -> AttachmentList:
     """
     List attachments for an organization.
 
     Can filter by entity_type and entity_id to get attachments for a specific entity.
+    With include_urls, each item carries a presigned download URL so the client
+    doesn't need a download request per file.
 
     Args:
         org_id: Organization UUID
@@ -60,10 +139,14 @@ async def list_attachments(
         entity_id: Optional entity ID filter (requires entity_type)
         limit: Maximum results (1-1000)
         offset: Results to skip
+        include_urls: Whether to include presigned download URLs
 
     Returns:
         List of attachments with total count
     """
+    if include_urls:
+        _require_storage()
+
     repo = AttachmentRepository(db)
 
     if entity_type and entity_id:
@@ -84,6 +167,17 @@ async def list_attachments(
         )
         total = len(attachments)  # Simplified; could add count query
 
+    download_urls: list[str | None] = [None] * len(attachments)
+    urls_expire_in = None
+    if include_urls:
+        file_storage = get_file_storage_service()
+        download_urls = list(
+            await file_storage.generate_download_urls(
+                (att.s3_key, att.filename) for att in attachments
+            )
+        )
+        urls_expire_in = file_storage.download_url_min_lifetime
+
     return AttachmentList(
         items=[
             AttachmentPublic(
@@ -96,10 +190,61 @@ async def list_attachments(
                 content_type=att.content_type,
                 size_bytes=att.size_bytes,
                 created_at=att.created_at,
+                download_url=download_url,
             )
-            for att in attachments
+            for att, download_url in zip(attachments, download_urls, strict=True)
         ],
         total=total,
+        urls_expire_in=urls_expire_in,
+    )
+
+
+@router.post("/attachments/download-urls", response_model=AttachmentUrlsResponse)
+async def get_download_urls(
+    org_id: UUID,
+    request: AttachmentUrlsRequest,
+    current_user: CurrentActiveUser,
+    db: DbSession,
+) -> AttachmentUrlsResponse:
+    """
+    Get presigned download URLs for several attachments in one call.
+
+    Used to resolve every image embedded in a document at once instead of
+    following one /view redirect per image. IDs that don't exist in the
+    organization are left out of the response.
+
+    Args:
+        org_id: Organization UUID
+        request: Attachment IDs
+        current_user: Current authenticated user
+        db: Database session
+
+    Returns:
+        Presigned download URLs in request order
+    """
+    _require_storage()
+
+    repo = AttachmentRepository(db)
+    found = {att.id: att for att in await repo.get_by_ids_and_org(request.ids, org_id)}
+    attachments = [found[i] for i in dict.fromkeys(request.ids) if i in found]
+
+    file_storage = get_file_storage_service()
+    download_urls = await file_storage.generate_download_urls(
+        (att.s3_key, att.filename) for att in attachments
+    )
+
+    return AttachmentUrlsResponse(
+        items=[
+            AttachmentUrl(
+                id=str(att.id),
+                filename=att.filename,
+                content_type=att.content_type,
+                size_bytes=att.size_bytes,
+                download_url=download_url,
+            )
+            for att, download_url in zip(attachments, download_urls, strict=True)
+        ],
+        expires_in=file_storage.download_url_min_lifetime,
     )
 
 
@@ -119,9 +264,13 @@ async def create_attachment(
 
     The client should:
     1. Call this endpoint to get the upload URL
-    2. PUT the file directly to the presigned URL
+    2. PUT the file directly to the presigned URL, with upload_headers
     3. The attachment is ready for download after upload completes
 
+    If sha256 is given and the organization already stores identical
+    content, the attachment shares it: the response is marked deduplicated,
+    has no upload URL, and the attachment is ready straight away.
+
     Args:
         org_id: Organization UUID
         attachment_data: Attachment metadata
@@ -138,40 +287,15 @@ async def create_attachment(
             detail="File storage is not configured",
         )
 
-    repo = AttachmentRepository(db)
-    file_storage = get_file_storage_service()
-
-    # Create attachment record
-    attachment = Attachment(
-        organization_id=org_id,
+    attachment, upload_url = await _create_with_upload(
+        db,
+        org_id,
         entity_type=attachment_data.entity_type,
         entity_id=attachment_data.entity_id,
         filename=attachment_data.filename,
         content_type=attachment_data.content_type,
         size_bytes=attachment_data.size_bytes,
-        s3_key="",  # Will be set after generating
-    )
-
-    # Create first to get ID
-    attachment = await repo.create(attachment)
-
-    # Generate S3 key with attachment ID
-    s3_key = file_storage.generate_s3_key(
-        organization_id=org_id,
-        entity_type=attachment_data.entity_type.value,
-        entity_id=attachment_data.entity_id,
-        attachment_id=attachment.id,
-        filename=attachment_data.filename,
-    )
-
-    # Update with S3 key
-    attachment.s3_key = s3_key
-    await repo.update(attachment)
-
-    # Generate presigned upload URL
-    upload_url = await file_storage.generate_upload_url(
-        s3_key=s3_key,
-        content_type=attachment_data.content_type,
+        sha256=attachment_data.sha256,
     )
 
     logger.info(
@@ -182,6 +306,7 @@ async def create_attachment(
             "entity_type": attachment_data.entity_type.value,
             "entity_id": str(attachment_data.entity_id),
             "user_id": str(current_user.user_id),
+            "deduplicated": upload_url is None,
         },
     )
 
@@ -189,6 +314,12 @@ async def create_attachment(
         id=str(attachment.id),
         filename=attachment.filename,
         upload_url=upload_url,
+        upload_headers=(
+            FileStorageService.upload_headers(attachment.content_type, attachment_data.sha256)
+            if upload_url
+            else {}
+        ),
+        deduplicated=upload_url is None,
         expires_in=settings.s3_presigned_url_expiry,
     )
 
@@ -282,7 +413,7 @@ async def download_attachment(
         filename=attachment.filename,
         content_type=attachment.content_type,
         size_bytes=attachment.size_bytes,
-        expires_in=settings.s3_download_url_expiry,
+        expires_in=file_storage.download_url_min_lifetime,
     )
 
 
@@ -343,6 +474,8 @@ async def delete_attachment(
     """
     Delete an attachment (database record and S3 file).
 
+    The S3 object is only deleted if no other attachment shares it.
+
     Args:
         org_id: Organization UUID
         attachment_id: Attachment UUID
@@ -361,11 +494,15 @@ async def delete_attachment(
     s3_key = attachment.s3_key
 
     # Delete from database first
+    if attachment.content_hash:
+        await repo.lock_content(org_id, attachment.content_hash)
     await repo.delete(attachment)
+    unreferenced = await repo.unreferenced_s3_keys([s3_key])
+    await db.commit()
 
-    # Then delete from S3 (best effort)
+    # Then delete from S3 once nothing references it (best effort)
     settings = get_settings()
-    if settings.s3_configured:
+    if unreferenced and settings.s3_configured:
         file_storage = get_file_storage_service()
         await file_storage.delete_file(s3_key)
 
@@ -375,6 +512,7 @@ async def delete_attachment(
             "attachment_id": str(attachment_id),
             "org_id": str(org_id),
             "user_id": str(current_user.user_id),
+            "s3_object_deleted": bool(unreferenced),
         },
     )
 
@@ -395,6 +533,8 @@ async def upload_document_image(
     Upload an image for embedding in markdown documents.
 
     Returns a presigned upload URL and the final image URL to use in markdown.
+    As with attachments, an image whose sha256 is already stored in the
+    organization is deduplicated and needs no upload.
 
     Args:
         org_id: Organization UUID
@@ -419,43 +559,20 @@ async def upload_document_image(
             detail="Content type must be an image",
         )
 
-    repo = AttachmentRepository(db)
-    file_storage = get_file_storage_service()
-
     # Use a placeholder entity_id for document images without a document
     from uuid import uuid4
 
     entity_id = image_data.document_id or uuid4()
 
-    # Create attachment record
-    attachment = Attachment(
-        organization_id=org_id,
+    attachment, upload_url = await _create_with_upload(
+        db,
+        org_id,
         entity_type=EntityType.DOCUMENT_IMAGE,
         entity_id=entity_id,
         filename=image_data.filename,
         content_type=image_data.content_type,
         size_bytes=image_data.size_bytes,
-        s3_key="",
-    )
-
-    attachment = await repo.create(attachment)
-
-    # Generate S3 key
-    s3_key = file_storage.generate_s3_key(
-        organization_id=org_id,
-        entity_type=EntityType.DOCUMENT_IMAGE.value,
-        entity_id=entity_id,
-        attachment_id=attachment.id,
-        filename=image_data.filename,
-    )
-
-    attachment.s3_key = s3_key
-    await repo.update(attachment)
-
-    # Generate presigned upload URL
-    upload_url = await file_storage.generate_upload_url(
-        s3_key=s3_key,
-        content_type=image_data.content_type,
+        sha256=image_data.sha256,
     )
 
     # Generate stable image URL using the /view endpoint
@@ -468,12 +585,19 @@ async def upload_document_image(
             "attachment_id": str(attachment.id),
             "org_id": str(org_id),
             "user_id": str(current_user.user_id),
+            "deduplicated": upload_url is None,
         },
     )
 
     return DocumentImageUploadResponse(
         id=str(attachment.id),
         upload_url=upload_url,
+        upload_headers=(
+            FileStorageService.upload_headers(attachment.content_type, image_data.sha256)
+            if upload_url
+            else {}
+        ),
+        deduplicated=upload_url is None,
         image_url=image_url,
         expires_in=settings.s3_presigned_url_expiry,
     )
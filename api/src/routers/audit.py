@@ -14,6 +14,7 @@ from src.core.auth import CurrentActiveUser
 from src.core.database import DbSession
 from src.models.contracts.audit import AuditLogEntry, AuditLogListResponse
 from src.repositories.audit import AuditRepository
+from src.repositories.pagination import CountMode
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +35,8 @@ async def list_audit_logs(
     search: str | None = Query(None, description="Search by org name, actor, entity type, or action"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page (replaces page)"),
+    count: CountMode = Query("exact", description="Total to compute: exact, estimated or none"),
 ) -> AuditLogListResponse:
     """
     List audit logs with filtering and pagination.
@@ -42,7 +45,7 @@ async def list_audit_logs(
     Filter by organization_id to scope to a specific org.
     """
     audit_repo = AuditRepository(db)
-    logs, total = await audit_repo.get_paginated(
+    result = await audit_repo.get_paginated(
         organization_id=organization_id,
         entity_type=entity_type,
         entity_id=entity_id,
@@ -53,6 +56,8 @@ async def list_audit_logs(
         search=search,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        count=count,
     )
 
     items = [
@@ -74,14 +79,16 @@ async def list_audit_logs(
             actor_label=log.actor_label,
             created_at=log.created_at,
         )
-        for log in logs
+        for log in result.items
     ]
 
     return AuditLogListResponse(
         items=items,
-        total=total,
+        total=result.total,
         page=page,
         page_size=page_size,
+        total_is_estimate=result.total_is_estimate,
+        next_cursor=result.next_cursor,
     )
 
 
@@ -103,6 +110,8 @@ async def list_org_audit_logs(
     search: str | None = Query(None, description="Search by actor, entity type, or action"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page (replaces page)"),
+    count: CountMode = Query("exact", description="Total to compute: exact, estimated or none"),
 ) -> AuditLogListResponse:
     """
     List audit logs for a specific organization.
@@ -110,7 +119,7 @@ async def list_org_audit_logs(
     Includes both org-scoped events and system-level events.
     """
     audit_repo = AuditRepository(db)
-    logs, total = await audit_repo.get_paginated(
+    result = await audit_repo.get_paginated(
         organization_id=org_id,
         entity_type=entity_type,
         entity_id=entity_id,
@@ -122,6 +131,8 @@ async def list_org_audit_logs(
         page=page,
         page_size=page_size,
         include_system=False,  # Org view doesn't include system events
+        cursor=cursor,
+        count=count,
     )
 
     items = [
@@ -143,12 +154,14 @@ async def list_org_audit_logs(
             actor_label=log.actor_label,
             created_at=log.created_at,
         )
-        for log in logs
+        for log in result.items
     ]
 
     return AuditLogListResponse(
         items=items,
-        total=total,
+        total=result.total,
         page=page,
         page_size=page_size,
+        total_is_estimate=result.total_is_estimate,
+        next_cursor=result.next_cursor,
     )
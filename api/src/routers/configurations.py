@@ -22,17 +22,25 @@ from src.models.contracts.configuration import (
 from src.models.enums import AuditAction
 from src.models.orm.configuration import Configuration
 from src.repositories.configuration import ConfigurationRepository
+from src.repositories.pagination import CountMode
 from src.services.audit_service import get_audit_service
-from src.services.search_indexing import index_entity_for_search, remove_entity_from_search
+from src.services.search_indexing import (
+    index_entities_for_search,
+    index_entity_for_search,
+    remove_entity_from_search,
+)
+from src.services.sidebar_counts import invalidate_sidebar_counts
 
 
 class ConfigurationListResponse(BaseModel):
     """Paginated response for configuration list."""
 
     items: list[ConfigurationPublic]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    total_is_estimate: bool = False
+    next_cursor: str | None = None
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +89,8 @@ async def list_configurations(
     sort_dir: str = Query("asc", pattern="^(asc|desc)$", description="Sort direction"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum results per page"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page (replaces offset)"),
+    count: CountMode = Query("exact", description="Total to compute: exact, estimated or none"),
     show_disabled: bool = Query(False, description="Include disabled configurations"),
 ) -> ConfigurationListResponse:
     """
@@ -97,6 +107,8 @@ async def list_configurations(
         sort_dir: Sort direction ("asc" or "desc")
         limit: Maximum number of results
         offset: Number of results to skip
+        cursor: Cursor from the previous page, for keyset pagination
+        count: How to compute the total
         show_disabled: Include disabled configurations
 
     Returns:
@@ -106,7 +118,7 @@ async def list_configurations(
     # Filter by is_enabled: when show_disabled=False, only show enabled (True)
     # When show_disabled=True, show all (None filter)
     is_enabled_filter = None if show_disabled else True
-    configurations, total = await repo.get_paginated_by_org(
+    page = await repo.get_paginated_by_org(
         org_id,
         configuration_type_id=type_id,
         configuration_status_id=status_id,
@@ -116,13 +128,17 @@ async def list_configurations(
         limit=limit,
         offset=offset,
         is_enabled=is_enabled_filter,
+        cursor=cursor,
+        count=count,
     )
 
     return ConfigurationListResponse(
-        items=[_configuration_to_public(c) for c in configurations],
-        total=total,
+        items=[_configuration_to_public(c) for c in page.items],
+        total=page.total,
         limit=limit,
         offset=offset,
+        total_is_estimate=page.total_is_estimate,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -191,6 +207,9 @@ async def create_configuration(
         },
     )
 
+    # Drop cached sidebar counts once this request commits
+    invalidate_sidebar_counts(db, org_id)
+
     # Index for search (async, non-blocking on failure)
     await index_entity_for_search(db, "configuration", config.id, org_id)
 
@@ -344,6 +363,8 @@ async def update_configuration(
         config.name = data.name
     if data.configuration_type_id is not None:
         config.configuration_type_id = UUID(data.configuration_type_id) if data.configuration_type_id else None
+        # Moves the configuration between per-type sidebar counts
+        invalidate_sidebar_counts(db, org_id)
     if data.configuration_status_id is not None:
         config.configuration_status_id = UUID(data.configuration_status_id) if data.configuration_status_id else None
     if data.serial_number is not None:
@@ -444,6 +465,9 @@ async def delete_configuration(
             detail="Configuration not found",
         )
 
+    # Drop cached sidebar counts once this request commits
+    invalidate_sidebar_counts(db, org_id)
+
     # Remove from search index (async, non-blocking on failure)
     await remove_entity_from_search(db, "configuration", config_id)
 
@@ -497,9 +521,8 @@ async def batch_toggle_configurations(
         },
     )
 
-    # Update search index for each affected configuration
+    # Update search index for all affected configurations in a single job
     # The worker will index if enabled, remove from index if disabled
-    for config_id in config_ids:
-        await index_entity_for_search(db, "configuration", config_id, org_id)
+    await index_entities_for_search(db, "configuration", config_ids, org_id)
 
     return BatchToggleResponse(updated_count=result.rowcount)
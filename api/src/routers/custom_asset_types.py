@@ -28,6 +28,7 @@ from src.services.custom_asset_validation import (
     CustomAssetValidationError,
     validate_field_definitions,
 )
+from src.services.indexing_queue import enqueue_sync_custom_asset_indexes
 
 logger = logging.getLogger(__name__)
 
@@ -202,6 +203,10 @@ async def create_custom_asset_type(
     )
     asset_type = await repo.create(asset_type)
 
+    # Field indexes are built by the worker, which must see the committed type
+    await db.commit()
+    await enqueue_sync_custom_asset_indexes(str(asset_type.id))
+
     logger.info(
         f"Custom asset type created: {asset_type.name}",
         extra={
@@ -308,6 +313,8 @@ async def update_custom_asset_type(
             )
         asset_type.name = data.name
 
+    indexed_fields_before = (asset_type.fields, asset_type.display_field_key)
+
     if data.fields is not None:
         asset_type.fields = [f.model_dump() for f in data.fields]
 
@@ -318,6 +325,11 @@ async def update_custom_asset_type(
     asset_type = await repo.update(asset_type)
     asset_count = await repo.get_asset_count(type_id)
 
+    if (asset_type.fields, asset_type.display_field_key) != indexed_fields_before:
+        # Field indexes are rebuilt by the worker, which must see the committed change
+        await db.commit()
+        await enqueue_sync_custom_asset_indexes(str(type_id))
+
     logger.info(
         f"Custom asset type updated: {asset_type.name}",
         extra={
@@ -450,6 +462,10 @@ async def delete_custom_asset_type(
 
     await repo.delete(asset_type)
 
+    # Drop the type's field indexes once the delete is committed
+    await db.commit()
+    await enqueue_sync_custom_asset_indexes(str(type_id))
+
     logger.info(
         f"Custom asset type deleted: {asset_type.name}",
         extra={
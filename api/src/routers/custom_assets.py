@@ -26,6 +26,7 @@ from src.models.orm.custom_asset import CustomAsset
 from src.models.orm.custom_asset_type import CustomAssetType
 from src.repositories.custom_asset import CustomAssetRepository
 from src.repositories.custom_asset_type import CustomAssetTypeRepository
+from src.repositories.pagination import CountMode
 from src.services.audit_service import get_audit_service
 from src.services.custom_asset_validation import (
     CustomAssetValidationError,
@@ -33,18 +34,26 @@ from src.services.custom_asset_validation import (
     decrypt_password_fields,
     encrypt_password_fields,
     filter_password_fields,
+    get_display_field_key,
     validate_values,
 )
-from src.services.search_indexing import index_entity_for_search, remove_entity_from_search
+from src.services.search_indexing import (
+    index_entities_for_search,
+    index_entity_for_search,
+    remove_entity_from_search,
+)
+from src.services.sidebar_counts import invalidate_sidebar_counts
 
 
 class CustomAssetListResponse(BaseModel):
     """Paginated response for custom asset list."""
 
     items: list[CustomAssetPublic]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    total_is_estimate: bool = False
+    next_cursor: str | None = None
 
 logger = logging.getLogger(__name__)
 
@@ -84,40 +93,6 @@ def _get_field_definitions(asset_type: CustomAssetType) -> list[FieldDefinition]
     return [FieldDefinition(**f) for f in asset_type.fields]
 
 
-def _get_display_field_key(asset_type: CustomAssetType) -> str | None:
-    """
-    Get the display field key for an asset type.
-
-    Priority:
-    1. Use explicit display_field_key if set
-    2. Fall back to first text/textbox field
-    3. Fall back to first non-header field
-    4. Return None if no fields
-
-    Args:
-        asset_type: CustomAssetType entity
-
-    Returns:
-        Field key to use for display, or None if no suitable field
-    """
-    if asset_type.display_field_key:
-        return asset_type.display_field_key
-
-    fields = _get_field_definitions(asset_type)
-    non_header_fields = [f for f in fields if f.type != "header"]
-
-    # Try to find first text/textbox field
-    for field in non_header_fields:
-        if field.type in ("text", "textbox"):
-            return field.key
-
-    # Fall back to first non-header field
-    if non_header_fields:
-        return non_header_fields[0].key
-
-    return None
-
-
 def _to_public(
     asset: CustomAsset,
     type_fields: list[FieldDefinition],
@@ -169,6 +144,8 @@ async def list_custom_assets(
     sort_dir: str = Query("asc", pattern="^(asc|desc)$", description="Sort direction"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum results per page"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page (replaces offset)"),
+    count: CountMode = Query("exact", description="Total to compute: exact, estimated or none"),
     show_disabled: bool = Query(False, description="Include disabled custom assets"),
 ) -> CustomAssetListResponse:
     """
@@ -186,6 +163,8 @@ async def list_custom_assets(
         sort_dir: Sort direction ("asc" or "desc")
         limit: Maximum number of results
         offset: Number of results to skip
+        cursor: Cursor from the previous page, for keyset pagination
+        count: How to compute the total
         show_disabled: Include disabled custom assets
 
     Returns:
@@ -196,13 +175,13 @@ async def list_custom_assets(
     type_fields = _get_field_definitions(asset_type)
 
     # Get the display field key for searching
-    display_field_key = _get_display_field_key(asset_type)
+    display_field_key = get_display_field_key(asset_type)
 
     repo = CustomAssetRepository(db)
     # Filter by is_enabled: when show_disabled=False, only show enabled (True)
     # When show_disabled=True, show all (None filter)
     is_enabled_filter = None if show_disabled else True
-    assets, total = await repo.get_paginated_by_type_and_org(
+    page = await repo.get_paginated_by_type_and_org(
         type_id,
         org_id,
         search=search,
@@ -212,13 +191,17 @@ async def list_custom_assets(
         limit=limit,
         offset=offset,
         is_enabled=is_enabled_filter,
+        cursor=cursor,
+        count=count,
     )
 
     return CustomAssetListResponse(
-        items=[_to_public(a, type_fields) for a in assets],
-        total=total,
+        items=[_to_public(a, type_fields) for a in page.items],
+        total=page.total,
         limit=limit,
         offset=offset,
+        total_is_estimate=page.total_is_estimate,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -283,7 +266,7 @@ async def create_custom_asset(
     )
 
     # Get display name for logging
-    display_field_key = _get_display_field_key(asset_type)
+    display_field_key = get_display_field_key(asset_type)
     display_name = values.get(display_field_key, str(asset.id)) if display_field_key else str(asset.id)
 
     logger.info(
@@ -296,6 +279,9 @@ async def create_custom_asset(
         },
     )
 
+    # Drop cached sidebar counts once this request commits
+    invalidate_sidebar_counts(db, org_id)
+
     # Index for search (async, non-blocking on failure)
     await index_entity_for_search(db, "custom_asset", asset.id, org_id)
 
@@ -392,7 +378,7 @@ async def get_custom_asset_preview(
         )
 
     # Get display name
-    display_field_key = _get_display_field_key(asset_type)
+    display_field_key = get_display_field_key(asset_type)
     display_name = (
         asset.values.get(display_field_key, asset_type.name)
         if display_field_key
@@ -461,7 +447,7 @@ async def reveal_custom_asset(
         )
 
     # Get display name for logging
-    display_field_key = _get_display_field_key(asset_type)
+    display_field_key = get_display_field_key(asset_type)
     display_name = asset.values.get(display_field_key, str(asset.id)) if display_field_key else str(asset.id)
 
     logger.info(
@@ -560,7 +546,7 @@ async def update_custom_asset(
     )
 
     # Get display name for logging
-    display_field_key = _get_display_field_key(asset_type)
+    display_field_key = get_display_field_key(asset_type)
     display_name = asset.values.get(display_field_key, str(asset.id)) if display_field_key else str(asset.id)
 
     logger.info(
@@ -621,11 +607,14 @@ async def delete_custom_asset(
 
     # Get display name for logging before deletion
     asset_type = await _get_asset_type(type_id, db)
-    display_field_key = _get_display_field_key(asset_type)
+    display_field_key = get_display_field_key(asset_type)
     display_name = asset.values.get(display_field_key, str(asset.id)) if display_field_key else str(asset.id)
 
     await repo.delete(asset)
 
+    # Drop cached sidebar counts once this request commits
+    invalidate_sidebar_counts(db, org_id)
+
     # Remove from search index (async, non-blocking on failure)
     await remove_entity_from_search(db, "custom_asset", asset_id)
 
@@ -687,9 +676,8 @@ async def batch_toggle_custom_assets(
         },
     )
 
-    # Update search index for each affected custom asset
+    # Update search index for all affected custom assets in a single job
     # The worker will index if enabled, remove from index if disabled
-    for asset_id in asset_ids:
-        await index_entity_for_search(db, "custom_asset", asset_id, org_id)
+    await index_entities_for_search(db, "custom_asset", asset_ids, org_id)
 
     return BatchToggleResponse(updated_count=result.rowcount)
@@ -25,19 +25,27 @@ from src.models.contracts.document import (
 from src.models.enums import AuditAction
 from src.models.orm.document import Document
 from src.repositories.document import DocumentRepository
+from src.repositories.pagination import CountMode
 from src.services.audit_service import get_audit_service
 from src.services.document_mutations import DocumentMutationService
 from src.services.llm import get_completions_config, get_llm_client
-from src.services.search_indexing import index_entity_for_search, remove_entity_from_search
+from src.services.search_indexing import (
+    index_entities_for_search,
+    index_entity_for_search,
+    remove_entity_from_search,
+)
+from src.services.sidebar_counts import invalidate_sidebar_counts
 
 
 class DocumentListResponse(BaseModel):
     """Paginated response for document list."""
 
     items: list[DocumentPublic]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    total_is_estimate: bool = False
+    next_cursor: str | None = None
 
 
 class BatchPathUpdateRequest(BaseModel):
@@ -78,6 +86,8 @@ async def list_documents(
     sort_dir: str = Query("asc", pattern="^(asc|desc)$", description="Sort direction"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum results per page"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page (replaces offset)"),
+    count: CountMode = Query("exact", description="Total to compute: exact, estimated or none"),
     show_disabled: bool = Query(False, description="Include disabled documents"),
 ) -> DocumentListResponse:
     """
@@ -95,6 +105,8 @@ async def list_documents(
         sort_dir: Sort direction ("asc" or "desc")
         limit: Maximum number of results
         offset: Number of results to skip
+        cursor: Cursor from the previous page, for keyset pagination
+        count: How to compute the total
         show_disabled: Include disabled documents
 
     Returns:
@@ -104,7 +116,7 @@ async def list_documents(
     # Filter by is_enabled: when show_disabled=False, only show enabled (True)
     # When show_disabled=True, show all (None filter)
     is_enabled_filter = None if show_disabled else True
-    documents, total = await doc_repo.get_paginated_by_org(
+    page = await doc_repo.get_paginated_by_org(
         org_id,
         path=path,
         search=search,
@@ -113,6 +125,8 @@ async def list_documents(
         limit=limit,
         offset=offset,
         is_enabled=is_enabled_filter,
+        cursor=cursor,
+        count=count,
     )
 
     items = [
@@ -129,14 +143,16 @@ async def list_documents(
             updated_by_user_id=str(doc.updated_by_user_id) if doc.updated_by_user_id else None,
             updated_by_user_name=(doc.updated_by_user.name or doc.updated_by_user.email) if doc.updated_by_user else None,
         )
-        for doc in documents
+        for doc in page.items
     ]
 
     return DocumentListResponse(
         items=items,
-        total=total,
+        total=page.total,
         limit=limit,
         offset=offset,
+        total_is_estimate=page.total_is_estimate,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -217,6 +233,9 @@ async def create_document(
         },
     )
 
+    # Drop cached sidebar counts once this request commits
+    invalidate_sidebar_counts(db, org_id)
+
     # Index for search (async, non-blocking on failure)
     await index_entity_for_search(db, "document", doc.id, org_id)
 
@@ -526,6 +545,9 @@ async def delete_document(
             detail="Document not found",
         )
 
+    # Drop cached sidebar counts once this request commits
+    invalidate_sidebar_counts(db, org_id)
+
     # Remove from search index (async, non-blocking on failure)
     await remove_entity_from_search(db, "document", doc_id)
 
@@ -579,10 +601,9 @@ async def batch_toggle_documents(
         },
     )
 
-    # Update search index for each affected document
+    # Update search index for all affected documents in a single job
     # The worker will index if enabled, remove from index if disabled
-    for doc_id in doc_ids:
-        await index_entity_for_search(db, "document", doc_id, org_id)
+    await index_entities_for_search(db, "document", doc_ids, org_id)
 
     return BatchToggleResponse(updated_count=result.rowcount)
 
@@ -12,7 +12,7 @@ from datetime import UTC, datetime, timedelta
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -21,6 +21,7 @@ from src.core.database import get_db
 from src.models.orm.export import Export, ExportStatus
 from src.repositories.export import ExportRepository
 from src.services.file_storage import get_file_storage_service
+from src.services.indexing_queue import enqueue_export
 
 router = APIRouter(prefix="/api/exports", tags=["exports"])
 
@@ -107,28 +108,23 @@ def export_to_response(export: Export) -> ExportResponse:
 @router.post("", response_model=ExportResponse, status_code=status.HTTP_201_CREATED)
 async def create_export(
     request: CreateExportRequest,
-    background_tasks: BackgroundTasks,
     user: RequireAdmin,
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> ExportResponse:
     """
     Create a new data export job.
 
-    Only administrators can create exports. The export will be processed
-    in the background and progress will be streamed via WebSocket.
+    Only administrators can create exports. The export is processed by the
+    export worker and progress will be streamed via WebSocket.
 
     Args:
         request: Export configuration
-        background_tasks: FastAPI background tasks
         user: Authenticated admin user
         db: Database session
 
     Returns:
         Created export record
     """
-    # Import here to avoid circular imports
-    from src.services.export_service import process_export
-
     repo = ExportRepository(db)
 
     # Convert UUID list to string list for JSONB storage
@@ -145,8 +141,18 @@ async def create_export(
     await db.commit()
     await db.refresh(created_export)
 
-    # Queue background job to process the export
-    background_tasks.add_task(process_export, created_export.id)
+    # Queue the export on the export worker
+    try:
+        await enqueue_export(str(created_export.id))
+    except Exception as e:
+        await repo.update_status(
+            created_export, ExportStatus.FAILED, error_message="Failed to queue export"
+        )
+        await db.commit()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Export queue is unavailable",
+        ) from e
 
     return export_to_response(created_export)
 
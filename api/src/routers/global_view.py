@@ -10,7 +10,6 @@ from uuid import UUID
 
 from fastapi import APIRouter, Query
 from pydantic import BaseModel
-from sqlalchemy import func, select
 from sqlalchemy.orm import joinedload
 
 from src.core.auth import CurrentActiveUser
@@ -23,11 +22,14 @@ from src.models.orm.location import Location
 from src.models.orm.password import Password
 from src.repositories.configuration import ConfigurationRepository
 from src.repositories.configuration_type import ConfigurationTypeRepository
+from src.repositories.custom_asset import CustomAssetRepository
 from src.repositories.custom_asset_type import CustomAssetTypeRepository
 from src.repositories.document import DocumentRepository
 from src.repositories.location import LocationRepository
+from src.repositories.pagination import CountMode
 from src.repositories.password import PasswordRepository
-from src.services.custom_asset_validation import filter_password_fields
+from src.services.custom_asset_validation import filter_password_fields, get_display_field_key
+from src.services.sidebar_counts import get_sidebar_counts
 
 logger = logging.getLogger(__name__)
 
@@ -58,9 +60,11 @@ class GlobalPasswordListResponse(BaseModel):
     """Paginated response for global password list."""
 
     items: list[GlobalPasswordPublic]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    total_is_estimate: bool = False
+    next_cursor: str | None = None
 
 
 class GlobalConfigurationPublic(BaseModel):
@@ -89,9 +93,11 @@ class GlobalConfigurationListResponse(BaseModel):
     """Paginated response for global configuration list."""
 
     items: list[GlobalConfigurationPublic]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    total_is_estimate: bool = False
+    next_cursor: str | None = None
 
 
 class GlobalLocationPublic(BaseModel):
@@ -110,9 +116,11 @@ class GlobalLocationListResponse(BaseModel):
     """Paginated response for global location list."""
 
     items: list[GlobalLocationPublic]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    total_is_estimate: bool = False
+    next_cursor: str | None = None
 
 
 class GlobalDocumentPublic(BaseModel):
@@ -132,9 +140,11 @@ class GlobalDocumentListResponse(BaseModel):
     """Paginated response for global document list."""
 
     items: list[GlobalDocumentPublic]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    total_is_estimate: bool = False
+    next_cursor: str | None = None
 
 
 class GlobalCustomAssetPublic(BaseModel):
@@ -154,9 +164,11 @@ class GlobalCustomAssetListResponse(BaseModel):
     """Paginated response for global custom asset list."""
 
     items: list[GlobalCustomAssetPublic]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    total_is_estimate: bool = False
+    next_cursor: str | None = None
 
 
 class GlobalSidebarItemCount(BaseModel):
@@ -198,6 +210,8 @@ async def list_global_passwords(
     sort_dir: str = Query("asc", pattern="^(asc|desc)$", description="Sort direction"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum results per page"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page (replaces offset)"),
+    count: CountMode = Query("exact", description="Total to compute: exact, estimated or none"),
 ) -> GlobalPasswordListResponse:
     """
     List all passwords across all organizations with pagination and search.
@@ -210,6 +224,8 @@ async def list_global_passwords(
         sort_dir: Sort direction ("asc" or "desc")
         limit: Maximum number of results
         offset: Number of results to skip
+        cursor: Cursor from the previous page, for keyset pagination
+        count: How to compute the total
 
     Returns:
         Paginated list of passwords with organization info
@@ -217,7 +233,7 @@ async def list_global_passwords(
     password_repo = PasswordRepository(db)
 
     # Get paginated results without org filter
-    passwords, total = await password_repo.get_paginated(
+    page = await password_repo.get_paginated(
         filters=[],  # No org filter for global view
         search_columns=password_repo.SEARCH_COLUMNS,
         search_term=search,
@@ -226,6 +242,8 @@ async def list_global_passwords(
         limit=limit,
         offset=offset,
         options=[joinedload(Password.organization)],
+        cursor=cursor,
+        count=count,
     )
 
     items = [
@@ -241,14 +259,16 @@ async def list_global_passwords(
             created_at=p.created_at.isoformat(),
             updated_at=p.updated_at.isoformat(),
         )
-        for p in passwords
+        for p in page.items
     ]
 
     return GlobalPasswordListResponse(
         items=items,
-        total=total,
+        total=page.total,
         limit=limit,
         offset=offset,
+        total_is_estimate=page.total_is_estimate,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -263,6 +283,8 @@ async def list_global_configurations(
     sort_dir: str = Query("asc", pattern="^(asc|desc)$", description="Sort direction"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum results per page"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page (replaces offset)"),
+    count: CountMode = Query("exact", description="Total to compute: exact, estimated or none"),
 ) -> GlobalConfigurationListResponse:
     """
     List all configurations across all organizations with pagination and search.
@@ -277,6 +299,8 @@ async def list_global_configurations(
         sort_dir: Sort direction ("asc" or "desc")
         limit: Maximum number of results
         offset: Number of results to skip
+        cursor: Cursor from the previous page, for keyset pagination
+        count: How to compute the total
 
     Returns:
         Paginated list of configurations with organization info
@@ -290,7 +314,7 @@ async def list_global_configurations(
     if status_id is not None:
         filters.append(Configuration.configuration_status_id == status_id)
 
-    configs, total = await config_repo.get_paginated(
+    page = await config_repo.get_paginated(
         filters=filters,
         search_columns=config_repo.SEARCH_COLUMNS,
         search_term=search,
@@ -303,6 +327,8 @@ async def list_global_configurations(
             joinedload(Configuration.configuration_status),
             joinedload(Configuration.organization),
         ],
+        cursor=cursor,
+        count=count,
     )
 
     items = [
@@ -325,14 +351,16 @@ async def list_global_configurations(
             configuration_type_name=c.configuration_type.name if c.configuration_type else None,
             configuration_status_name=c.configuration_status.name if c.configuration_status else None,
         )
-        for c in configs
+        for c in page.items
     ]
 
     return GlobalConfigurationListResponse(
         items=items,
-        total=total,
+        total=page.total,
         limit=limit,
         offset=offset,
+        total_is_estimate=page.total_is_estimate,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -345,6 +373,8 @@ async def list_global_locations(
     sort_dir: str = Query("asc", pattern="^(asc|desc)$", description="Sort direction"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum results per page"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page (replaces offset)"),
+    count: CountMode = Query("exact", description="Total to compute: exact, estimated or none"),
 ) -> GlobalLocationListResponse:
     """
     List all locations across all organizations with pagination and search.
@@ -357,13 +387,15 @@ async def list_global_locations(
         sort_dir: Sort direction ("asc" or "desc")
         limit: Maximum number of results
         offset: Number of results to skip
+        cursor: Cursor from the previous page, for keyset pagination
+        count: How to compute the total
 
     Returns:
         Paginated list of locations with organization info
     """
     location_repo = LocationRepository(db)
 
-    locations, total = await location_repo.get_paginated(
+    page = await location_repo.get_paginated(
         filters=[],  # No org filter for global view
         search_columns=location_repo.SEARCH_COLUMNS,
         search_term=search,
@@ -372,6 +404,8 @@ async def list_global_locations(
         limit=limit,
         offset=offset,
         options=[joinedload(Location.organization)],
+        cursor=cursor,
+        count=count,
     )
 
     items = [
@@ -384,14 +418,16 @@ async def list_global_locations(
             created_at=loc.created_at.isoformat(),
             updated_at=loc.updated_at.isoformat(),
         )
-        for loc in locations
+        for loc in page.items
     ]
 
     return GlobalLocationListResponse(
         items=items,
-        total=total,
+        total=page.total,
         limit=limit,
         offset=offset,
+        total_is_estimate=page.total_is_estimate,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -405,6 +441,8 @@ async def list_global_documents(
     sort_dir: str = Query("asc", pattern="^(asc|desc)$", description="Sort direction"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum results per page"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page (replaces offset)"),
+    count: CountMode = Query("exact", description="Total to compute: exact, estimated or none"),
 ) -> GlobalDocumentListResponse:
     """
     List all documents across all organizations with pagination and search.
@@ -418,6 +456,8 @@ async def list_global_documents(
         sort_dir: Sort direction ("asc" or "desc")
         limit: Maximum number of results
         offset: Number of results to skip
+        cursor: Cursor from the previous page, for keyset pagination
+        count: How to compute the total
 
     Returns:
         Paginated list of documents with organization info
@@ -429,7 +469,7 @@ async def list_global_documents(
     if path is not None:
         filters.append(Document.path == path)
 
-    documents, total = await doc_repo.get_paginated(
+    page = await doc_repo.get_paginated(
         filters=filters,
         search_columns=doc_repo.SEARCH_COLUMNS,
         search_term=search,
@@ -438,6 +478,8 @@ async def list_global_documents(
         limit=limit,
         offset=offset,
         options=[joinedload(Document.organization)],
+        cursor=cursor,
+        count=count,
     )
 
     items = [
@@ -451,14 +493,16 @@ async def list_global_documents(
             created_at=doc.created_at.isoformat(),
             updated_at=doc.updated_at.isoformat(),
         )
-        for doc in documents
+        for doc in page.items
     ]
 
     return GlobalDocumentListResponse(
         items=items,
-        total=total,
+        total=page.total,
         limit=limit,
         offset=offset,
+        total_is_estimate=page.total_is_estimate,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -472,6 +516,8 @@ async def list_global_custom_assets(
     sort_dir: str = Query("asc", pattern="^(asc|desc)$", description="Sort direction"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum results per page"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page (replaces offset)"),
+    count: CountMode = Query("exact", description="Total to compute: exact, estimated or none"),
 ) -> GlobalCustomAssetListResponse:
     """
     List all custom assets of a specific type across all organizations.
@@ -485,6 +531,8 @@ async def list_global_custom_assets(
         sort_dir: Sort direction ("asc" or "desc")
         limit: Maximum number of results
         offset: Number of results to skip
+        cursor: Cursor from the previous page, for keyset pagination
+        count: How to compute the total
 
     Returns:
         Paginated list of custom assets with organization info
@@ -502,58 +550,26 @@ async def list_global_custom_assets(
 
     type_fields = [FieldDefinition(**f) for f in asset_type.fields]
 
-    # Get display field key for search (similar to custom_assets router)
-    display_field_key = asset_type.display_field_key
-    if not display_field_key:
-        # Fall back to first text/textbox field, then first non-header field
-        non_header_fields = [f for f in type_fields if f.type != "header"]
-        for field in non_header_fields:
-            if field.type in ("text", "textbox"):
-                display_field_key = field.key
-                break
-        if not display_field_key and non_header_fields:
-            display_field_key = non_header_fields[0].key
-
-    # Build query with JSONB search - note: we can't use get_paginated for JSONB search
-    # so we use a custom query similar to the custom_assets router
-    query = select(CustomAsset).where(CustomAsset.custom_asset_type_id == type_id)
-    count_query = select(func.count(CustomAsset.id)).where(
-        CustomAsset.custom_asset_type_id == type_id
-    )
+    # Search the display field, as the custom_assets router does
+    display_field_key = get_display_field_key(asset_type)
+
+    # Newest first unless a sort is requested
+    if not sort_by:
+        sort_by, sort_dir = "created_at", "desc"
 
-    # Search within JSONB values field
-    if search and display_field_key:
-        search_condition = CustomAsset.values[display_field_key].astext.ilike(f"%{search}%")
-        query = query.where(search_condition)
-        count_query = count_query.where(search_condition)
-
-    # Sort by JSONB field if sort_by starts with "values." or default to created_at
-    if sort_by:
-        if sort_by.startswith("values."):
-            jsonb_key = sort_by[7:]  # Remove "values." prefix
-            if sort_dir == "desc":
-                query = query.order_by(CustomAsset.values[jsonb_key].astext.desc())
-            else:
-                query = query.order_by(CustomAsset.values[jsonb_key].astext.asc())
-        elif hasattr(CustomAsset, sort_by):
-            from sqlalchemy import asc, desc
-            order_func = desc if sort_dir == "desc" else asc
-            query = query.order_by(order_func(getattr(CustomAsset, sort_by)))
-    else:
-        query = query.order_by(CustomAsset.created_at.desc())
-
-    # Add joinedload for organization
-    query = query.options(joinedload(CustomAsset.organization))
-
-    # Get total count
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    # Apply pagination
-    query = query.limit(limit).offset(offset)
-
-    result = await db.execute(query)
-    assets = list(result.unique().scalars().all())
+    asset_repo = CustomAssetRepository(db)
+    page = await asset_repo.get_paginated_by_type(
+        type_id,
+        search=search,
+        search_field_key=display_field_key,
+        sort_by=sort_by,
+        sort_dir=sort_dir,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        count=count,
+        options=[joinedload(CustomAsset.organization)],
+    )
 
     items = [
         GlobalCustomAssetPublic(
@@ -566,14 +582,16 @@ async def list_global_custom_assets(
             created_at=asset.created_at.isoformat(),
             updated_at=asset.updated_at.isoformat(),
         )
-        for asset in assets
+        for asset in page.items
     ]
 
     return GlobalCustomAssetListResponse(
         items=items,
-        total=total,
+        total=page.total,
         limit=limit,
         offset=offset,
+        total_is_estimate=page.total_is_estimate,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -597,52 +615,25 @@ async def get_global_sidebar_data(
     Returns:
         Sidebar data with aggregated counts
     """
-    # Get aggregated core entity counts
-    password_count_result = await db.execute(select(func.count(Password.id)))
-    passwords_count = password_count_result.scalar_one()
-
-    location_count_result = await db.execute(select(func.count(Location.id)))
-    locations_count = location_count_result.scalar_one()
-
-    document_count_result = await db.execute(select(func.count(Document.id)))
-    documents_count = document_count_result.scalar_one()
-
-    # Get configuration types with aggregated counts
-    config_type_repo = ConfigurationTypeRepository(db)
-    config_types = await config_type_repo.get_all_ordered()
-
-    configuration_types = []
-    for ct in config_types:
-        count_result = await db.execute(
-            select(func.count(Configuration.id)).where(
-                Configuration.configuration_type_id == ct.id
-            )
-        )
-        count = count_result.scalar_one()
-        configuration_types.append(
-            GlobalSidebarItemCount(id=str(ct.id), name=ct.name, count=count)
-        )
+    counts = await get_sidebar_counts(db, None)
 
-    # Get custom asset types with aggregated counts
-    asset_type_repo = CustomAssetTypeRepository(db)
-    asset_types = await asset_type_repo.get_all_ordered()
+    # Types are global; counts come from grouped queries (see sidebar_counts)
+    config_types = await ConfigurationTypeRepository(db).get_all_ordered()
+    configuration_types = [
+        GlobalSidebarItemCount(id=str(ct.id), name=ct.name, count=counts.configurations_by_type.get(str(ct.id), 0))
+        for ct in config_types
+    ]
 
-    custom_asset_types = []
-    for at in asset_types:
-        count_result = await db.execute(
-            select(func.count(CustomAsset.id)).where(
-                CustomAsset.custom_asset_type_id == at.id
-            )
-        )
-        count = count_result.scalar_one()
-        custom_asset_types.append(
-            GlobalSidebarItemCount(id=str(at.id), name=at.name, count=count)
-        )
+    asset_types = await CustomAssetTypeRepository(db).get_all_ordered()
+    custom_asset_types = [
+        GlobalSidebarItemCount(id=str(at.id), name=at.name, count=counts.custom_assets_by_type.get(str(at.id), 0))
+        for at in asset_types
+    ]
 
     return GlobalSidebarData(
-        passwords_count=passwords_count,
-        locations_count=locations_count,
-        documents_count=documents_count,
+        passwords_count=counts.passwords,
+        locations_count=counts.locations,
+        documents_count=counts.documents,
         configuration_types=configuration_types,
         custom_asset_types=custom_asset_types,
     )
@@ -22,17 +22,25 @@ from src.models.contracts.location import (
 from src.models.enums import AuditAction
 from src.models.orm.location import Location
 from src.repositories.location import LocationRepository
+from src.repositories.pagination import CountMode
 from src.services.audit_service import get_audit_service
-from src.services.search_indexing import index_entity_for_search, remove_entity_from_search
+from src.services.search_indexing import (
+    index_entities_for_search,
+    index_entity_for_search,
+    remove_entity_from_search,
+)
+from src.services.sidebar_counts import invalidate_sidebar_counts
 
 
 class LocationListResponse(BaseModel):
     """Paginated response for location list."""
 
     items: list[LocationPublic]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    total_is_estimate: bool = False
+    next_cursor: str | None = None
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +73,8 @@ async def list_locations(
     sort_dir: str = Query("asc", pattern="^(asc|desc)$", description="Sort direction"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum results per page"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page (replaces offset)"),
+    count: CountMode = Query("exact", description="Total to compute: exact, estimated or none"),
     show_disabled: bool = Query(False, description="Include disabled locations"),
 ) -> LocationListResponse:
     """
@@ -79,6 +89,8 @@ async def list_locations(
         sort_dir: Sort direction ("asc" or "desc")
         limit: Maximum number of results
         offset: Number of results to skip
+        cursor: Cursor from the previous page, for keyset pagination
+        count: How to compute the total
         show_disabled: Include disabled locations
 
     Returns:
@@ -88,7 +100,7 @@ async def list_locations(
     # Filter by is_enabled: when show_disabled=False, only show enabled (True)
     # When show_disabled=True, show all (None filter)
     is_enabled_filter = None if show_disabled else True
-    locations, total = await location_repo.get_paginated_by_org(
+    page = await location_repo.get_paginated_by_org(
         org_id,
         search=search,
         sort_by=sort_by,
@@ -96,13 +108,17 @@ async def list_locations(
         limit=limit,
         offset=offset,
         is_enabled=is_enabled_filter,
+        cursor=cursor,
+        count=count,
     )
 
     return LocationListResponse(
-        items=[_to_public(loc) for loc in locations],
-        total=total,
+        items=[_to_public(loc) for loc in page.items],
+        total=page.total,
         limit=limit,
         offset=offset,
+        total_is_estimate=page.total_is_estimate,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -156,6 +172,9 @@ async def create_location(
         },
     )
 
+    # Drop cached sidebar counts once this request commits
+    invalidate_sidebar_counts(db, org_id)
+
     # Index for search (async, non-blocking on failure)
     await index_entity_for_search(db, "location", location.id, org_id)
 
@@ -383,6 +402,9 @@ async def delete_location(
 
     await location_repo.delete(location)
 
+    # Drop cached sidebar counts once this request commits
+    invalidate_sidebar_counts(db, org_id)
+
     # Remove from search index (async, non-blocking on failure)
     await remove_entity_from_search(db, "location", location_id)
 
@@ -436,9 +458,8 @@ async def batch_toggle_locations(
         },
     )
 
-    # Update search index for each affected location
+    # Update search index for all affected locations in a single job
     # The worker will index if enabled, remove from index if disabled
-    for location_id in location_ids:
-        await index_entity_for_search(db, "location", location_id, org_id)
+    await index_entities_for_search(db, "location", location_ids, org_id)
 
     return BatchToggleResponse(updated_count=result.rowcount)
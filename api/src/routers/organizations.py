@@ -22,15 +22,11 @@ from src.models.contracts.organization import (
 from src.models.enums import AuditAction
 from src.models.orm.organization import Organization
 from src.repositories.access_tracking import AccessTrackingRepository
-from src.repositories.configuration import ConfigurationRepository
 from src.repositories.configuration_type import ConfigurationTypeRepository
-from src.repositories.custom_asset import CustomAssetRepository
 from src.repositories.custom_asset_type import CustomAssetTypeRepository
-from src.repositories.document import DocumentRepository
-from src.repositories.location import LocationRepository
 from src.repositories.organization import OrganizationRepository
-from src.repositories.password import PasswordRepository
 from src.services.audit_service import get_audit_service
+from src.services.sidebar_counts import get_sidebar_counts, invalidate_sidebar_counts
 
 logger = logging.getLogger(__name__)
 
@@ -312,6 +308,9 @@ async def delete_organization(
 
     await org_repo.delete(org)
 
+    # Its entities are cascade-deleted, so the global counts change too
+    invalidate_sidebar_counts(db, org_id)
+
     logger.info(
         f"Organization deleted: {org.name}",
         extra={"org_id": str(org.id), "user_id": str(current_user.user_id)},
@@ -340,43 +339,25 @@ async def get_sidebar_data(
     Returns:
         Sidebar data with counts
     """
-    # Get core entity counts
-    password_repo = PasswordRepository(db)
-    location_repo = LocationRepository(db)
-    document_repo = DocumentRepository(db)
-
-    passwords_count = await password_repo.count_by_organization(org_id)
-    locations_count = await location_repo.count_by_organization(org_id)
-    documents_count = await document_repo.count_by_organization(org_id)
-
-    # Get configuration types with their configuration counts (types are global)
-    config_type_repo = ConfigurationTypeRepository(db)
-    config_repo = ConfigurationRepository(db)
-    config_types = await config_type_repo.get_all_ordered()
-
-    configuration_types = []
-    for ct in config_types:
-        count = await config_repo.count_by_type_and_organization(ct.id, org_id)
-        configuration_types.append(
-            SidebarItemCount(id=str(ct.id), name=ct.name, count=count)
-        )
+    counts = await get_sidebar_counts(db, org_id)
 
-    # Get custom asset types with their asset counts (types are global)
-    asset_type_repo = CustomAssetTypeRepository(db)
-    asset_repo = CustomAssetRepository(db)
-    asset_types = await asset_type_repo.get_all_ordered()
+    # Types are global; counts come from grouped queries (see sidebar_counts)
+    config_types = await ConfigurationTypeRepository(db).get_all_ordered()
+    configuration_types = [
+        SidebarItemCount(id=str(ct.id), name=ct.name, count=counts.configurations_by_type.get(str(ct.id), 0))
+        for ct in config_types
+    ]
 
-    custom_asset_types = []
-    for at in asset_types:
-        count = await asset_repo.count_by_type_and_organization(at.id, org_id)
-        custom_asset_types.append(
-            SidebarItemCount(id=str(at.id), name=at.name, count=count)
-        )
+    asset_types = await CustomAssetTypeRepository(db).get_all_ordered()
+    custom_asset_types = [
+        SidebarItemCount(id=str(at.id), name=at.name, count=counts.custom_assets_by_type.get(str(at.id), 0))
+        for at in asset_types
+    ]
 
     return SidebarData(
-        passwords_count=passwords_count,
-        locations_count=locations_count,
-        documents_count=documents_count,
+        passwords_count=counts.passwords,
+        locations_count=counts.locations,
+        documents_count=counts.documents,
         configuration_types=configuration_types,
         custom_asset_types=custom_asset_types,
     )
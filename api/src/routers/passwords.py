@@ -23,18 +23,26 @@ from src.models.contracts.password import (
 )
 from src.models.enums import AuditAction
 from src.models.orm.password import Password
+from src.repositories.pagination import CountMode
 from src.repositories.password import PasswordRepository
 from src.services.audit_service import get_audit_service
-from src.services.search_indexing import index_entity_for_search, remove_entity_from_search
+from src.services.search_indexing import (
+    index_entities_for_search,
+    index_entity_for_search,
+    remove_entity_from_search,
+)
+from src.services.sidebar_counts import invalidate_sidebar_counts
 
 
 class PasswordListResponse(BaseModel):
     """Paginated response for password list."""
 
     items: list[PasswordPublic]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    total_is_estimate: bool = False
+    next_cursor: str | None = None
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +59,8 @@ async def list_passwords(
     sort_dir: str = Query("asc", pattern="^(asc|desc)$", description="Sort direction"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum results per page"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page (replaces offset)"),
+    count: CountMode = Query("exact", description="Total to compute: exact, estimated or none"),
     show_disabled: bool = Query(False, description="Include disabled passwords"),
 ) -> PasswordListResponse:
     """
@@ -65,6 +75,8 @@ async def list_passwords(
         sort_dir: Sort direction ("asc" or "desc")
         limit: Maximum number of results
         offset: Number of results to skip
+        cursor: Cursor from the previous page, for keyset pagination
+        count: How to compute the total
         show_disabled: Include disabled passwords
 
     Returns:
@@ -74,7 +86,7 @@ async def list_passwords(
     # Filter by is_enabled: when show_disabled=False, only show enabled (True)
     # When show_disabled=True, show all (None filter)
     is_enabled_filter = None if show_disabled else True
-    passwords, total = await password_repo.get_paginated_by_org(
+    page = await password_repo.get_paginated_by_org(
         org_id,
         search=search,
         sort_by=sort_by,
@@ -82,6 +94,8 @@ async def list_passwords(
         limit=limit,
         offset=offset,
         is_enabled=is_enabled_filter,
+        cursor=cursor,
+        count=count,
     )
 
     items = [
@@ -100,14 +114,16 @@ async def list_passwords(
             updated_by_user_id=str(p.updated_by_user_id) if p.updated_by_user_id else None,
             updated_by_user_name=p.updated_by_user.email if p.updated_by_user else None,
         )
-        for p in passwords
+        for p in page.items
     ]
 
     return PasswordListResponse(
         items=items,
-        total=total,
+        total=page.total,
         limit=limit,
         offset=offset,
+        total_is_estimate=page.total_is_estimate,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -167,6 +183,9 @@ async def create_password(
         extra={"password_id": str(password.id), "org_id": str(org_id), "user_id": str(current_user.user_id)},
     )
 
+    # Drop cached sidebar counts once this request commits
+    invalidate_sidebar_counts(db, org_id)
+
     # Index for search (async, non-blocking on failure)
     await index_entity_for_search(db, "password", password.id, org_id)
 
@@ -501,6 +520,9 @@ async def delete_password(
 
     await password_repo.delete(password)
 
+    # Drop cached sidebar counts once this request commits
+    invalidate_sidebar_counts(db, org_id)
+
     # Remove from search index (async, non-blocking on failure)
     await remove_entity_from_search(db, "password", password_id)
 
@@ -550,9 +572,8 @@ async def batch_toggle_passwords(
         },
     )
 
-    # Update search index for each affected password
+    # Update search index for all affected passwords in a single job
     # The worker will index if enabled, remove from index if disabled
-    for password_id in password_ids:
-        await index_entity_for_search(db, "password", password_id, org_id)
+    await index_entities_for_search(db, "password", password_ids, org_id)
 
     return BatchToggleResponse(updated_count=result.rowcount)
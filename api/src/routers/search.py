@@ -9,7 +9,6 @@ Also provides AI-powered search using RAG (Retrieval Augmented Generation).
 Streaming is handled via WebSocket (client subscribes to search:{request_id} channel).
 """
 
-import asyncio
 import logging
 from typing import Literal
 from uuid import UUID, uuid4
@@ -17,9 +16,12 @@ from uuid import UUID, uuid4
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, status
 from sqlalchemy import select
 
+from src.config import get_settings
 from src.core.auth import CurrentActiveUser
 from src.core.database import DbSession, get_db_context
 from src.core.pubsub import (
+    SearchDeltaCoalescer,
+    get_connection_manager,
     publish_entity_update,
     publish_search_citations,
     publish_search_delta,
@@ -53,6 +55,20 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/search", tags=["search"])
 
 
+async def _wait_for_client(request_id: str) -> None:
+    """
+    Wait for the client to subscribe to search:{request_id}.
+
+    The client only learns the request ID from the response, so it subscribes
+    after the background task has started. Streams anyway after
+    search_subscribe_timeout, in which case early messages may be missed.
+    """
+    timeout = get_settings().search_subscribe_timeout
+    manager = get_connection_manager()
+    if not await manager.wait_for_subscriber(f"search:{request_id}", timeout):
+        logger.warning(f"No subscriber for search:{request_id} after {timeout}s")
+
+
 @router.get("", response_model=SearchResponse)
 async def search(
     current_user: CurrentActiveUser,
@@ -63,7 +79,7 @@ async def search(
     mode: Literal["auto", "text", "semantic", "hybrid"] = Query(
         "auto",
         description="Search mode: 'auto' (default, picks best available), "
-        "'text' (ILIKE only), 'semantic' (embeddings only, requires OpenAI), "
+        "'text' (full-text only), 'semantic' (embeddings only, requires OpenAI), "
         "'hybrid' (combines both when available)",
     ),
     show_disabled: bool = Query(False, description="Include disabled items in search results"),
@@ -76,7 +92,7 @@ async def search(
 
     Search modes:
     - auto: Uses hybrid if OpenAI is configured, otherwise text search
-    - text: Uses PostgreSQL ILIKE matching only (no AI required)
+    - text: Uses PostgreSQL full-text search only (no AI required)
     - semantic: Uses OpenAI embeddings for similarity search (requires OpenAI)
     - hybrid: Combines semantic and text search, dedupes and ranks results
 
@@ -183,9 +199,7 @@ async def _perform_ai_search(
     - {"type": "done"}
     - {"type": "error", "message": "..."}
     """
-    # Small delay to allow client to establish WebSocket subscription
-    # The client receives request_id and then connects to WebSocket
-    await asyncio.sleep(0.5)
+    await _wait_for_client(request_id)
 
     try:
         async with get_db_context() as db:
@@ -217,10 +231,9 @@ async def _perform_ai_search(
             ai_chat_service = get_ai_chat_service(db)
 
             try:
-                async for chunk in ai_chat_service.stream_response(query, search_results):
-                    await publish_search_delta(request_id, chunk)
-                    # Small delay to prevent overwhelming WebSocket
-                    await asyncio.sleep(0.01)
+                async with SearchDeltaCoalescer(request_id) as deltas:
+                    async for chunk in ai_chat_service.stream_response(query, search_results):
+                        await deltas.add(chunk)
 
                 await publish_search_done(request_id)
 
@@ -318,8 +331,7 @@ async def ai_search(
 
 async def _send_empty_ai_response(request_id: str) -> None:
     """Send empty response when user has no organizations."""
-    # Small delay to allow client to establish WebSocket subscription
-    await asyncio.sleep(0.5)
+    await _wait_for_client(request_id)
     await publish_search_citations(request_id, [])
     await publish_search_delta(
         request_id,
@@ -350,8 +362,7 @@ async def _perform_chat(
     - {"type": "done"}
     - {"type": "error", "message": "..."}
     """
-    # Small delay to allow client to establish WebSocket subscription
-    await asyncio.sleep(0.5)
+    await _wait_for_client(request_id)
 
     try:
         async with get_db_context() as db:
@@ -469,61 +480,66 @@ async def _perform_chat(
             chat_service = get_conversational_chat_service(db)
 
             try:
-                async for chunk in chat_service.stream_response(
-                    message, search_results, history, current_entity=current_entity_context
-                ):
-                    # Handle both string content and dict tool calls
-                    if isinstance(chunk, str):
-                        await publish_search_delta(request_id, chunk)
-                    elif isinstance(chunk, dict) and chunk.get("type") == "mutation_pending":
-                        # Send pending state for immediate UI feedback
-                        from src.core.pubsub import publish_mutation_pending
-                        await publish_mutation_pending(
-                            request_id,
-                            tool_call_id=chunk.get("tool_call_id", "")
-                        )
-                    elif isinstance(chunk, dict) and chunk.get("type") == "tool_call":
-                        # Parse tool call and convert to mutation_preview format
-                        from src.core.pubsub import publish_mutation_error, publish_mutation_preview
-                        from src.services.ai_chat import parse_mutation_tool_call
-                        from src.services.llm.base import ToolCall
-
-                        try:
-                            tool_call_data = chunk["tool_call"]
-                            tool_call = ToolCall(
-                                id=tool_call_data["id"],
-                                name=tool_call_data["name"],
-                                arguments=tool_call_data["arguments"]
+                async with SearchDeltaCoalescer(request_id) as deltas:
+                    async for chunk in chat_service.stream_response(
+                        message, search_results, history, current_entity=current_entity_context
+                    ):
+                        # Handle both string content and dict tool calls
+                        if isinstance(chunk, str):
+                            await deltas.add(chunk)
+                            continue
+                        # Text before a tool call reaches the client first
+                        await deltas.flush()
+                        if isinstance(chunk, dict) and chunk.get("type") == "mutation_pending":
+                            # Send pending state for immediate UI feedback
+                            from src.core.pubsub import publish_mutation_pending
+                            await publish_mutation_pending(
+                                request_id,
+                                tool_call_id=chunk.get("tool_call_id", "")
+                            )
+                        elif isinstance(chunk, dict) and chunk.get("type") == "tool_call":
+                            # Parse tool call and convert to mutation_preview format
+                            from src.core.pubsub import (
+                                publish_mutation_error,
+                                publish_mutation_preview,
                             )
-                            mutation_preview = parse_mutation_tool_call(tool_call)
-
-                            # Build preview data
-                            preview_data = {
-                                "tool_call_id": tool_call_data["id"],
-                                "entity_type": mutation_preview.entity_type,
-                                "entity_id": str(mutation_preview.entity_id),
-                                "organization_id": str(mutation_preview.organization_id),
-                                "mutation": {
-                                    "summary": mutation_preview.mutation.summary,
+                            from src.services.ai_chat import parse_mutation_tool_call
+                            from src.services.llm.base import ToolCall
+
+                            try:
+                                tool_call_data = chunk["tool_call"]
+                                tool_call = ToolCall(
+                                    id=tool_call_data["id"],
+                                    name=tool_call_data["name"],
+                                    arguments=tool_call_data["arguments"]
+                                )
+                                mutation_preview = parse_mutation_tool_call(tool_call)
+
+                                # Build preview data
+                                preview_data = {
+                                    "tool_call_id": tool_call_data["id"],
+                                    "entity_type": mutation_preview.entity_type,
+                                    "entity_id": str(mutation_preview.entity_id),
+                                    "organization_id": str(mutation_preview.organization_id),
+                                    "mutation": {
+                                        "summary": mutation_preview.mutation.summary,
+                                    }
                                 }
-                            }
 
-                            # Add content or field_updates based on type
-                            if isinstance(mutation_preview.mutation, DocumentMutation):
-                                preview_data["mutation"]["content"] = mutation_preview.mutation.content
-                            elif isinstance(mutation_preview.mutation, AssetMutation):
-                                preview_data["mutation"]["field_updates"] = mutation_preview.mutation.field_updates
-
-                            await publish_mutation_preview(request_id, preview_data)
-                        except Exception as e:
-                            logger.error(f"Failed to parse tool call: {e}", exc_info=True)
-                            # Send user-friendly error instead of raw JSON
-                            await publish_mutation_error(
-                                request_id,
-                                "Unable to preview this action"
-                            )
-                    # Small delay to prevent overwhelming WebSocket
-                    await asyncio.sleep(0.01)
+                                # Add content or field_updates based on type
+                                if isinstance(mutation_preview.mutation, DocumentMutation):
+                                    preview_data["mutation"]["content"] = mutation_preview.mutation.content
+                                elif isinstance(mutation_preview.mutation, AssetMutation):
+                                    preview_data["mutation"]["field_updates"] = mutation_preview.mutation.field_updates
+
+                                await publish_mutation_preview(request_id, preview_data)
+                            except Exception as e:
+                                logger.error(f"Failed to parse tool call: {e}", exc_info=True)
+                                # Send user-friendly error instead of raw JSON
+                                await publish_mutation_error(
+                                    request_id,
+                                    "Unable to preview this action"
+                                )
 
                 await publish_search_done(request_id)
 
@@ -626,7 +642,7 @@ async def chat(
 
 async def _send_empty_chat_response(request_id: str) -> None:
     """Send empty response when user has no organizations."""
-    await asyncio.sleep(0.5)
+    await _wait_for_client(request_id)
     await publish_search_citations(request_id, [])
     await publish_search_delta(
         request_id,
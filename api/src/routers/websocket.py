@@ -205,16 +205,12 @@ async def ping_loop(
             if websocket.client_state != WebSocketState.CONNECTED:
                 break
 
-            try:
-                ping_message = WebSocketMessage(
-                    type=MessageType.PING,
-                    channel="system",
-                    data={},
-                )
-                await websocket.send_text(ping_message.to_json())
-            except Exception as e:
-                logger.debug(f"Ping failed for {connection_id}: {e}")
-                break
+            ping_message = WebSocketMessage(
+                type=MessageType.PING,
+                channel="system",
+                data={},
+            )
+            manager.send(connection_id, ping_message)
     except asyncio.CancelledError:
         pass
 
@@ -254,14 +250,14 @@ async def receive_loop(
                         channel="system",
                         data={"subscribed": channel},
                     )
-                    await websocket.send_text(confirm.to_json())
+                    manager.send(connection_id, confirm)
                 else:
                     error = WebSocketMessage(
                         type=MessageType.ERROR,
                         channel="system",
                         data={"error": f"Cannot subscribe to channel: {channel}"},
                     )
-                    await websocket.send_text(error.to_json())
+                    manager.send(connection_id, error)
 
             elif action == "unsubscribe":
                 channel = data.get("channel")
@@ -272,7 +268,7 @@ async def receive_loop(
                         channel="system",
                         data={"unsubscribed": channel},
                     )
-                    await websocket.send_text(confirm.to_json())
+                    manager.send(connection_id, confirm)
 
             elif action == "pong":
                 # Client responded to ping, connection is alive
@@ -0,0 +1,181 @@
+"""
+Custom Asset Field Indexes
+
+Custom asset values live in one JSONB column, so sorting a list by a field
+or searching its display field can't use a regular column index. For every
+custom asset type this module maintains partial expression indexes on the
+fields the list view uses:
+
+- btree on (organization_id, values ->> key, id) for each field shown in the
+  list or used as the display field, matching the list's ORDER BY
+- trigram GIN on values ->> display_key for ILIKE search
+
+Each index is limited to its type's rows (WHERE custom_asset_type_id = ...),
+so a type's indexes only cost as much as its own assets. Postgres can only
+match these indexes when the query spells out the same field key and type ID
+as constants, which is what CustomAssetRepository's field_text() and
+type_filter() produce.
+
+Indexes are built and dropped CONCURRENTLY outside any transaction, so the
+sync runs in the worker (see sync_custom_asset_indexes_task) after a type's
+fields change.
+"""
+
+import hashlib
+import logging
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.core.database import get_db_context, get_engine
+from src.models.contracts.custom_asset import FieldDefinition
+from src.models.orm.custom_asset_type import CustomAssetType
+from src.services.custom_asset_validation import get_display_field_key
+
+logger = logging.getLogger(__name__)
+
+# Every managed index name starts with this prefix followed by the type ID
+INDEX_PREFIX = "ix_ca_field_"
+
+# Field types that are never sorted or searched in the list
+_UNINDEXED_FIELD_TYPES = {"header", "password", "totp"}
+
+
+@dataclass(frozen=True)
+class FieldIndex:
+    """One managed expression index."""
+
+    name: str
+    ddl: str
+
+
+def _quote(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _type_prefix(custom_asset_type_id: UUID) -> str:
+    return f"{INDEX_PREFIX}{custom_asset_type_id.hex}_"
+
+
+async def _existing_indexes(conn: AsyncConnection, prefix: str) -> dict[str, bool]:
+    """Map managed index names starting with prefix to whether they are valid."""
+    result = await conn.execute(
+        text(
+            "SELECT c.relname, i.indisvalid FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE i.indrelid = 'custom_assets'::regclass AND starts_with(c.relname, :prefix)"
+        ),
+        {"prefix": prefix},
+    )
+    return dict(result.tuples().all())
+
+
+def desired_indexes(asset_type: CustomAssetType) -> list[FieldIndex]:
+    """
+    List the field indexes an asset type should have.
+
+    Args:
+        asset_type: CustomAssetType entity
+
+    Returns:
+        Index definitions (names are stable for a given type and field key)
+    """
+    fields = [FieldDefinition(**f) for f in asset_type.fields]
+    display_key = get_display_field_key(asset_type)
+    sort_keys = [
+        f.key
+        for f in fields
+        if f.type not in _UNINDEXED_FIELD_TYPES and (f.show_in_list or f.key == display_key)
+    ]
+
+    prefix = _type_prefix(asset_type.id)
+    predicate = f"custom_asset_type_id = {_quote(str(asset_type.id))}"
+    indexes: list[FieldIndex] = []
+
+    for key in sort_keys:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:8]
+        indexes.append(
+            FieldIndex(
+                name=f"{prefix}{digest}_sort",
+                ddl=(
+                    f'ON custom_assets (organization_id, ("values" ->> {_quote(key)}), id) '
+                    f"WHERE {predicate}"
+                ),
+            )
+        )
+
+    if display_key is not None:
+        digest = hashlib.sha1(display_key.encode("utf-8")).hexdigest()[:8]
+        indexes.append(
+            FieldIndex(
+                name=f"{prefix}{digest}_trgm",
+                ddl=(
+                    f'ON custom_assets USING gin (("values" ->> {_quote(display_key)}) gin_trgm_ops) '
+                    f"WHERE {predicate}"
+                ),
+            )
+        )
+
+    return indexes
+
+
+async def sync_custom_asset_type_indexes(custom_asset_type_id: UUID) -> None:
+    """
+    Create and drop field indexes so they match the type's current fields.
+
+    Indexes that are no longer wanted, or were left invalid by an interrupted
+    concurrent build, are dropped; missing ones are built. If the type no
+    longer exists all of its indexes are dropped.
+
+    Args:
+        custom_asset_type_id: CustomAssetType UUID
+    """
+    async with get_db_context() as db:
+        result = await db.execute(
+            select(CustomAssetType).where(CustomAssetType.id == custom_asset_type_id)
+        )
+        asset_type = result.scalar_one_or_none()
+        wanted = {i.name: i for i in desired_indexes(asset_type)} if asset_type else {}
+
+    engine = get_engine()
+    async with engine.connect() as conn:
+        # CREATE/DROP INDEX CONCURRENTLY can't run inside a transaction block
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+
+        existing = await _existing_indexes(conn, _type_prefix(custom_asset_type_id))
+
+        for name, is_valid in existing.items():
+            if name not in wanted or not is_valid:
+                logger.info(f"Dropping custom asset field index {name}")
+                await conn.exec_driver_sql(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"')
+
+        for name, index in wanted.items():
+            if existing.get(name):
+                continue
+            logger.info(f"Creating custom asset field index {name}")
+            # Raw driver SQL: field keys may contain text() bind syntax like ":x"
+            await conn.exec_driver_sql(f'CREATE INDEX CONCURRENTLY "{name}" {index.ddl}')
+
+
+async def sync_all_custom_asset_type_indexes() -> None:
+    """Sync field indexes for every custom asset type, including deleted ones."""
+    async with get_db_context() as db:
+        result = await db.execute(select(CustomAssetType.id))
+        type_ids = set(result.scalars().all())
+
+    # Pick up leftovers from types deleted while no sync job ran
+    async with get_engine().connect() as conn:
+        for name in await _existing_indexes(conn, INDEX_PREFIX):
+            type_hex = name[len(INDEX_PREFIX) :].split("_", 1)[0]
+            try:
+                type_ids.add(UUID(hex=type_hex))
+            except ValueError:
+                continue
+
+    for type_id in type_ids:
+        try:
+            await sync_custom_asset_type_indexes(type_id)
+        except Exception as e:
+            logger.error(f"Failed to sync field indexes for custom asset type {type_id}: {e}")
@@ -9,6 +9,7 @@ from typing import Any
 
 from src.core.security import decrypt_secret, encrypt_secret
 from src.models.contracts.custom_asset import FieldDefinition
+from src.models.orm.custom_asset_type import CustomAssetType
 
 
 class CustomAssetValidationError(ValueError):
@@ -269,3 +270,37 @@ def apply_default_values(
                     result[field.key] = field.default_value
 
     return result
+
+
+def get_display_field_key(asset_type: CustomAssetType) -> str | None:
+    """
+    Get the display field key for an asset type.
+
+    Priority:
+    1. Use explicit display_field_key if set
+    2. Fall back to first text/textbox field
+    3. Fall back to first non-header field
+    4. Return None if no fields
+
+    Args:
+        asset_type: CustomAssetType entity
+
+    Returns:
+        Field key to use for display, or None if no suitable field
+    """
+    if asset_type.display_field_key:
+        return asset_type.display_field_key
+
+    fields = [FieldDefinition(**f) for f in asset_type.fields]
+    non_header_fields = [f for f in fields if f.type != "header"]
+
+    # Try to find first text/textbox field
+    for field in non_header_fields:
+        if field.type in ("text", "textbox"):
+            return field.key
+
+    # Fall back to first non-header field
+    if non_header_fields:
+        return non_header_fields[0].key
+
+    return None
@@ -6,15 +6,26 @@ Also provides text-based search fallback when OpenAI is not configured.
 Handles entity indexing, embedding generation, and similarity search.
 """
 
+import asyncio
+import base64
 import hashlib
 import logging
+import struct
+import time
+from array import array
+from collections import OrderedDict
 from typing import Any, Literal
 from uuid import UUID
 
 from openai import AsyncOpenAI
-from sqlalchemy import delete, or_, select
+from sqlalchemy import Text, delete, func, literal, or_, select, text, union_all
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
+from src.config import get_settings
+from src.core.cache import get_redis
+from src.core.database import get_db_context
 from src.models.contracts.custom_asset import FieldDefinition
 from src.models.contracts.search import SearchResult
 from src.models.orm.configuration import Configuration
@@ -31,6 +42,108 @@ logger = logging.getLogger(__name__)
 
 EntityType = Literal["password", "configuration", "location", "document", "custom_asset"]
 
+# Entity model mapping for batched lookups
+ENTITY_MODELS: dict[str, type[Any]] = {
+    "password": Password,
+    "configuration": Configuration,
+    "location": Location,
+    "document": Document,
+    "custom_asset": CustomAsset,
+}
+
+
+class EmbeddingCache:
+    """
+    Process-wide LRU cache of embedding vectors keyed by model and content hash.
+
+    Identical searchable text (templated custom assets, duplicated locations)
+    embeds to the same vector, so it only needs to be paid for once per process.
+
+    Vectors are kept as packed float32 (pgvector's storage precision): about
+    6 KB per 1536-dimension entry instead of about 49 KB as a list of floats.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple[str, str], array[float]] = OrderedDict()
+
+    def get(self, model: str, content_hash: str) -> list[float] | None:
+        """Return the cached vector, marking it most recently used."""
+        key = (model, content_hash)
+        embedding = self._entries.get(key)
+        if embedding is None:
+            return None
+        self._entries.move_to_end(key)
+        return embedding.tolist()
+
+    def put(self, model: str, content_hash: str, embedding: list[float]) -> None:
+        """Store a vector, evicting the least recently used entry when full."""
+        if self.max_size <= 0:
+            return
+        key = (model, content_hash)
+        self._entries[key] = array("f", embedding)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached vectors."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Module-level cache shared by all EmbeddingsService instances in this process
+_embedding_cache: EmbeddingCache | None = None
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get the process-wide embedding cache, creating it on first use."""
+    global _embedding_cache
+
+    if _embedding_cache is None:
+        _embedding_cache = EmbeddingCache(get_settings().embedding_cache_size)
+
+    return _embedding_cache
+
+
+# Redis keys for the query embedding cache; vectors live under
+# {prefix}:{model}:{sha256 of normalized query}
+QUERY_EMBEDDING_KEY_PREFIX = "search:query_embedding"
+QUERY_EMBEDDING_STATS_KEY = "search:query_embedding:stats"
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a search query so trivially different spellings share an embedding."""
+    return " ".join(query.split()).casefold()
+
+
+def _pack_embedding(embedding: list[float]) -> str:
+    # float32 matches pgvector's storage precision and is a quarter of the JSON size
+    return base64.b64encode(struct.pack(f"<{len(embedding)}f", *embedding)).decode("ascii")
+
+
+def _unpack_embedding(packed: str) -> list[float]:
+    raw = base64.b64decode(packed)
+    return list(struct.unpack(f"<{len(raw) // 4}f", raw))
+
+
+async def get_query_embedding_stats() -> dict[str, int]:
+    """
+    Get query embedding cache hit and miss counts across all API processes.
+
+    Returns:
+        Mapping with "hits" and "misses" counts
+    """
+    try:
+        redis = await get_redis()
+        stats = await redis.hgetall(QUERY_EMBEDDING_STATS_KEY)  # type: ignore[misc]
+    except Exception as e:
+        logger.warning(f"Failed to read query embedding cache stats: {e}")
+        stats = {}
+    return {"hits": int(stats.get("hits", 0)), "misses": int(stats.get("misses", 0))}
+
 
 class EmbeddingsService:
     """
@@ -113,6 +226,124 @@ class EmbeddingsService:
 
         return response.data[0].embedding
 
+    async def generate_query_embedding(self, query: str) -> list[float]:
+        """
+        Generate the embedding for a search query, using the Redis cache.
+
+        Queries are normalized (whitespace collapsed, case folded) before
+        embedding and keyed by the normalized text and the embedding model.
+        Each hit extends the entry's TTL, so frequent queries stay cached.
+        Cache errors are logged and fall through to the OpenAI API.
+
+        Args:
+            query: Search query text
+
+        Returns:
+            Embedding vector as list of floats
+        """
+        normalized = normalize_query(query)
+        ttl = get_settings().query_embedding_cache_ttl_seconds
+        if not ttl:
+            return await self.generate_embedding(normalized)
+
+        await self._ensure_initialized()
+        model = self._model or "text-embedding-3-small"
+        query_hash = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        key = f"{QUERY_EMBEDDING_KEY_PREFIX}:{model}:{query_hash}"
+
+        try:
+            redis = await get_redis()
+            # Count the lookup as a hit in the same round trip, so hits cost
+            # one round trip
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.getex(key, ex=ttl)
+                pipe.hincrby(QUERY_EMBEDDING_STATS_KEY, "hits", 1)
+                cached, _ = await pipe.execute()
+            if cached is not None:
+                return _unpack_embedding(cached)
+
+            # A miss after all - move the provisional hit over before calling
+            # OpenAI, so a failed embedding request can't leave it counted
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.hincrby(QUERY_EMBEDDING_STATS_KEY, "hits", -1)
+                pipe.hincrby(QUERY_EMBEDDING_STATS_KEY, "misses", 1)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Query embedding cache lookup failed: {e}")
+
+        embedding = await self.generate_embedding(normalized)
+
+        try:
+            redis = await get_redis()
+            await redis.set(key, _pack_embedding(embedding), ex=ttl)
+        except Exception as e:
+            logger.warning(f"Query embedding cache store failed: {e}")
+
+        return embedding
+
+    async def generate_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embeddings for many texts in a single OpenAI API request.
+
+        Args:
+            texts: Texts to embed (must all be non-empty)
+
+        Returns:
+            Embedding vectors in the same order as the input texts
+        """
+        if not texts:
+            return []
+        if any(not text.strip() for text in texts):
+            raise ValueError("Cannot generate embedding for empty text")
+
+        client = await self.get_client()
+        await self._ensure_initialized()
+
+        response = await client.embeddings.create(
+            input=texts,
+            model=self._model or "text-embedding-3-small",
+            dimensions=EMBEDDING_DIMENSIONS,
+        )
+
+        # The API documents that data is returned in input order, but each item
+        # carries its index so sort defensively rather than rely on it
+        ordered = sorted(response.data, key=lambda item: item.index)
+        return [item.embedding for item in ordered]
+
+    async def _embed_by_hash(self, texts_by_hash: dict[str, str]) -> dict[str, list[float]]:
+        """
+        Resolve embeddings for texts keyed by content hash.
+
+        Vectors already in the process-wide cache are reused; the remaining
+        texts are embedded in a single API request and added to the cache.
+
+        Args:
+            texts_by_hash: Mapping of content hash to the text it was computed from
+
+        Returns:
+            Mapping of content hash to embedding vector
+        """
+        await self._ensure_initialized()
+        model = self._model or "text-embedding-3-small"
+        cache = get_embedding_cache()
+
+        embeddings: dict[str, list[float]] = {}
+        missing: list[str] = []
+        for content_hash in texts_by_hash:
+            cached = cache.get(model, content_hash)
+            if cached is not None:
+                embeddings[content_hash] = cached
+            else:
+                missing.append(content_hash)
+
+        if missing:
+            generated = await self.generate_embeddings([texts_by_hash[h] for h in missing])
+            for content_hash, embedding in zip(missing, generated, strict=True):
+                cache.put(model, content_hash, embedding)
+                embeddings[content_hash] = embedding
+
+        return embeddings
+
     def compute_content_hash(self, text: str) -> str:
         """
         Compute MD5 hash of content to detect changes.
@@ -311,23 +542,26 @@ class EmbeddingsService:
         )
         content_hash = self.compute_content_hash(searchable_text)
 
-        # Check if we already have an index for this entity
+        # Check if we already have an index for this entity. The vector and text
+        # are deferred - we only need the hash to decide whether to re-embed.
         existing_result = await db.execute(
-            select(EmbeddingIndex).where(
+            select(EmbeddingIndex)
+            .options(defer(EmbeddingIndex.embedding), defer(EmbeddingIndex.searchable_text))
+            .where(
                 EmbeddingIndex.entity_type == entity_type,
                 EmbeddingIndex.entity_id == entity_id,
             )
         )
         existing = existing_result.scalar_one_or_none()
 
-        # Skip if content hasn't changed
+        # Skip both the API call and the row rewrite if content hasn't changed
         if existing and existing.content_hash == content_hash:
             logger.debug(f"Skipping index update, content unchanged: {entity_type}/{entity_id}")
             return existing
 
-        # Generate embedding
+        # Generate embedding (reusing a cached vector for identical content)
         try:
-            embedding = await self.generate_embedding(searchable_text)
+            embedding = (await self._embed_by_hash({content_hash: searchable_text}))[content_hash]
         except Exception as e:
             logger.error(f"Failed to generate embedding for {entity_type}/{entity_id}: {e}")
             raise
@@ -356,6 +590,149 @@ class EmbeddingsService:
             logger.info(f"Created embedding index: {entity_type}/{entity_id}")
             return index
 
+    async def _get_entities(
+        self,
+        db: AsyncSession,
+        entity_type: EntityType,
+        entity_ids: list[UUID],
+    ) -> list[Any]:
+        """Fetch a batch of entities of a single type in one query."""
+        model = ENTITY_MODELS.get(entity_type)
+        if model is None:
+            raise ValueError(f"Unknown entity type: {entity_type}")
+
+        result = await db.execute(select(model).where(model.id.in_(entity_ids)))
+        return list(result.scalars().all())
+
+    async def _get_asset_type_contexts(
+        self,
+        db: AsyncSession,
+        type_ids: set[UUID],
+    ) -> dict[UUID, tuple[list[FieldDefinition], str | None]]:
+        """Fetch field definitions and display field keys for custom asset types."""
+        if not type_ids:
+            return {}
+
+        result = await db.execute(
+            select(CustomAssetType).where(CustomAssetType.id.in_(type_ids))
+        )
+        return {
+            asset_type.id: (
+                [FieldDefinition(**f) for f in asset_type.fields],
+                asset_type.display_field_key,
+            )
+            for asset_type in result.scalars().all()
+        }
+
+    async def index_entities(
+        self,
+        db: AsyncSession,
+        entity_type: EntityType,
+        entities: list[tuple[UUID, UUID]],
+    ) -> tuple[int, int]:
+        """
+        Index a batch of entities of one type with a single embeddings request.
+
+        Entities are loaded in one query, embedded in one API call, and written
+        with a single bulk upsert. Entities that no longer exist, have no
+        searchable text, or whose content hash matches their existing index
+        row are skipped. Used by the reindex and batch index worker tasks;
+        single-entity updates go through index_entity.
+
+        Args:
+            db: Database session
+            entity_type: Type of all entities in the batch
+            entities: List of (entity_id, organization_id) tuples
+
+        Returns:
+            Tuple of (index rows written, entities skipped)
+        """
+        if not entities:
+            return 0, 0
+
+        org_by_id = dict(entities)
+        loaded = await self._get_entities(db, entity_type, list(org_by_id))
+
+        asset_type_contexts: dict[UUID, tuple[list[FieldDefinition], str | None]] = {}
+        if entity_type == "custom_asset":
+            asset_type_contexts = await self._get_asset_type_contexts(
+                db, {entity.custom_asset_type_id for entity in loaded}
+            )
+
+        pending: list[tuple[Any, str]] = []
+        for entity in loaded:
+            asset_type_fields: list[FieldDefinition] | None = None
+            display_field_key: str | None = None
+            if entity_type == "custom_asset":
+                asset_type_fields, display_field_key = asset_type_contexts.get(
+                    entity.custom_asset_type_id, (None, None)
+                )
+
+            searchable_text = self.extract_searchable_text(
+                entity_type, entity, asset_type_fields, display_field_key
+            )
+            if not searchable_text.strip():
+                logger.debug(f"Skipping {entity_type}/{entity.id} - no searchable text")
+                continue
+            pending.append((entity, searchable_text))
+
+        if not pending:
+            return 0, len(entities)
+
+        hashed = [
+            (entity, searchable_text, self.compute_content_hash(searchable_text))
+            for entity, searchable_text in pending
+        ]
+
+        # Skip entities whose index row already matches the current content
+        existing_result = await db.execute(
+            select(EmbeddingIndex.entity_id, EmbeddingIndex.content_hash).where(
+                EmbeddingIndex.entity_type == entity_type,
+                EmbeddingIndex.entity_id.in_([entity.id for entity, _, _ in hashed]),
+            )
+        )
+        existing_hashes = {row[0]: row[1] for row in existing_result.all()}
+        hashed = [
+            (entity, searchable_text, content_hash)
+            for entity, searchable_text, content_hash in hashed
+            if existing_hashes.get(entity.id) != content_hash
+        ]
+        if not hashed:
+            return 0, len(entities)
+
+        # Identical texts in the batch collapse to one input via their hash
+        embeddings = await self._embed_by_hash(
+            {content_hash: searchable_text for _, searchable_text, content_hash in hashed}
+        )
+
+        rows = [
+            {
+                "organization_id": org_by_id[entity.id],
+                "entity_type": entity_type,
+                "entity_id": entity.id,
+                "content_hash": content_hash,
+                "embedding": embeddings[content_hash],
+                "searchable_text": searchable_text,
+            }
+            for entity, searchable_text, content_hash in hashed
+        ]
+
+        stmt = insert(EmbeddingIndex).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_embedding_entity",
+            set_={
+                "organization_id": stmt.excluded.organization_id,
+                "content_hash": stmt.excluded.content_hash,
+                "embedding": stmt.excluded.embedding,
+                "searchable_text": stmt.excluded.searchable_text,
+                "updated_at": func.now(),
+            },
+        )
+        await db.execute(stmt)
+
+        logger.info(f"Bulk indexed {len(rows)} {entity_type} entities")
+        return len(rows), len(entities) - len(rows)
+
     async def delete_index(
         self,
         db: AsyncSession,
@@ -418,7 +795,7 @@ class EmbeddingsService:
 
         # Generate query embedding
         try:
-            query_embedding = await self.generate_embedding(query)
+            query_embedding = await self.generate_query_embedding(query)
         except Exception as e:
             logger.error(f"Failed to generate query embedding: {e}")
             raise
@@ -427,28 +804,26 @@ class EmbeddingsService:
         # pgvector's <=> operator computes cosine distance (1 - cosine_similarity)
         # Lower distance = higher similarity
         # We convert to similarity score: 1 - distance
-        from sqlalchemy import literal
-
-        # Build the query with cosine distance
         distance_expr = EmbeddingIndex.embedding.cosine_distance(query_embedding)
 
-        # Build base query - no need to filter by is_enabled since the index
-        # only contains enabled entities (disabled entities are removed from index)
-        stmt = (
-            select(
-                EmbeddingIndex,
-                Organization.name.label("org_name"),
-                (literal(1.0) - distance_expr).label("score"),
-            )
-            .join(Organization, EmbeddingIndex.organization_id == Organization.id)
-            .where(EmbeddingIndex.organization_id.in_(org_ids))
+        # No need to filter by is_enabled since the index only contains
+        # enabled entities (disabled entities are removed from index)
+        await self._configure_vector_scan(db, limit)
+        rows = await self._nearest_embeddings(db, distance_expr, org_ids, limit, exact=False)
+        if len(rows) < limit:
+            # The HNSW scan comes back short when the organization filter
+            # discards most candidates (a small org among many), so answer
+            # from the organization's own rows instead
+            rows = await self._nearest_embeddings(db, distance_expr, org_ids, limit, exact=True)
+
+        # Iterative scans in relaxed_order can return neighbours slightly out of order
+        rows.sort(key=lambda row: float(row[2]), reverse=True)
+
+        # Resolve entity names with one query per entity type
+        entity_names = await self._get_entity_names(
+            db, [(row[0].entity_type, row[0].entity_id) for row in rows]
         )
 
-        stmt = stmt.order_by(distance_expr).limit(limit)
-
-        result = await db.execute(stmt)
-        rows = result.all()
-
         # Convert to SearchResult objects
         # All results are from enabled entities since the index only contains enabled entities
         results: list[SearchResult] = []
@@ -457,8 +832,7 @@ class EmbeddingsService:
             org_name: str = row[1]
             score: float = float(row[2])
 
-            # Get entity name by fetching the entity
-            entity_name = await self._get_entity_name(db, index.entity_type, index.entity_id)
+            entity_name = entity_names.get((index.entity_type, index.entity_id))
 
             # Create snippet from searchable text (first 200 chars)
             snippet = index.searchable_text[:200]
@@ -480,6 +854,79 @@ class EmbeddingsService:
 
         return results
 
+    async def _configure_vector_scan(self, db: AsyncSession, limit: int) -> None:
+        """
+        Apply HNSW search settings for the current transaction.
+
+        ef_search is raised to at least `limit`, since an HNSW scan returns
+        no more than ef_search rows.
+        """
+        settings = get_settings()
+        params: dict[str, str] = {"ef_search": str(max(settings.vector_ef_search, limit))}
+        assignments = ["set_config('hnsw.ef_search', :ef_search, true)"]
+        if settings.vector_iterative_scan != "off":
+            params["iterative_scan"] = settings.vector_iterative_scan
+            params["max_scan_tuples"] = str(settings.vector_max_scan_tuples)
+            assignments.append("set_config('hnsw.iterative_scan', :iterative_scan, true)")
+            assignments.append("set_config('hnsw.max_scan_tuples', :max_scan_tuples, true)")
+
+        await db.execute(text(f"SELECT {', '.join(assignments)}"), params)
+
+    async def _nearest_embeddings(
+        self,
+        db: AsyncSession,
+        distance_expr: Any,
+        org_ids: list[UUID],
+        limit: int,
+        exact: bool,
+    ) -> list[Any]:
+        """
+        Fetch the nearest index rows within the given organizations.
+
+        The approximate plan orders by distance directly so Postgres walks the
+        HNSW index and filters by organization as it goes. The exact plan
+        materializes the organizations' rows first (via the organization_id
+        index) so the index cannot be used, then sorts them by distance.
+
+        Returns:
+            Rows of (EmbeddingIndex, org_name, score)
+        """
+        if exact:
+            candidates = (
+                select(EmbeddingIndex.id, distance_expr.label("distance"))
+                .where(EmbeddingIndex.organization_id.in_(org_ids))
+                .cte("org_embeddings")
+                .prefix_with("MATERIALIZED")
+            )
+            stmt = (
+                select(
+                    EmbeddingIndex,
+                    Organization.name.label("org_name"),
+                    (literal(1.0) - candidates.c.distance).label("score"),
+                )
+                .join(candidates, candidates.c.id == EmbeddingIndex.id)
+                .join(Organization, EmbeddingIndex.organization_id == Organization.id)
+                .options(defer(EmbeddingIndex.embedding))
+                .order_by(candidates.c.distance)
+                .limit(limit)
+            )
+        else:
+            stmt = (
+                select(
+                    EmbeddingIndex,
+                    Organization.name.label("org_name"),
+                    (literal(1.0) - distance_expr).label("score"),
+                )
+                .join(Organization, EmbeddingIndex.organization_id == Organization.id)
+                .options(defer(EmbeddingIndex.embedding))
+                .where(EmbeddingIndex.organization_id.in_(org_ids))
+                .order_by(distance_expr)
+                .limit(limit)
+            )
+
+        result = await db.execute(stmt)
+        return list(result.all())
+
     async def text_search(
         self,
         db: AsyncSession,
@@ -489,10 +936,10 @@ class EmbeddingsService:
         show_disabled: bool = False,
     ) -> list[SearchResult]:
         """
-        Perform text-based search using PostgreSQL ILIKE matching.
+        Perform text-based search across all entity types.
 
-        Searches across all entity types using simple text matching.
-        Does not require OpenAI API.
+        Uses PostgreSQL full-text search by default, or ILIKE matching when
+        text_search_mode is set to "ilike". Does not require OpenAI API.
 
         Args:
             db: Database session
@@ -510,6 +957,172 @@ class EmbeddingsService:
         if not query.strip():
             return []
 
+        if get_settings().text_search_mode == "ilike":
+            return await self._ilike_search(db, query, org_ids, limit, show_disabled)
+        return await self._fulltext_search(db, query, org_ids, limit, show_disabled)
+
+    def _build_tsquery(self, query: str) -> str:
+        """
+        Build a to_tsquery() string matching every term of the query as a prefix.
+
+        Each whitespace-separated term is quoted (so punctuation in hostnames,
+        IPs and emails is handled by the text search parser rather than the
+        tsquery syntax) and suffixed with :* for search-as-you-type matching.
+        """
+        terms = []
+        for term in query.split():
+            escaped = term.replace("\\", "\\\\").replace("'", "''")
+            terms.append(f"'{escaped}':*")
+        return " & ".join(terms)
+
+    async def _fulltext_search(
+        self,
+        db: AsyncSession,
+        query: str,
+        org_ids: list[UUID],
+        limit: int,
+        show_disabled: bool,
+    ) -> list[SearchResult]:
+        """
+        Perform text search using tsvector columns and trigram name matching.
+
+        Matches entities whose search_vector satisfies the prefix tsquery, or
+        whose name is a fuzzy (word_similarity) match for the query. Scores are
+        the greater of the normalized ts_rank and the name similarity, so both
+        lie in 0-1.
+
+        All entity types are searched in a single UNION ALL statement: each
+        branch takes its own top `limit` hits (so it can use its indexes), and
+        the outer query ranks across types and applies the final limit.
+        """
+        tsquery = func.to_tsquery("simple", self._build_tsquery(query))
+        query_literal = literal(query, Text)
+
+        branches = []
+        for entity_type, model, snippet_columns in (
+            ("password", Password, (Password.name, Password.username, Password.url, Password.notes)),
+            ("document", Document, (Document.name, Document.path, Document.content)),
+            (
+                "configuration",
+                Configuration,
+                (
+                    Configuration.name,
+                    Configuration.manufacturer,
+                    Configuration.model,
+                    Configuration.serial_number,
+                    Configuration.notes,
+                ),
+            ),
+            ("location", Location, (Location.name, Location.notes)),
+        ):
+            # ts_rank normalization 32 scales rank into 0-1 as rank / (rank + 1)
+            score = func.greatest(
+                func.ts_rank(model.search_vector, tsquery, 32),
+                func.word_similarity(query_literal, model.name),
+            )
+            # One character past the snippet length so truncation can be detected
+            snippet = func.left(
+                func.concat_ws(" | ", *(func.nullif(column, "") for column in snippet_columns)),
+                201,
+            )
+            conditions = [
+                model.organization_id.in_(org_ids),
+                or_(
+                    model.search_vector.op("@@")(tsquery),
+                    query_literal.op("<%", is_comparison=True)(model.name),
+                ),
+            ]
+            if not show_disabled:
+                conditions.append(model.is_enabled)
+
+            branches.append(
+                select(
+                    literal(entity_type, Text).label("entity_type"),
+                    model.id.label("entity_id"),
+                    model.organization_id.label("organization_id"),
+                    Organization.name.label("org_name"),
+                    model.name.label("name"),
+                    snippet.label("snippet"),
+                    model.is_enabled.label("is_enabled"),
+                    score.label("score"),
+                )
+                .join(Organization, model.organization_id == Organization.id)
+                .where(*conditions)
+                .order_by(score.desc())
+                .limit(limit)
+            )
+
+        # Custom assets are searched through embedding_index.searchable_text,
+        # which already excludes password fields
+        custom_asset_score = func.ts_rank(EmbeddingIndex.search_vector, tsquery, 32)
+        custom_asset_conditions = [
+            EmbeddingIndex.organization_id.in_(org_ids),
+            EmbeddingIndex.entity_type == "custom_asset",
+            EmbeddingIndex.search_vector.op("@@")(tsquery),
+        ]
+        if not show_disabled:
+            custom_asset_conditions.append(CustomAsset.is_enabled)
+
+        branches.append(
+            select(
+                literal("custom_asset", Text).label("entity_type"),
+                EmbeddingIndex.entity_id.label("entity_id"),
+                EmbeddingIndex.organization_id.label("organization_id"),
+                Organization.name.label("org_name"),
+                self._custom_asset_name_expr().label("name"),
+                func.left(EmbeddingIndex.searchable_text, 201).label("snippet"),
+                CustomAsset.is_enabled.label("is_enabled"),
+                custom_asset_score.label("score"),
+            )
+            .join(Organization, EmbeddingIndex.organization_id == Organization.id)
+            .join(CustomAsset, EmbeddingIndex.entity_id == CustomAsset.id)
+            .outerjoin(CustomAssetType, CustomAsset.custom_asset_type_id == CustomAssetType.id)
+            .where(*custom_asset_conditions)
+            .order_by(custom_asset_score.desc())
+            .limit(limit)
+        )
+
+        hits = union_all(*branches).subquery("search_hits")
+        stmt = select(hits).order_by(hits.c.score.desc()).limit(limit)
+        result = await db.execute(stmt)
+
+        results: list[SearchResult] = []
+        for row in result.all():
+            if row.entity_type == "custom_asset":
+                snippet_text = row.snippet or ""
+                if len(snippet_text) > 200:
+                    snippet_text = snippet_text[:200] + "..."
+            else:
+                snippet_text = self._build_snippet(row.snippet)
+            results.append(
+                SearchResult(
+                    entity_type=row.entity_type,
+                    entity_id=str(row.entity_id),
+                    organization_id=str(row.organization_id),
+                    organization_name=row.org_name,
+                    name=row.name or "Unknown",
+                    snippet=snippet_text,
+                    score=max(0.0, min(1.0, float(row.score))),
+                    is_enabled=row.is_enabled,
+                )
+            )
+
+        return results
+
+    async def _ilike_search(
+        self,
+        db: AsyncSession,
+        query: str,
+        org_ids: list[UUID],
+        limit: int,
+        show_disabled: bool,
+    ) -> list[SearchResult]:
+        """
+        Perform text search using PostgreSQL ILIKE matching.
+
+        Legacy text search mode. Cannot use indexes, so cost grows linearly
+        with data; kept for databases without the full-text search migration.
+        """
         # Prepare the search pattern for ILIKE
         search_pattern = f"%{query}%"
 
@@ -685,48 +1298,39 @@ class EmbeddingsService:
 
         # Search custom assets (name + values as text - but not password fields)
         # Note: For custom assets, we use the embedding_index.searchable_text
-        # which already excludes password fields
+        # which already excludes password fields. Name and enabled state come
+        # from the same query via joins rather than a lookup per hit.
         custom_asset_conditions = [
             EmbeddingIndex.organization_id.in_(org_ids),
             EmbeddingIndex.entity_type == "custom_asset",
             EmbeddingIndex.searchable_text.ilike(search_pattern),
         ]
-        # Note: We need to filter by CustomAsset.is_enabled, but EmbeddingIndex
-        # doesn't have this field. We'll filter after fetching.
-        # For now, include the filter in the query if show_disabled is False
-        # by joining with CustomAsset table
         if not show_disabled:
-            # Join with CustomAsset to filter by is_enabled
-            custom_asset_stmt = (
-                select(
-                    EmbeddingIndex,
-                    Organization.name.label("org_name"),
-                )
-                .join(Organization, EmbeddingIndex.organization_id == Organization.id)
-                .join(CustomAsset, EmbeddingIndex.entity_id == CustomAsset.id)
-                .where(*custom_asset_conditions, CustomAsset.is_enabled)
-                .limit(limit)
-            )
-        else:
-            custom_asset_stmt = (
-                select(
-                    EmbeddingIndex,
-                    Organization.name.label("org_name"),
-                )
-                .join(Organization, EmbeddingIndex.organization_id == Organization.id)
-                .where(*custom_asset_conditions)
-                .limit(limit)
+            custom_asset_conditions.append(CustomAsset.is_enabled)
+
+        custom_asset_stmt = (
+            select(
+                EmbeddingIndex,
+                Organization.name.label("org_name"),
+                self._custom_asset_name_expr().label("entity_name"),
+                CustomAsset.is_enabled,
             )
+            .join(Organization, EmbeddingIndex.organization_id == Organization.id)
+            .options(defer(EmbeddingIndex.embedding))
+            .join(CustomAsset, EmbeddingIndex.entity_id == CustomAsset.id)
+            .outerjoin(CustomAssetType, CustomAsset.custom_asset_type_id == CustomAssetType.id)
+            .where(*custom_asset_conditions)
+            .limit(limit)
+        )
         custom_asset_result = await db.execute(custom_asset_stmt)
         for row in custom_asset_result.all():
             index = row[0]
             org_name = row[1]
+            entity_name = row[2]
+            is_enabled = row[3]
             key = ("custom_asset", str(index.entity_id))
             if key not in seen_entities:
                 seen_entities.add(key)
-                entity_name = await self._get_entity_name(db, "custom_asset", index.entity_id)
-                # Get custom asset enabled status
-                is_enabled = await self._check_entity_enabled(db, "custom_asset", index.entity_id)
                 snippet = index.searchable_text[:200]
                 if len(index.searchable_text) > 200:
                     snippet += "..."
@@ -796,11 +1400,14 @@ class EmbeddingsService:
         """
         Perform hybrid search combining semantic and text search.
 
-        When OpenAI is available, runs both semantic and text search,
-        combines results, deduplicates, and ranks by relevance.
-        Semantic results are weighted higher than text matches.
+        When OpenAI is available, runs semantic and text search concurrently
+        (the semantic leg on its own session, since a session cannot run two
+        statements at once) and fuses the two rankings with reciprocal rank
+        fusion or a weighted score sum (see the hybrid_* settings).
 
-        When OpenAI is not available, falls back to text search only.
+        If the semantic leg fails, or misses hybrid_semantic_timeout_ms, the
+        text results are returned alone. When OpenAI is not available, falls
+        back to text search only.
 
         Args:
             db: Database session
@@ -823,118 +1430,132 @@ class EmbeddingsService:
             logger.info("OpenAI not configured, using text search only")
             return await self.text_search(db, query, org_ids, limit=limit, show_disabled=show_disabled)
 
-        # Run both searches
+        settings = get_settings()
+        started = time.monotonic()
+
+        async def semantic_leg() -> list[SearchResult]:
+            async with get_db_context() as semantic_db:
+                return await self.search(semantic_db, query, org_ids, limit=limit, show_disabled=show_disabled)
+
+        semantic_task = asyncio.create_task(semantic_leg())
+        try:
+            text_results = await self.text_search(db, query, org_ids, limit=limit, show_disabled=show_disabled)
+        except BaseException:
+            semantic_task.cancel()
+            # Let it release its session before the error propagates
+            await asyncio.gather(semantic_task, return_exceptions=True)
+            raise
+
+        timeout: float | None = None
+        if settings.hybrid_semantic_timeout_ms:
+            timeout = max(0.0, settings.hybrid_semantic_timeout_ms / 1000 - (time.monotonic() - started))
+
         try:
-            semantic_results = await self.search(db, query, org_ids, limit=limit, show_disabled=show_disabled)
+            semantic_results = await asyncio.wait_for(semantic_task, timeout)
+        except TimeoutError:
+            logger.warning(
+                f"Semantic search missed its {settings.hybrid_semantic_timeout_ms}ms deadline, "
+                "returning text results"
+            )
+            return text_results
         except Exception as e:
             logger.warning(f"Semantic search failed, falling back to text search: {e}")
-            return await self.text_search(db, query, org_ids, limit=limit, show_disabled=show_disabled)
+            return text_results
 
-        text_results = await self.text_search(db, query, org_ids, limit=limit, show_disabled=show_disabled)
-
-        # Combine and deduplicate results
-        seen: set[tuple[str, str]] = set()
-        combined: list[SearchResult] = []
-
-        # Add semantic results first (higher priority)
-        # Boost semantic scores slightly to ensure they rank higher
-        for result in semantic_results:
-            key = (result.entity_type, result.entity_id)
-            if key not in seen:
-                seen.add(key)
-                # Boost semantic scores by 0.1 (capped at 1.0)
-                boosted_score = min(1.0, result.score + 0.1)
-                combined.append(
-                    SearchResult(
-                        entity_type=result.entity_type,
-                        entity_id=result.entity_id,
-                        organization_id=result.organization_id,
-                        organization_name=result.organization_name,
-                        name=result.name,
-                        snippet=result.snippet,
-                        score=boosted_score,
-                        is_enabled=result.is_enabled,
-                    )
-                )
+        return self._fuse_results(semantic_results, text_results, limit)
 
-        # Add text results that weren't in semantic results
-        for result in text_results:
-            key = (result.entity_type, result.entity_id)
-            if key not in seen:
-                seen.add(key)
-                combined.append(result)
+    def _fuse_results(
+        self,
+        semantic_results: list[SearchResult],
+        text_results: list[SearchResult],
+        limit: int,
+    ) -> list[SearchResult]:
+        """
+        Combine semantic and text rankings into one deduplicated ranking.
 
-        # Sort by score descending
-        combined.sort(key=lambda x: x.score, reverse=True)
+        With "rrf", each leg contributes weight / (k + rank) for every result
+        it returned; with "weighted", each leg contributes weight * score.
+        Fused scores are rescaled so a top hit in both legs scores 1.0.
+        """
+        settings = get_settings()
+        leg_weights = (
+            (semantic_results, settings.hybrid_semantic_weight),
+            (text_results, 1.0 - settings.hybrid_semantic_weight),
+        )
+        k = settings.hybrid_rrf_k
+
+        fused: dict[tuple[str, str], float] = {}
+        best: dict[tuple[str, str], SearchResult] = {}
+        for results, weight in leg_weights:
+            for rank, result in enumerate(results, start=1):
+                key = (result.entity_type, result.entity_id)
+                if settings.hybrid_fusion == "rrf":
+                    contribution = weight / (k + rank)
+                else:
+                    contribution = weight * result.score
+                fused[key] = fused.get(key, 0.0) + contribution
+                # Semantic results come first, so their snippets are kept
+                best.setdefault(key, result)
+
+        max_score = 1 / (k + 1) if settings.hybrid_fusion == "rrf" else 1.0
+        ranked = sorted(fused.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+        return [
+            best[key].model_copy(update={"score": max(0.0, min(1.0, score / max_score))})
+            for key, score in ranked
+        ]
 
-        return combined[:limit]
+    def _custom_asset_name_expr(self) -> Any:
+        """
+        SQL expression for a custom asset's display name.
 
-    async def _get_entity_name(
+        Uses the value of the type's display field, falling back to common
+        name fields. Requires CustomAssetType to be joined.
+        """
+        return func.coalesce(
+            CustomAsset.values.op("->>", return_type=Text)(CustomAssetType.display_field_key),
+            CustomAsset.values["name"].astext,
+            CustomAsset.values["title"].astext,
+            CustomAsset.values["domain"].astext,
+        )
+
+    async def _get_entity_names(
         self,
         db: AsyncSession,
-        entity_type: str,
-        entity_id: UUID,
-    ) -> str | None:
-        """Get the name of an entity by type and ID."""
-        match entity_type:
-            case "password":
-                result = await db.execute(select(Password.name).where(Password.id == entity_id))
-            case "configuration":
-                result = await db.execute(
-                    select(Configuration.name).where(Configuration.id == entity_id)
-                )
-            case "location":
-                result = await db.execute(select(Location.name).where(Location.id == entity_id))
-            case "document":
-                result = await db.execute(select(Document.name).where(Document.id == entity_id))
-            case "custom_asset":
-                # Custom assets store name in values JSONB field
-                result = await db.execute(
-                    select(CustomAsset.values).where(CustomAsset.id == entity_id)
-                )
-                values = result.scalar_one_or_none()
-                if values:
-                    # Try common name fields
-                    return values.get("name") or values.get("title") or values.get("domain")
-                return None
-            case _:
-                return None
+        refs: list[tuple[str, UUID]],
+    ) -> dict[tuple[str, UUID], str | None]:
+        """
+        Get entity names for a set of (entity_type, entity_id) references.
 
-        return result.scalar_one_or_none()
+        Runs one query per entity type present in refs, regardless of how
+        many entities of that type are requested.
 
-    async def _check_entity_enabled(
-        self,
-        db: AsyncSession,
-        entity_type: str,
-        entity_id: UUID,
-    ) -> bool:
-        """Check if an entity is enabled by type and ID."""
-        match entity_type:
-            case "password":
-                result = await db.execute(
-                    select(Password.is_enabled).where(Password.id == entity_id)
-                )
-            case "configuration":
-                result = await db.execute(
-                    select(Configuration.is_enabled).where(Configuration.id == entity_id)
-                )
-            case "location":
-                result = await db.execute(
-                    select(Location.is_enabled).where(Location.id == entity_id)
-                )
-            case "document":
-                result = await db.execute(
-                    select(Document.is_enabled).where(Document.id == entity_id)
-                )
-            case "custom_asset":
-                result = await db.execute(
-                    select(CustomAsset.is_enabled).where(CustomAsset.id == entity_id)
+        Returns:
+            Mapping of (entity_type, entity_id) to name; missing entities are absent
+        """
+        ids_by_type: dict[str, set[UUID]] = {}
+        for entity_type, entity_id in refs:
+            ids_by_type.setdefault(entity_type, set()).add(entity_id)
+
+        names: dict[tuple[str, UUID], str | None] = {}
+        for entity_type, entity_ids in ids_by_type.items():
+            if entity_type == "custom_asset":
+                stmt = (
+                    select(CustomAsset.id, self._custom_asset_name_expr())
+                    .outerjoin(CustomAssetType, CustomAsset.custom_asset_type_id == CustomAssetType.id)
+                    .where(CustomAsset.id.in_(entity_ids))
                 )
-            case _:
-                return True  # Unknown entity type, assume enabled
+            else:
+                model = ENTITY_MODELS.get(entity_type)
+                if model is None:
+                    continue
+                stmt = select(model.id, model.name).where(model.id.in_(entity_ids))
+
+            result = await db.execute(stmt)
+            for entity_id, name in result.all():
+                names[(entity_type, entity_id)] = name
 
-        is_enabled = result.scalar_one_or_none()
-        return is_enabled if is_enabled is not None else True
+        return names
 
 
 def get_embeddings_service(db: AsyncSession) -> EmbeddingsService:
@@ -2,118 +2,166 @@
 Export Service
 
 Handles the background processing of data exports:
-- Generates CSV files for each entity type
+- Generates CSV files for each entity type, concurrently
 - Bundles everything into a ZIP file
 - Uploads to S3
-- Streams progress updates via WebSocket
+- Streams progress updates via WebSocket (published through Redis)
+
+Exports run on the export worker (see ExportWorkerSettings in src/worker.py).
+
+The pipeline streams end to end: rows are read from server-side cursors in
+batches and written as CSV straight into S3 multipart uploads, then the CSVs
+are streamed from S3 into the ZIP file, itself uploaded in parts. Memory use
+is bounded by the batch and part sizes, not by the size of the export.
+
+Each entity type's CSV is staged as its own S3 object, which is the
+checkpoint: a retried export skips the types that are already staged.
 """
 
+import asyncio
 import csv
 import io
+import json
 import logging
 import zipfile
+from collections.abc import AsyncIterator, Callable, Sequence
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from typing import IO, Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import get_settings
 from src.core.database import get_db_context
-from src.core.pubsub import MessageType, WebSocketMessage, get_connection_manager
+from src.core.pubsub import (
+    publish_export_completed,
+    publish_export_failed,
+    publish_export_progress,
+)
 from src.models.orm.configuration import Configuration
 from src.models.orm.custom_asset import CustomAsset
 from src.models.orm.document import Document
-from src.models.orm.export import ExportStatus
+from src.models.orm.export import Export, ExportStatus
 from src.models.orm.location import Location
 from src.models.orm.organization import Organization
 from src.models.orm.password import Password
 from src.repositories.export import ExportRepository
-from src.services.file_storage import get_file_storage_service
+from src.services.file_storage import MultipartUpload, get_file_storage_service
 
 logger = logging.getLogger(__name__)
 
 
 # =============================================================================
-# WebSocket Progress Publishing
+# Streaming ZIP Archive
 # =============================================================================
 
 
-async def publish_export_progress(
-    export_id: UUID,
-    stage: str,
-    current: int,
-    total: int,
-    entity_type: str | None = None,
-) -> None:
-    """
-    Publish export progress update via WebSocket.
+class _PartBuffer(io.RawIOBase):
+    """Write-only stream collecting output until it is sent as an upload part."""
 
-    Args:
-        export_id: Export job identifier
-        stage: Current stage (e.g., "passwords", "documents")
-        current: Current item number
-        total: Total items to process
-        entity_type: Type of entity being processed
-    """
-    manager = get_connection_manager()
-    message = WebSocketMessage(
-        type=MessageType.PROGRESS,
-        channel=f"export:{export_id}",
-        data={
-            "stage": stage,
-            "current": current,
-            "total": total,
-            "entity_type": entity_type,
-            "percent": round((current / total * 100) if total > 0 else 0, 1),
-        },
-    )
-    await manager.broadcast(f"export:{export_id}", message)
+    def __init__(self) -> None:
+        super().__init__()
+        self._data = bytearray()
+        self.bytes_written = 0
 
+    def writable(self) -> bool:
+        return True
 
-async def publish_export_completed(
-    export_id: UUID,
-    file_size_bytes: int,
-) -> None:
-    """
-    Publish export completion notification via WebSocket.
+    def write(self, data: Any) -> int:
+        self._data += data
+        self.bytes_written += len(data)
+        return len(data)
 
-    Args:
-        export_id: Export job identifier
-        file_size_bytes: Size of the generated ZIP file
-    """
-    manager = get_connection_manager()
-    message = WebSocketMessage(
-        type=MessageType.COMPLETED,
-        channel=f"export:{export_id}",
-        data={
-            "stage": "complete",
-            "file_size_bytes": file_size_bytes,
-        },
-    )
-    await manager.broadcast(f"export:{export_id}", message)
+    def __len__(self) -> int:
+        return len(self._data)
 
+    def take(self, size: int | None = None) -> bytes:
+        """Remove and return up to size bytes (everything if size is None)."""
+        size = len(self._data) if size is None else size
+        data = bytes(self._data[:size])
+        del self._data[:size]
+        return data
 
-async def publish_export_failed(
-    export_id: UUID,
-    error: str,
-) -> None:
+
+class _StreamedUpload:
+    """Output buffered in memory and sent to a multipart upload a part at a time."""
+
+    def __init__(self, upload: MultipartUpload, part_size: int):
+        """
+        Args:
+            upload: Multipart upload receiving the output
+            part_size: Bytes per uploaded part (all but the last)
+        """
+        self._upload = upload
+        self._part_size = part_size
+        self._buffer = _PartBuffer()
+
+    @property
+    def bytes_written(self) -> int:
+        """Size of the output produced so far."""
+        return self._buffer.bytes_written
+
+    async def flush(self) -> None:
+        """Upload every full part buffered so far."""
+        while len(self._buffer) >= self._part_size:
+            await self._upload.upload_part(self._buffer.take(self._part_size))
+
+    async def _finish(self) -> None:
+        await self.flush()
+        if len(self._buffer):
+            await self._upload.upload_part(self._buffer.take())
+
+
+class CsvUpload(_StreamedUpload):
+    """CSV file written straight into an S3 multipart upload."""
+
+    def __init__(self, upload: MultipartUpload, part_size: int):
+        super().__init__(upload, part_size)
+        # TextIOWrapper needs a buffered stream; flushing it flushes through
+        self._text = io.TextIOWrapper(
+            io.BufferedWriter(self._buffer), encoding="utf-8", newline=""
+        )
+        self.writer = csv.writer(self._text)
+
+    async def flush(self) -> None:
+        """Upload every full part written so far."""
+        self._text.flush()
+        await super().flush()
+
+    async def close(self) -> None:
+        """Upload the rest of the file."""
+        self._text.flush()
+        await self._finish()
+
+
+class ExportArchive(_StreamedUpload):
     """
-    Publish export failure notification via WebSocket.
+    ZIP archive written straight into an S3 multipart upload.
 
-    Args:
-        export_id: Export job identifier
-        error: Error message
+    The output buffer isn't seekable, so zipfile records each entry's sizes
+    in a data descriptor after its data instead of going back to patch the
+    header.
     """
-    manager = get_connection_manager()
-    message = WebSocketMessage(
-        type=MessageType.FAILED,
-        channel=f"export:{export_id}",
-        data={
-            "stage": "failed",
-            "error": error,
-        },
-    )
-    await manager.broadcast(f"export:{export_id}", message)
+
+    def __init__(self, upload: MultipartUpload, part_size: int):
+        super().__init__(upload, part_size)
+        self._zip = zipfile.ZipFile(self._buffer, "w", zipfile.ZIP_DEFLATED)
+
+    def open_file(self, name: str) -> IO[bytes]:
+        """Open an entry for writing; close it before opening the next."""
+        # force_zip64: the entry's final size isn't known up front
+        return self._zip.open(name, "w", force_zip64=True)
+
+    def writestr(self, name: str, data: str) -> None:
+        """Add a small entry from a string."""
+        self._zip.writestr(name, data)
+
+    async def close(self) -> None:
+        """Finish the archive and upload the remaining output."""
+        self._zip.close()
+        await self._finish()
 
 
 # =============================================================================
@@ -121,6 +169,210 @@ async def publish_export_failed(
 # =============================================================================
 
 
+@dataclass(frozen=True)
+class EntityExport:
+    """How one entity type is written to its CSV file."""
+
+    filename: str
+    # Progress stage and entity type names, e.g. "passwords" / "password"
+    stage: str
+    entity_type: str
+    model: Any
+    # Sort within each organization
+    order_by: tuple[Any, ...]
+    columns: list[str]
+    row: Callable[[Any], list[Any]]
+
+
+def _timestamp(value: datetime | None) -> str:
+    return value.isoformat() if value else ""
+
+
+def _password_row(password: Password) -> list[Any]:
+    # Passwords are exported without the secret - decryption would require
+    # additional security considerations
+    return [
+        str(password.id),
+        str(password.organization_id),
+        password.name,
+        password.username or "",
+        password.url or "",
+        password.notes or "",
+        _timestamp(password.created_at),
+        _timestamp(password.updated_at),
+    ]
+
+
+def _configuration_row(config: Configuration) -> list[Any]:
+    return [
+        str(config.id),
+        str(config.organization_id),
+        config.name,
+        str(config.configuration_type_id) if config.configuration_type_id else "",
+        str(config.configuration_status_id) if config.configuration_status_id else "",
+        config.serial_number or "",
+        config.asset_tag or "",
+        config.manufacturer or "",
+        config.model or "",
+        config.ip_address or "",
+        config.notes or "",
+        _timestamp(config.created_at),
+        _timestamp(config.updated_at),
+    ]
+
+
+def _location_row(location: Location) -> list[Any]:
+    return [
+        str(location.id),
+        str(location.organization_id),
+        location.name,
+        getattr(location, "address_line_1", "") or "",
+        getattr(location, "address_line_2", "") or "",
+        getattr(location, "city", "") or "",
+        getattr(location, "region", "") or "",
+        getattr(location, "postal_code", "") or "",
+        getattr(location, "country", "") or "",
+        location.notes or "",
+        _timestamp(location.created_at),
+        _timestamp(location.updated_at),
+    ]
+
+
+def _document_row(doc: Document) -> list[Any]:
+    return [
+        str(doc.id),
+        str(doc.organization_id),
+        doc.name,
+        doc.path or "",
+        doc.content or "",
+        _timestamp(doc.created_at),
+        _timestamp(doc.updated_at),
+    ]
+
+
+def _custom_asset_row(asset: CustomAsset) -> list[Any]:
+    # values_json holds the custom field values
+    return [
+        str(asset.id),
+        str(asset.organization_id),
+        str(asset.custom_asset_type_id),
+        json.dumps(asset.values) if asset.values else "{}",
+        asset.is_enabled,
+        _timestamp(asset.created_at),
+        _timestamp(asset.updated_at),
+    ]
+
+
+# CSV files in the archive, in order
+ENTITY_EXPORTS: list[EntityExport] = [
+    EntityExport(
+        filename="passwords.csv",
+        stage="passwords",
+        entity_type="password",
+        model=Password,
+        order_by=(Password.name,),
+        columns=[
+            "id",
+            "organization_id",
+            "name",
+            "username",
+            "url",
+            "notes",
+            "created_at",
+            "updated_at",
+        ],
+        row=_password_row,
+    ),
+    EntityExport(
+        filename="configurations.csv",
+        stage="configurations",
+        entity_type="configuration",
+        model=Configuration,
+        order_by=(Configuration.name,),
+        columns=[
+            "id",
+            "organization_id",
+            "name",
+            "configuration_type_id",
+            "configuration_status_id",
+            "serial_number",
+            "asset_tag",
+            "manufacturer",
+            "model",
+            "ip_address",
+            "notes",
+            "created_at",
+            "updated_at",
+        ],
+        row=_configuration_row,
+    ),
+    EntityExport(
+        filename="locations.csv",
+        stage="locations",
+        entity_type="location",
+        model=Location,
+        order_by=(Location.name,),
+        columns=[
+            "id",
+            "organization_id",
+            "name",
+            "address_line_1",
+            "address_line_2",
+            "city",
+            "region",
+            "postal_code",
+            "country",
+            "notes",
+            "created_at",
+            "updated_at",
+        ],
+        row=_location_row,
+    ),
+    EntityExport(
+        filename="documents.csv",
+        stage="documents",
+        entity_type="document",
+        model=Document,
+        order_by=(Document.path, Document.name),
+        columns=[
+            "id",
+            "organization_id",
+            "name",
+            "path",
+            "content",
+            "created_at",
+            "updated_at",
+        ],
+        row=_document_row,
+    ),
+    EntityExport(
+        filename="custom_assets.csv",
+        stage="custom_assets",
+        entity_type="custom_asset",
+        model=CustomAsset,
+        order_by=(CustomAsset.created_at.desc(),),
+        columns=[
+            "id",
+            "organization_id",
+            "custom_asset_type_id",
+            "values_json",
+            "is_enabled",
+            "created_at",
+            "updated_at",
+        ],
+        row=_custom_asset_row,
+    ),
+]
+
+
+async def _stream_batches(db: AsyncSession, query: Select[Any]) -> AsyncIterator[Sequence[Any]]:
+    """Yield query results in batches read from a server-side cursor."""
+    batch_size = get_settings().export_batch_size
+    result = await db.stream_scalars(query.execution_options(yield_per=batch_size))
+    async for batch in result.partitions():
+        yield batch
+
+
 async def get_all_organization_ids(
     db: AsyncSession,
 ) -> list[UUID]:
@@ -139,327 +391,200 @@ async def get_all_organization_ids(
     return [row[0] for row in result.fetchall()]
 
 
-async def export_passwords_to_csv(
+async def export_entities_to_csv(
     db: AsyncSession,
+    entity: EntityExport,
     organization_ids: list[UUID],
     export_id: UUID,
-) -> str:
+    out: CsvUpload,
+) -> None:
     """
-    Export passwords to CSV format.
+    Export one entity type to CSV format.
 
-    Note: Passwords are exported encrypted - decryption would require
-    additional security considerations.
+    A single query covers every organization. Rows are read in batches from
+    a server-side cursor, so only one batch is held in memory at a time.
 
     Args:
         db: Database session
+        entity: Entity type to export
         organization_ids: List of organization UUIDs to export
         export_id: Export job ID for progress updates
-
-    Returns:
-        CSV content as string
+        out: CSV file to write rows into
     """
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
-        "id",
-        "organization_id",
-        "name",
-        "username",
-        "url",
-        "notes",
-        "created_at",
-        "updated_at",
-    ])
-
-    for i, org_id in enumerate(organization_ids):
-        result = await db.execute(
-            select(Password)
-            .where(Password.organization_id == org_id)
-            .order_by(Password.name)
-        )
-        passwords = result.scalars().all()
-
-        for password in passwords:
-            writer.writerow([
-                str(password.id),
-                str(password.organization_id),
-                password.name,
-                password.username or "",
-                password.url or "",
-                password.notes or "",
-                password.created_at.isoformat() if password.created_at else "",
-                password.updated_at.isoformat() if password.updated_at else "",
-            ])
+    model = entity.model
+    out.writer.writerow(entity.columns)
+
+    # Rows arrive grouped by organization in ID order, so the last row's
+    # organization tells how far through the export is
+    org_position = {org_id: i + 1 for i, org_id in enumerate(sorted(organization_ids))}
+    total = len(organization_ids)
+
+    query = (
+        select(model)
+        .where(model.organization_id.in_(organization_ids))
+        .order_by(model.organization_id, *entity.order_by)
+    )
+    async for batch in _stream_batches(db, query):
+        for item in batch:
+            out.writer.writerow(entity.row(item))
+        await out.flush()
 
         await publish_export_progress(
-            export_id, "passwords", i + 1, len(organization_ids), "password"
+            export_id,
+            entity.stage,
+            org_position[batch[-1].organization_id],
+            total,
+            entity.entity_type,
+            bytes_written=out.bytes_written,
         )
 
-    return output.getvalue()
+    await publish_export_progress(
+        export_id,
+        entity.stage,
+        total,
+        total,
+        entity.entity_type,
+        bytes_written=out.bytes_written,
+    )
 
 
-async def export_configurations_to_csv(
-    db: AsyncSession,
-    organization_ids: list[UUID],
-    export_id: UUID,
-) -> str:
-    """
-    Export configurations to CSV format.
+# =============================================================================
+# Main Export Processing
+# =============================================================================
 
-    Args:
-        db: Database session
-        organization_ids: List of organization UUIDs to export
-        export_id: Export job ID for progress updates
 
-    Returns:
-        CSV content as string
-    """
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
-        "id",
-        "organization_id",
-        "name",
-        "configuration_type_id",
-        "configuration_status_id",
-        "serial_number",
-        "asset_tag",
-        "manufacturer",
-        "model",
-        "ip_address",
-        "notes",
-        "created_at",
-        "updated_at",
-    ])
-
-    for i, org_id in enumerate(organization_ids):
-        result = await db.execute(
-            select(Configuration)
-            .where(Configuration.organization_id == org_id)
-            .order_by(Configuration.name)
-        )
-        configurations = result.scalars().all()
-
-        for config in configurations:
-            writer.writerow([
-                str(config.id),
-                str(config.organization_id),
-                config.name,
-                str(config.configuration_type_id) if config.configuration_type_id else "",
-                str(config.configuration_status_id) if config.configuration_status_id else "",
-                config.serial_number or "",
-                config.asset_tag or "",
-                config.manufacturer or "",
-                config.model or "",
-                config.ip_address or "",
-                config.notes or "",
-                config.created_at.isoformat() if config.created_at else "",
-                config.updated_at.isoformat() if config.updated_at else "",
-            ])
+def staged_file_key(export_id: UUID, filename: str) -> str:
+    """S3 key a finished CSV is kept under until the ZIP file is built."""
+    return f"exports/{export_id}/staged/{filename}"
 
-        await publish_export_progress(
-            export_id, "configurations", i + 1, len(organization_ids), "configuration"
-        )
 
-    return output.getvalue()
+async def _stage_file(org_ids: list[UUID], export_id: UUID, entity: EntityExport) -> None:
+    """Stream one entity type's CSV to its staging object, on its own connection."""
+    file_storage = get_file_storage_service()
+    part_size = get_settings().s3_multipart_part_size
 
+    async with (
+        get_db_context() as db,
+        file_storage.multipart_upload(
+            staged_file_key(export_id, entity.filename), content_type="text/csv"
+        ) as upload,
+    ):
+        out = CsvUpload(upload, part_size)
+        await export_entities_to_csv(db, entity, org_ids, export_id, out)
+        await out.close()
 
-async def export_locations_to_csv(
-    db: AsyncSession,
-    organization_ids: list[UUID],
+
+async def stage_files(
+    org_ids: list[UUID],
     export_id: UUID,
-) -> str:
+    entities: list[EntityExport],
+) -> None:
     """
-    Export locations to CSV format.
+    Stage several entity types' CSVs concurrently.
 
-    Args:
-        db: Database session
-        organization_ids: List of organization UUIDs to export
-        export_id: Export job ID for progress updates
+    Every type runs to completion even if another fails, so a retry has as
+    little left to do as possible.
 
-    Returns:
-        CSV content as string
+    Raises:
+        Exception: The first failure, once all types have finished
     """
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
-        "id",
-        "organization_id",
-        "name",
-        "address_line_1",
-        "address_line_2",
-        "city",
-        "region",
-        "postal_code",
-        "country",
-        "notes",
-        "created_at",
-        "updated_at",
-    ])
-
-    for i, org_id in enumerate(organization_ids):
-        result = await db.execute(
-            select(Location)
-            .where(Location.organization_id == org_id)
-            .order_by(Location.name)
-        )
-        locations = result.scalars().all()
-
-        for location in locations:
-            writer.writerow([
-                str(location.id),
-                str(location.organization_id),
-                location.name,
-                getattr(location, "address_line_1", "") or "",
-                getattr(location, "address_line_2", "") or "",
-                getattr(location, "city", "") or "",
-                getattr(location, "region", "") or "",
-                getattr(location, "postal_code", "") or "",
-                getattr(location, "country", "") or "",
-                location.notes or "",
-                location.created_at.isoformat() if location.created_at else "",
-                location.updated_at.isoformat() if location.updated_at else "",
-            ])
-
-        await publish_export_progress(
-            export_id, "locations", i + 1, len(organization_ids), "location"
-        )
-
-    return output.getvalue()
+    results = await asyncio.gather(
+        *(_stage_file(org_ids, export_id, entity) for entity in entities),
+        return_exceptions=True,
+    )
+    for entity, result in zip(entities, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.error(f"Export {export_id}: {entity.filename} failed: {result}")
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
 
 
-async def export_documents_to_csv(
-    db: AsyncSession,
-    organization_ids: list[UUID],
-    export_id: UUID,
-) -> str:
+async def _build_archive(export_id: UUID, org_ids: list[UUID], s3_key: str) -> int:
     """
-    Export documents to CSV format.
-
-    Args:
-        db: Database session
-        organization_ids: List of organization UUIDs to export
-        export_id: Export job ID for progress updates
+    Stream the staged CSVs and a metadata file into the export ZIP file.
 
     Returns:
-        CSV content as string
+        Size of the ZIP file in bytes
     """
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
-        "id",
-        "organization_id",
-        "name",
-        "path",
-        "content",
-        "created_at",
-        "updated_at",
-    ])
-
-    for i, org_id in enumerate(organization_ids):
-        result = await db.execute(
-            select(Document)
-            .where(Document.organization_id == org_id)
-            .order_by(Document.path, Document.name)
-        )
-        documents = result.scalars().all()
-
-        for doc in documents:
-            writer.writerow([
-                str(doc.id),
-                str(doc.organization_id),
-                doc.name,
-                doc.path or "",
-                doc.content or "",
-                doc.created_at.isoformat() if doc.created_at else "",
-                doc.updated_at.isoformat() if doc.updated_at else "",
-            ])
+    file_storage = get_file_storage_service()
+    part_size = get_settings().s3_multipart_part_size
 
-        await publish_export_progress(
-            export_id, "documents", i + 1, len(organization_ids), "document"
-        )
+    async with file_storage.multipart_upload(s3_key, content_type="application/zip") as upload:
+        archive = ExportArchive(upload, part_size)
 
-    return output.getvalue()
+        for entity in ENTITY_EXPORTS:
+            with archive.open_file(entity.filename) as entry:
+                async for chunk in file_storage.iter_file(staged_file_key(export_id, entity.filename)):
+                    entry.write(chunk)
+                    await archive.flush()
 
+        metadata = {
+            "export_id": str(export_id),
+            "created_at": datetime.now(UTC).isoformat(),
+            "organization_ids": [str(org_id) for org_id in org_ids],
+            "files": [entity.filename for entity in ENTITY_EXPORTS],
+        }
+        archive.writestr("metadata.json", json.dumps(metadata, indent=2))
+        await archive.close()
 
-async def export_custom_assets_to_csv(
-    db: AsyncSession,
-    organization_ids: list[UUID],
-    export_id: UUID,
-) -> str:
-    """
-    Export custom assets to CSV format.
+    return archive.bytes_written
 
-    The 'fields' column contains JSON data with custom field values.
 
-    Args:
-        db: Database session
-        organization_ids: List of organization UUIDs to export
-        export_id: Export job ID for progress updates
+async def _delete_staged_files(export_id: UUID) -> None:
+    file_storage = get_file_storage_service()
+    for entity in ENTITY_EXPORTS:
+        await file_storage.delete_file(staged_file_key(export_id, entity.filename))
 
-    Returns:
-        CSV content as string
-    """
-    import json
-
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
-        "id",
-        "organization_id",
-        "custom_asset_type_id",
-        "values_json",
-        "is_enabled",
-        "created_at",
-        "updated_at",
-    ])
-
-    for i, org_id in enumerate(organization_ids):
-        result = await db.execute(
-            select(CustomAsset)
-            .where(CustomAsset.organization_id == org_id)
-            .order_by(CustomAsset.created_at.desc())
-        )
-        assets = result.scalars().all()
-
-        for asset in assets:
-            values_json = json.dumps(asset.values) if asset.values else "{}"
-            writer.writerow([
-                str(asset.id),
-                str(asset.organization_id),
-                str(asset.custom_asset_type_id),
-                values_json,
-                asset.is_enabled,
-                asset.created_at.isoformat() if asset.created_at else "",
-                asset.updated_at.isoformat() if asset.updated_at else "",
-            ])
 
-        await publish_export_progress(
-            export_id, "custom_assets", i + 1, len(organization_ids), "custom_asset"
+async def _fail_export(
+    db: AsyncSession,
+    repo: ExportRepository,
+    export: Export,
+    export_id: UUID,
+    error_message: str,
+) -> None:
+    """Mark an export FAILED, remove its staged CSVs and publish the failure."""
+    try:
+        await repo.update_status(
+            export,
+            ExportStatus.FAILED,
+            error_message=error_message[:1000],  # Truncate if too long
         )
+        await db.commit()
+    except Exception as update_error:
+        logger.error(f"Failed to update export status: {update_error}")
 
-    return output.getvalue()
-
+    await _delete_staged_files(export_id)
 
-# =============================================================================
-# Main Export Processing
-# =============================================================================
+    # Publish failure
+    await publish_export_failed(export_id, error_message)
 
 
-async def process_export(export_id: UUID) -> None:
+async def process_export(export_id: UUID, *, final_attempt: bool = True) -> bool:
     """
-    Background task to generate export ZIP file.
+    Generate an export ZIP file. Run by the export worker.
 
     This function:
     1. Updates export status to PROCESSING
-    2. Generates CSV files for each entity type
-    3. Creates a ZIP file containing all CSVs
-    4. Uploads ZIP to S3
-    5. Updates export status to COMPLETED
-    6. Publishes progress via WebSocket throughout
+    2. Streams each entity type's CSV to a staging object in S3, all types
+       concurrently, skipping types an earlier attempt already finished
+    3. Streams the staged CSVs into the ZIP file, uploaded to S3 in parts
+    4. Updates export status to COMPLETED and removes the staged CSVs
+    5. Publishes progress via WebSocket throughout
+
+    When an attempt that isn't the final one fails, the export stays
+    PROCESSING and the staged CSVs are kept, so the retry resumes with the
+    first entity type that didn't finish. A cancelled attempt (timeout or
+    worker shutdown) is handled the same way, except the cancellation is
+    re-raised once the export has been dealt with.
 
     Args:
         export_id: Export job identifier
+        final_attempt: Whether a failure should mark the export FAILED
+
+    Returns:
+        False if the attempt failed and should be retried, otherwise True
     """
     async with get_db_context() as db:
         repo = ExportRepository(db)
@@ -467,7 +592,10 @@ async def process_export(export_id: UUID) -> None:
 
         if not export:
             logger.error(f"Export {export_id} not found")
-            return
+            return True
+
+        if export.status == ExportStatus.COMPLETED:
+            return True
 
         try:
             # Update status to processing
@@ -487,69 +615,34 @@ async def process_export(export_id: UUID) -> None:
             logger.info(
                 f"Processing export {export_id} for {len(org_ids)} organizations"
             )
+            # Release this session's connection while the stages use their own
+            await db.commit()
 
-            # Create in-memory ZIP file
-            zip_buffer = io.BytesIO()
-
-            with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-                # Export passwords
-                await publish_export_progress(export_id, "starting", 0, 5, "passwords")
-                passwords_csv = await export_passwords_to_csv(db, org_ids, export_id)
-                zf.writestr("passwords.csv", passwords_csv)
-
-                # Export configurations
-                await publish_export_progress(export_id, "starting", 1, 5, "configurations")
-                configs_csv = await export_configurations_to_csv(db, org_ids, export_id)
-                zf.writestr("configurations.csv", configs_csv)
-
-                # Export locations
-                await publish_export_progress(export_id, "starting", 2, 5, "locations")
-                locations_csv = await export_locations_to_csv(db, org_ids, export_id)
-                zf.writestr("locations.csv", locations_csv)
-
-                # Export documents
-                await publish_export_progress(export_id, "starting", 3, 5, "documents")
-                documents_csv = await export_documents_to_csv(db, org_ids, export_id)
-                zf.writestr("documents.csv", documents_csv)
-
-                # Export custom assets
-                await publish_export_progress(export_id, "starting", 4, 5, "custom_assets")
-                custom_assets_csv = await export_custom_assets_to_csv(db, org_ids, export_id)
-                zf.writestr("custom_assets.csv", custom_assets_csv)
-
-                # Add metadata file
-                import json
-
-                metadata = {
-                    "export_id": str(export_id),
-                    "created_at": datetime.now(UTC).isoformat(),
-                    "organization_ids": [str(org_id) for org_id in org_ids],
-                    "files": [
-                        "passwords.csv",
-                        "configurations.csv",
-                        "locations.csv",
-                        "documents.csv",
-                        "custom_assets.csv",
-                    ],
-                }
-                zf.writestr("metadata.json", json.dumps(metadata, indent=2))
-
-            # Upload to S3
-            await publish_export_progress(export_id, "uploading", 5, 5, None)
-            zip_buffer.seek(0)
-            zip_content = zip_buffer.getvalue()
-            file_size_bytes = len(zip_content)
-
-            s3_key = f"exports/{export_id}/{datetime.now(UTC).strftime('%Y-%m-%d')}-export.zip"
+            # Entity types staged by an earlier attempt are already done
             file_storage = get_file_storage_service()
-            success = await file_storage.upload_file(
-                s3_key,
-                zip_content,
-                content_type="application/zip",
+            pending = [
+                entity
+                for entity in ENTITY_EXPORTS
+                if not await file_storage.file_exists(staged_file_key(export_id, entity.filename))
+            ]
+            total_stages = len(ENTITY_EXPORTS) + 1
+            if len(pending) < len(ENTITY_EXPORTS):
+                logger.info(
+                    f"Export {export_id}: resuming with {', '.join(e.filename for e in pending) or 'packaging'}"
+                )
+
+            # Each entity type streams on its own connection, all at once
+            await publish_export_progress(
+                export_id, "starting", len(ENTITY_EXPORTS) - len(pending), total_stages, None
             )
+            await stage_files(org_ids, export_id, pending)
 
-            if not success:
-                raise RuntimeError("Failed to upload export to S3")
+            # Package the staged CSVs
+            await publish_export_progress(
+                export_id, "packaging", len(ENTITY_EXPORTS), total_stages, None
+            )
+            s3_key = f"exports/{export_id}/{datetime.now(UTC).strftime('%Y-%m-%d')}-export.zip"
+            file_size_bytes = await _build_archive(export_id, org_ids, s3_key)
 
             # Update export status to completed
             await repo.update_status(
@@ -560,6 +653,8 @@ async def process_export(export_id: UUID) -> None:
             )
             await db.commit()
 
+            await _delete_staged_files(export_id)
+
             # Publish completion
             await publish_export_completed(export_id, file_size_bytes)
 
@@ -567,21 +662,29 @@ async def process_export(export_id: UUID) -> None:
                 f"Export {export_id} completed successfully: "
                 f"{file_size_bytes} bytes, {len(org_ids)} organizations"
             )
+            return True
+
+        except asyncio.CancelledError:
+            # The attempt timed out or the worker is shutting down
+            if not final_attempt:
+                logger.warning(f"Export {export_id} attempt cancelled, will retry")
+                raise
+
+            logger.error(f"Export {export_id} cancelled on its final attempt")
+            await _fail_export(db, repo, export, export_id, "Export timed out or was cancelled")
+            raise
 
         except Exception as e:
             error_message = str(e)
-            logger.error(f"Export {export_id} failed: {error_message}", exc_info=True)
 
-            # Update export status to failed
-            try:
-                await repo.update_status(
-                    export,
-                    ExportStatus.FAILED,
-                    error_message=error_message[:1000],  # Truncate if too long
+            if not final_attempt:
+                logger.warning(
+                    f"Export {export_id} attempt failed, will retry: {error_message}",
+                    exc_info=True,
                 )
-                await db.commit()
-            except Exception as update_error:
-                logger.error(f"Failed to update export status: {update_error}")
+                return False
+
+            logger.error(f"Export {export_id} failed: {error_message}", exc_info=True)
+            await _fail_export(db, repo, export, export_id, error_message)
+            return True
 
-            # Publish failure
-            await publish_export_failed(export_id, error_message)
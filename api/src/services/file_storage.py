@@ -5,25 +5,98 @@ Handles S3 operations including:
 - Presigned upload URLs
 - Presigned download URLs
 - File deletion
+- Multipart uploads and chunked downloads for streamed content
 - MIME type detection
 
 Supports MinIO in development and any S3-compatible storage in production.
+
+Each process shares one S3 client with a pooled set of HTTP connections. It
+is created on first use (or at API startup) and closed on shutdown, so
+presigning URLs is local signing work with no per-call client setup.
+
+Presigned download URLs are also reused for a short while per file, so a
+page listing many attachments (or a document embedding many images) gets
+the same URLs on every load and browsers can serve them from cache.
 """
 
+import asyncio
+import base64
 import hashlib
 import logging
 import mimetypes
-from contextlib import asynccontextmanager
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from src.config import Settings, get_settings
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator
+    from collections.abc import AsyncGenerator, AsyncIterator, Iterable
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on cached presigned download URLs per process
+_DOWNLOAD_URL_CACHE_SIZE = 10_000
+
+
+class MultipartUpload:
+    """
+    An in-progress S3 multipart upload.
+
+    Created by FileStorageService.multipart_upload(). Every part except the
+    last must be at least 5 MiB (an S3 limit).
+    """
+
+    def __init__(self, client: Any, bucket: str, s3_key: str, upload_id: str):
+        self._client = client
+        self._bucket = bucket
+        self.s3_key = s3_key
+        self.upload_id = upload_id
+        self._parts: list[dict[str, Any]] = []
+        self.bytes_uploaded = 0
+
+    async def upload_part(self, data: bytes) -> None:
+        """
+        Upload the next part.
+
+        Args:
+            data: Part content
+        """
+        part_number = len(self._parts) + 1
+        response = await self._client.upload_part(
+            Bucket=self._bucket,
+            Key=self.s3_key,
+            UploadId=self.upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+        self.bytes_uploaded += len(data)
+
+    async def complete(self) -> None:
+        """Assemble the uploaded parts into the final object."""
+        if not self._parts:
+            # S3 rejects completing an upload with no parts
+            await self.upload_part(b"")
+        await self._client.complete_multipart_upload(
+            Bucket=self._bucket,
+            Key=self.s3_key,
+            UploadId=self.upload_id,
+            MultipartUpload={"Parts": self._parts},
+        )
+
+    async def abort(self) -> None:
+        """Discard the upload and any parts stored so far."""
+        try:
+            await self._client.abort_multipart_upload(
+                Bucket=self._bucket,
+                Key=self.s3_key,
+                UploadId=self.upload_id,
+            )
+        except Exception as e:
+            logger.error(f"Failed to abort multipart upload: {self.s3_key}, error: {e}")
+
 
 class FileStorageService:
     """Service for S3-compatible file storage operations."""
@@ -37,35 +110,81 @@ class FileStorageService:
                      Uses get_settings() if not provided.
         """
         self.settings = settings or get_settings()
+        self._client: Any = None
+        self._client_stack: AsyncExitStack | None = None
+        self._client_lock = asyncio.Lock()
+        # (s3_key, filename) -> (cached until, presigned URL)
+        self._download_urls: dict[tuple[str, str | None], tuple[float, str]] = {}
+
+    async def _get_shared_client(self) -> Any:
+        """Get the shared S3 client, creating it on first use."""
+        if self._client is not None:
+            return self._client
+
+        if not self.settings.s3_configured:
+            raise RuntimeError(
+                "S3 storage not configured. "
+                "Set BIFROST_DOCS_S3_ACCESS_KEY and BIFROST_DOCS_S3_SECRET_KEY environment variables."
+            )
+
+        async with self._client_lock:
+            if self._client is None:
+                from aiobotocore.config import AioConfig
+                from aiobotocore.session import get_session
+
+                session = get_session()
+                stack = AsyncExitStack()
+                self._client = await stack.enter_async_context(
+                    session.create_client(
+                        "s3",
+                        endpoint_url=self.settings.s3_endpoint,
+                        aws_access_key_id=self.settings.s3_access_key,
+                        aws_secret_access_key=self.settings.s3_secret_key,
+                        region_name=self.settings.s3_region,
+                        config=AioConfig(
+                            max_pool_connections=self.settings.s3_max_pool_connections,
+                            connect_timeout=self.settings.s3_connect_timeout,
+                        ),
+                    )
+                )
+                self._client_stack = stack
+        return self._client
+
+    async def start_client(self) -> None:
+        """
+        Create the shared S3 client ahead of the first request.
+
+        Called on application startup. Does nothing if S3 isn't configured.
+        """
+        if self.settings.s3_configured:
+            await self._get_shared_client()
+
+    async def close_client(self) -> None:
+        """
+        Close the shared S3 client and its connection pool.
+
+        Should be called on application shutdown.
+        """
+        if self._client_stack is not None:
+            await self._client_stack.aclose()
+        self._client = None
+        self._client_stack = None
 
     @asynccontextmanager
     async def get_client(self) -> "AsyncGenerator[Any, None]":
         """
         Get S3 client context manager.
 
+        Yields the process-wide shared client; leaving the context does not
+        close it.
+
         Yields:
             Async S3 client from aiobotocore
 
         Raises:
             RuntimeError: If S3 storage is not configured
         """
-        if not self.settings.s3_configured:
-            raise RuntimeError(
-                "S3 storage not configured. "
-                "Set BIFROST_DOCS_S3_ACCESS_KEY and BIFROST_DOCS_S3_SECRET_KEY environment variables."
-            )
-
-        from aiobotocore.session import get_session
-
-        session = get_session()
-        async with session.create_client(
-            "s3",
-            endpoint_url=self.settings.s3_endpoint,
-            aws_access_key_id=self.settings.s3_access_key,
-            aws_secret_access_key=self.settings.s3_secret_key,
-            region_name=self.settings.s3_region,
-        ) as client:
-            yield client
+        yield await self._get_shared_client()
 
     @staticmethod
     def compute_hash(content: bytes) -> str:
@@ -143,14 +262,20 @@ class FileStorageService:
         s3_key: str,
         content_type: str,
         expires_in: int | None = None,
+        sha256: str | None = None,
     ) -> str:
         """
         Generate a presigned PUT URL for direct S3 upload.
 
+        With sha256 the URL is signed for that checksum, so S3 rejects any
+        upload whose content doesn't match it. The uploader must send the
+        headers from upload_headers().
+
         Args:
             s3_key: Target path in S3
             content_type: MIME type of the file being uploaded
             expires_in: URL expiration time in seconds (default from settings)
+            sha256: Hex SHA-256 the uploaded content must have
 
         Returns:
             Presigned PUT URL for direct browser upload
@@ -158,18 +283,68 @@ class FileStorageService:
         if expires_in is None:
             expires_in = self.settings.s3_presigned_url_expiry
 
+        params: dict[str, Any] = {
+            "Bucket": self.settings.s3_bucket,
+            "Key": s3_key,
+            "ContentType": content_type,
+        }
+        if sha256:
+            params["ChecksumSHA256"] = self.checksum_sha256(sha256)
+
         async with self.get_client() as s3:
             url: str = await s3.generate_presigned_url(
                 "put_object",
-                Params={
-                    "Bucket": self.settings.s3_bucket,
-                    "Key": s3_key,
-                    "ContentType": content_type,
-                },
+                Params=params,
                 ExpiresIn=expires_in,
             )
         return self._rewrite_url_for_public(url)
 
+    @staticmethod
+    def checksum_sha256(sha256: str) -> str:
+        """Convert a hex SHA-256 to the base64 form S3 checksums use."""
+        return base64.b64encode(bytes.fromhex(sha256)).decode("ascii")
+
+    @classmethod
+    def upload_headers(cls, content_type: str, sha256: str | None = None) -> dict[str, str]:
+        """
+        Headers a PUT to a URL from generate_upload_url() must send.
+
+        Args:
+            content_type: MIME type the URL was signed for
+            sha256: Hex SHA-256 the URL was signed for, if any
+
+        Returns:
+            Header names and values
+        """
+        headers = {"Content-Type": content_type}
+        if sha256:
+            headers["x-amz-checksum-sha256"] = cls.checksum_sha256(sha256)
+        return headers
+
+    @property
+    def download_url_cache_ttl(self) -> int:
+        """Seconds a presigned download URL is reused (at most half its expiry)."""
+        return min(
+            self.settings.s3_download_url_cache_ttl,
+            self.settings.s3_download_url_expiry // 2,
+        )
+
+    @property
+    def download_url_min_lifetime(self) -> int:
+        """Seconds a URL from generate_download_url() is still valid for, at least."""
+        return self.settings.s3_download_url_expiry - self.download_url_cache_ttl
+
+    def _cache_download_url(self, key: tuple[str, str | None], url: str, ttl: int) -> None:
+        now = time.monotonic()
+        if len(self._download_urls) >= _DOWNLOAD_URL_CACHE_SIZE:
+            self._download_urls = {
+                k: entry for k, entry in self._download_urls.items() if entry[0] > now
+            }
+            if len(self._download_urls) >= _DOWNLOAD_URL_CACHE_SIZE:
+                # Still full of live entries: drop the oldest
+                del self._download_urls[next(iter(self._download_urls))]
+        self._download_urls[key] = (now + ttl, url)
+
     async def generate_download_url(
         self,
         s3_key: str,
@@ -179,6 +354,10 @@ class FileStorageService:
         """
         Generate a presigned GET URL for file download.
 
+        With the default expiry, a URL signed for the same file and filename
+        within the last s3_download_url_cache_ttl seconds is returned instead
+        of a new one, so it is valid for at least download_url_min_lifetime.
+
         Args:
             s3_key: File path in S3
             filename: Original filename for Content-Disposition header
@@ -187,8 +366,16 @@ class FileStorageService:
         Returns:
             Presigned GET URL for download
         """
+        cache_ttl = 0
         if expires_in is None:
             expires_in = self.settings.s3_download_url_expiry
+            cache_ttl = self.download_url_cache_ttl
+
+        cache_key = (s3_key, filename)
+        if cache_ttl > 0:
+            cached = self._download_urls.get(cache_key)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
 
         params: dict[str, Any] = {
             "Bucket": self.settings.s3_bucket,
@@ -205,7 +392,27 @@ class FileStorageService:
                 Params=params,
                 ExpiresIn=expires_in,
             )
-        return self._rewrite_url_for_public(url)
+        url = self._rewrite_url_for_public(url)
+        if cache_ttl > 0:
+            self._cache_download_url(cache_key, url, cache_ttl)
+        return url
+
+    async def generate_download_urls(
+        self, files: "Iterable[tuple[str, str | None]]"
+    ) -> list[str]:
+        """
+        Generate presigned GET URLs for several files.
+
+        Args:
+            files: (s3_key, filename) pairs
+
+        Returns:
+            Presigned GET URLs in the same order as files
+        """
+        return [
+            await self.generate_download_url(s3_key=s3_key, filename=filename)
+            for s3_key, filename in files
+        ]
 
     async def delete_file(self, s3_key: str) -> bool:
         """
@@ -217,6 +424,9 @@ class FileStorageService:
         Returns:
             True if deletion was successful
         """
+        self._download_urls = {
+            k: entry for k, entry in self._download_urls.items() if k[0] != s3_key
+        }
         try:
             async with self.get_client() as s3:
                 await s3.delete_object(
@@ -262,6 +472,64 @@ class FileStorageService:
             logger.error(f"Failed to upload file to S3: {s3_key}, error: {e}")
             return False
 
+    @asynccontextmanager
+    async def multipart_upload(
+        self,
+        s3_key: str,
+        content_type: str = "application/octet-stream",
+    ) -> "AsyncGenerator[MultipartUpload, None]":
+        """
+        Upload content to S3 in parts as it is produced.
+
+        The upload is completed when the context exits normally and aborted
+        if it raises, so no partial object is left behind.
+
+        Args:
+            s3_key: Target path in S3
+            content_type: MIME type of the content
+
+        Yields:
+            MultipartUpload to send parts to
+        """
+        async with self.get_client() as s3:
+            response = await s3.create_multipart_upload(
+                Bucket=self.settings.s3_bucket,
+                Key=s3_key,
+                ContentType=content_type,
+            )
+            upload = MultipartUpload(s3, self.settings.s3_bucket, s3_key, response["UploadId"])
+            try:
+                yield upload
+            except BaseException:
+                await upload.abort()
+                raise
+            await upload.complete()
+        logger.info(f"Uploaded file to S3: {s3_key} ({upload.bytes_uploaded} bytes)")
+
+    async def iter_file(
+        self,
+        s3_key: str,
+        chunk_size: int = 1024 * 1024,
+    ) -> "AsyncIterator[bytes]":
+        """
+        Stream a file's content from S3.
+
+        Args:
+            s3_key: File path in S3
+            chunk_size: Maximum bytes per chunk
+
+        Yields:
+            Chunks of file content
+        """
+        async with self.get_client() as s3:
+            response = await s3.get_object(
+                Bucket=self.settings.s3_bucket,
+                Key=s3_key,
+            )
+            async with response["Body"] as body:
+                async for chunk in body.iter_chunks(chunk_size):
+                    yield chunk
+
     async def file_exists(self, s3_key: str) -> bool:
         """
         Check if a file exists in S3.
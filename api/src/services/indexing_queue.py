@@ -5,17 +5,139 @@ Provides async functions to enqueue indexing jobs for background processing.
 Jobs are processed by the arq worker (src/worker.py).
 
 This allows indexing to happen asynchronously without blocking API responses.
+
+Jobs are enqueued through a single application-lifetime arq pool, created in
+the API lifespan via init_arq_pool() and closed with close_arq_pool().
+
+Index jobs use a deterministic job ID per entity and are deferred by a short
+debounce window, so repeated saves of the same entity collapse into one job.
+
+Exports go to their own queue (EXPORT_QUEUE_NAME), served by a separate
+worker (ExportWorkerSettings) so long exports never delay indexing.
 """
 
+import asyncio
+import hashlib
 import logging
 
-from arq import create_pool
+from arq import ArqRedis, create_pool
 from arq.connections import RedisSettings
+from arq.constants import in_progress_key_prefix
 
 from src.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# arq queue served by the export worker (src.worker.ExportWorkerSettings)
+EXPORT_QUEUE_NAME = "arq:queue:exports"
+
+# Module-level arq pool shared by all enqueue calls in this process
+_arq_pool: ArqRedis | None = None
+_arq_pool_lock = asyncio.Lock()
+
+
+async def init_arq_pool() -> ArqRedis:
+    """
+    Create the shared arq pool.
+
+    Called on application startup. Safe to call more than once.
+
+    Returns:
+        The shared ArqRedis pool
+    """
+    return await get_arq_pool()
+
+
+async def get_arq_pool() -> ArqRedis:
+    """
+    Get the shared arq pool, creating it on first use.
+
+    Lazy creation keeps enqueueing working in contexts that don't run the
+    API lifespan (scripts, tests, the worker itself).
+
+    Returns:
+        The shared ArqRedis pool
+    """
+    global _arq_pool
+
+    if _arq_pool is None:
+        async with _arq_pool_lock:
+            if _arq_pool is None:
+                settings = get_settings()
+                _arq_pool = await create_pool(RedisSettings.from_dsn(settings.redis_url))
+
+    return _arq_pool
+
+
+async def close_arq_pool() -> None:
+    """
+    Close the shared arq pool.
+
+    Should be called on application shutdown.
+    """
+    global _arq_pool
+
+    if _arq_pool is not None:
+        await _arq_pool.aclose()
+        _arq_pool = None
+
+
+def index_job_id(entity_type: str, entity_id: str) -> str:
+    """Deterministic arq job ID for indexing a single entity."""
+    return f"index:{entity_type}:{entity_id}"
+
+
+def index_batch_job_id(entity_type: str, entity_ids: list[str]) -> str:
+    """Deterministic arq job ID for indexing a set of entities."""
+    digest = hashlib.sha1(",".join(sorted(entity_ids)).encode("utf-8")).hexdigest()
+    return f"index-batch:{entity_type}:{digest}"
+
+
+def remove_job_id(entity_type: str, entity_id: str) -> str:
+    """Deterministic arq job ID for removing an entity from the index."""
+    return f"remove:{entity_type}:{entity_id}"
+
+
+def custom_asset_indexes_job_id(custom_asset_type_id: str) -> str:
+    """Deterministic arq job ID for syncing a custom asset type's field indexes."""
+    return f"custom-asset-indexes:{custom_asset_type_id}"
+
+
+def export_job_id(export_id: str) -> str:
+    """Deterministic arq job ID for processing an export."""
+    return f"export:{export_id}"
+
+
+async def _enqueue_deduplicated(
+    redis: ArqRedis,
+    function: str,
+    job_id: str,
+    *args: object,
+    defer_by: float | None = None,
+) -> bool:
+    """
+    Enqueue a job under a deterministic ID, collapsing pending duplicates.
+
+    arq refuses to enqueue a job whose ID already exists. That is what we want
+    while the job is still queued - it will read the latest data when it runs.
+    If the existing job is already running it may have read stale data, so a
+    single follow-up job is queued behind it instead.
+
+    Returns:
+        True if a new job was queued, False if it collapsed into a pending one
+    """
+    job = await redis.enqueue_job(function, *args, _job_id=job_id, _defer_by=defer_by)
+    if job is not None:
+        return True
+
+    if await redis.exists(in_progress_key_prefix + job_id):
+        job = await redis.enqueue_job(
+            function, *args, _job_id=f"{job_id}:rerun", _defer_by=defer_by
+        )
+        return job is not None
+
+    return False
+
 
 async def enqueue_index_entity(
     entity_type: str,
@@ -26,7 +148,9 @@ async def enqueue_index_entity(
     Enqueue an entity for indexing.
 
     Called from routers after create/update operations.
-    The job will be processed asynchronously by the worker.
+    The job will be processed asynchronously by the worker after the
+    debounce window; further enqueues for the same entity in the meantime
+    are collapsed into the pending job.
 
     Args:
         entity_type: Type of entity (password, document, configuration, etc.)
@@ -35,15 +159,18 @@ async def enqueue_index_entity(
     """
     settings = get_settings()
     try:
-        redis = await create_pool(RedisSettings.from_dsn(settings.redis_url))
-        await redis.enqueue_job(
+        redis = await get_arq_pool()
+        queued = await _enqueue_deduplicated(
+            redis,
             "index_entity_task",
+            index_job_id(entity_type, entity_id),
             entity_type,
             entity_id,
             org_id,
+            defer_by=settings.index_debounce_seconds,
         )
         logger.debug(
-            f"Enqueued index job for {entity_type}/{entity_id}",
+            f"{'Enqueued' if queued else 'Coalesced'} index job for {entity_type}/{entity_id}",
             extra={
                 "entity_type": entity_type,
                 "entity_id": entity_id,
@@ -63,6 +190,59 @@ async def enqueue_index_entity(
         )
 
 
+async def enqueue_index_entities(
+    entity_type: str,
+    entity_ids: list[str],
+    org_id: str,
+) -> None:
+    """
+    Enqueue a set of entities for indexing as a single job.
+
+    Called from routers after batch operations so that N entities produce
+    one job instead of N.
+
+    Args:
+        entity_type: Type of all entities (password, document, configuration, etc.)
+        entity_ids: UUIDs of the entities as strings
+        org_id: UUID of the organization as string
+    """
+    if not entity_ids:
+        return
+
+    settings = get_settings()
+    try:
+        redis = await get_arq_pool()
+        queued = await _enqueue_deduplicated(
+            redis,
+            "index_entities_task",
+            index_batch_job_id(entity_type, entity_ids),
+            entity_type,
+            entity_ids,
+            org_id,
+            defer_by=settings.index_debounce_seconds,
+        )
+        logger.debug(
+            f"{'Enqueued' if queued else 'Coalesced'} batch index job for "
+            f"{len(entity_ids)} {entity_type} entities",
+            extra={
+                "entity_type": entity_type,
+                "entity_count": len(entity_ids),
+                "org_id": org_id,
+            },
+        )
+    except Exception as e:
+        # Log but don't fail the request - indexing is best-effort
+        logger.warning(
+            f"Failed to enqueue batch index job for {len(entity_ids)} {entity_type} entities: {e}",
+            extra={
+                "entity_type": entity_type,
+                "entity_count": len(entity_ids),
+                "org_id": org_id,
+                "error": str(e),
+            },
+        )
+
+
 async def enqueue_remove_entity(
     entity_type: str,
     entity_id: str,
@@ -77,11 +257,12 @@ async def enqueue_remove_entity(
         entity_type: Type of entity (password, document, configuration, etc.)
         entity_id: UUID of the entity as string
     """
-    settings = get_settings()
     try:
-        redis = await create_pool(RedisSettings.from_dsn(settings.redis_url))
-        await redis.enqueue_job(
+        redis = await get_arq_pool()
+        await _enqueue_deduplicated(
+            redis,
             "remove_entity_task",
+            remove_job_id(entity_type, entity_id),
             entity_type,
             entity_id,
         )
@@ -102,3 +283,52 @@ async def enqueue_remove_entity(
                 "error": str(e),
             },
         )
+
+
+async def enqueue_sync_custom_asset_indexes(custom_asset_type_id: str) -> None:
+    """
+    Enqueue a rebuild of a custom asset type's field indexes.
+
+    Called from the custom asset types router after a type's fields or display
+    field change (or the type is deleted), once the change is committed.
+
+    Args:
+        custom_asset_type_id: UUID of the custom asset type as string
+    """
+    settings = get_settings()
+    try:
+        redis = await get_arq_pool()
+        await _enqueue_deduplicated(
+            redis,
+            "sync_custom_asset_indexes_task",
+            custom_asset_indexes_job_id(custom_asset_type_id),
+            custom_asset_type_id,
+            defer_by=settings.index_debounce_seconds,
+        )
+        logger.debug(f"Enqueued field index sync for custom asset type {custom_asset_type_id}")
+    except Exception as e:
+        # Log but don't fail the request - lists still work without the indexes
+        logger.warning(
+            f"Failed to enqueue field index sync for custom asset type {custom_asset_type_id}: {e}",
+            extra={"custom_asset_type_id": custom_asset_type_id, "error": str(e)},
+        )
+
+
+async def enqueue_export(export_id: str) -> None:
+    """
+    Enqueue an export for processing on the export queue.
+
+    Unlike index jobs, a failure to enqueue is raised: the export would
+    otherwise stay pending forever.
+
+    Args:
+        export_id: UUID of the export as string
+    """
+    redis = await get_arq_pool()
+    await redis.enqueue_job(
+        "process_export_task",
+        export_id,
+        _job_id=export_job_id(export_id),
+        _queue_name=EXPORT_QUEUE_NAME,
+    )
+    logger.debug(f"Enqueued export job for {export_id}", extra={"export_id": export_id})
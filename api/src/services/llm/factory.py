@@ -12,6 +12,7 @@ from src.models.orm.system_config import SystemConfig
 from src.services.llm.anthropic_client import AnthropicClient
 from src.services.llm.base import BaseLLMClient
 from src.services.llm.openai_client import OpenAIClient
+from src.services.system_config_cache import get_system_config_cache
 
 logger = logging.getLogger(__name__)
 
@@ -51,11 +52,18 @@ class EmbeddingsConfig:
 
 
 async def get_completions_config(session: AsyncSession) -> CompletionsConfig | None:
-    """Load and decrypt completions config from database.
+    """Load and decrypt completions config, cached per process.
 
     Returns:
         CompletionsConfig if valid config exists and can be decrypted, None otherwise.
     """
+    return await get_system_config_cache().get_or_load(
+        COMPLETIONS_CONFIG_KEY, lambda: _load_completions_config(session)
+    )
+
+
+async def _load_completions_config(session: AsyncSession) -> CompletionsConfig | None:
+    """Load and decrypt completions config from database."""
     result = await session.execute(
         select(SystemConfig).where(
             SystemConfig.category == LLM_CATEGORY,
@@ -92,11 +100,18 @@ async def get_completions_config(session: AsyncSession) -> CompletionsConfig | N
 
 
 async def get_embeddings_config(session: AsyncSession) -> EmbeddingsConfig | None:
-    """Load and decrypt embeddings config from database.
+    """Load and decrypt embeddings config, cached per process.
 
     Returns:
         EmbeddingsConfig if valid config exists and can be decrypted, None otherwise.
     """
+    return await get_system_config_cache().get_or_load(
+        EMBEDDINGS_CONFIG_KEY, lambda: _load_embeddings_config(session)
+    )
+
+
+async def _load_embeddings_config(session: AsyncSession) -> EmbeddingsConfig | None:
+    """Load and decrypt embeddings config from database."""
     result = await session.execute(
         select(SystemConfig).where(
             SystemConfig.category == LLM_CATEGORY,
@@ -132,7 +147,7 @@ async def is_indexing_enabled(session: AsyncSession) -> bool:
     """Check if automatic search indexing is enabled.
 
     The indexing setting is stored in SystemConfig under llm/indexing_config.
-    Returns True by default if no configuration exists.
+    Returns True by default if no configuration exists. Cached per process.
 
     Args:
         session: Database session.
@@ -140,6 +155,13 @@ async def is_indexing_enabled(session: AsyncSession) -> bool:
     Returns:
         True if indexing is enabled, False otherwise.
     """
+    return await get_system_config_cache().get_or_load(
+        INDEXING_CONFIG_KEY, lambda: _load_indexing_enabled(session)
+    )
+
+
+async def _load_indexing_enabled(session: AsyncSession) -> bool:
+    """Read the indexing flag from database."""
     result = await session.execute(
         select(SystemConfig).where(
             SystemConfig.category == LLM_CATEGORY,
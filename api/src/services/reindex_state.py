@@ -3,16 +3,21 @@ Reindex State Service.
 
 Manages reindex job state in Redis for multi-worker support.
 State is stored with 24-hour TTL and accessible from any API/worker instance.
+
+Each job's state is a Redis hash, so the worker can add to its counters
+with HINCRBY instead of rewriting the whole state. The worker reports
+through ReindexProgressReporter, which writes progress and checks for
+cancellation in one round trip at most every
+reindex_progress_every_entities entities or reindex_progress_interval_ms.
 """
 
-import json
 import time
 from dataclasses import asdict, dataclass
 from typing import Literal
 
 from redis.asyncio import Redis
 
-REINDEX_STATE_KEY = "reindex:state:{job_id}"
+REINDEX_STATE_KEY = "reindex:progress:{job_id}"
 REINDEX_CURRENT_JOB_KEY = "reindex:current_job"
 REINDEX_CANCEL_KEY = "reindex:cancel:{job_id}"
 REINDEX_STATE_TTL = 86400  # 24 hours
@@ -35,6 +40,33 @@ class ReindexProgress:
     completed_at: float | None
 
 
+def _text(value: str | bytes) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _encode(fields: dict[str, str | int | float | None]) -> dict[str, str | int | float]:
+    """Hash values can't be None; store missing values as empty strings."""
+    return {key: "" if value is None else value for key, value in fields.items()}
+
+
+def _decode(fields: dict[str | bytes, str | bytes]) -> ReindexProgress | None:
+    """Build a ReindexProgress from a state hash, or None if it isn't a complete job."""
+    data = {_text(key): _text(value) for key, value in fields.items()}
+    if "job_id" not in data:
+        return None
+    return ReindexProgress(
+        job_id=data["job_id"],
+        status=data["status"],  # type: ignore[arg-type]
+        total=int(data["total"]),
+        processed=int(data["processed"]),
+        errors=int(data["errors"]),
+        current_entity_type=data.get("current_entity_type") or None,
+        error_message=data.get("error_message") or None,
+        started_at=float(data["started_at"]),
+        completed_at=float(data["completed_at"]) if data.get("completed_at") else None,
+    )
+
+
 class ReindexStateService:
     """
     Service for managing reindex job state in Redis.
@@ -59,65 +91,70 @@ class ReindexStateService:
             started_at=time.time(),
             completed_at=None,
         )
-        await self.redis.setex(
-            REINDEX_STATE_KEY.format(job_id=job_id),
-            REINDEX_STATE_TTL,
-            json.dumps(asdict(state)),
-        )
-        await self.redis.set(REINDEX_CURRENT_JOB_KEY, job_id)
+        key = REINDEX_STATE_KEY.format(job_id=job_id)
+        async with self.redis.pipeline() as pipe:
+            pipe.hset(key, mapping=_encode(asdict(state)))
+            pipe.expire(key, REINDEX_STATE_TTL)
+            pipe.set(REINDEX_CURRENT_JOB_KEY, job_id)
+            await pipe.execute()
+
+    async def _update(self, job_id: str, **fields: str | float | None) -> bool:
+        """Set fields on an existing job's state; returns False if there is no such job."""
+        key = REINDEX_STATE_KEY.format(job_id=job_id)
+        if not await self.redis.exists(key):  # type: ignore[misc]
+            return False
+        await self.redis.hset(key, mapping=_encode(fields))  # type: ignore[misc]
+        return True
 
-    async def update_progress(
+    async def add_progress(
         self,
         job_id: str,
         processed: int,
         errors: int,
         entity_type: str,
-    ) -> None:
-        """Update job progress - called by worker after each entity."""
+    ) -> bool:
+        """
+        Add to a job's counters and check for cancellation in one round trip.
+
+        Args:
+            job_id: Reindex job ID
+            processed: Entities indexed since the last call
+            errors: Entities that failed since the last call
+            entity_type: Entity type being indexed
+
+        Returns:
+            True if cancellation has been requested
+        """
         key = REINDEX_STATE_KEY.format(job_id=job_id)
-        state_json = await self.redis.get(key)
-        if state_json:
-            state = json.loads(state_json)
-            state["processed"] = processed
-            state["errors"] = errors
-            state["current_entity_type"] = entity_type
-            await self.redis.setex(key, REINDEX_STATE_TTL, json.dumps(state))
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hincrby(key, "processed", processed)
+            pipe.hincrby(key, "errors", errors)
+            pipe.hset(key, "current_entity_type", entity_type)
+            pipe.expire(key, REINDEX_STATE_TTL)
+            pipe.exists(REINDEX_CANCEL_KEY.format(job_id=job_id))
+            results = await pipe.execute()
+        return bool(results[-1])
 
     async def complete_job(self, job_id: str) -> None:
         """Mark job as completed."""
-        key = REINDEX_STATE_KEY.format(job_id=job_id)
-        state_json = await self.redis.get(key)
-        if state_json:
-            state = json.loads(state_json)
-            state["status"] = "completed"
-            state["completed_at"] = time.time()
-            await self.redis.setex(key, REINDEX_STATE_TTL, json.dumps(state))
+        await self._update(job_id, status="completed", completed_at=time.time())
 
     async def fail_job(self, job_id: str, error_message: str) -> None:
         """Mark job as failed with error message."""
-        key = REINDEX_STATE_KEY.format(job_id=job_id)
-        state_json = await self.redis.get(key)
-        if state_json:
-            state = json.loads(state_json)
-            state["status"] = "failed"
-            state["error_message"] = error_message
-            state["completed_at"] = time.time()
-            await self.redis.setex(key, REINDEX_STATE_TTL, json.dumps(state))
+        await self._update(
+            job_id, status="failed", error_message=error_message, completed_at=time.time()
+        )
 
     async def get_job(self, job_id: str) -> ReindexProgress | None:
         """Get job state by ID."""
-        state_json = await self.redis.get(REINDEX_STATE_KEY.format(job_id=job_id))
-        if state_json:
-            data = json.loads(state_json)
-            return ReindexProgress(**data)
-        return None
+        fields = await self.redis.hgetall(REINDEX_STATE_KEY.format(job_id=job_id))  # type: ignore[misc]
+        return _decode(fields) if fields else None
 
     async def get_current_job(self) -> ReindexProgress | None:
         """Get the most recent job."""
         job_id = await self.redis.get(REINDEX_CURRENT_JOB_KEY)
         if job_id:
-            job_id_str = job_id.decode() if isinstance(job_id, bytes) else job_id
-            return await self.get_job(job_id_str)
+            return await self.get_job(_text(job_id))
         return None
 
     async def is_job_running(self) -> bool:
@@ -130,17 +167,13 @@ class ReindexStateService:
         Request graceful cancellation of a job.
 
         Sets the cancel flag and updates status to 'cancelling'.
-        Worker will check this flag and stop at next entity boundary.
+        Worker will see this flag the next time it reports progress.
 
         Returns True if cancellation was requested, False if job not found/not running.
         """
         key = REINDEX_STATE_KEY.format(job_id=job_id)
-        state_json = await self.redis.get(key)
-        if not state_json:
-            return False
-
-        state = json.loads(state_json)
-        if state["status"] not in ("running", "cancelling"):
+        status = await self.redis.hget(key, "status")  # type: ignore[misc]
+        if status is None or _text(status) not in ("running", "cancelling"):
             return False
 
         # Set cancel flag
@@ -151,8 +184,7 @@ class ReindexStateService:
         )
 
         # Update status to cancelling
-        state["status"] = "cancelling"
-        await self.redis.setex(key, REINDEX_STATE_TTL, json.dumps(state))
+        await self.redis.hset(key, "status", "cancelling")  # type: ignore[misc]
         return True
 
     async def is_cancelled(self, job_id: str) -> bool:
@@ -162,13 +194,7 @@ class ReindexStateService:
 
     async def mark_cancelled(self, job_id: str) -> None:
         """Mark job as cancelled (called by worker after stopping)."""
-        key = REINDEX_STATE_KEY.format(job_id=job_id)
-        state_json = await self.redis.get(key)
-        if state_json:
-            state = json.loads(state_json)
-            state["status"] = "cancelled"
-            state["completed_at"] = time.time()
-            await self.redis.setex(key, REINDEX_STATE_TTL, json.dumps(state))
+        await self._update(job_id, status="cancelled", completed_at=time.time())
 
         # Clean up cancel flag
         await self.redis.delete(REINDEX_CANCEL_KEY.format(job_id=job_id))
@@ -182,29 +208,79 @@ class ReindexStateService:
 
         Returns True if job was found and cancelled, False otherwise.
         """
-        key = REINDEX_STATE_KEY.format(job_id=job_id)
-        state_json = await self.redis.get(key)
-        if not state_json:
-            return False
-
-        state = json.loads(state_json)
-
         # Update state to cancelled
-        state["status"] = "cancelled"
-        state["completed_at"] = time.time()
-        state["error_message"] = "Force cancelled by administrator"
-        await self.redis.setex(key, REINDEX_STATE_TTL, json.dumps(state))
+        found = await self._update(
+            job_id,
+            status="cancelled",
+            completed_at=time.time(),
+            error_message="Force cancelled by administrator",
+        )
+        if not found:
+            return False
 
         # Clear current job pointer if this was the active job
         current_job_id = await self.redis.get(REINDEX_CURRENT_JOB_KEY)
-        if current_job_id:
-            current_job_id_str = (
-                current_job_id.decode() if isinstance(current_job_id, bytes) else current_job_id
-            )
-            if current_job_id_str == job_id:
-                await self.redis.delete(REINDEX_CURRENT_JOB_KEY)
+        if current_job_id and _text(current_job_id) == job_id:
+            await self.redis.delete(REINDEX_CURRENT_JOB_KEY)
 
         # Clean up cancel flag
         await self.redis.delete(REINDEX_CANCEL_KEY.format(job_id=job_id))
 
         return True
+
+
+class ReindexProgressReporter:
+    """
+    Accumulates a reindex worker's progress and reports it in bulk.
+
+    The worker calls add() after every batch and report() when due() says
+    so: after every_entities entities or interval seconds since the last
+    report, whichever comes first. Each report is one pipelined round trip.
+    """
+
+    def __init__(
+        self,
+        state: ReindexStateService,
+        job_id: str,
+        every_entities: int,
+        interval: float,
+    ) -> None:
+        self._state = state
+        self._job_id = job_id
+        self._every_entities = every_entities
+        self._interval = interval
+        self._processed = 0
+        self._errors = 0
+        self._entity_type: str | None = None
+        self._last_report = time.monotonic()
+
+    def add(self, processed: int, errors: int, entity_type: str) -> None:
+        """Record entities indexed and failed since the last call."""
+        self._processed += processed
+        self._errors += errors
+        self._entity_type = entity_type
+
+    def due(self) -> bool:
+        """Whether enough entities or time have gone by to report again."""
+        return (
+            self._processed + self._errors >= self._every_entities
+            or time.monotonic() - self._last_report >= self._interval
+        )
+
+    async def report(self) -> bool:
+        """
+        Write the accumulated progress to Redis.
+
+        Returns:
+            True if cancellation has been requested
+        """
+        self._last_report = time.monotonic()
+        if self._entity_type is None:
+            return await self._state.is_cancelled(self._job_id)
+
+        cancelled = await self._state.add_progress(
+            self._job_id, self._processed, self._errors, self._entity_type
+        )
+        self._processed = 0
+        self._errors = 0
+        return cancelled
@@ -67,6 +67,57 @@ async def index_entity_for_search(
         )
 
 
+async def index_entities_for_search(
+    db: AsyncSession,
+    entity_type: EntityType,
+    entity_ids: list[UUID],
+    org_id: UUID,
+) -> None:
+    """
+    Enqueue a batch of entities for semantic search indexing as one job.
+
+    This function is designed to be called from routers after batch
+    operations (e.g. batch enable/disable). It handles errors gracefully -
+    failures don't affect the main request.
+
+    Args:
+        db: Database session
+        entity_type: Type of all entities in the batch
+        entity_ids: Entity UUIDs
+        org_id: Organization UUID
+    """
+    if not entity_ids:
+        return
+
+    try:
+        # Check if indexing is enabled (don't even enqueue if disabled)
+        if not await is_indexing_enabled(db):
+            logger.debug(
+                f"Skipping indexing for {len(entity_ids)} {entity_type} entities - indexing disabled",
+                extra={
+                    "entity_type": entity_type,
+                    "entity_count": len(entity_ids),
+                    "org_id": str(org_id),
+                },
+            )
+            return
+
+        # Enqueue for async processing by the worker
+        from src.services.indexing_queue import enqueue_index_entities
+
+        await enqueue_index_entities(entity_type, [str(entity_id) for entity_id in entity_ids], str(org_id))
+    except Exception as e:
+        # Log but don't fail the request
+        logger.warning(
+            f"Failed to enqueue {len(entity_ids)} {entity_type} entities for indexing: {e}",
+            extra={
+                "entity_type": entity_type,
+                "entity_count": len(entity_ids),
+                "org_id": str(org_id),
+            },
+        )
+
+
 async def remove_entity_from_search(
     db: AsyncSession,  # noqa: ARG001 - kept for API compatibility
     entity_type: EntityType,
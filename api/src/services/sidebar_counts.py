@@ -0,0 +1,158 @@
+"""
+Sidebar Counts
+
+Entity counts shown in the organization and global sidebars. Counts are
+computed with one aggregate query per table, independent of how many
+configuration or custom asset types exist, and cached in Redis per
+organization (plus one entry for the global view).
+
+Routers that create or delete entities call invalidate_sidebar_counts();
+the cached entries are dropped once the request's transaction commits, so
+a sidebar refresh can't re-cache the counts from before the write.
+"""
+
+import asyncio
+import json
+import logging
+from dataclasses import asdict, dataclass
+from uuid import UUID
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.config import get_settings
+from src.core.cache import get_redis
+from src.models.orm.document import Document
+from src.models.orm.location import Location
+from src.models.orm.password import Password
+from src.repositories.configuration import ConfigurationRepository
+from src.repositories.custom_asset import CustomAssetRepository
+
+logger = logging.getLogger(__name__)
+
+# Redis key prefix; entries are {prefix}:{org_id} or {prefix}:global
+SIDEBAR_COUNTS_KEY_PREFIX = "sidebar_counts"
+GLOBAL_SCOPE = "global"
+
+# Session.info key holding organization IDs to invalidate on commit
+_PENDING_INFO_KEY = "sidebar_counts_invalidate"
+
+# Keep references to in-flight invalidation tasks so they aren't garbage collected
+_background_tasks: set[asyncio.Task[None]] = set()
+
+
+@dataclass
+class SidebarCounts:
+    """Entity counts for one organization, or for all organizations."""
+
+    passwords: int
+    locations: int
+    documents: int
+    # Keyed by type ID as a string (JSON object keys)
+    configurations_by_type: dict[str, int]
+    custom_assets_by_type: dict[str, int]
+
+
+def _cache_key(org_id: UUID | None) -> str:
+    return f"{SIDEBAR_COUNTS_KEY_PREFIX}:{org_id or GLOBAL_SCOPE}"
+
+
+async def _load_sidebar_counts(db: AsyncSession, org_id: UUID | None) -> SidebarCounts:
+    """Count entities with one statement for core entities and one grouped query per typed table."""
+
+    def count(model: type[Password] | type[Location] | type[Document]):
+        stmt = select(func.count(model.id))
+        if org_id is not None:
+            stmt = stmt.where(model.organization_id == org_id)
+        return stmt.scalar_subquery()
+
+    core_result = await db.execute(select(count(Password), count(Location), count(Document)))
+    passwords, locations, documents = core_result.one()
+
+    configurations_by_type = await ConfigurationRepository(db).count_by_type(org_id)
+    custom_assets_by_type = await CustomAssetRepository(db).count_by_type(org_id)
+
+    return SidebarCounts(
+        passwords=passwords,
+        locations=locations,
+        documents=documents,
+        configurations_by_type={str(k): v for k, v in configurations_by_type.items()},
+        custom_assets_by_type={str(k): v for k, v in custom_assets_by_type.items()},
+    )
+
+
+async def get_sidebar_counts(db: AsyncSession, org_id: UUID | None) -> SidebarCounts:
+    """
+    Get sidebar counts, using the Redis cache when possible.
+
+    Args:
+        db: Database session
+        org_id: Organization UUID, or None for counts across all organizations
+
+    Returns:
+        Entity counts for the sidebar
+    """
+    ttl = get_settings().sidebar_counts_cache_ttl_seconds
+    if not ttl:
+        return await _load_sidebar_counts(db, org_id)
+
+    key = _cache_key(org_id)
+    try:
+        redis = await get_redis()
+        cached = await redis.get(key)
+        if cached is not None:
+            return SidebarCounts(**json.loads(cached))
+    except Exception as e:
+        logger.warning(f"Sidebar counts cache lookup failed: {e}")
+
+    counts = await _load_sidebar_counts(db, org_id)
+
+    try:
+        redis = await get_redis()
+        await redis.set(key, json.dumps(asdict(counts)), ex=ttl)
+    except Exception as e:
+        logger.warning(f"Sidebar counts cache store failed: {e}")
+
+    return counts
+
+
+def invalidate_sidebar_counts(db: AsyncSession, org_id: UUID) -> None:
+    """
+    Drop the cached sidebar counts for an organization once db commits.
+
+    The global view's counts are dropped too. Nothing is dropped if the
+    transaction rolls back.
+
+    Args:
+        db: Session the entity write was made in
+        org_id: Organization whose entity counts changed
+    """
+    db.info.setdefault(_PENDING_INFO_KEY, set()).add(org_id)
+
+
+async def _delete_cached_counts(org_ids: set[UUID]) -> None:
+    try:
+        redis = await get_redis()
+        await redis.delete(*(_cache_key(org_id) for org_id in org_ids), _cache_key(None))
+    except Exception as e:
+        logger.warning(f"Failed to invalidate sidebar counts: {e}")
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    org_ids = session.info.pop(_PENDING_INFO_KEY, None)
+    if not org_ids:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    task = loop.create_task(_delete_cached_counts(org_ids))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_INFO_KEY, None)
@@ -0,0 +1,164 @@
+"""
+System Config Cache
+
+In-process TTL cache for SystemConfig lookups on hot paths (AI settings and
+the indexing flag), which are read on every search, chat, entity save and
+worker job.
+
+Writers call publish_config_invalidation() after committing; the message is
+broadcast over Redis pub/sub so every API and worker process drops its copy
+straight away. The TTL only bounds staleness if a message is missed (e.g.
+while a listener is reconnecting).
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from src.config import get_settings
+from src.core.cache import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Redis pub/sub channel carrying the key of a changed config ("*" for all)
+CONFIG_INVALIDATION_CHANNEL = "system_config:invalidate"
+
+# Seconds to wait before resubscribing after the listener loses Redis
+_RECONNECT_DELAY = 1.0
+
+_MISSING = object()
+
+T = TypeVar("T")
+
+
+class SystemConfigCache:
+    """TTL cache of loaded config values keyed by SystemConfig key."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[float, Any]] = {}
+        # Bumped on every invalidation so loads that raced with a write
+        # don't store the value they read before it
+        self.generation = 0
+        self._listener_task: asyncio.Task[None] | None = None
+
+    def get(self, key: str) -> Any:
+        """Return the cached value for key, or _MISSING if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return _MISSING
+        return value
+
+    def put(self, key: str, value: Any, generation: int) -> None:
+        """
+        Cache a loaded value.
+
+        Args:
+            key: Config key
+            value: Loaded value (None is cached too, meaning "not configured")
+            generation: Value of self.generation read before loading
+        """
+        ttl = get_settings().system_config_cache_ttl_seconds
+        if ttl <= 0 or generation != self.generation:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    async def get_or_load(self, key: str, load: Callable[[], Awaitable[T]]) -> T:
+        """
+        Return the cached value for key, loading and caching it on a miss.
+
+        Args:
+            key: Config key
+            load: Coroutine function that reads the value from the database
+        """
+        value = self.get(key)
+        if value is not _MISSING:
+            return value
+
+        generation = self.generation
+        value = await load()
+        self.put(key, value, generation)
+        return value
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Drop one cached key, or everything when key is None."""
+        self.generation += 1
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def start_listener(self) -> None:
+        """Start listening for invalidations published by other processes."""
+        if self._listener_task is None:
+            self._listener_task = asyncio.create_task(self._listen())
+
+    async def stop_listener(self) -> None:
+        """Stop the invalidation listener."""
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+
+    async def _listen(self) -> None:
+        """Apply invalidations from Redis, resubscribing if the connection drops."""
+        while True:
+            try:
+                redis = await get_redis()
+                pubsub = redis.pubsub()
+                await pubsub.subscribe(CONFIG_INVALIDATION_CHANNEL)
+                try:
+                    # Anything published while we were not subscribed is lost
+                    self.invalidate()
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        key = message["data"]
+                        self.invalidate(None if key == "*" else key)
+                finally:
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"System config invalidation listener error: {e}")
+                await asyncio.sleep(_RECONNECT_DELAY)
+
+
+# Module-level cache instance (one per process)
+_system_config_cache: SystemConfigCache | None = None
+
+
+def get_system_config_cache() -> SystemConfigCache:
+    """Get the process-wide system config cache."""
+    global _system_config_cache
+
+    if _system_config_cache is None:
+        _system_config_cache = SystemConfigCache()
+
+    return _system_config_cache
+
+
+async def publish_config_invalidation(key: str | None = None) -> None:
+    """
+    Invalidate a config key in this process and broadcast it to all others.
+
+    Call after the write has been committed, otherwise another process may
+    reload and cache the old value.
+
+    Args:
+        key: SystemConfig key that changed, or None for all keys
+    """
+    get_system_config_cache().invalidate(key)
+    try:
+        redis = await get_redis()
+        await redis.publish(CONFIG_INVALIDATION_CHANNEL, key or "*")
+    except Exception as e:
+        logger.warning(f"Failed to broadcast system config invalidation: {e}")
@@ -7,8 +7,12 @@ HTTP requests.
 
 Run the worker with:
     arq src.worker.WorkerSettings
+
+Exports run on their own queue, served by a separate worker:
+    arq src.worker.ExportWorkerSettings
 """
 
+import asyncio
 import logging
 from datetime import UTC, datetime, timedelta
 from typing import Any, Literal, cast
@@ -18,6 +22,7 @@ from arq import cron, func
 from arq.connections import RedisSettings
 
 from src.config import get_settings
+from src.services.indexing_queue import EXPORT_QUEUE_NAME
 
 logger = logging.getLogger(__name__)
 
@@ -25,9 +30,14 @@ logger = logging.getLogger(__name__)
 EntityType = Literal["password", "configuration", "location", "document", "custom_asset"]
 VALID_ENTITY_TYPES: set[str] = {"password", "configuration", "location", "document", "custom_asset"}
 
+# An export attempt gets 6 hours; arq's own timeout leaves a few minutes on top
+# so a timed-out attempt can record its failure and clean up before arq gives up
+EXPORT_TIMEOUT_SECONDS = 21600
+EXPORT_JOB_TIMEOUT_SECONDS = EXPORT_TIMEOUT_SECONDS + 300
+
 
 async def index_entity_task(
-    _ctx: dict[str, Any],
+    ctx: dict[str, Any],  # noqa: ARG001
     entity_type: str,
     entity_id: str,
     org_id: str,
@@ -42,7 +52,7 @@ async def index_entity_task(
     it will be removed from the index instead of being indexed.
 
     Args:
-        _ctx: arq context (contains redis connection, job info, etc.)
+        ctx: arq context (contains redis connection, job info, etc.)
         entity_type: Type of entity (password, configuration, location, document, custom_asset)
         entity_id: Entity UUID as string
         org_id: Organization UUID as string
@@ -126,8 +136,102 @@ async def index_entity_task(
     )
 
 
+async def index_entities_task(
+    ctx: dict[str, Any],  # noqa: ARG001
+    entity_type: str,
+    entity_ids: list[str],
+    org_id: str,
+) -> None:
+    """
+    Process a batch indexing job for entities of one type.
+
+    This task is queued by batch operations (e.g. batch enable/disable) in
+    place of one index_entity_task per entity. Enabled entities are indexed
+    in batches through the embeddings API; disabled or missing entities are
+    removed from the index with a single delete.
+
+    Args:
+        ctx: arq context (contains redis connection, job info, etc.)
+        entity_type: Type of all entities in the batch
+        entity_ids: Entity UUIDs as strings
+        org_id: Organization UUID as string
+    """
+    from sqlalchemy import delete, select
+
+    from src.core.database import get_db_context
+    from src.models.orm.embedding_index import EmbeddingIndex
+    from src.services.embeddings import ENTITY_MODELS, get_embeddings_service
+    from src.services.llm.factory import is_indexing_enabled
+
+    logger.info(
+        f"Processing batch index job for {len(entity_ids)} {entity_type} entities",
+        extra={
+            "entity_type": entity_type,
+            "entity_count": len(entity_ids),
+            "org_id": org_id,
+        },
+    )
+
+    # Validate entity_type
+    if entity_type not in VALID_ENTITY_TYPES:
+        logger.error(f"Invalid entity_type: {entity_type}")
+        raise ValueError(f"Invalid entity_type: {entity_type}")
+
+    typed_entity_type = cast(EntityType, entity_type)
+    entity_uuids = [UUID(entity_id) for entity_id in entity_ids]
+    settings = get_settings()
+
+    async with get_db_context() as db:
+        if not await is_indexing_enabled(db):
+            logger.debug(f"Skipping batch indexing for {entity_type} - indexing disabled")
+            return
+
+        # Split into enabled entities and everything else in one query
+        model = ENTITY_MODELS[entity_type]
+        result = await db.execute(
+            select(model.id, model.organization_id)
+            .where(model.id.in_(entity_uuids))
+            .where(model.is_enabled.is_(True))
+        )
+        enabled: list[tuple[UUID, UUID]] = [(row[0], row[1]) for row in result.all()]
+        enabled_ids = {entity_id for entity_id, _ in enabled}
+        to_remove = [entity_id for entity_id in entity_uuids if entity_id not in enabled_ids]
+
+        if to_remove:
+            await db.execute(
+                delete(EmbeddingIndex).where(
+                    EmbeddingIndex.entity_type == entity_type,
+                    EmbeddingIndex.entity_id.in_(to_remove),
+                )
+            )
+            logger.info(f"Removed {len(to_remove)} disabled {entity_type} entities from index")
+
+        if not enabled:
+            return
+
+        embeddings_service = get_embeddings_service(db)
+        if not await embeddings_service.check_openai_available():
+            logger.debug(f"Skipping batch indexing for {entity_type} - OpenAI not configured")
+            return
+
+        batch_size = settings.reindex_batch_size
+        for start in range(0, len(enabled), batch_size):
+            await embeddings_service.index_entities(
+                db, typed_entity_type, enabled[start : start + batch_size]
+            )
+
+    logger.info(
+        f"Completed batch index job for {len(entity_ids)} {entity_type} entities",
+        extra={
+            "entity_type": entity_type,
+            "entity_count": len(entity_ids),
+            "org_id": org_id,
+        },
+    )
+
+
 async def remove_entity_task(
-    _ctx: dict[str, Any],
+    ctx: dict[str, Any],  # noqa: ARG001
     entity_type: str,
     entity_id: str,
 ) -> None:
@@ -138,7 +242,7 @@ async def remove_entity_task(
     It removes the entity's embeddings from the search index.
 
     Args:
-        _ctx: arq context (contains redis connection, job info, etc.)
+        ctx: arq context (contains redis connection, job info, etc.)
         entity_type: Type of entity (password, configuration, location, document, custom_asset)
         entity_id: Entity UUID as string
     """
@@ -188,6 +292,13 @@ async def reindex_task(
     that don't yet have embeddings. This makes the job naturally resumable -
     if it fails partway through, re-running will pick up where it left off.
 
+    Entities are embedded in batches of ``reindex_batch_size`` per OpenAI
+    request, paced to ``reindex_requests_per_minute``, and written with a
+    bulk upsert. Each batch is committed before the next one starts.
+    Progress is reported, and cancellation checked, every
+    ``reindex_progress_every_entities`` entities or
+    ``reindex_progress_interval_ms`` and after each entity type.
+
     Args:
         ctx: arq context (unused but required by arq)
         job_id: Unique job ID for progress tracking
@@ -216,7 +327,7 @@ async def reindex_task(
     from src.models.orm.password import Password
     from src.services.embeddings import get_embeddings_service
     from src.services.llm.factory import is_indexing_enabled
-    from src.services.reindex_state import ReindexStateService
+    from src.services.reindex_state import ReindexProgressReporter, ReindexStateService
 
     logger.info(
         f"Starting reindex job {job_id} with {total} entities",
@@ -232,9 +343,52 @@ async def reindex_task(
     settings = get_settings()
     redis = Redis.from_url(settings.redis_url)
     state_service = ReindexStateService(redis)
+    progress = ReindexProgressReporter(
+        state_service,
+        job_id,
+        every_entities=settings.reindex_progress_every_entities,
+        interval=settings.reindex_progress_interval_ms / 1000,
+    )
+
+    async def report_progress(etype: str) -> bool:
+        """Write and publish progress; returns True (after stopping the job) if cancelled."""
+        current_progress = processed + already_indexed
+        if await progress.report():
+            logger.info(f"Reindex {job_id} cancelled by user at {current_progress}/{total}")
+            await state_service.mark_cancelled(job_id)
+            await publish_reindex_cancelled(
+                job_id=job_id,
+                processed=current_progress,
+                total=total,
+                force=False,
+            )
+            return True
+
+        await publish_reindex_progress(
+            job_id=job_id,
+            phase=f"Indexing {etype}s",
+            current=current_progress,
+            total=total,
+            entity_type=etype,
+        )
+        logger.info(f"Reindex {job_id} progress: {current_progress}/{total} ({etype})")
+        return False
 
     org_uuid = UUID(organization_id) if organization_id else None
 
+    # Batching and rate-limit budget for the embeddings API
+    batch_size = settings.reindex_batch_size
+    request_interval = 60.0 / settings.reindex_requests_per_minute
+    next_request_at = time.monotonic()
+
+    async def wait_for_request_slot() -> None:
+        """Sleep until the next embeddings request fits the per-minute budget."""
+        nonlocal next_request_at
+        wait = next_request_at - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        next_request_at = time.monotonic() + request_interval
+
     try:
         async with get_db_context() as db:
             # Check if indexing is enabled
@@ -296,51 +450,72 @@ async def reindex_task(
                 if org_uuid is not None:
                     stmt = stmt.where(model.organization_id == org_uuid)
 
-                result = await db.execute(stmt)
-                entities = result.all()
-
-                entities_needing_index = len(entities)
-                logger.info(f"Reindex {job_id}: {entities_needing_index} {etype}s need indexing")
-
-                # Index each entity that doesn't have an embedding
-                for entity_id, entity_org_id in entities:
-                    # Check for cancellation before each entity
-                    if await state_service.is_cancelled(job_id):
-                        logger.info(f"Reindex {job_id} cancelled by user at {processed}/{total}")
-                        await state_service.mark_cancelled(job_id)
-                        await publish_reindex_cancelled(
-                            job_id=job_id,
-                            processed=processed,
-                            total=total,
-                            force=False,
-                        )
-                        return
-
+                # Page through by primary key (keyset) so entities that fail to index
+                # are not fetched again within this run
+                last_id: UUID | None = None
+                while True:
+                    page_stmt = stmt.order_by(model.id).limit(batch_size)
+                    if last_id is not None:
+                        page_stmt = page_stmt.where(model.id > last_id)
+
+                    result = await db.execute(page_stmt)
+                    batch: list[tuple[UUID, UUID]] = [(row[0], row[1]) for row in result.all()]
+                    if not batch:
+                        break
+                    last_id = batch[-1][0]
+
+                    # Stay within the embeddings API request budget
+                    await wait_for_request_slot()
+
+                    indexed = 0
+                    failed = 0
                     try:
-                        await embeddings_service.index_entity(db, typed_etype, entity_id, entity_org_id)
-                        processed += 1
-                        counts_by_type[etype] += 1
+                        written, skipped = await embeddings_service.index_entities(
+                            db, typed_etype, batch
+                        )
+                        # Entities with nothing to embed still count towards the total
+                        indexed = written + skipped
                     except Exception as e:
-                        logger.error(f"Failed to index {etype}/{entity_id}: {e}", exc_info=True)
-                        errors += 1
-
-                    # Update progress (processed + already_indexed for accurate total progress)
-                    current_progress = processed + already_indexed
-                    await state_service.update_progress(job_id, current_progress, errors, etype)
-                    await publish_reindex_progress(
-                        job_id=job_id,
-                        phase=f"Indexing {etype}s",
-                        current=current_progress,
-                        total=total,
-                        entity_type=etype,
-                    )
-
-                    # Log every 10 entities to avoid log spam
-                    if processed % 10 == 0:
-                        logger.info(f"Reindex {job_id} progress: {current_progress}/{total} ({etype})")
+                        # One bad entity shouldn't fail the whole batch - retry individually,
+                        # pacing each request through the same budget
+                        logger.warning(
+                            f"Batch index of {len(batch)} {etype}s failed, retrying individually: {e}"
+                        )
+                        await db.rollback()
+                        for entity_id, entity_org_id in batch:
+                            await wait_for_request_slot()
+                            try:
+                                await embeddings_service.index_entity(
+                                    db, typed_etype, entity_id, entity_org_id
+                                )
+                                # Commit each success so a later rollback can't undo it
+                                await db.commit()
+                                indexed += 1
+                            except Exception as entity_error:
+                                logger.error(
+                                    f"Failed to index {etype}/{entity_id}: {entity_error}",
+                                    exc_info=True,
+                                )
+                                # Keep the session usable for the rest of the batch
+                                await db.rollback()
+                                failed += 1
+
+                    processed += indexed
+                    errors += failed
+                    counts_by_type[etype] += indexed
+
+                    # Commit each batch so progress survives a worker restart
+                    await db.commit()
+
+                    # Report progress and check for cancellation every so many
+                    # entities or seconds rather than after every batch
+                    progress.add(indexed, failed, etype)
+                    if progress.due() and await report_progress(etype):
+                        return
 
-                    # Small delay to avoid overwhelming OpenAI API
-                    await asyncio.sleep(0.1)
+                # Report each finished type, which also settles the counts
+                if await report_progress(etype):
+                    return
 
             await db.commit()
 
@@ -403,6 +578,100 @@ async def cleanup_audit_logs_task(
     )
 
 
+async def sync_custom_asset_indexes_task(
+    ctx: dict[str, Any],  # noqa: ARG001
+    custom_asset_type_id: str,
+) -> None:
+    """
+    Build and drop a custom asset type's field indexes to match its fields.
+
+    Queued when a type's field definitions or display field change. Indexes
+    are built CONCURRENTLY, which can take a while on large types.
+
+    Args:
+        ctx: arq context
+        custom_asset_type_id: CustomAssetType UUID as string
+    """
+    from src.services.custom_asset_indexes import sync_custom_asset_type_indexes
+
+    logger.info(f"Syncing field indexes for custom asset type {custom_asset_type_id}")
+    await sync_custom_asset_type_indexes(UUID(custom_asset_type_id))
+
+
+async def sync_all_custom_asset_indexes_task(
+    ctx: dict[str, Any],  # noqa: ARG001
+) -> None:
+    """
+    Reconcile field indexes for every custom asset type.
+
+    Runs at worker startup and nightly, covering types created before field
+    indexes existed and any sync job that failed.
+
+    Args:
+        ctx: arq context
+    """
+    from src.services.custom_asset_indexes import sync_all_custom_asset_type_indexes
+
+    logger.info("Reconciling custom asset field indexes")
+    await sync_all_custom_asset_type_indexes()
+
+
+async def process_export_task(
+    ctx: dict[str, Any],
+    export_id: str,
+) -> None:
+    """
+    Generate a data export ZIP file.
+
+    Runs on the export queue (see ExportWorkerSettings). A failed or timed-out
+    attempt is retried with backoff and resumes after the last entity type it
+    finished; the export is only marked failed once the final attempt fails.
+    The timeout is enforced here rather than by arq, which doesn't retry jobs
+    that hit its own timeout.
+
+    Args:
+        ctx: arq context (job_try is the current attempt, starting at 1)
+        export_id: Export UUID as string
+    """
+    from arq import Retry
+
+    from src.services.export_service import process_export
+
+    job_try = ctx.get("job_try", 1)
+    final_attempt = job_try >= get_settings().export_max_tries
+
+    logger.info(f"Processing export {export_id} (attempt {job_try})")
+    try:
+        async with asyncio.timeout(EXPORT_TIMEOUT_SECONDS):
+            finished = await process_export(UUID(export_id), final_attempt=final_attempt)
+    except TimeoutError:
+        if final_attempt:
+            raise
+        logger.warning(f"Export {export_id} attempt {job_try} timed out, will retry")
+        finished = False
+
+    if not finished:
+        raise Retry(defer=timedelta(minutes=job_try))
+
+
+async def startup(_ctx: dict[str, Any]) -> None:
+    """Start listening for AI/indexing settings changes made through the API."""
+    from src.services.system_config_cache import get_system_config_cache
+
+    await get_system_config_cache().start_listener()
+
+
+async def shutdown(_ctx: dict[str, Any]) -> None:
+    """Stop the settings listener and release shared connections."""
+    from src.core.cache import close_redis
+    from src.services.file_storage import get_file_storage_service
+    from src.services.system_config_cache import get_system_config_cache
+
+    await get_system_config_cache().stop_listener()
+    await get_file_storage_service().close_client()
+    await close_redis()
+
+
 class WorkerSettings:
     """
     arq worker settings.
@@ -414,18 +683,35 @@ class WorkerSettings:
     # Task functions to register with the worker
     # reindex_task gets a 6-hour timeout since it processes thousands of entities
     # Other tasks use the global job_timeout (60s)
+    # Index/remove jobs use deterministic job IDs for deduplication, so results
+    # are not kept - a kept result would block re-enqueueing that entity
     functions = [
-        index_entity_task,
-        remove_entity_task,
+        func(index_entity_task, keep_result=0),
+        func(index_entities_task, keep_result=0, timeout=600),
+        func(remove_entity_task, keep_result=0),
         func(reindex_task, timeout=21600),  # 6 hours for bulk reindexing
+        # Concurrent index builds on large types can take a long time
+        func(sync_custom_asset_indexes_task, keep_result=0, timeout=3600),
+        func(sync_all_custom_asset_indexes_task, keep_result=0, timeout=21600),
         cleanup_audit_logs_task,
     ]
 
     # Cron jobs for scheduled tasks
     cron_jobs = [
         cron(cleanup_audit_logs_task, hour=3, minute=0),  # Run daily at 3am
+        cron(
+            sync_all_custom_asset_indexes_task,
+            hour=4,
+            minute=0,
+            run_at_startup=True,
+            timeout=21600,
+        ),
     ]
 
+    # Lifecycle hooks
+    on_startup = startup
+    on_shutdown = shutdown
+
     # Redis connection settings (loaded from environment)
     redis_settings = RedisSettings.from_dsn(get_settings().redis_url)
 
@@ -441,3 +727,31 @@ class WorkerSettings:
 
     # Max retry attempts before marking job as failed
     max_tries = 3
+
+
+class ExportWorkerSettings:
+    """
+    arq settings for the export worker.
+
+    Exports run on a dedicated queue so zipping never competes with the API
+    or holds up indexing jobs. max_jobs caps concurrent exports per worker,
+    since each one holds a database connection and buffers an upload part.
+    """
+
+    queue_name = EXPORT_QUEUE_NAME
+
+    functions = [
+        func(process_export_task, timeout=EXPORT_JOB_TIMEOUT_SECONDS),
+    ]
+
+    on_shutdown = shutdown
+
+    redis_settings = RedisSettings.from_dsn(get_settings().redis_url)
+
+    max_jobs = get_settings().export_max_concurrent_jobs
+
+    job_timeout = EXPORT_JOB_TIMEOUT_SECONDS
+
+    # Retries resume after the last entity type that finished
+    retry_jobs = True
+    max_tries = get_settings().export_max_tries
@@ -85,6 +85,16 @@ def setup_test_environment(tmp_path_factory):
     reset_db_state()
 
 
+@pytest.fixture(autouse=True)
+def reset_system_config_cache():
+    """Start each test without cached AI/indexing settings."""
+    from src.services.system_config_cache import get_system_config_cache
+
+    get_system_config_cache().invalidate()
+    yield
+    get_system_config_cache().invalidate()
+
+
 # ==================== DATABASE FIXTURES ====================
 
 
@@ -300,6 +300,51 @@ class TestAttachmentRepository:
         )
         assert len(remaining) == 0
 
+    @pytest.mark.asyncio
+    async def test_shared_content_is_kept_until_last_reference(
+        self,
+        db_session: AsyncSession,
+        test_org: Organization,
+    ):
+        """Attachments with the same content share an S3 key until the last is deleted."""
+        repo = AttachmentRepository(db_session)
+        content_hash = "ab" * 32
+        shared_key = f"{test_org.id}/configuration/{uuid4()}/{uuid4()}/logo.png"
+
+        attachments = []
+        for _ in range(2):
+            entity_id = uuid4()
+            await repo.lock_content(test_org.id, content_hash)
+            existing = await repo.get_by_content_hash(test_org.id, content_hash, 512)
+            attachments.append(
+                await repo.create(
+                    Attachment(
+                        organization_id=test_org.id,
+                        entity_type=EntityType.CONFIGURATION,
+                        entity_id=entity_id,
+                        filename="logo.png",
+                        s3_key=existing.s3_key if existing else shared_key,
+                        content_type="image/png",
+                        size_bytes=512,
+                        content_hash=content_hash,
+                    )
+                )
+            )
+
+        assert attachments[1].s3_key == shared_key
+        # Same hash with a different size is not a match
+        assert await repo.get_by_content_hash(test_org.id, content_hash, 513) is None
+
+        await repo.delete(attachments[0])
+        assert await repo.unreferenced_s3_keys([shared_key]) == []
+
+        deleted_keys = await repo.delete_by_entity(
+            organization_id=test_org.id,
+            entity_type=EntityType.CONFIGURATION,
+            entity_id=attachments[1].entity_id,
+        )
+        assert deleted_keys == [shared_key]
+
     @pytest.mark.asyncio
     async def test_calculate_storage_for_org(
         self,
@@ -17,6 +17,7 @@ from httpx import ASGITransport, AsyncClient
 
 from src.main import app
 from src.models.enums import UserRole
+from src.repositories.pagination import Page
 
 
 @pytest_asyncio.fixture
@@ -226,7 +227,7 @@ class TestConfigurationWithAuth:
             "src.routers.configurations.ConfigurationRepository"
         ) as mock_config_repo:
             mock_config_repo.return_value.get_paginated_by_org = AsyncMock(
-                return_value=([], 0)
+                return_value=Page(items=[], total=0)
             )
 
             response = await client.get(
@@ -234,7 +234,7 @@ class TestCreateExport:
             ) as ac:
                 with (
                     patch("src.routers.exports.ExportRepository", return_value=mock_repo),
-                    patch("src.services.export_service.process_export", new_callable=AsyncMock),
+                    patch("src.routers.exports.enqueue_export", new_callable=AsyncMock),
                 ):
                     response = await ac.post(
                         "/api/exports",
@@ -276,7 +276,7 @@ class TestCreateExport:
             ) as ac:
                 with (
                     patch("src.routers.exports.ExportRepository", return_value=mock_repo),
-                    patch("src.services.export_service.process_export", new_callable=AsyncMock),
+                    patch("src.routers.exports.enqueue_export", new_callable=AsyncMock),
                 ):
                     response = await ac.post(
                         "/api/exports",
@@ -332,7 +332,7 @@ class TestCreateExport:
             ) as ac:
                 with (
                     patch("src.routers.exports.ExportRepository", return_value=mock_repo),
-                    patch("src.services.export_service.process_export", new_callable=AsyncMock),
+                    patch("src.routers.exports.enqueue_export", new_callable=AsyncMock),
                 ):
                     response = await ac.post(
                         "/api/exports",
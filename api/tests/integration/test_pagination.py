@@ -16,6 +16,7 @@ from src.core.auth import UserPrincipal, get_current_active_user
 from src.main import app
 from src.models.enums import UserRole
 from src.models.orm.password import Password
+from src.repositories.pagination import Page
 
 
 @pytest.fixture
@@ -72,7 +73,7 @@ class TestPaginationBasic:
         mock_password_repo = AsyncMock()
         # Return first 2 passwords, total of 5
         mock_password_repo.get_paginated_by_org = AsyncMock(
-            return_value=(all_passwords[:2], 5)
+            return_value=Page(items=all_passwords[:2], total=5)
         )
 
         try:
@@ -100,7 +101,10 @@ class TestPaginationBasic:
                 sort_by=None,
                 sort_dir="asc",
                 limit=2,
-                offset=0)
+                offset=0,
+                is_enabled=True,
+                cursor=None,
+                count="exact")
         finally:
             app.dependency_overrides.pop(get_current_active_user, None)
 
@@ -116,7 +120,7 @@ class TestPaginationBasic:
         mock_password_repo = AsyncMock()
         # Return passwords 3-4, total of 5
         mock_password_repo.get_paginated_by_org = AsyncMock(
-            return_value=(all_passwords[2:4], 5)
+            return_value=Page(items=all_passwords[2:4], total=5)
         )
 
         try:
@@ -143,7 +147,10 @@ class TestPaginationBasic:
                 sort_by=None,
                 sort_dir="asc",
                 limit=2,
-                offset=2)
+                offset=2,
+                is_enabled=True,
+                cursor=None,
+                count="exact")
         finally:
             app.dependency_overrides.pop(get_current_active_user, None)
 
@@ -159,7 +166,7 @@ class TestPaginationBasic:
         mock_password_repo = AsyncMock()
         # Return last password (only 1), total of 5
         mock_password_repo.get_paginated_by_org = AsyncMock(
-            return_value=([all_passwords[4]], 5)
+            return_value=Page(items=[all_passwords[4]], total=5)
         )
 
         try:
@@ -186,7 +193,10 @@ class TestPaginationBasic:
                 sort_by=None,
                 sort_dir="asc",
                 limit=2,
-                offset=4)
+                offset=4,
+                is_enabled=True,
+                cursor=None,
+                count="exact")
         finally:
             app.dependency_overrides.pop(get_current_active_user, None)
 
@@ -195,7 +205,7 @@ class TestPaginationBasic:
         app.dependency_overrides[get_current_active_user] = lambda: test_user
 
         mock_password_repo = AsyncMock()
-        mock_password_repo.get_paginated_by_org = AsyncMock(return_value=([], 0))
+        mock_password_repo.get_paginated_by_org = AsyncMock(return_value=Page(items=[], total=0))
 
         try:
             async with AsyncClient(
@@ -221,7 +231,10 @@ class TestPaginationBasic:
                 sort_by=None,
                 sort_dir="asc",
                 limit=100,
-                offset=0)
+                offset=0,
+                is_enabled=True,
+                cursor=None,
+                count="exact")
         finally:
             app.dependency_overrides.pop(get_current_active_user, None)
 
@@ -240,7 +253,7 @@ class TestPaginationSearch:
         mock_password_repo = AsyncMock()
         # Search for "admin" should return only matching password
         mock_password_repo.get_paginated_by_org = AsyncMock(
-            return_value=([admin_password], 1)
+            return_value=Page(items=[admin_password], total=1)
         )
 
         try:
@@ -266,7 +279,10 @@ class TestPaginationSearch:
                 sort_by=None,
                 sort_dir="asc",
                 limit=100,
-                offset=0)
+                offset=0,
+                is_enabled=True,
+                cursor=None,
+                count="exact")
         finally:
             app.dependency_overrides.pop(get_current_active_user, None)
 
@@ -276,7 +292,7 @@ class TestPaginationSearch:
 
         mock_password_repo = AsyncMock()
         # Search for non-existent term returns empty
-        mock_password_repo.get_paginated_by_org = AsyncMock(return_value=([], 0))
+        mock_password_repo.get_paginated_by_org = AsyncMock(return_value=Page(items=[], total=0))
 
         try:
             async with AsyncClient(
@@ -308,7 +324,7 @@ class TestPaginationSearch:
         mock_password_repo = AsyncMock()
         # Return first 2 matching passwords, total of 5 matches
         mock_password_repo.get_paginated_by_org = AsyncMock(
-            return_value=(matching_passwords[:2], 5)
+            return_value=Page(items=matching_passwords[:2], total=5)
         )
 
         try:
@@ -336,7 +352,10 @@ class TestPaginationSearch:
                 sort_by=None,
                 sort_dir="asc",
                 limit=2,
-                offset=0)
+                offset=0,
+                is_enabled=True,
+                cursor=None,
+                count="exact")
         finally:
             app.dependency_overrides.pop(get_current_active_user, None)
 
@@ -358,7 +377,7 @@ class TestPaginationSorting:
 
         mock_password_repo = AsyncMock()
         mock_password_repo.get_paginated_by_org = AsyncMock(
-            return_value=(passwords, 3)
+            return_value=Page(items=passwords, total=3)
         )
 
         try:
@@ -382,7 +401,10 @@ class TestPaginationSorting:
                 sort_by="name",
                 sort_dir="asc",
                 limit=100,
-                offset=0)
+                offset=0,
+                is_enabled=True,
+                cursor=None,
+                count="exact")
             # Verify order in response
             assert data["items"][0]["name"] == "Alpha"
             assert data["items"][1]["name"] == "Beta"
@@ -403,7 +425,7 @@ class TestPaginationSorting:
 
         mock_password_repo = AsyncMock()
         mock_password_repo.get_paginated_by_org = AsyncMock(
-            return_value=(passwords, 3)
+            return_value=Page(items=passwords, total=3)
         )
 
         try:
@@ -426,7 +448,10 @@ class TestPaginationSorting:
                 sort_by="name",
                 sort_dir="desc",
                 limit=100,
-                offset=0)
+                offset=0,
+                is_enabled=True,
+                cursor=None,
+                count="exact")
             # Verify reverse order in response
             assert data["items"][0]["name"] == "Gamma"
             assert data["items"][1]["name"] == "Beta"
@@ -446,7 +471,7 @@ class TestPaginationSorting:
 
         mock_password_repo = AsyncMock()
         mock_password_repo.get_paginated_by_org = AsyncMock(
-            return_value=(passwords, 5)
+            return_value=Page(items=passwords, total=5)
         )
 
         try:
@@ -475,7 +500,10 @@ class TestPaginationSorting:
                 sort_by="name",
                 sort_dir="asc",
                 limit=2,
-                offset=2)
+                offset=2,
+                is_enabled=True,
+                cursor=None,
+                count="exact")
         finally:
             app.dependency_overrides.pop(get_current_active_user, None)
 
@@ -490,7 +518,7 @@ class TestPaginationEdgeCases:
 
         mock_password_repo = AsyncMock()
         # Offset is beyond total, return empty list but correct total
-        mock_password_repo.get_paginated_by_org = AsyncMock(return_value=([], 5))
+        mock_password_repo.get_paginated_by_org = AsyncMock(return_value=Page(items=[], total=5))
 
         try:
             async with AsyncClient(
@@ -516,7 +544,7 @@ class TestPaginationEdgeCases:
         app.dependency_overrides[get_current_active_user] = lambda: test_user
 
         mock_password_repo = AsyncMock()
-        mock_password_repo.get_paginated_by_org = AsyncMock(return_value=([], 5))
+        mock_password_repo.get_paginated_by_org = AsyncMock(return_value=Page(items=[], total=5))
 
         try:
             async with AsyncClient(
@@ -618,7 +646,7 @@ class TestPaginationEdgeCases:
 
         mock_password_repo = AsyncMock()
         mock_password_repo.get_paginated_by_org = AsyncMock(
-            return_value=(passwords, 1)
+            return_value=Page(items=passwords, total=1)
         )
 
         try:
@@ -642,7 +670,10 @@ class TestPaginationEdgeCases:
                 sort_by=None,
                 sort_dir="asc",
                 limit=100,
-                offset=0)
+                offset=0,
+                is_enabled=True,
+                cursor=None,
+                count="exact")
         finally:
             app.dependency_overrides.pop(get_current_active_user, None)
 
@@ -663,7 +694,7 @@ class TestPaginationCombined:
 
         mock_password_repo = AsyncMock()
         mock_password_repo.get_paginated_by_org = AsyncMock(
-            return_value=(passwords, 10)
+            return_value=Page(items=passwords, total=10)
         )
 
         try:
@@ -696,7 +727,10 @@ class TestPaginationCombined:
                 sort_by="name",
                 sort_dir="desc",
                 limit=2,
-                offset=4)
+                offset=4,
+                is_enabled=True,
+                cursor=None,
+                count="exact")
         finally:
             app.dependency_overrides.pop(get_current_active_user, None)
 
@@ -705,7 +739,7 @@ class TestPaginationCombined:
         app.dependency_overrides[get_current_active_user] = lambda: test_user
 
         mock_password_repo = AsyncMock()
-        mock_password_repo.get_paginated_by_org = AsyncMock(return_value=([], 0))
+        mock_password_repo.get_paginated_by_org = AsyncMock(return_value=Page(items=[], total=0))
 
         try:
             async with AsyncClient(
@@ -732,7 +766,7 @@ class TestPaginationCombined:
 
         mock_password_repo = AsyncMock()
         mock_password_repo.get_paginated_by_org = AsyncMock(
-            return_value=(passwords, 5)
+            return_value=Page(items=passwords, total=5)
         )
 
         try:
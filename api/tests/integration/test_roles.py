@@ -22,6 +22,7 @@ from src.core.auth import UserPrincipal, get_current_active_user
 from src.main import app
 from src.models.enums import UserRole
 from src.models.orm.user import User
+from src.repositories.pagination import Page
 
 
 def create_mock_user(
@@ -628,7 +629,7 @@ class TestReaderRestrictions:
         app.dependency_overrides[get_current_active_user] = lambda: reader_user
 
         mock_password_repo = AsyncMock()
-        mock_password_repo.get_paginated_by_org = AsyncMock(return_value=([], 0))
+        mock_password_repo.get_paginated_by_org = AsyncMock(return_value=Page(items=[], total=0))
 
         try:
             async with AsyncClient(
@@ -650,7 +651,7 @@ class TestReaderRestrictions:
         app.dependency_overrides[get_current_active_user] = lambda: reader_user
 
         mock_doc_repo = AsyncMock()
-        mock_doc_repo.get_paginated_by_org = AsyncMock(return_value=([], 0))
+        mock_doc_repo.get_paginated_by_org = AsyncMock(return_value=Page(items=[], total=0))
 
         try:
             async with AsyncClient(
@@ -674,7 +675,7 @@ class TestReaderRestrictions:
         app.dependency_overrides[get_current_active_user] = lambda: reader_user
 
         mock_config_repo = AsyncMock()
-        mock_config_repo.get_paginated_by_org = AsyncMock(return_value=([], 0))
+        mock_config_repo.get_paginated_by_org = AsyncMock(return_value=Page(items=[], total=0))
 
         try:
             with patch(
@@ -996,7 +997,7 @@ class TestRoleHierarchy:
         app.dependency_overrides[get_current_active_user] = lambda: admin_user
 
         mock_password_repo = AsyncMock()
-        mock_password_repo.get_paginated_by_org = AsyncMock(return_value=([], 0))
+        mock_password_repo.get_paginated_by_org = AsyncMock(return_value=Page(items=[], total=0))
 
         try:
             async with AsyncClient(
@@ -1020,7 +1021,7 @@ class TestRoleHierarchy:
         app.dependency_overrides[get_current_active_user] = lambda: contributor_user
 
         mock_password_repo = AsyncMock()
-        mock_password_repo.get_paginated_by_org = AsyncMock(return_value=([], 0))
+        mock_password_repo.get_paginated_by_org = AsyncMock(return_value=Page(items=[], total=0))
 
         try:
             async with AsyncClient(
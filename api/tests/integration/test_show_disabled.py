@@ -13,6 +13,7 @@ from httpx import ASGITransport, AsyncClient
 
 from src.main import app
 from src.models.enums import UserRole
+from src.repositories.pagination import Page
 
 
 @pytest_asyncio.fixture
@@ -54,7 +55,7 @@ class TestShowDisabledConfigurations:
             with patch(
                 "src.repositories.configuration.ConfigurationRepository.get_paginated_by_org"
             ) as mock_repo:
-                mock_repo.return_value = ([], 0)
+                mock_repo.return_value = Page(items=[], total=0)
 
                 response = await client.get(
                     f"/api/organizations/{org_id}/configurations?show_disabled=false"
@@ -74,7 +75,7 @@ class TestShowDisabledConfigurations:
             with patch(
                 "src.repositories.configuration.ConfigurationRepository.get_paginated_by_org"
             ) as mock_repo:
-                mock_repo.return_value = ([], 0)
+                mock_repo.return_value = Page(items=[], total=0)
 
                 response = await client.get(
                     f"/api/organizations/{org_id}/configurations?show_disabled=true"
@@ -94,7 +95,7 @@ class TestShowDisabledConfigurations:
             with patch(
                 "src.repositories.configuration.ConfigurationRepository.get_paginated_by_org"
             ) as mock_repo:
-                mock_repo.return_value = ([], 0)
+                mock_repo.return_value = Page(items=[], total=0)
 
                 # Call without show_disabled parameter
                 response = await client.get(f"/api/organizations/{org_id}/configurations")
@@ -118,7 +119,7 @@ class TestShowDisabledLocations:
             with patch(
                 "src.repositories.location.LocationRepository.get_paginated_by_org"
             ) as mock_repo:
-                mock_repo.return_value = ([], 0)
+                mock_repo.return_value = Page(items=[], total=0)
 
                 response = await client.get(
                     f"/api/organizations/{org_id}/locations?show_disabled=false"
@@ -137,7 +138,7 @@ class TestShowDisabledLocations:
             with patch(
                 "src.repositories.location.LocationRepository.get_paginated_by_org"
             ) as mock_repo:
-                mock_repo.return_value = ([], 0)
+                mock_repo.return_value = Page(items=[], total=0)
 
                 response = await client.get(
                     f"/api/organizations/{org_id}/locations?show_disabled=true"
@@ -161,7 +162,7 @@ class TestShowDisabledCustomAssets:
             with patch(
                 "src.repositories.custom_asset.CustomAssetRepository.get_paginated_by_org"
             ) as mock_repo:
-                mock_repo.return_value = ([], 0)
+                mock_repo.return_value = Page(items=[], total=0)
 
                 response = await client.get(
                     f"/api/organizations/{org_id}/custom-assets?show_disabled=false"
@@ -180,7 +181,7 @@ class TestShowDisabledCustomAssets:
             with patch(
                 "src.repositories.custom_asset.CustomAssetRepository.get_paginated_by_org"
             ) as mock_repo:
-                mock_repo.return_value = ([], 0)
+                mock_repo.return_value = Page(items=[], total=0)
 
                 response = await client.get(
                     f"/api/organizations/{org_id}/custom-assets?show_disabled=true"
@@ -204,7 +205,7 @@ class TestShowDisabledPasswords:
             with patch(
                 "src.repositories.password.PasswordRepository.get_paginated_by_org"
             ) as mock_repo:
-                mock_repo.return_value = ([], 0)
+                mock_repo.return_value = Page(items=[], total=0)
 
                 response = await client.get(
                     f"/api/organizations/{org_id}/passwords?show_disabled=false"
@@ -223,7 +224,7 @@ class TestShowDisabledPasswords:
             with patch(
                 "src.repositories.password.PasswordRepository.get_paginated_by_org"
             ) as mock_repo:
-                mock_repo.return_value = ([], 0)
+                mock_repo.return_value = Page(items=[], total=0)
 
                 response = await client.get(
                     f"/api/organizations/{org_id}/passwords?show_disabled=true"
@@ -247,7 +248,7 @@ class TestShowDisabledDocuments:
             with patch(
                 "src.repositories.document.DocumentRepository.get_paginated_by_org"
             ) as mock_repo:
-                mock_repo.return_value = ([], 0)
+                mock_repo.return_value = Page(items=[], total=0)
 
                 response = await client.get(
                     f"/api/organizations/{org_id}/documents?show_disabled=false"
@@ -266,7 +267,7 @@ class TestShowDisabledDocuments:
             with patch(
                 "src.repositories.document.DocumentRepository.get_paginated_by_org"
             ) as mock_repo:
-                mock_repo.return_value = ([], 0)
+                mock_repo.return_value = Page(items=[], total=0)
 
                 response = await client.get(
                     f"/api/organizations/{org_id}/documents?show_disabled=true"
@@ -0,0 +1,277 @@
+"""Tests for keyset pagination helpers."""
+import json
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql
+
+from src.models.orm.password import Password
+from src.repositories.pagination import (
+    count_rows,
+    decode_cursor,
+    encode_cursor,
+    keyset_condition,
+    paginate,
+)
+
+
+def _sql(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.unit
+class TestCursorEncoding:
+    """Tests for encode_cursor / decode_cursor."""
+
+    def test_round_trip(self):
+        """Sort value and id survive encoding."""
+        row_id = uuid4()
+        created = datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC)
+
+        cursor = encode_cursor("created_at", "desc", created, row_id)
+
+        assert decode_cursor(cursor, "created_at", "desc") == (created.isoformat(), str(row_id))
+
+    def test_cursor_is_url_safe(self):
+        """Cursors can be passed as query parameters without escaping."""
+        cursor = encode_cursor("name", "asc", "a/b+c?" * 10, uuid4())
+
+        assert "=" not in cursor
+        assert "+" not in cursor
+        assert "/" not in cursor
+
+    def test_rejects_garbage(self):
+        """Malformed cursors raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            decode_cursor("not a cursor!", "name", "asc")
+
+    def test_rejects_cursor_for_other_sort(self):
+        """A cursor only applies to the sort it was issued for."""
+        cursor = encode_cursor("name", "asc", "x", uuid4())
+
+        with pytest.raises(ValueError, match="does not match"):
+            decode_cursor(cursor, "name", "desc")
+        with pytest.raises(ValueError, match="does not match"):
+            decode_cursor(cursor, "url", "asc")
+
+
+@pytest.mark.unit
+class TestKeysetCondition:
+    """Tests for keyset_condition."""
+
+    def test_non_nullable_column_uses_row_comparison(self):
+        """NOT NULL sort columns compare (sort, id) as a row."""
+        sql = _sql(keyset_condition(Password.name, Password.id, "asc", "b", uuid4()))
+
+        assert "(passwords.name, passwords.id) >" in sql
+
+    def test_descending_flips_comparison(self):
+        """Descending pages continue with smaller values."""
+        sql = _sql(keyset_condition(Password.name, Password.id, "desc", "b", uuid4()))
+
+        assert "(passwords.name, passwords.id) <" in sql
+
+    def test_nullable_ascending_keeps_trailing_nulls(self):
+        """Ascending: NULLs sort last, so they're still ahead of a non-NULL cursor."""
+        sql = _sql(keyset_condition(Password.username, Password.id, "asc", "b", uuid4()))
+
+        assert "passwords.username >" in sql
+        assert "passwords.username IS NULL" in sql
+
+    def test_nullable_ascending_null_cursor_stays_in_nulls(self):
+        """Ascending from a NULL value only the remaining NULL rows are left."""
+        sql = _sql(keyset_condition(Password.username, Password.id, "asc", None, uuid4()))
+
+        assert sql == "passwords.username IS NULL AND passwords.id > %(id_1)s::UUID"
+
+    def test_nullable_descending_null_cursor_includes_non_nulls(self):
+        """Descending: NULLs come first, then every non-NULL row."""
+        sql = _sql(keyset_condition(Password.username, Password.id, "desc", None, uuid4()))
+
+        assert "passwords.id <" in sql
+        assert "passwords.username IS NOT NULL" in sql
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCountRows:
+    """Tests for count_rows."""
+
+    async def test_none_skips_query(self):
+        """count="none" doesn't touch the database."""
+        session = AsyncMock()
+
+        assert await count_rows(session, select(func.count(Password.id)), "none") == (None, False)
+        session.execute.assert_not_called()
+
+    async def test_exact_runs_count(self):
+        """count="exact" runs the count query."""
+        session = AsyncMock()
+        result = MagicMock()
+        result.scalar.return_value = 42
+        session.execute.return_value = result
+
+        assert await count_rows(session, select(func.count(Password.id)), "exact") == (42, False)
+
+    async def test_estimated_reads_plan_rows(self):
+        """count="estimated" returns the planner's row estimate for the filtered rows."""
+        session = AsyncMock()
+        result = MagicMock()
+        result.scalar_one.return_value = json.dumps([{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 1234}}])
+        session.execute.return_value = result
+        org_id = uuid4()
+        count_query = select(func.count(Password.id)).where(Password.organization_id == org_id)
+
+        assert await count_rows(session, count_query, "estimated") == (1234, True)
+
+        sql = _sql(session.execute.call_args.args[0])
+        assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT 1")
+        assert "count(" not in sql
+        assert "passwords.organization_id =" in sql
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPaginate:
+    """Tests for paginate."""
+
+    @staticmethod
+    def _session(rows, total=None):
+        session = AsyncMock()
+        count_result = MagicMock()
+        count_result.scalar.return_value = total
+        page_result = MagicMock()
+        page_result.unique.return_value.all.return_value = rows
+        session.execute.side_effect = [count_result, page_result] if total is not None else [page_result]
+        return session
+
+    @staticmethod
+    def _rows(n):
+        rows = []
+        for i in range(n):
+            entity = MagicMock()
+            rows.append((entity, f"name {i}", uuid4()))
+        return rows
+
+    async def test_full_page_returns_next_cursor(self):
+        """Fetching limit + 1 rows means there is a next page."""
+        rows = self._rows(3)
+        session = self._session(rows, total=10)
+
+        page = await paginate(
+            session,
+            select(Password),
+            select(func.count(Password.id)),
+            sort_key="name",
+            sort_column=Password.name,
+            id_column=Password.id,
+            limit=2,
+        )
+
+        assert page.items == [rows[0][0], rows[1][0]]
+        assert page.total == 10
+        assert page.total_is_estimate is False
+        assert page.next_cursor is not None
+        assert decode_cursor(page.next_cursor, "name", "asc") == ("name 1", str(rows[1][2]))
+
+        query_sql = _sql(session.execute.call_args_list[1].args[0])
+        assert "ORDER BY passwords.name ASC, passwords.id ASC" in query_sql
+        assert "LIMIT" in query_sql
+
+    async def test_last_page_has_no_cursor(self):
+        """Short pages end pagination."""
+        session = self._session(self._rows(2), total=2)
+
+        page = await paginate(
+            session,
+            select(Password),
+            select(func.count(Password.id)),
+            sort_key="name",
+            sort_column=Password.name,
+            id_column=Password.id,
+            limit=2,
+        )
+
+        assert len(page.items) == 2
+        assert page.next_cursor is None
+
+    async def test_cursor_replaces_offset(self):
+        """With a cursor the page starts after it rather than at offset."""
+        session = self._session(self._rows(1))
+        cursor = encode_cursor("name", "desc", "m", uuid4())
+
+        await paginate(
+            session,
+            select(Password),
+            select(func.count(Password.id)),
+            sort_key="name",
+            sort_column=Password.name,
+            id_column=Password.id,
+            sort_dir="desc",
+            limit=5,
+            offset=50,
+            cursor=cursor,
+            count="none",
+        )
+
+        query = session.execute.call_args.args[0]
+        assert "(passwords.name, passwords.id) <" in _sql(query)
+        assert 50 not in query.compile(dialect=postgresql.dialect()).params.values()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSortAllowList:
+    """Tests that list endpoints only sort by allow-listed columns."""
+
+    @staticmethod
+    def _order_by(session) -> str:
+        sql = _sql(session.execute.call_args.args[0])
+        return sql.split("ORDER BY ", 1)[1].split("LIMIT", 1)[0].strip()
+
+    @staticmethod
+    def _session():
+        session = AsyncMock()
+        page_result = MagicMock()
+        page_result.unique.return_value.all.return_value = []
+        session.execute.return_value = page_result
+        return session
+
+    async def test_allowed_column_is_used(self):
+        """An allow-listed column is sorted by as requested."""
+        from src.repositories.password import PasswordRepository
+
+        session = self._session()
+        await PasswordRepository(session).get_paginated_by_org(
+            uuid4(), sort_by="updated_at", sort_dir="desc", count="none"
+        )
+
+        assert self._order_by(session) == "passwords.updated_at DESC, passwords.id DESC"
+
+    @pytest.mark.parametrize(
+        "sort_by", [None, "password_encrypted", "totp_secret_encrypted", "organization"]
+    )
+    async def test_other_columns_use_default_sort(self, sort_by):
+        """Secrets, relationships and missing sorts fall back to the default."""
+        from src.repositories.password import PasswordRepository
+
+        session = self._session()
+        await PasswordRepository(session).get_paginated_by_org(
+            uuid4(), sort_by=sort_by, count="none"
+        )
+
+        assert self._order_by(session) == "passwords.name ASC, passwords.id ASC"
+
+    async def test_custom_asset_skips_encrypted_fields(self):
+        """Encrypted custom asset fields are never sorted by."""
+        from src.repositories.custom_asset import CustomAssetRepository
+
+        session = self._session()
+        await CustomAssetRepository(session).get_paginated_by_type(
+            uuid4(), sort_by="values.secret_encrypted", count="none"
+        )
+
+        assert self._order_by(session) == "custom_assets.id ASC, custom_assets.id ASC"
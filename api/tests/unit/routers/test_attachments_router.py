@@ -0,0 +1,140 @@
+"""
+Unit tests for the Attachments Router.
+
+Tests content-addressed upload reuse and reference-counted deletion.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.models.enums import EntityType
+from src.routers import attachments
+from src.routers.attachments import _create_with_upload, delete_attachment
+
+SHA256 = "ab" * 32
+
+
+@pytest.fixture
+def mock_repo():
+    """Create a mock attachment repository that echoes created records."""
+    repo = MagicMock()
+    repo.lock_content = AsyncMock()
+    repo.get_by_content_hash = AsyncMock(return_value=None)
+    repo.unreferenced_s3_keys = AsyncMock(return_value=[])
+    repo.delete = AsyncMock()
+
+    async def create(attachment):
+        attachment.id = uuid4()
+        return attachment
+
+    repo.create = AsyncMock(side_effect=create)
+    repo.update = AsyncMock(side_effect=lambda attachment: attachment)
+    return repo
+
+
+@pytest.fixture
+def mock_file_storage():
+    """Create a mock file storage service."""
+    file_storage = MagicMock()
+    file_storage.file_exists = AsyncMock(return_value=True)
+    file_storage.generate_s3_key = MagicMock(return_value="org/configuration/e/a/logo.png")
+    file_storage.generate_upload_url = AsyncMock(return_value="https://s3.example.com/upload")
+    file_storage.delete_file = AsyncMock(return_value=True)
+    return file_storage
+
+
+async def _create(sha256):
+    return await _create_with_upload(
+        AsyncMock(),
+        uuid4(),
+        entity_type=EntityType.CONFIGURATION,
+        entity_id=uuid4(),
+        filename="logo.png",
+        content_type="image/png",
+        size_bytes=512,
+        sha256=sha256,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCreateWithUpload:
+    """Tests for _create_with_upload."""
+
+    async def test_known_content_reuses_object(self, mock_repo, mock_file_storage):
+        """Content already stored is referenced instead of uploaded again."""
+        mock_repo.get_by_content_hash.return_value = MagicMock(s3_key="org/shared/logo.png")
+
+        with (
+            patch.object(attachments, "AttachmentRepository", return_value=mock_repo),
+            patch.object(attachments, "get_file_storage_service", return_value=mock_file_storage),
+        ):
+            attachment, upload_url = await _create(SHA256)
+
+        assert upload_url is None
+        assert attachment.s3_key == "org/shared/logo.png"
+        assert attachment.content_hash == SHA256
+        mock_repo.lock_content.assert_awaited_once()
+        mock_file_storage.generate_upload_url.assert_not_called()
+
+    async def test_missing_object_is_uploaded_separately(self, mock_repo, mock_file_storage):
+        """A match whose upload never finished doesn't count as stored."""
+        mock_repo.get_by_content_hash.return_value = MagicMock(s3_key="org/pending/logo.png")
+        mock_file_storage.file_exists.return_value = False
+
+        with (
+            patch.object(attachments, "AttachmentRepository", return_value=mock_repo),
+            patch.object(attachments, "get_file_storage_service", return_value=mock_file_storage),
+        ):
+            attachment, upload_url = await _create(SHA256)
+
+        assert upload_url == "https://s3.example.com/upload"
+        assert attachment.s3_key == "org/configuration/e/a/logo.png"
+        assert mock_file_storage.generate_upload_url.call_args.kwargs["sha256"] == SHA256
+
+    async def test_without_hash_always_uploads(self, mock_repo, mock_file_storage):
+        """Uploads without a hash get their own object as before."""
+        with (
+            patch.object(attachments, "AttachmentRepository", return_value=mock_repo),
+            patch.object(attachments, "get_file_storage_service", return_value=mock_file_storage),
+        ):
+            attachment, upload_url = await _create(None)
+
+        assert upload_url == "https://s3.example.com/upload"
+        assert attachment.content_hash is None
+        mock_repo.lock_content.assert_not_called()
+        mock_repo.get_by_content_hash.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestDeleteAttachment:
+    """Tests for delete_attachment."""
+
+    @pytest.mark.parametrize(
+        ("unreferenced", "deletes_object"),
+        [([], False), (["org/shared/logo.png"], True)],
+    )
+    async def test_object_deleted_with_last_reference(
+        self, mock_repo, mock_file_storage, unreferenced, deletes_object
+    ):
+        """The S3 object is only deleted once no attachment references it."""
+        mock_repo.get_by_id_and_org = AsyncMock(
+            return_value=MagicMock(s3_key="org/shared/logo.png", content_hash=SHA256)
+        )
+        mock_repo.unreferenced_s3_keys.return_value = unreferenced
+        db = AsyncMock()
+        settings = MagicMock(s3_configured=True)
+
+        with (
+            patch.object(attachments, "AttachmentRepository", return_value=mock_repo),
+            patch.object(attachments, "get_file_storage_service", return_value=mock_file_storage),
+            patch.object(attachments, "get_settings", return_value=settings),
+        ):
+            await delete_attachment(uuid4(), uuid4(), MagicMock(), db)
+
+        mock_repo.lock_content.assert_awaited_once()
+        db.commit.assert_awaited_once()
+        assert mock_file_storage.delete_file.called is deletes_object
@@ -366,3 +366,29 @@ class TestIsIndexingEnabled:
 
         result = await is_indexing_enabled(mock_session)
         assert result is True
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestConfigCaching:
+    """Tests for per-process caching of config lookups."""
+
+    async def test_repeat_lookups_hit_database_once(self):
+        """Test that cached lookups skip the database until invalidated."""
+        from src.services.system_config_cache import get_system_config_cache
+
+        mock_session = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = None
+        mock_session.execute.return_value = mock_result
+
+        assert await is_indexing_enabled(mock_session) is True
+        assert await is_indexing_enabled(mock_session) is True
+        assert await get_embeddings_config(mock_session) is None
+        assert await get_embeddings_config(mock_session) is None
+        assert mock_session.execute.await_count == 2
+
+        get_system_config_cache().invalidate("indexing_config")
+        await is_indexing_enabled(mock_session)
+        await get_embeddings_config(mock_session)
+        assert mock_session.execute.await_count == 3
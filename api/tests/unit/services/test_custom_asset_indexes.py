@@ -0,0 +1,105 @@
+"""Tests for per-type custom asset field indexes."""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.models.orm.custom_asset import CustomAsset
+from src.repositories.custom_asset import field_text, type_filter
+from src.services.custom_asset_indexes import INDEX_PREFIX, desired_indexes
+
+
+def make_type(fields: list[dict], display_field_key: str | None = None) -> MagicMock:
+    asset_type = MagicMock()
+    asset_type.id = uuid4()
+    asset_type.fields = fields
+    asset_type.display_field_key = display_field_key
+    return asset_type
+
+
+@pytest.mark.unit
+class TestDesiredIndexes:
+    """Tests for desired_indexes."""
+
+    def test_list_fields_get_sort_indexes(self):
+        """Fields shown in the list get a btree matching the list's ORDER BY."""
+        asset_type = make_type(
+            [
+                {"key": "name", "name": "Name", "type": "text", "show_in_list": True},
+                {"key": "serial", "name": "Serial", "type": "text", "show_in_list": True},
+                {"key": "notes", "name": "Notes", "type": "textbox"},
+            ]
+        )
+
+        indexes = desired_indexes(asset_type)
+        sort_ddl = [i.ddl for i in indexes if i.name.endswith("_sort")]
+
+        assert len(sort_ddl) == 2
+        assert """ON custom_assets (organization_id, ("values" ->> 'serial'), id)""" in sort_ddl[1]
+        assert all(f"custom_asset_type_id = '{asset_type.id}'" in ddl for ddl in sort_ddl)
+        assert all(i.name.startswith(f"{INDEX_PREFIX}{asset_type.id.hex}_") for i in indexes)
+
+    def test_display_field_gets_trigram_index(self):
+        """The display field is sortable and searchable even if not shown in the list."""
+        asset_type = make_type(
+            [
+                {"key": "hostname", "name": "Hostname", "type": "text"},
+                {"key": "ip", "name": "IP", "type": "text"},
+            ],
+            display_field_key="ip",
+        )
+
+        indexes = desired_indexes(asset_type)
+
+        assert [i.name.rsplit("_", 1)[1] for i in indexes] == ["sort", "trgm"]
+        assert """USING gin (("values" ->> 'ip') gin_trgm_ops)""" in indexes[1].ddl
+
+    def test_secret_and_header_fields_are_skipped(self):
+        """Password, TOTP and header fields are never indexed."""
+        asset_type = make_type(
+            [
+                {"key": "section", "name": "Section", "type": "header", "show_in_list": True},
+                {"key": "secret", "name": "Secret", "type": "password", "show_in_list": True},
+                {"key": "otp", "name": "OTP", "type": "totp", "show_in_list": True},
+            ]
+        )
+
+        assert [i for i in desired_indexes(asset_type) if i.name.endswith("_sort")] == []
+
+    def test_keys_are_quoted(self):
+        """Field keys are embedded as escaped SQL literals."""
+        asset_type = make_type(
+            [{"key": "owner's", "name": "Owner", "type": "text", "show_in_list": True}]
+        )
+
+        assert """("values" ->> 'owner''s')""" in desired_indexes(asset_type)[0].ddl
+
+    def test_names_are_stable(self):
+        """Index names don't depend on field order, so reordering doesn't rebuild."""
+        a = {"key": "a", "name": "A", "type": "text", "show_in_list": True}
+        b = {"key": "b", "name": "B", "type": "text", "show_in_list": True}
+        asset_type = make_type([a, b], display_field_key="a")
+        names = {i.name for i in desired_indexes(asset_type)}
+
+        asset_type.fields = [b, a]
+
+        assert {i.name for i in desired_indexes(asset_type)} == names
+
+
+@pytest.mark.unit
+class TestIndexableExpressions:
+    """Repository expressions must inline the constants the partial indexes use."""
+
+    def test_key_and_type_are_inlined(self):
+        type_id = uuid4()
+        query = select(CustomAsset.id).where(type_filter(type_id)).order_by(field_text("serial"))
+
+        sql = str(
+            query.compile(dialect=postgresql.dialect(), compile_kwargs={"render_postcompile": True})
+        )
+
+        assert f"custom_assets.custom_asset_type_id = '{type_id}'" in sql
+        assert "custom_assets.values ->> 'serial'" in sql
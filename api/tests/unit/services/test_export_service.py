@@ -0,0 +1,300 @@
+"""Tests for the streaming, resumable export pipeline."""
+
+import asyncio
+import csv
+import io
+import zipfile
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.models.orm.export import ExportStatus
+from src.services import export_service
+from src.services.export_service import (
+    ENTITY_EXPORTS,
+    CsvUpload,
+    ExportArchive,
+    export_entities_to_csv,
+    process_export,
+    stage_files,
+    staged_file_key,
+)
+
+
+class FakeUpload:
+    """Collects uploaded parts in memory."""
+
+    def __init__(self) -> None:
+        self.parts: list[bytes] = []
+
+    async def upload_part(self, data: bytes) -> None:
+        self.parts.append(data)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestExportArchive:
+    """Tests for ExportArchive."""
+
+    async def test_archive_is_uploaded_in_parts(self):
+        """Output is sent in full-size parts while writing, with a smaller final part."""
+        upload = FakeUpload()
+        archive = ExportArchive(upload, part_size=1024)  # type: ignore[arg-type]
+
+        with archive.open_file("rows.csv") as entry:
+            entry.write(b"id,value\r\n")
+            for batch in range(20):
+                # Random-looking values so the output doesn't compress away
+                entry.write(
+                    b"".join(f"{batch * 200 + i},{hash((batch, i))}\r\n".encode() for i in range(200))
+                )
+                await archive.flush()
+                # Never more than a part buffered between flushes
+                assert archive.bytes_written - sum(map(len, upload.parts)) < 1024
+
+        parts_while_writing = len(upload.parts)
+        archive.writestr("metadata.json", "{}")
+        await archive.close()
+
+        assert parts_while_writing > 1
+        assert all(len(part) == 1024 for part in upload.parts[:-1])
+        assert 0 < len(upload.parts[-1]) <= 1024
+        assert sum(map(len, upload.parts)) == archive.bytes_written
+
+        with zipfile.ZipFile(io.BytesIO(b"".join(upload.parts))) as zf:
+            assert zf.namelist() == ["rows.csv", "metadata.json"]
+            assert zf.testzip() is None
+            rows = list(csv.reader(io.StringIO(zf.read("rows.csv").decode())))
+        assert rows[0] == ["id", "value"]
+        assert len(rows) == 4001
+        assert rows[-1][0] == "3999"
+
+    async def test_small_archive_is_a_single_part(self):
+        """Archives smaller than a part are uploaded on close."""
+        upload = FakeUpload()
+        archive = ExportArchive(upload, part_size=1024 * 1024)  # type: ignore[arg-type]
+
+        with archive.open_file("empty.csv") as entry:
+            entry.write(b"id\r\n")
+        await archive.flush()
+        assert upload.parts == []
+
+        await archive.close()
+
+        assert len(upload.parts) == 1
+        with zipfile.ZipFile(io.BytesIO(upload.parts[0])) as zf:
+            assert zf.read("empty.csv") == b"id\r\n"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCsvUpload:
+    """Tests for CsvUpload."""
+
+    async def test_rows_are_uploaded_in_parts(self):
+        """Rows written through the CSV writer are uploaded as full parts on flush."""
+        upload = FakeUpload()
+        out = CsvUpload(upload, part_size=64)  # type: ignore[arg-type]
+
+        for i in range(50):
+            out.writer.writerow([i, "ünïcode"])
+        await out.flush()
+        assert upload.parts and all(len(part) == 64 for part in upload.parts)
+
+        await out.close()
+
+        content = b"".join(upload.parts).decode("utf-8")
+        assert content.startswith("0,ünïcode\r\n")
+        assert len(content.splitlines()) == 50
+        assert out.bytes_written == sum(map(len, upload.parts))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestExportEntitiesToCsv:
+    """Tests for export_entities_to_csv."""
+
+    async def test_one_streamed_query_for_all_organizations(self):
+        """Every organization is read by one server-side cursor query."""
+        org_ids = sorted([uuid4(), uuid4(), uuid4()])
+        entity = ENTITY_EXPORTS[0]
+
+        def password(org_id, name):
+            item = MagicMock()
+            item.organization_id = org_id
+            item.name = name
+            item.username = item.url = item.notes = None
+            item.created_at = item.updated_at = None
+            return item
+
+        async def partitions():
+            yield [password(org_ids[0], "a"), password(org_ids[0], "b")]
+            yield [password(org_ids[2], "c")]
+
+        db = MagicMock()
+        db.stream_scalars = AsyncMock()
+        db.stream_scalars.return_value.partitions = partitions
+        upload = FakeUpload()
+        out = CsvUpload(upload, part_size=1024 * 1024)  # type: ignore[arg-type]
+
+        with patch.object(export_service, "publish_export_progress", new_callable=AsyncMock) as progress:
+            await export_entities_to_csv(db, entity, list(reversed(org_ids)), uuid4(), out)
+        await out.close()
+
+        db.stream_scalars.assert_awaited_once()
+        query = db.stream_scalars.call_args.args[0]
+        assert query.get_execution_options()["yield_per"] > 0
+        assert "passwords.organization_id IN" in str(query)
+
+        rows = list(csv.reader(io.StringIO(b"".join(upload.parts).decode())))
+        assert rows[0] == entity.columns
+        assert [row[2] for row in rows[1:]] == ["a", "b", "c"]
+        # Progress follows the organizations in the order rows arrive
+        assert [c.args[2:4] for c in progress.call_args_list] == [(1, 3), (3, 3), (3, 3)]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestStageFiles:
+    """Tests for stage_files."""
+
+    async def test_all_types_finish_before_a_failure_is_raised(self):
+        """One failing entity type doesn't cancel the others."""
+        finished = []
+
+        async def stage_file(org_ids, export_id, entity):
+            if entity.filename == "passwords.csv":
+                raise RuntimeError("boom")
+            finished.append(entity.filename)
+
+        with (
+            patch.object(export_service, "_stage_file", stage_file),
+            pytest.raises(RuntimeError, match="boom"),
+        ):
+            await stage_files([uuid4()], uuid4(), ENTITY_EXPORTS)
+
+        assert finished == [entity.filename for entity in ENTITY_EXPORTS[1:]]
+
+
+def _patch_process_export(staged: set[str]):
+    """Patch process_export's collaborators; files in staged already exist in S3."""
+    export = MagicMock()
+    export.status = ExportStatus.PENDING
+    export.organization_ids = [str(uuid4())]
+
+    repo = MagicMock()
+    repo.get_by_id = AsyncMock(return_value=export)
+    repo.update_status = AsyncMock()
+
+    @asynccontextmanager
+    async def db_context():
+        yield AsyncMock()
+
+    file_storage = MagicMock()
+    file_storage.file_exists = AsyncMock(side_effect=lambda key: key.rsplit("/", 1)[1] in staged)
+    file_storage.delete_file = AsyncMock(return_value=True)
+
+    patches = [
+        patch.object(export_service, "get_db_context", db_context),
+        patch.object(export_service, "ExportRepository", return_value=repo),
+        patch.object(export_service, "get_file_storage_service", return_value=file_storage),
+        patch.object(export_service, "publish_export_progress", new_callable=AsyncMock),
+        patch.object(export_service, "publish_export_completed", new_callable=AsyncMock),
+        patch.object(export_service, "publish_export_failed", new_callable=AsyncMock),
+    ]
+    return patches, repo, file_storage
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestProcessExport:
+    """Tests for process_export resumption."""
+
+    async def test_resumes_after_staged_files(self):
+        """Entity types staged by an earlier attempt are not exported again."""
+        patches, repo, file_storage = _patch_process_export({"passwords.csv", "configurations.csv"})
+        export_id = uuid4()
+
+        with (
+            patches[0], patches[1], patches[2], patches[3], patches[4], patches[5],
+            patch.object(export_service, "_stage_file", new_callable=AsyncMock) as stage_file,
+            patch.object(export_service, "_build_archive", AsyncMock(return_value=1234)),
+        ):
+            assert await process_export(export_id) is True
+
+        assert [c.args[2].filename for c in stage_file.call_args_list] == [
+            "locations.csv",
+            "documents.csv",
+            "custom_assets.csv",
+        ]
+        assert repo.update_status.call_args.args[1] == ExportStatus.COMPLETED
+        # Staged files are removed once the ZIP is built
+        assert {c.args[0] for c in file_storage.delete_file.call_args_list} == {
+            staged_file_key(export_id, entity.filename) for entity in ENTITY_EXPORTS
+        }
+
+    async def test_failed_attempt_keeps_staged_files_for_retry(self):
+        """A non-final failure asks for a retry without failing the export."""
+        patches, repo, file_storage = _patch_process_export(set())
+
+        with (
+            patches[0], patches[1], patches[2], patches[3], patches[4], patches[5],
+            patch.object(
+                export_service,
+                "_stage_file",
+                AsyncMock(side_effect=[None, RuntimeError("connection lost"), None, None, None]),
+            ),
+        ):
+            assert await process_export(uuid4(), final_attempt=False) is False
+
+        assert ExportStatus.FAILED not in [c.args[1] for c in repo.update_status.call_args_list]
+        file_storage.delete_file.assert_not_called()
+
+    async def test_final_failure_marks_export_failed(self):
+        """The last attempt records the failure and cleans up."""
+        patches, repo, file_storage = _patch_process_export(set())
+
+        with (
+            patches[0], patches[1], patches[2], patches[3], patches[4], patches[5],
+            patch.object(
+                export_service, "_stage_file", AsyncMock(side_effect=RuntimeError("boom"))
+            ),
+        ):
+            assert await process_export(uuid4(), final_attempt=True) is True
+
+        assert repo.update_status.call_args.args[1] == ExportStatus.FAILED
+        assert file_storage.delete_file.call_count == len(ENTITY_EXPORTS)
+
+    async def test_cancelled_final_attempt_marks_export_failed(self):
+        """A final attempt cut off by the job timeout still fails the export and cleans up."""
+        patches, repo, file_storage = _patch_process_export(set())
+
+        with (
+            patches[0], patches[1], patches[2], patches[3], patches[4], patches[5],
+            patch.object(
+                export_service, "_stage_file", AsyncMock(side_effect=asyncio.CancelledError)
+            ),
+            pytest.raises(asyncio.CancelledError),
+        ):
+            await process_export(uuid4(), final_attempt=True)
+
+        assert repo.update_status.call_args.args[1] == ExportStatus.FAILED
+        assert file_storage.delete_file.call_count == len(ENTITY_EXPORTS)
+
+    async def test_cancelled_attempt_keeps_staged_files_for_retry(self):
+        """A cancelled attempt that will be retried leaves the export and its staged files alone."""
+        patches, repo, file_storage = _patch_process_export(set())
+
+        with (
+            patches[0], patches[1], patches[2], patches[3], patches[4], patches[5],
+            patch.object(
+                export_service, "_stage_file", AsyncMock(side_effect=asyncio.CancelledError)
+            ),
+            pytest.raises(asyncio.CancelledError),
+        ):
+            await process_export(uuid4(), final_attempt=False)
+
+        assert ExportStatus.FAILED not in [c.args[1] for c in repo.update_status.call_args_list]
+        file_storage.delete_file.assert_not_called()
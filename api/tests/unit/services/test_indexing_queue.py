@@ -0,0 +1,106 @@
+"""Tests for the shared arq pool used to enqueue indexing jobs."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.services import indexing_queue
+
+
+@pytest.fixture(autouse=True)
+def reset_pool():
+    """Ensure each test starts without a shared pool."""
+    indexing_queue._arq_pool = None
+    yield
+    indexing_queue._arq_pool = None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestArqPool:
+    """Tests for arq pool lifecycle."""
+
+    async def test_enqueues_reuse_one_pool(self):
+        """Test that repeated enqueues create the pool only once."""
+        mock_pool = AsyncMock()
+
+        with patch.object(indexing_queue, "create_pool", AsyncMock(return_value=mock_pool)) as mock_create:
+            await indexing_queue.enqueue_index_entity("password", "entity-1", "org-1")
+            await indexing_queue.enqueue_index_entity("password", "entity-2", "org-1")
+            await indexing_queue.enqueue_remove_entity("password", "entity-3")
+
+        mock_create.assert_awaited_once()
+        assert mock_pool.enqueue_job.await_count == 3
+
+    async def test_close_arq_pool_closes_and_resets(self):
+        """Test that closing the pool releases it so a new one can be created."""
+        mock_pool = AsyncMock()
+
+        with patch.object(indexing_queue, "create_pool", AsyncMock(return_value=mock_pool)):
+            await indexing_queue.init_arq_pool()
+            await indexing_queue.close_arq_pool()
+
+        mock_pool.aclose.assert_awaited_once()
+        assert indexing_queue._arq_pool is None
+
+    async def test_enqueue_failure_does_not_raise(self):
+        """Test that Redis errors are logged rather than failing the request."""
+        with patch.object(indexing_queue, "create_pool", AsyncMock(side_effect=ConnectionError("down"))):
+            await indexing_queue.enqueue_index_entity("password", "entity-1", "org-1")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestJobDeduplication:
+    """Tests for deterministic job IDs and coalescing."""
+
+    async def test_index_job_uses_deterministic_id_and_debounce(self):
+        """Test that index jobs are keyed per entity and deferred."""
+        mock_pool = AsyncMock()
+
+        with patch.object(indexing_queue, "create_pool", AsyncMock(return_value=mock_pool)):
+            await indexing_queue.enqueue_index_entity("password", "entity-1", "org-1")
+
+        kwargs = mock_pool.enqueue_job.call_args.kwargs
+        assert kwargs["_job_id"] == "index:password:entity-1"
+        assert kwargs["_defer_by"] == indexing_queue.get_settings().index_debounce_seconds
+
+    async def test_pending_duplicate_is_collapsed(self):
+        """Test that a duplicate of a queued job is not re-enqueued."""
+        mock_pool = AsyncMock()
+        mock_pool.enqueue_job = AsyncMock(return_value=None)
+        mock_pool.exists = AsyncMock(return_value=0)
+
+        with patch.object(indexing_queue, "create_pool", AsyncMock(return_value=mock_pool)):
+            await indexing_queue.enqueue_index_entity("password", "entity-1", "org-1")
+
+        mock_pool.enqueue_job.assert_awaited_once()
+
+    async def test_running_duplicate_queues_one_rerun(self):
+        """Test that a duplicate of a running job queues a follow-up job."""
+        mock_pool = AsyncMock()
+        mock_pool.enqueue_job = AsyncMock(side_effect=[None, AsyncMock()])
+        mock_pool.exists = AsyncMock(return_value=1)
+
+        with patch.object(indexing_queue, "create_pool", AsyncMock(return_value=mock_pool)):
+            await indexing_queue.enqueue_index_entity("password", "entity-1", "org-1")
+
+        assert mock_pool.enqueue_job.await_count == 2
+        assert mock_pool.enqueue_job.call_args.kwargs["_job_id"] == "index:password:entity-1:rerun"
+
+    async def test_batch_enqueues_single_job(self):
+        """Test that a batch of entities becomes one index_entities_task job."""
+        mock_pool = AsyncMock()
+        entity_ids = [f"entity-{i}" for i in range(2000)]
+
+        with patch.object(indexing_queue, "create_pool", AsyncMock(return_value=mock_pool)):
+            await indexing_queue.enqueue_index_entities("configuration", entity_ids, "org-1")
+
+        mock_pool.enqueue_job.assert_awaited_once()
+        assert mock_pool.enqueue_job.call_args.args[0] == "index_entities_task"
+
+    def test_batch_job_id_ignores_order(self):
+        """Test that the batch job ID is the same regardless of ID order."""
+        assert indexing_queue.index_batch_job_id("document", ["a", "b"]) == (
+            indexing_queue.index_batch_job_id("document", ["b", "a"])
+        )
@@ -0,0 +1,175 @@
+"""Tests for reindex job state kept as a Redis hash."""
+
+from typing import Any
+
+import pytest
+
+from src.services.reindex_state import ReindexProgressReporter, ReindexStateService
+
+
+class FakeRedis:
+    """In-memory Redis with bytes responses, counting round trips."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+    def _call(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        return getattr(self, f"_{name}")(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        async def command(*args: Any, **kwargs: Any) -> Any:
+            self.round_trips += 1
+            return self._call(name, *args, **kwargs)
+
+        return command
+
+    def _get(self, key: str) -> bytes | None:
+        value = self.data.get(key)
+        return value.encode() if isinstance(value, str) else None
+
+    def _set(self, key: str, value: str) -> None:
+        self.data[key] = value
+
+    def _setex(self, key: str, ttl: int, value: str) -> None:
+        self.data[key] = value
+
+    def _delete(self, key: str) -> None:
+        self.data.pop(key, None)
+
+    def _exists(self, key: str) -> int:
+        return int(key in self.data)
+
+    def _expire(self, key: str, ttl: int) -> None:
+        pass
+
+    def _hset(self, key: str, field: str | None = None, value: Any = None, mapping: dict | None = None) -> None:
+        fields = self.data.setdefault(key, {})
+        if field is not None:
+            fields[field] = str(value)
+        for k, v in (mapping or {}).items():
+            fields[k] = str(v)
+
+    def _hget(self, key: str, field: str) -> bytes | None:
+        value = self.data.get(key, {}).get(field)
+        return value.encode() if value is not None else None
+
+    def _hincrby(self, key: str, field: str, amount: int) -> int:
+        fields = self.data.setdefault(key, {})
+        fields[field] = str(int(fields.get(field, 0)) + amount)
+        return int(fields[field])
+
+    def _hgetall(self, key: str) -> dict[bytes, bytes]:
+        return {k.encode(): v.encode() for k, v in self.data.get(key, {}).items()}
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis) -> None:
+        self.redis = redis
+        self.commands: list[tuple[str, tuple, dict]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        def queue(*args: Any, **kwargs: Any) -> None:
+            self.commands.append((name, args, kwargs))
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        self.redis.round_trips += 1
+        return [self.redis._call(name, *args, **kwargs) for name, args, kwargs in self.commands]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestReindexStateService:
+    """Tests for ReindexStateService."""
+
+    async def test_job_lifecycle(self):
+        """State round-trips through the hash, including unset values."""
+        service = ReindexStateService(FakeRedis())  # type: ignore[arg-type]
+        await service.start_job("job-1", total=10)
+
+        job = await service.get_current_job()
+        assert job is not None
+        assert (job.status, job.total, job.processed) == ("running", 10, 0)
+        assert job.current_entity_type is None and job.completed_at is None
+
+        await service.add_progress("job-1", processed=4, errors=1, entity_type="document")
+        await service.add_progress("job-1", processed=3, errors=0, entity_type="password")
+        await service.complete_job("job-1")
+
+        job = await service.get_job("job-1")
+        assert job is not None
+        assert (job.processed, job.errors, job.current_entity_type) == (7, 1, "password")
+        assert job.status == "completed" and job.completed_at is not None
+
+    async def test_add_progress_sees_cancellation(self):
+        """Progress writes report a pending cancellation in the same round trip."""
+        redis = FakeRedis()
+        service = ReindexStateService(redis)  # type: ignore[arg-type]
+        await service.start_job("job-1", total=10)
+
+        assert await service.add_progress("job-1", 1, 0, "document") is False
+        assert await service.request_cancel("job-1") is True
+        redis.round_trips = 0
+        assert await service.add_progress("job-1", 1, 0, "document") is True
+        assert redis.round_trips == 1
+
+        job = await service.get_job("job-1")
+        assert job is not None and job.status == "cancelling"
+
+    async def test_missing_job(self):
+        """Status changes on an unknown job do nothing."""
+        service = ReindexStateService(FakeRedis())  # type: ignore[arg-type]
+
+        assert await service.get_job("nope") is None
+        assert await service.request_cancel("nope") is False
+        assert await service.force_cancel("nope") is False
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestReindexProgressReporter:
+    """Tests for throttled progress reporting."""
+
+    async def test_reports_every_n_entities(self):
+        """A large reindex writes progress a handful of times, not per entity."""
+        redis = FakeRedis()
+        service = ReindexStateService(redis)  # type: ignore[arg-type]
+        await service.start_job("job-1", total=100_000)
+        reporter = ReindexProgressReporter(service, "job-1", every_entities=1000, interval=3600)
+        redis.round_trips = 0
+
+        reports = 0
+        for _ in range(1000):
+            reporter.add(100, 0, "document")
+            if reporter.due():
+                assert await reporter.report() is False
+                reports += 1
+
+        assert reports == 100
+        assert redis.round_trips == 100
+        job = await service.get_job("job-1")
+        assert job is not None and job.processed == 100_000
+
+    async def test_reports_after_interval(self):
+        """Slow progress is still reported once the interval has passed."""
+        service = ReindexStateService(FakeRedis())  # type: ignore[arg-type]
+        await service.start_job("job-1", total=10)
+        reporter = ReindexProgressReporter(service, "job-1", every_entities=1000, interval=0)
+
+        reporter.add(1, 0, "document")
+        assert reporter.due()
+        await reporter.report()
+
+        job = await service.get_job("job-1")
+        assert job is not None and job.processed == 1
@@ -0,0 +1,112 @@
+"""Tests for grouped, cached sidebar counts."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.services import sidebar_counts
+from src.services.sidebar_counts import (
+    SidebarCounts,
+    get_sidebar_counts,
+    invalidate_sidebar_counts,
+)
+
+
+def make_db(type_counts: int) -> MagicMock:
+    """Create a session mock returning counts for `type_counts` types of each kind."""
+    core = MagicMock()
+    core.one.return_value = (3, 2, 1)
+    configurations = MagicMock()
+    configurations.tuples.return_value.all.return_value = [(uuid4(), 5) for _ in range(type_counts)]
+    assets = MagicMock()
+    assets.tuples.return_value.all.return_value = [(uuid4(), 7) for _ in range(type_counts)]
+
+    db = MagicMock()
+    db.execute = AsyncMock(side_effect=[core, configurations, assets])
+    return db
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGetSidebarCounts:
+    """Tests for get_sidebar_counts."""
+
+    async def test_query_count_is_independent_of_type_count(self):
+        """Test that 100 types still cost three queries."""
+        db = make_db(type_counts=100)
+        redis = MagicMock()
+        redis.get = AsyncMock(return_value=None)
+        redis.set = AsyncMock()
+
+        with patch.object(sidebar_counts, "get_redis", AsyncMock(return_value=redis)):
+            counts = await get_sidebar_counts(db, uuid4())
+
+        assert db.execute.await_count == 3
+        assert (counts.passwords, counts.locations, counts.documents) == (3, 2, 1)
+        assert len(counts.configurations_by_type) == 100
+        redis.set.assert_awaited_once()
+
+    async def test_cache_hit_skips_database(self):
+        """Test that cached counts are returned without querying."""
+        org_id = uuid4()
+        cached = SidebarCounts(1, 2, 3, {"a": 4}, {"b": 5})
+        db = MagicMock()
+        db.execute = AsyncMock()
+        redis = MagicMock()
+        redis.get = AsyncMock(return_value=json.dumps(cached.__dict__))
+
+        with patch.object(sidebar_counts, "get_redis", AsyncMock(return_value=redis)):
+            counts = await get_sidebar_counts(db, org_id)
+
+        assert counts == cached
+        db.execute.assert_not_called()
+        redis.get.assert_awaited_once_with(f"sidebar_counts:{org_id}")
+
+    async def test_redis_failure_falls_back_to_database(self):
+        """Test that an unavailable cache does not break the sidebar."""
+        db = make_db(type_counts=1)
+
+        with patch.object(sidebar_counts, "get_redis", AsyncMock(side_effect=ConnectionError("down"))):
+            counts = await get_sidebar_counts(db, None)
+
+        assert counts.passwords == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestInvalidateSidebarCounts:
+    """Tests for commit-time invalidation."""
+
+    async def test_deletes_org_and_global_entries_after_commit(self):
+        """Test that cached counts are dropped only once the write commits."""
+        org_id = uuid4()
+        session = Session()
+        db = MagicMock()
+        db.info = session.info
+        redis = MagicMock()
+        redis.delete = AsyncMock()
+
+        with patch.object(sidebar_counts, "get_redis", AsyncMock(return_value=redis)):
+            invalidate_sidebar_counts(db, org_id)
+            redis.delete.assert_not_called()
+
+            session.commit()
+            await asyncio.sleep(0)
+
+        redis.delete.assert_awaited_once_with(f"sidebar_counts:{org_id}", "sidebar_counts:global")
+
+    async def test_rollback_discards_pending_invalidation(self):
+        """Test that a rolled back write leaves the cache alone."""
+        session = Session()
+        session.begin()
+        db = MagicMock()
+        db.info = session.info
+
+        invalidate_sidebar_counts(db, uuid4())
+        session.rollback()
+
+        assert "sidebar_counts_invalidate" not in session.info
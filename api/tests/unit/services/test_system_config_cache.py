@@ -0,0 +1,87 @@
+"""Tests for the process-wide system config cache."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.services import system_config_cache
+from src.services.system_config_cache import (
+    CONFIG_INVALIDATION_CHANNEL,
+    SystemConfigCache,
+    publish_config_invalidation,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSystemConfigCache:
+    """Tests for SystemConfigCache."""
+
+    async def test_caches_none_values(self):
+        """Test that "not configured" is cached like any other value."""
+        cache = SystemConfigCache()
+        load = AsyncMock(return_value=None)
+
+        assert await cache.get_or_load("embeddings_config", load) is None
+        assert await cache.get_or_load("embeddings_config", load) is None
+        load.assert_awaited_once()
+
+    async def test_expired_entries_reload(self):
+        """Test that entries are reloaded after the TTL."""
+        cache = SystemConfigCache()
+        load = AsyncMock(side_effect=[True, False])
+
+        with patch.object(system_config_cache.time, "monotonic", side_effect=[0.0, 1000.0, 1000.0]):
+            assert await cache.get_or_load("indexing_config", load) is True
+            assert await cache.get_or_load("indexing_config", load) is False
+
+    async def test_load_racing_an_invalidation_is_not_cached(self):
+        """Test that a value read before a write cannot outlive the write."""
+        cache = SystemConfigCache()
+
+        async def stale_load():
+            # A write lands (and is broadcast) while this load is in flight
+            cache.invalidate("indexing_config")
+            return True
+
+        await cache.get_or_load("indexing_config", stale_load)
+        load = AsyncMock(return_value=False)
+
+        assert await cache.get_or_load("indexing_config", load) is False
+        load.assert_awaited_once()
+
+    async def test_disabled_when_ttl_is_zero(self):
+        """Test that a zero TTL turns caching off."""
+        cache = SystemConfigCache()
+        load = AsyncMock(return_value=True)
+        settings = MagicMock(system_config_cache_ttl_seconds=0)
+
+        with patch.object(system_config_cache, "get_settings", return_value=settings):
+            await cache.get_or_load("indexing_config", load)
+            await cache.get_or_load("indexing_config", load)
+
+        assert load.await_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPublishConfigInvalidation:
+    """Tests for broadcasting invalidations."""
+
+    async def test_invalidates_locally_and_publishes(self):
+        """Test that the writer's own process and Redis are both notified."""
+        cache = system_config_cache.get_system_config_cache()
+        cache.put("embeddings_config", "cached", cache.generation)
+        redis = MagicMock()
+        redis.publish = AsyncMock()
+
+        with patch.object(system_config_cache, "get_redis", AsyncMock(return_value=redis)):
+            await publish_config_invalidation("embeddings_config")
+
+        assert cache.get("embeddings_config") is system_config_cache._MISSING
+        redis.publish.assert_awaited_once_with(CONFIG_INVALIDATION_CHANNEL, "embeddings_config")
+
+    async def test_redis_failure_is_not_raised(self):
+        """Test that an unavailable Redis does not fail the settings update."""
+        with patch.object(system_config_cache, "get_redis", AsyncMock(side_effect=ConnectionError("down"))):
+            await publish_config_invalidation("indexing_config")
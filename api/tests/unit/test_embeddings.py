@@ -5,12 +5,14 @@ Tests searchable text extraction and content hash generation.
 Uses mocks for OpenAI API calls.
 """
 
+import asyncio
 import hashlib
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.models.contracts.custom_asset import FieldDefinition
+from src.models.contracts.search import SearchResult
 from src.services.embeddings import EmbeddingsService
 
 
@@ -331,3 +333,761 @@ class TestGenerateEmbedding:
 
                 mock_client.embeddings.create.assert_called_once()
                 assert result == [0.1] * 1536
+
+
+class TestGenerateEmbeddings:
+    """Tests for batched embedding generation."""
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_empty_list_skips_api(self) -> None:
+        """Test that an empty batch returns without calling OpenAI."""
+        service = create_mock_service()
+        mock_client = AsyncMock()
+
+        with patch.object(service, "_client", mock_client):
+            result = await service.generate_embeddings([])
+
+        assert result == []
+        mock_client.embeddings.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_rejects_empty_text(self) -> None:
+        """Test that any empty text in the batch raises ValueError."""
+        service = create_mock_service()
+
+        with pytest.raises(ValueError, match="Cannot generate embedding for empty text"):
+            await service.generate_embeddings(["valid", "  "])
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_single_request_in_input_order(self) -> None:
+        """Test that all texts go in one request and results follow input order."""
+        from src.services.llm.factory import EmbeddingsConfig
+
+        with patch("src.services.embeddings.get_embeddings_config") as mock_config:
+            mock_config.return_value = EmbeddingsConfig(
+                api_key="test-api-key",
+                model="text-embedding-3-small",
+            )
+
+            service = create_mock_service()
+
+            # Return items out of order to verify they are re-sorted by index
+            mock_response = MagicMock()
+            mock_response.data = [
+                MagicMock(index=1, embedding=[0.2] * 1536),
+                MagicMock(index=0, embedding=[0.1] * 1536),
+            ]
+
+            mock_client = AsyncMock()
+            mock_client.embeddings.create = AsyncMock(return_value=mock_response)
+
+            with patch.object(service, "_client", mock_client):
+                result = await service.generate_embeddings(["first", "second"])
+
+            mock_client.embeddings.create.assert_called_once()
+            assert mock_client.embeddings.create.call_args.kwargs["input"] == ["first", "second"]
+            assert result == [[0.1] * 1536, [0.2] * 1536]
+
+
+class TestEmbeddingCache:
+    """Tests for the process-wide embedding cache."""
+
+    def test_cache_evicts_least_recently_used(self) -> None:
+        """Test that the oldest untouched entry is evicted when full."""
+        from src.services.embeddings import EmbeddingCache
+
+        cache = EmbeddingCache(max_size=2)
+        cache.put("model", "a", [0.5])
+        cache.put("model", "b", [0.25])
+        cache.get("model", "a")  # touch "a" so "b" is least recently used
+        cache.put("model", "c", [0.125])
+
+        assert cache.get("model", "a") == [0.5]
+        assert cache.get("model", "b") is None
+        assert cache.get("model", "c") == [0.125]
+
+    def test_cache_stores_float32(self) -> None:
+        """Test that vectors are stored packed at float32 precision."""
+        from src.services.embeddings import EmbeddingCache
+
+        cache = EmbeddingCache(max_size=1)
+        cache.put("model", "hash", [0.1] * 1536)
+
+        cached = cache.get("model", "hash")
+        assert cached is not None
+        assert len(cached) == 1536
+        assert cached[0] == pytest.approx(0.1, rel=1e-6)
+        assert cache._entries["model", "hash"].itemsize == 4
+
+    def test_cache_is_keyed_by_model(self) -> None:
+        """Test that the same hash under a different model is a miss."""
+        from src.services.embeddings import EmbeddingCache
+
+        cache = EmbeddingCache(max_size=10)
+        cache.put("model-a", "hash", [0.1])
+
+        assert cache.get("model-b", "hash") is None
+
+    def test_cache_disabled_with_zero_size(self) -> None:
+        """Test that a zero-size cache stores nothing."""
+        from src.services.embeddings import EmbeddingCache
+
+        cache = EmbeddingCache(max_size=0)
+        cache.put("model", "hash", [0.1])
+
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_identical_texts_embedded_once(self) -> None:
+        """Test that repeated content hashes reuse the cached vector."""
+        from src.services.embeddings import get_embedding_cache
+        from src.services.llm.factory import EmbeddingsConfig
+
+        get_embedding_cache().clear()
+        with patch("src.services.embeddings.get_embeddings_config") as mock_config:
+            mock_config.return_value = EmbeddingsConfig(
+                api_key="test-api-key",
+                model="text-embedding-3-small",
+            )
+
+            service = create_mock_service()
+            mock_response = MagicMock()
+            mock_response.data = [MagicMock(index=0, embedding=[0.5] * 1536)]
+            mock_client = AsyncMock()
+            mock_client.embeddings.create = AsyncMock(return_value=mock_response)
+
+            text = "Shared template text"
+            content_hash = service.compute_content_hash(text)
+            with patch.object(service, "_client", mock_client):
+                first = await service._embed_by_hash({content_hash: text})
+                second = await service._embed_by_hash({content_hash: text})
+
+            mock_client.embeddings.create.assert_called_once()
+            assert first == second
+        get_embedding_cache().clear()
+
+
+class TestIndexEntities:
+    """Tests for batch indexing of entities."""
+
+    @staticmethod
+    def make_password(name: str) -> MagicMock:
+        from uuid import uuid4
+
+        password = MagicMock()
+        password.id = uuid4()
+        password.name = name
+        password.username = None
+        password.url = None
+        password.notes = None
+        return password
+
+    @staticmethod
+    def existing_hashes(hashes: dict) -> MagicMock:
+        result = MagicMock()
+        result.all.return_value = list(hashes.items())
+        return result
+
+    @pytest.mark.asyncio
+    async def test_rows_line_up_with_entities(self) -> None:
+        """Test that each written row carries the embedding of its own entity."""
+        from uuid import uuid4
+
+        from src.services.embeddings import get_embedding_cache
+
+        get_embedding_cache().clear()
+        service = create_mock_service()
+        org_id = uuid4()
+        passwords = [self.make_password(name) for name in ("Alpha", "Bravo", "Charlie")]
+        vectors = {"Alpha": [0.5], "Bravo": [0.25], "Charlie": [0.125]}
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=self.existing_hashes({}))
+
+        with (
+            patch.object(service, "_ensure_initialized", AsyncMock()),
+            patch.object(service, "_get_entities", AsyncMock(return_value=passwords)),
+            patch.object(
+                service,
+                "generate_embeddings",
+                AsyncMock(side_effect=lambda texts: [vectors[text] for text in texts]),
+            ) as generate,
+            patch("src.services.embeddings.insert") as mock_insert,
+        ):
+            written, skipped = await service.index_entities(
+                db, "password", [(p.id, org_id) for p in passwords]
+            )
+
+        assert (written, skipped) == (3, 0)
+        generate.assert_awaited_once()
+        rows = mock_insert.return_value.values.call_args[0][0]
+        assert [row["entity_id"] for row in rows] == [p.id for p in passwords]
+        assert [row["embedding"] for row in rows] == [[0.5], [0.25], [0.125]]
+        assert all(row["organization_id"] == org_id for row in rows)
+        get_embedding_cache().clear()
+
+    @pytest.mark.asyncio
+    async def test_skips_unchanged_content(self) -> None:
+        """Test that entities whose content hash is already indexed are not re-embedded."""
+        from uuid import uuid4
+
+        from src.services.embeddings import get_embedding_cache
+
+        get_embedding_cache().clear()
+        service = create_mock_service()
+        org_id = uuid4()
+        unchanged = self.make_password("Unchanged")
+        changed = self.make_password("Changed")
+        db = MagicMock()
+        db.execute = AsyncMock(
+            return_value=self.existing_hashes(
+                {unchanged.id: service.compute_content_hash("Unchanged"), changed.id: "stale"}
+            )
+        )
+
+        with (
+            patch.object(service, "_ensure_initialized", AsyncMock()),
+            patch.object(service, "_get_entities", AsyncMock(return_value=[unchanged, changed])),
+            patch.object(
+                service, "generate_embeddings", AsyncMock(return_value=[[0.5]])
+            ) as generate,
+            patch("src.services.embeddings.insert") as mock_insert,
+        ):
+            written, skipped = await service.index_entities(
+                db, "password", [(unchanged.id, org_id), (changed.id, org_id)]
+            )
+
+        assert (written, skipped) == (1, 1)
+        generate.assert_awaited_once_with(["Changed"])
+        rows = mock_insert.return_value.values.call_args[0][0]
+        assert [row["entity_id"] for row in rows] == [changed.id]
+        get_embedding_cache().clear()
+
+    @pytest.mark.asyncio
+    async def test_counts_entities_without_text_as_skipped(self) -> None:
+        """Test that missing entities and ones with no searchable text are reported as skipped."""
+        from uuid import uuid4
+
+        service = create_mock_service()
+        org_id = uuid4()
+        blank = self.make_password("  ")
+        db = MagicMock()
+        db.execute = AsyncMock()
+
+        with patch.object(service, "_get_entities", AsyncMock(return_value=[blank])):
+            result = await service.index_entities(
+                db, "password", [(blank.id, org_id), (uuid4(), org_id)]
+            )
+
+        assert result == (0, 2)
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_raises(self) -> None:
+        """Test that an embeddings failure propagates so the caller can retry per entity."""
+        from uuid import uuid4
+
+        from src.services.embeddings import get_embedding_cache
+
+        get_embedding_cache().clear()
+        service = create_mock_service()
+        org_id = uuid4()
+        passwords = [self.make_password(name) for name in ("Alpha", "Bravo")]
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=self.existing_hashes({}))
+
+        with (
+            patch.object(service, "_ensure_initialized", AsyncMock()),
+            patch.object(service, "_get_entities", AsyncMock(return_value=passwords)),
+            patch.object(
+                service, "generate_embeddings", AsyncMock(side_effect=RuntimeError("rate limited"))
+            ),
+            patch("src.services.embeddings.insert") as mock_insert,
+            pytest.raises(RuntimeError, match="rate limited"),
+        ):
+            await service.index_entities(db, "password", [(p.id, org_id) for p in passwords])
+
+        mock_insert.assert_not_called()
+        assert db.execute.await_count == 1
+
+
+class TestSearchHydration:
+    """Tests for batched name resolution in search results."""
+
+    @pytest.mark.asyncio
+    async def test_search_resolves_names_with_constant_queries(self) -> None:
+        """Test that 50 hits cost one search query plus one name query per type."""
+        from uuid import uuid4
+
+        service = create_mock_service()
+
+        hits = []
+        name_rows = []
+        for i in range(50):
+            index = MagicMock()
+            index.entity_type = "password"
+            index.entity_id = uuid4()
+            index.organization_id = uuid4()
+            index.searchable_text = f"Password {i}"
+            hits.append((index, "Org", 0.9))
+            name_rows.append((index.entity_id, f"Password {i}"))
+
+        search_result = MagicMock()
+        search_result.all.return_value = hits
+        names_result = MagicMock()
+        names_result.all.return_value = name_rows
+
+        db = MagicMock()
+        # First statement applies the HNSW scan settings
+        db.execute = AsyncMock(side_effect=[MagicMock(), search_result, names_result])
+
+        with patch.object(service, "generate_query_embedding", AsyncMock(return_value=[0.1] * 1536)):
+            results = await service.search(db, "vpn", [uuid4()], limit=50)
+
+        assert db.execute.await_count == 3
+        assert [r.name for r in results] == [f"Password {i}" for i in range(50)]
+
+
+class TestVectorSearch:
+    """Tests for the HNSW search plan."""
+
+    @pytest.mark.asyncio
+    async def test_applies_hnsw_settings_with_ef_search_at_least_limit(self) -> None:
+        """Test that ef_search is raised so the scan can return `limit` rows."""
+        service = create_mock_service()
+        db = MagicMock()
+        db.execute = AsyncMock()
+        settings = MagicMock(vector_ef_search=40, vector_iterative_scan="relaxed_order", vector_max_scan_tuples=20000)
+
+        with patch("src.services.embeddings.get_settings", return_value=settings):
+            await service._configure_vector_scan(db, limit=100)
+
+        statement, params = db.execute.call_args[0]
+        assert "hnsw.iterative_scan" in str(statement)
+        assert params["ef_search"] == "100"
+        assert params["iterative_scan"] == "relaxed_order"
+
+    @pytest.mark.asyncio
+    async def test_skips_iterative_scan_setting_when_off(self) -> None:
+        """Test that pgvector < 0.8 is supported by turning iterative scans off."""
+        service = create_mock_service()
+        db = MagicMock()
+        db.execute = AsyncMock()
+        settings = MagicMock(vector_ef_search=100, vector_iterative_scan="off", vector_max_scan_tuples=20000)
+
+        with patch("src.services.embeddings.get_settings", return_value=settings):
+            await service._configure_vector_scan(db, limit=20)
+
+        statement, params = db.execute.call_args[0]
+        assert "hnsw.iterative_scan" not in str(statement)
+        assert params == {"ef_search": "100"}
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_exact_scan_when_index_scan_is_short(self) -> None:
+        """Test that a small organization still gets its nearest rows."""
+        from uuid import uuid4
+
+        service = create_mock_service()
+
+        index = MagicMock()
+        index.entity_type = "password"
+        index.entity_id = uuid4()
+        index.organization_id = uuid4()
+        index.searchable_text = "VPN"
+
+        approximate = MagicMock()
+        approximate.all.return_value = []
+        exact = MagicMock()
+        exact.all.return_value = [(index, "Org", 0.8)]
+        names = MagicMock()
+        names.all.return_value = [(index.entity_id, "VPN")]
+
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[MagicMock(), approximate, exact, names])
+
+        with patch.object(service, "generate_query_embedding", AsyncMock(return_value=[0.1] * 1536)):
+            results = await service.search(db, "vpn", [index.organization_id], limit=5)
+
+        exact_sql = str(db.execute.call_args_list[2][0][0])
+        assert "MATERIALIZED" in exact_sql
+        assert [r.name for r in results] == ["VPN"]
+
+
+class TestFullTextSearch:
+    """Tests for full-text search query construction."""
+
+    def test_build_tsquery_prefix_matches_each_term(self) -> None:
+        """Test that every term is quoted, prefix-matched, and AND-ed."""
+        service = create_mock_service()
+
+        assert service._build_tsquery("wifi password") == "'wifi':* & 'password':*"
+
+    def test_build_tsquery_escapes_quotes(self) -> None:
+        """Test that quotes and backslashes cannot break out of a term."""
+        service = create_mock_service()
+
+        assert service._build_tsquery("o'brien") == "'o''brien':*"
+        assert service._build_tsquery("a\\b") == "'a\\\\b':*"
+
+    def test_build_tsquery_keeps_punctuated_terms_whole(self) -> None:
+        """Test that IPs and hostnames are passed through as single terms."""
+        service = create_mock_service()
+
+        assert service._build_tsquery("10.0.0.1") == "'10.0.0.1':*"
+
+    @pytest.mark.asyncio
+    async def test_text_search_uses_fulltext_by_default(self) -> None:
+        """Test that text_search dispatches to the full-text implementation."""
+        from uuid import uuid4
+
+        service = create_mock_service()
+
+        with (
+            patch.object(service, "_fulltext_search", AsyncMock(return_value=[])) as fulltext,
+            patch.object(service, "_ilike_search", AsyncMock(return_value=[])) as ilike,
+        ):
+            await service.text_search(MagicMock(), "vpn", [uuid4()])
+
+        fulltext.assert_awaited_once()
+        ilike.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fulltext_search_is_one_ranked_query(self) -> None:
+        """Test that all entity types are searched and limited in one statement."""
+        from types import SimpleNamespace
+        from uuid import uuid4
+
+        service = create_mock_service()
+        org_id = uuid4()
+        rows = [
+            SimpleNamespace(
+                entity_type="document",
+                entity_id=uuid4(),
+                organization_id=org_id,
+                org_name="Acme",
+                name="VPN Setup",
+                snippet="VPN Setup | " + "x" * 200,
+                is_enabled=True,
+                score=0.9,
+            ),
+            SimpleNamespace(
+                entity_type="custom_asset",
+                entity_id=uuid4(),
+                organization_id=org_id,
+                org_name="Acme",
+                name=None,
+                snippet="vpn.example.com",
+                is_enabled=True,
+                score=0.4,
+            ),
+        ]
+        result = MagicMock()
+        result.all.return_value = rows
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock(return_value=result)
+
+        results = await service._fulltext_search(mock_db, "vpn", [org_id], 5, False)
+
+        mock_db.execute.assert_awaited_once()
+        sql = str(mock_db.execute.call_args[0][0])
+        assert sql.count("UNION ALL") == 4
+        assert [r.entity_type for r in results] == ["document", "custom_asset"]
+        assert len(results[0].snippet) == 200
+        assert results[0].snippet.endswith("...")
+        assert results[1].name == "Unknown"
+
+
+def make_result(entity_id: str, score: float, entity_type: str = "document") -> SearchResult:
+    """Create a SearchResult for fusion tests."""
+    return SearchResult(
+        entity_type=entity_type,  # type: ignore[arg-type]
+        entity_id=entity_id,
+        organization_id="org",
+        organization_name="Acme",
+        name=entity_id,
+        snippet="",
+        score=score,
+        is_enabled=True,
+    )
+
+
+class TestHybridSearch:
+    """Tests for concurrent hybrid search and rank fusion."""
+
+    def test_rrf_ranks_hits_found_by_both_legs_first(self) -> None:
+        """Test that reciprocal rank fusion rewards agreement between legs."""
+        service = create_mock_service()
+        semantic = [make_result("a", 0.9), make_result("b", 0.8)]
+        text = [make_result("b", 0.3), make_result("c", 0.2)]
+
+        fused = service._fuse_results(semantic, text, limit=10)
+
+        assert [r.entity_id for r in fused] == ["b", "a", "c"]
+        assert all(0.0 <= r.score <= 1.0 for r in fused)
+
+    def test_rrf_top_hit_in_both_legs_scores_one(self) -> None:
+        """Test that fused scores are rescaled into 0-1."""
+        service = create_mock_service()
+
+        fused = service._fuse_results([make_result("a", 0.5)], [make_result("a", 0.1)], limit=10)
+
+        assert fused[0].score == pytest.approx(1.0)
+
+    def test_weighted_fusion_uses_leg_scores(self) -> None:
+        """Test the weighted-sum fusion mode."""
+        service = create_mock_service()
+        settings = MagicMock(hybrid_fusion="weighted", hybrid_semantic_weight=0.5, hybrid_rrf_k=60)
+
+        with patch("src.services.embeddings.get_settings", return_value=settings):
+            fused = service._fuse_results(
+                [make_result("a", 0.4)],
+                [make_result("b", 1.0), make_result("a", 0.4)],
+                limit=1,
+            )
+
+        assert [r.entity_id for r in fused] == ["b"]
+        assert fused[0].score == pytest.approx(0.5)
+
+    @pytest.mark.asyncio
+    async def test_returns_text_results_when_semantic_misses_deadline(self) -> None:
+        """Test that a slow semantic leg is abandoned after the deadline."""
+        import asyncio
+        from contextlib import asynccontextmanager
+        from uuid import uuid4
+
+        service = create_mock_service()
+        text_results = [make_result("t", 0.5)]
+        settings = MagicMock(hybrid_semantic_timeout_ms=50)
+
+        @asynccontextmanager
+        async def fake_db_context():
+            yield MagicMock()
+
+        async def slow_search(*args, **kwargs):
+            await asyncio.sleep(5)
+            return [make_result("s", 0.9)]
+
+        with (
+            patch("src.services.embeddings.get_settings", return_value=settings),
+            patch("src.services.embeddings.get_db_context", fake_db_context),
+            patch.object(service, "check_openai_available", AsyncMock(return_value=True)),
+            patch.object(service, "search", slow_search),
+            patch.object(service, "text_search", AsyncMock(return_value=text_results)),
+        ):
+            results = await asyncio.wait_for(
+                service.hybrid_search(MagicMock(), "vpn", [uuid4()]),
+                timeout=1,
+            )
+
+        assert results == text_results
+
+    @pytest.mark.asyncio
+    async def test_runs_semantic_leg_on_its_own_session(self) -> None:
+        """Test that the semantic leg does not share the caller's session."""
+        from contextlib import asynccontextmanager
+        from uuid import uuid4
+
+        service = create_mock_service()
+        request_db = MagicMock()
+        semantic_db = MagicMock()
+
+        @asynccontextmanager
+        async def fake_db_context():
+            yield semantic_db
+
+        search = AsyncMock(return_value=[make_result("s", 0.9)])
+        text_search = AsyncMock(return_value=[make_result("t", 0.5)])
+
+        with (
+            patch("src.services.embeddings.get_db_context", fake_db_context),
+            patch.object(service, "check_openai_available", AsyncMock(return_value=True)),
+            patch.object(service, "search", search),
+            patch.object(service, "text_search", text_search),
+        ):
+            results = await service.hybrid_search(request_db, "vpn", [uuid4()])
+
+        assert search.call_args[0][0] is semantic_db
+        assert text_search.call_args[0][0] is request_db
+        assert {r.entity_id for r in results} == {"s", "t"}
+
+    @pytest.mark.asyncio
+    async def test_text_failure_waits_for_semantic_leg_to_stop(self) -> None:
+        """Test that a failing text leg cancels the semantic leg and lets it close its session."""
+        from contextlib import asynccontextmanager
+        from uuid import uuid4
+
+        service = create_mock_service()
+        session_closed = False
+
+        @asynccontextmanager
+        async def fake_db_context():
+            nonlocal session_closed
+            try:
+                yield MagicMock()
+            finally:
+                session_closed = True
+
+        async def slow_search(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        async def failing_text_search(*args, **kwargs):
+            await asyncio.sleep(0)
+            raise RuntimeError("text search down")
+
+        with (
+            patch("src.services.embeddings.get_db_context", fake_db_context),
+            patch.object(service, "check_openai_available", AsyncMock(return_value=True)),
+            patch.object(service, "search", slow_search),
+            patch.object(service, "text_search", failing_text_search),
+            pytest.raises(RuntimeError, match="text search down"),
+        ):
+            await service.hybrid_search(MagicMock(), "vpn", [uuid4()])
+
+        assert session_closed
+
+
+class TestQueryEmbeddingCache:
+    """Tests for the Redis-backed query embedding cache."""
+
+    def test_normalize_query(self) -> None:
+        """Test that case and whitespace differences share a cache entry."""
+        from src.services.embeddings import normalize_query
+
+        assert normalize_query("  WiFi   Password ") == "wifi password"
+
+    def test_pack_round_trip(self) -> None:
+        """Test that packed vectors survive a round trip at float32 precision."""
+        from src.services.embeddings import _pack_embedding, _unpack_embedding
+
+        vector = [0.5, -0.25, 0.125]
+
+        assert _unpack_embedding(_pack_embedding(vector)) == vector
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_openai_and_counts(self) -> None:
+        """Test that a cached query is served from Redis."""
+        from src.services.embeddings import QUERY_EMBEDDING_STATS_KEY, _pack_embedding
+
+        service = create_mock_service()
+        service._initialized = True
+        service._model = "text-embedding-3-small"
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[_pack_embedding([0.5, 0.25]), 1])
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=None)
+        redis = MagicMock()
+        redis.pipeline.return_value = pipe
+        generate = AsyncMock()
+
+        with (
+            patch("src.services.embeddings.get_redis", AsyncMock(return_value=redis)),
+            patch.object(service, "generate_embedding", generate),
+        ):
+            result = await service.generate_query_embedding("VPN")
+
+        assert result == [0.5, 0.25]
+        generate.assert_not_called()
+        # Lookup and hit count share one round trip
+        pipe.execute.assert_awaited_once()
+        pipe.hincrby.assert_called_once_with(QUERY_EMBEDDING_STATS_KEY, "hits", 1)
+        key = pipe.getex.call_args[0][0]
+        assert key.startswith("search:query_embedding:text-embedding-3-small:")
+
+    @pytest.mark.asyncio
+    async def test_miss_embeds_normalized_query_and_stores(self) -> None:
+        """Test that a miss calls OpenAI once and caches the vector."""
+        service = create_mock_service()
+        service._initialized = True
+        service._model = "text-embedding-3-small"
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(side_effect=[[None, 1], [0, 1]])
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=None)
+        redis = MagicMock()
+        redis.pipeline.return_value = pipe
+        redis.set = AsyncMock()
+        generate = AsyncMock(return_value=[0.5])
+
+        with (
+            patch("src.services.embeddings.get_redis", AsyncMock(return_value=redis)),
+            patch.object(service, "generate_embedding", generate),
+        ):
+            result = await service.generate_query_embedding(" Wifi  Password")
+
+        assert result == [0.5]
+        generate.assert_awaited_once_with("wifi password")
+        redis.set.assert_awaited_once()
+        # The lookup's provisional hit becomes a miss
+        assert [c.args[1:] for c in pipe.hincrby.call_args_list] == [
+            ("hits", 1),
+            ("hits", -1),
+            ("misses", 1),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_openai_failure_still_counts_miss(self) -> None:
+        """Test that a miss is recorded even when generating the embedding fails."""
+        service = create_mock_service()
+        service._initialized = True
+        service._model = "text-embedding-3-small"
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(side_effect=[[None, 1], [0, 1]])
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=None)
+        redis = MagicMock()
+        redis.pipeline.return_value = pipe
+        redis.set = AsyncMock()
+
+        with (
+            patch("src.services.embeddings.get_redis", AsyncMock(return_value=redis)),
+            patch.object(
+                service, "generate_embedding", AsyncMock(side_effect=RuntimeError("openai down"))
+            ),
+            pytest.raises(RuntimeError, match="openai down"),
+        ):
+            await service.generate_query_embedding("vpn")
+
+        assert [c.args[1:] for c in pipe.hincrby.call_args_list] == [
+            ("hits", 1),
+            ("hits", -1),
+            ("misses", 1),
+        ]
+        redis.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_falls_back_to_openai(self) -> None:
+        """Test that an unavailable cache does not break search."""
+        service = create_mock_service()
+        service._initialized = True
+        generate = AsyncMock(return_value=[0.5])
+
+        with (
+            patch("src.services.embeddings.get_redis", AsyncMock(side_effect=ConnectionError("down"))),
+            patch.object(service, "generate_embedding", generate),
+        ):
+            result = await service.generate_query_embedding("vpn")
+
+        assert result == [0.5]
+
+    @pytest.mark.asyncio
+    async def test_failed_lookup_leaves_counters_alone(self) -> None:
+        """Test that a lookup that never ran is not corrected into a miss."""
+        service = create_mock_service()
+        service._initialized = True
+        service._model = "text-embedding-3-small"
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(side_effect=ConnectionError("down"))
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=None)
+        redis = MagicMock()
+        redis.pipeline.return_value = pipe
+        redis.set = AsyncMock()
+
+        with (
+            patch("src.services.embeddings.get_redis", AsyncMock(return_value=redis)),
+            patch.object(service, "generate_embedding", AsyncMock(return_value=[0.5])),
+        ):
+            result = await service.generate_query_embedding("vpn")
+
+        assert result == [0.5]
+        pipe.execute.assert_awaited_once()
+        redis.set.assert_awaited_once()
@@ -4,6 +4,8 @@ Unit tests for file storage service.
 Tests S3 URL generation and utility functions with mocked S3 client.
 """
 
+import base64
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
@@ -32,6 +34,8 @@ def mock_settings():
     settings.s3_bucket = "test-bucket"
     settings.s3_presigned_url_expiry = 600
     settings.s3_download_url_expiry = 3600
+    settings.s3_download_url_cache_ttl = 300
+    settings.s3_public_endpoint = None
     return settings
 
 
@@ -143,6 +147,28 @@ class TestFileStorageService:
                 ExpiresIn=600,
             )
 
+    @pytest.mark.asyncio
+    async def test_generate_upload_url_with_checksum(self, file_storage_service):
+        """Uploads with a known hash are signed for that checksum."""
+        sha256 = FileStorageService.compute_hash(b"logo")
+        mock_s3_client = AsyncMock()
+        mock_s3_client.generate_presigned_url.return_value = "https://s3.example.com/upload-url"
+        context = AsyncMock()
+        context.__aenter__.return_value = mock_s3_client
+
+        with patch.object(file_storage_service, "get_client", return_value=context):
+            await file_storage_service.generate_upload_url(
+                s3_key="test/logo.png", content_type="image/png", sha256=sha256
+            )
+
+        checksum = mock_s3_client.generate_presigned_url.call_args.kwargs["Params"]["ChecksumSHA256"]
+        assert base64.b64decode(checksum).hex() == sha256
+        assert FileStorageService.upload_headers("image/png", sha256) == {
+            "Content-Type": "image/png",
+            "x-amz-checksum-sha256": checksum,
+        }
+        assert FileStorageService.upload_headers("image/png") == {"Content-Type": "image/png"}
+
     @pytest.mark.asyncio
     async def test_generate_download_url(self, file_storage_service):
         """Test presigned download URL generation."""
@@ -298,6 +324,79 @@ class TestFileStorageService:
             assert result is False
 
 
+class TestDownloadUrlCache:
+    """Tests for reuse of presigned download URLs."""
+
+    @staticmethod
+    def _client_context(mock_s3_client):
+        context = AsyncMock()
+        context.__aenter__.return_value = mock_s3_client
+        return context
+
+    @staticmethod
+    def _signing_client():
+        mock_s3_client = AsyncMock()
+        mock_s3_client.generate_presigned_url.side_effect = (
+            lambda op, Params, ExpiresIn: f"https://s3.example.com/{Params['Key']}?n={uuid4()}"
+        )
+        return mock_s3_client
+
+    @pytest.mark.asyncio
+    async def test_url_is_reused_per_file_and_filename(self, file_storage_service):
+        """The same file gets the same URL until the cache TTL passes."""
+        mock_s3_client = self._signing_client()
+
+        with patch.object(
+            file_storage_service, "get_client", side_effect=lambda: self._client_context(mock_s3_client)
+        ):
+            first = await file_storage_service.generate_download_url("a/key.png", "key.png")
+            again = await file_storage_service.generate_download_url("a/key.png", "key.png")
+            renamed = await file_storage_service.generate_download_url("a/key.png", "other.png")
+            custom = await file_storage_service.generate_download_url(
+                "a/key.png", "key.png", expires_in=60
+            )
+
+            assert again == first
+            assert renamed != first
+            assert custom != first
+            assert mock_s3_client.generate_presigned_url.call_count == 3
+
+            with patch("src.services.file_storage.time.monotonic", return_value=time.monotonic() + 301):
+                assert await file_storage_service.generate_download_url("a/key.png", "key.png") != first
+
+        assert file_storage_service.download_url_min_lifetime == 3300
+
+    @pytest.mark.asyncio
+    async def test_bulk_urls_and_delete(self, file_storage_service):
+        """Bulk signing keeps order; deleting a file drops its cached URLs."""
+        mock_s3_client = self._signing_client()
+
+        with patch.object(
+            file_storage_service, "get_client", side_effect=lambda: self._client_context(mock_s3_client)
+        ):
+            urls = await file_storage_service.generate_download_urls(
+                [("a/1.png", "1.png"), ("a/2.png", None)]
+            )
+            assert [url.split("?")[0] for url in urls] == [
+                "https://s3.example.com/a/1.png",
+                "https://s3.example.com/a/2.png",
+            ]
+
+            await file_storage_service.delete_file("a/1.png")
+
+            assert await file_storage_service.generate_download_url("a/1.png", "1.png") != urls[0]
+            assert await file_storage_service.generate_download_url("a/2.png") == urls[1]
+
+    @pytest.mark.asyncio
+    async def test_ttl_is_capped_at_half_the_expiry(self, file_storage_service):
+        """A cache TTL close to the URL expiry can't hand out nearly expired URLs."""
+        file_storage_service.settings.s3_download_url_expiry = 400
+        file_storage_service.settings.s3_download_url_cache_ttl = 3600
+
+        assert file_storage_service.download_url_cache_ttl == 200
+        assert file_storage_service.download_url_min_lifetime == 200
+
+
 class TestFileStorageServiceNotConfigured:
     """Tests for FileStorageService when S3 is not configured."""
 
@@ -312,3 +411,122 @@ class TestFileStorageServiceNotConfigured:
         with pytest.raises(RuntimeError, match="S3 storage not configured"):
             async with service.get_client():
                 pass
+
+
+class TestMultipartUpload:
+    """Tests for FileStorageService.multipart_upload."""
+
+    @staticmethod
+    def _client_context(mock_s3_client):
+        context = AsyncMock()
+        context.__aenter__.return_value = mock_s3_client
+        return context
+
+    @pytest.mark.asyncio
+    async def test_parts_are_uploaded_and_completed(self, file_storage_service):
+        """Parts are numbered in order and assembled on exit."""
+        mock_s3_client = AsyncMock()
+        mock_s3_client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+        mock_s3_client.upload_part.side_effect = [{"ETag": '"a"'}, {"ETag": '"b"'}]
+
+        with patch.object(
+            file_storage_service, "get_client", return_value=self._client_context(mock_s3_client)
+        ):
+            async with file_storage_service.multipart_upload(
+                "exports/x.zip", content_type="application/zip"
+            ) as upload:
+                await upload.upload_part(b"first")
+                await upload.upload_part(b"second")
+
+        assert upload.bytes_uploaded == 11
+        mock_s3_client.create_multipart_upload.assert_called_once_with(
+            Bucket="test-bucket", Key="exports/x.zip", ContentType="application/zip"
+        )
+        assert mock_s3_client.upload_part.call_args_list[1].kwargs["PartNumber"] == 2
+        mock_s3_client.complete_multipart_upload.assert_called_once_with(
+            Bucket="test-bucket",
+            Key="exports/x.zip",
+            UploadId="upload-1",
+            MultipartUpload={
+                "Parts": [{"ETag": '"a"', "PartNumber": 1}, {"ETag": '"b"', "PartNumber": 2}]
+            },
+        )
+        mock_s3_client.abort_multipart_upload.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failure_aborts_upload(self, file_storage_service):
+        """An exception inside the context aborts instead of completing."""
+        mock_s3_client = AsyncMock()
+        mock_s3_client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+
+        with patch.object(
+            file_storage_service, "get_client", return_value=self._client_context(mock_s3_client)
+        ):
+            with pytest.raises(RuntimeError):
+                async with file_storage_service.multipart_upload("exports/x.zip"):
+                    raise RuntimeError("export failed")
+
+        mock_s3_client.abort_multipart_upload.assert_called_once_with(
+            Bucket="test-bucket", Key="exports/x.zip", UploadId="upload-1"
+        )
+        mock_s3_client.complete_multipart_upload.assert_not_called()
+
+
+class TestSharedClient:
+    """Tests for the process-wide shared S3 client."""
+
+    @staticmethod
+    def _mock_session(mock_s3_client):
+        mock_session = MagicMock()
+        mock_session.create_client.return_value.__aenter__ = AsyncMock(return_value=mock_s3_client)
+        mock_session.create_client.return_value.__aexit__ = AsyncMock(return_value=None)
+        return mock_session
+
+    @pytest.mark.asyncio
+    async def test_client_is_created_once(self, file_storage_service):
+        """Repeated calls reuse one client instead of building a new one each time."""
+        mock_s3_client = AsyncMock()
+        mock_s3_client.generate_presigned_url.return_value = "http://localhost:9000/test-bucket/a"
+        mock_session = self._mock_session(mock_s3_client)
+        file_storage_service.settings.s3_max_pool_connections = 25
+        file_storage_service.settings.s3_connect_timeout = 5.0
+
+        with patch("aiobotocore.session.get_session", return_value=mock_session) as mock_get_session:
+            await file_storage_service.start_client()
+            await file_storage_service.delete_file("a")
+            await file_storage_service.file_exists("a")
+
+            mock_get_session.assert_called_once()
+            mock_session.create_client.assert_called_once()
+            config = mock_session.create_client.call_args.kwargs["config"]
+            assert config.max_pool_connections == 25
+            # Leaving get_client() doesn't close the shared client
+            mock_session.create_client.return_value.__aexit__.assert_not_called()
+
+            await file_storage_service.close_client()
+            mock_session.create_client.return_value.__aexit__.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_use_creates_one_client(self, file_storage_service):
+        """Requests racing to create the client share the same one."""
+        import asyncio
+
+        mock_session = self._mock_session(AsyncMock())
+
+        with patch("aiobotocore.session.get_session", return_value=mock_session):
+            await asyncio.gather(*(file_storage_service.file_exists(f"k{i}") for i in range(5)))
+
+        mock_session.create_client.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_start_client_skips_when_not_configured(self):
+        """Startup doesn't fail when S3 isn't configured."""
+        settings = MagicMock()
+        settings.s3_configured = False
+        service = FileStorageService(settings=settings)
+
+        with patch("aiobotocore.session.get_session") as mock_get_session:
+            await service.start_client()
+            await service.close_client()
+
+        mock_get_session.assert_not_called()
@@ -0,0 +1,369 @@
+"""
+Unit tests for WebSocket fan-out in ConnectionManager.
+
+Uses in-memory WebSockets, and an in-memory stand-in for Redis pub/sub.
+"""
+
+import asyncio
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from src.core import pubsub
+from src.core.pubsub import (
+    SLOW_CONSUMER_CLOSE_CODE,
+    ConnectionManager,
+    MessageType,
+    SearchDeltaCoalescer,
+    WebSocketMessage,
+)
+
+
+class FakeWebSocket:
+    """Records sent messages; stalled sockets never finish a send."""
+
+    def __init__(self, stalled: bool = False) -> None:
+        self.stalled = stalled
+        self.sent: list[str] = []
+        self.close_code: int | None = None
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, data: str) -> None:
+        if self.stalled:
+            await asyncio.Event().wait()
+        self.sent.append(data)
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None:
+        self.close_code = code
+
+
+class FakeRedis:
+    """In-memory Redis pub/sub: messages reach sessions subscribed to their channel."""
+
+    def __init__(self) -> None:
+        self.sessions: list[FakePubSub] = []
+        self.lists: dict[str, list[str]] = {}
+
+    async def ping(self) -> bool:
+        return True
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+    async def blpop(self, keys: list[str], timeout: float) -> tuple[str, str] | None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while loop.time() < deadline:
+            for key in keys:
+                if self.lists.get(key):
+                    return key, self.lists[key].pop(0)
+            await asyncio.sleep(0.001)
+        return None
+
+    def pubsub(self) -> "FakePubSub":
+        session = FakePubSub()
+        self.sessions.append(session)
+        return session
+
+    async def publish(self, channel: str, data: str) -> int:
+        receivers = [s for s in self.sessions if channel in s.channels]
+        for session in receivers:
+            session.inbox.put_nowait({"type": "message", "channel": channel, "data": data})
+        return len(receivers)
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis) -> None:
+        self.redis = redis
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        pass
+
+    def rpush(self, key: str, value: str) -> None:
+        self.redis.lists.setdefault(key, []).append(value)
+
+    def expire(self, key: str, seconds: int) -> None:
+        pass
+
+    async def execute(self) -> None:
+        pass
+
+
+class FakePubSub:
+    def __init__(self) -> None:
+        self.channels: set[str] = set()
+        self.inbox: asyncio.Queue[dict] = asyncio.Queue()
+        self.commands: list[tuple[str, ...]] = []
+        self.fail = False
+
+    async def connect(self) -> None:
+        pass
+
+    async def subscribe(self, *channels: str) -> None:
+        self.commands.append(("subscribe", *sorted(channels)))
+        for channel in channels:
+            self.channels.add(channel)
+            self.inbox.put_nowait({"type": "subscribe", "channel": channel, "data": 1})
+
+    async def unsubscribe(self, *channels: str) -> None:
+        self.commands.append(("unsubscribe", *sorted(channels)))
+        self.channels.difference_update(channels)
+
+    async def get_message(self, timeout: float) -> dict | None:
+        if self.fail:
+            raise ConnectionError("connection lost")
+        try:
+            return await asyncio.wait_for(self.inbox.get(), timeout=min(timeout, 0.01))
+        except TimeoutError:
+            return None
+
+    async def aclose(self) -> None:
+        self.channels.clear()
+
+
+def _message(n: int) -> WebSocketMessage:
+    return WebSocketMessage(type=MessageType.PROGRESS, channel="export:1", data={"n": n})
+
+
+async def _connect(manager: ConnectionManager, websocket: FakeWebSocket) -> str:
+    connection_id = str(uuid4())
+    await manager.connect(websocket, connection_id, uuid4(), ["export:1"])  # type: ignore[arg-type]
+    return connection_id
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBroadcastLocal:
+    """Tests for queued, per-connection delivery."""
+
+    async def test_stalled_client_does_not_block_others(self):
+        """Healthy clients get every message while a stalled one is evicted."""
+        manager = ConnectionManager(send_queue_size=5, send_timeout=60)
+        fast = [FakeWebSocket() for _ in range(3)]
+        stalled = FakeWebSocket(stalled=True)
+        for websocket in [*fast, stalled]:
+            await _connect(manager, websocket)
+
+        for n in range(20):
+            await manager._broadcast_local("export:1", _message(n))
+            # Let the writers run, as between real updates
+            await asyncio.sleep(0.001)
+
+        assert all(len(websocket.sent) == 20 for websocket in fast)
+        assert stalled.close_code == SLOW_CONSUMER_CLOSE_CODE
+        assert manager.get_connection_count() == 3
+        assert manager.get_channel_subscriber_count("export:1") == 3
+
+    async def test_broadcast_does_not_wait_for_sends(self):
+        """Broadcasting only enqueues, even when every client is stalled."""
+        manager = ConnectionManager(send_queue_size=100, send_timeout=60)
+        for _ in range(10):
+            await _connect(manager, FakeWebSocket(stalled=True))
+
+        await asyncio.wait_for(manager._broadcast_local("export:1", _message(0)), timeout=0.1)
+
+        assert manager.get_connection_count() == 10
+        for connection_id in list(manager._connections):
+            await manager.disconnect(connection_id)
+
+    async def test_send_timeout_evicts(self):
+        """A send that doesn't finish in time evicts the client."""
+        manager = ConnectionManager(send_queue_size=100, send_timeout=0.01)
+        stalled = FakeWebSocket(stalled=True)
+        await _connect(manager, stalled)
+
+        await manager._broadcast_local("export:1", _message(0))
+        await asyncio.sleep(0.05)
+
+        assert stalled.close_code == SLOW_CONSUMER_CLOSE_CODE
+        assert manager.get_connection_count() == 0
+
+    async def test_messages_keep_their_order(self):
+        """Each connection receives messages in the order they were queued."""
+        manager = ConnectionManager(send_queue_size=100, send_timeout=60)
+        websocket = FakeWebSocket()
+        connection_id = await _connect(manager, websocket)
+
+        for n in range(10):
+            await manager._broadcast_local("export:1", _message(n))
+        manager.send(connection_id, WebSocketMessage(MessageType.PING, "system", {}))
+        await asyncio.sleep(0.01)
+
+        received = [WebSocketMessage.from_json(data) for data in websocket.sent]
+        assert [m.data.get("n") for m in received[:10]] == list(range(10))
+        assert received[10].type == MessageType.PING
+
+        await manager.disconnect(connection_id)
+        assert manager.get_connection_count() == 0
+
+
+@pytest.fixture
+async def redis_manager():
+    """A ConnectionManager listening to a FakeRedis."""
+    redis = FakeRedis()
+    manager = ConnectionManager(send_queue_size=100, send_timeout=60)
+    with (
+        patch.object(pubsub, "get_redis", return_value=redis),
+        patch.object(pubsub, "_RECONNECT_DELAY", 0.01),
+    ):
+        await manager.start_pubsub()
+        while manager._pubsub is None:
+            await asyncio.sleep(0.001)
+        yield manager, redis
+        await manager.stop_pubsub()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRedisSubscriptions:
+    """Tests for subscribing in Redis only to locally joined channels."""
+
+    async def test_first_and_last_local_subscriber(self, redis_manager):
+        """Only the first join subscribes and only the last leave unsubscribes."""
+        manager, redis = redis_manager
+        session = redis.sessions[0]
+
+        first = await _connect(manager, FakeWebSocket())
+        second = await _connect(manager, FakeWebSocket())
+        assert session.commands == [("subscribe", "ws:pubsub:export:1")]
+
+        await manager.disconnect(first)
+        assert session.channels == {"ws:pubsub:export:1"}
+
+        await manager.disconnect(second)
+        assert session.commands[-1] == ("unsubscribe", "ws:pubsub:export:1")
+        assert session.channels == set()
+
+    async def test_only_joined_channels_are_delivered(self, redis_manager):
+        """Messages for channels nobody here joined never reach the replica."""
+        manager, redis = redis_manager
+        websocket = FakeWebSocket()
+        connection_id = await _connect(manager, websocket)
+        await manager.subscribe(connection_id, "search:abc")
+
+        # Published straight after joining: the subscription is already confirmed
+        await redis.publish("ws:pubsub:search:abc", _message(1).to_json())
+        assert await redis.publish("ws:pubsub:reindex:1", _message(2).to_json()) == 0
+        await asyncio.sleep(0.02)
+
+        assert [WebSocketMessage.from_json(d).data for d in websocket.sent] == [{"n": 1}]
+
+        await manager.unsubscribe(connection_id, "search:abc")
+        assert redis.sessions[0].channels == {"ws:pubsub:export:1"}
+
+    async def test_eviction_unsubscribes(self, redis_manager):
+        """Evicting a channel's last subscriber unsubscribes it in the background."""
+        manager, redis = redis_manager
+        connection_id = await _connect(manager, FakeWebSocket())
+
+        manager._evict(connection_id, "test")
+        await asyncio.sleep(0.01)
+
+        assert redis.sessions[0].channels == set()
+
+    async def test_resubscribes_after_reconnect(self, redis_manager):
+        """A new session subscribes to every channel with local subscribers."""
+        manager, redis = redis_manager
+        websocket = FakeWebSocket()
+        await _connect(manager, websocket)
+
+        redis.sessions[0].fail = True
+        while len(redis.sessions) < 2 or manager._pubsub is None:
+            await asyncio.sleep(0.005)
+
+        assert redis.sessions[1].channels == {"ws:pubsub:export:1"}
+        await redis.publish("ws:pubsub:export:1", _message(3).to_json())
+        await asyncio.sleep(0.02)
+        assert len(websocket.sent) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestWaitForSubscriber:
+    """Tests for waiting until a client has joined a request channel."""
+
+    async def test_local_subscriber(self):
+        """A client joining on this replica ends the wait."""
+        manager = ConnectionManager(send_queue_size=100, send_timeout=60)
+        connection_id = await _connect(manager, FakeWebSocket())
+        channel = f"search:{uuid4()}"
+
+        waiting = asyncio.create_task(manager.wait_for_subscriber(channel, timeout=5))
+        await asyncio.sleep(0.01)
+        assert not waiting.done()
+
+        await manager.subscribe(connection_id, channel)
+        assert await asyncio.wait_for(waiting, timeout=0.1) is True
+        # Already subscribed: no wait at all
+        assert await manager.wait_for_subscriber(channel, timeout=0) is True
+
+    async def test_times_out(self):
+        """Without a subscriber the wait ends after the timeout."""
+        manager = ConnectionManager(send_queue_size=100, send_timeout=60)
+
+        assert await manager.wait_for_subscriber(f"search:{uuid4()}", timeout=0.01) is False
+        assert manager._subscriber_waiters == {}
+
+    async def test_subscriber_on_another_replica(self, redis_manager):
+        """A client joining on another replica is announced through Redis."""
+        manager, redis = redis_manager
+        other = ConnectionManager(send_queue_size=100, send_timeout=60)
+        other._redis_enabled = True
+        connection_id = await _connect(other, FakeWebSocket())
+        channel = f"search:{uuid4()}"
+
+        waiting = asyncio.create_task(manager.wait_for_subscriber(channel, timeout=5))
+        await asyncio.sleep(0.01)
+        with patch.object(pubsub, "get_redis", return_value=redis):
+            await other.subscribe(connection_id, channel)
+
+        assert await asyncio.wait_for(waiting, timeout=0.1) is True
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSearchDeltaCoalescer:
+    """Tests for batching streamed search text into fewer deltas."""
+
+    async def test_flushes_on_size(self):
+        """Text is published once enough has built up, and the rest on exit."""
+        with patch.object(pubsub, "publish_search_delta") as publish:
+            async with SearchDeltaCoalescer("abc", max_chars=10, max_delay=60) as deltas:
+                for token in ["Hel", "lo, ", "wor", "ld!", " Bye"]:
+                    await deltas.add(token)
+
+        assert [c.args for c in publish.call_args_list] == [
+            ("abc", "Hello, wor"),
+            ("abc", "ld! Bye"),
+        ]
+
+    async def test_flushes_on_time(self):
+        """Text doesn't wait for more once the interval has passed."""
+        with patch.object(pubsub, "publish_search_delta") as publish:
+            deltas = SearchDeltaCoalescer("abc", max_chars=1000, max_delay=0.01)
+            await deltas.add("Hel")
+            await deltas.add("lo")
+            assert publish.call_count == 0
+
+            await asyncio.sleep(0.03)
+            assert [c.args for c in publish.call_args_list] == [("abc", "Hello")]
+
+            await deltas.flush()
+            assert publish.call_count == 1
+
+    async def test_token_stream_is_coalesced(self):
+        """A fast token stream produces far fewer messages with the same text."""
+        tokens = [f"tok{n} " for n in range(500)]
+        with patch.object(pubsub, "publish_search_delta") as publish:
+            async with SearchDeltaCoalescer("abc", max_chars=256, max_delay=0.03) as deltas:
+                for token in tokens:
+                    await deltas.add(token)
+
+        assert "".join(c.args[1] for c in publish.call_args_list) == "".join(tokens)
+        assert publish.call_count * 10 < len(tokens)
@@ -986,11 +986,14 @@ class BifrostDocsClient:
         filename: str,
         content_type: str,
         size_bytes: int,
+        sha256: str | None = None,
     ) -> dict[str, Any]:
         """
         Create an attachment record and get a presigned upload URL.
 
-        After calling this, use the returned upload_url to PUT the file directly.
+        After calling this, use the returned upload_url to PUT the file directly,
+        unless the response is marked deduplicated (identical content is
+        already stored and there is nothing to upload).
 
         Args:
             org_id: Organization UUID
@@ -999,20 +1002,26 @@ class BifrostDocsClient:
             filename: Original filename
             content_type: MIME type
             size_bytes: File size in bytes
+            sha256: Hex SHA-256 of the content, to reuse identical uploads
 
         Returns:
-            Response with id, filename, upload_url, expires_in
+            Response with id, filename, upload_url, upload_headers,
+            deduplicated, expires_in
         """
+        payload: dict[str, Any] = {
+            "entity_type": entity_type,
+            "entity_id": str(entity_id),
+            "filename": filename,
+            "content_type": content_type,
+            "size_bytes": size_bytes,
+        }
+        if sha256 is not None:
+            payload["sha256"] = sha256
+
         return await self._request(
             "POST",
             f"/api/organizations/{org_id}/attachments",
-            json={
-                "entity_type": entity_type,
-                "entity_id": str(entity_id),
-                "filename": filename,
-                "content_type": content_type,
-                "size_bytes": size_bytes,
-            },
+            json=payload,
         )
 
     async def get_attachment_download_url(
@@ -1059,6 +1068,7 @@ class BifrostDocsClient:
         content_type: str,
         size_bytes: int,
         document_id: str | UUID | None = None,
+        sha256: str | None = None,
     ) -> dict[str, Any]:
         """
         Upload an image for embedding in markdown documents.
@@ -1069,9 +1079,11 @@ class BifrostDocsClient:
             content_type: MIME type (must be image/*)
             size_bytes: File size in bytes
             document_id: Optional document ID to associate with
+            sha256: Hex SHA-256 of the content, to reuse identical uploads
 
         Returns:
-            Response with id, upload_url, image_url, expires_in
+            Response with id, upload_url, upload_headers, deduplicated,
+            image_url, expires_in
         """
         payload: dict[str, Any] = {
             "filename": filename,
@@ -1080,6 +1092,8 @@ class BifrostDocsClient:
         }
         if document_id is not None:
             payload["document_id"] = str(document_id)
+        if sha256 is not None:
+            payload["sha256"] = sha256
 
         return await self._request(
             "POST",
@@ -1092,6 +1106,7 @@ class BifrostDocsClient:
         upload_url: str,
         file_content: bytes,
         content_type: str,
+        headers: dict[str, str] | None = None,
     ) -> None:
         """
         Upload a file to a presigned S3 URL.
@@ -1102,6 +1117,7 @@ class BifrostDocsClient:
             upload_url: Presigned S3 PUT URL
             file_content: File content as bytes
             content_type: MIME type
+            headers: Headers the URL was signed for (upload_headers from the API)
         """
         # Rewrite Docker-internal URLs for local development
         upload_url = _rewrite_docker_url(upload_url)
@@ -1110,7 +1126,7 @@ class BifrostDocsClient:
             response = await client.put(
                 upload_url,
                 content=file_content,
-                headers={"Content-Type": content_type},
+                headers={"Content-Type": content_type, **(headers or {})},
             )
             if response.status_code >= 400:
                 raise APIError(
@@ -15,6 +15,7 @@ Image src format in HTML: <img src="{org_id}/docs/{doc_id}/images/{image_id}">
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import mimetypes
 import re
@@ -420,23 +421,27 @@ class DocumentProcessor:
                 filename=filename,
                 content_type=content_type,
                 size_bytes=file_size,
+                sha256=hashlib.sha256(file_content).hexdigest(),
             )
 
             upload_url = upload_response.get("upload_url")
             image_url = upload_response.get("image_url")
+            deduplicated = upload_response.get("deduplicated", False)
 
-            if not upload_url or not image_url:
+            if not (upload_url or deduplicated) or not image_url:
                 logger.error(
                     f"Invalid upload response for {filename}: {upload_response}"
                 )
                 return None
 
-            # Upload the file to presigned URL
-            await self.client.upload_file_to_presigned_url(
-                upload_url=upload_url,
-                file_content=file_content,
-                content_type=content_type,
-            )
+            # Upload the file to presigned URL (skipped if already stored)
+            if upload_url:
+                await self.client.upload_file_to_presigned_url(
+                    upload_url=upload_url,
+                    file_content=file_content,
+                    content_type=content_type,
+                    headers=upload_response.get("upload_headers"),
+                )
 
             # Cache and return the stable URL
             self._image_url_cache[cache_key] = image_url
@@ -740,21 +745,24 @@ class DocumentProcessor:
                     filename=filename,
                     content_type=content_type,
                     size_bytes=file_size,
+                    sha256=hashlib.sha256(file_content).hexdigest(),
                 )
 
                 upload_url = attachment_response.get("upload_url")
-                if not upload_url:
+                if not upload_url and not attachment_response.get("deduplicated"):
                     logger.error(
                         f"No upload URL in attachment response for {filename}"
                     )
                     continue
 
-                # Upload the file
-                await self.client.upload_file_to_presigned_url(
-                    upload_url=upload_url,
-                    file_content=file_content,
-                    content_type=content_type,
-                )
+                # Upload the file (skipped if identical content is already stored)
+                if upload_url:
+                    await self.client.upload_file_to_presigned_url(
+                        upload_url=upload_url,
+                        file_content=file_content,
+                        content_type=content_type,
+                        headers=attachment_response.get("upload_headers"),
+                    )
 
                 uploaded_count += 1
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import tempfile
 from collections.abc import Generator
 from pathlib import Path
@@ -843,6 +844,30 @@ class TestUploadImage:
         call_kwargs = _mock_client(processor).upload_document_image.call_args[1]
         assert call_kwargs["filename"] == "noext.png"
 
+    @pytest.mark.asyncio
+    async def test_upload_image_skips_put_when_deduplicated(
+        self, processor: DocumentProcessor, temp_dir: Path
+    ) -> None:
+        """Test that content already stored by the API isn't uploaded again."""
+        content = b"\x89PNG\r\n\x1a\n" + b"x" * 100
+        img_path = temp_dir / "logo.png"
+        img_path.write_bytes(content)
+        processor.client.upload_document_image = AsyncMock(
+            return_value={
+                "id": "img-uuid-123",
+                "upload_url": None,
+                "deduplicated": True,
+                "image_url": "https://cdn.example.com/images/img-uuid-123",
+            }
+        )
+
+        result = await processor._upload_image(img_path, "org-uuid-123")
+
+        assert result == "https://cdn.example.com/images/img-uuid-123"
+        call_kwargs = _mock_client(processor).upload_document_image.call_args[1]
+        assert call_kwargs["sha256"] == hashlib.sha256(content).hexdigest()
+        _mock_client(processor).upload_file_to_presigned_url.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_upload_image_handles_api_error(
         self, processor: DocumentProcessor, temp_dir: Path
@@ -1002,6 +1027,27 @@ class TestUploadEntityAttachments:
         call_kwargs = _mock_client(processor).create_attachment.call_args[1]
         assert call_kwargs["entity_type"] == "configuration"
 
+    @pytest.mark.asyncio
+    async def test_upload_entity_attachments_skips_put_when_deduplicated(
+        self, processor: DocumentProcessor, temp_dir: Path
+    ) -> None:
+        """Test that attachments already stored by the API aren't uploaded again."""
+        config_dir = temp_dir / "attachments" / "configurations" / "123"
+        config_dir.mkdir(parents=True)
+        (config_dir / "file.pdf").write_bytes(b"PDF")
+        processor.client.create_attachment = AsyncMock(
+            return_value={"id": "att-uuid-456", "upload_url": None, "deduplicated": True}
+        )
+
+        count = await processor.upload_entity_attachments(
+            "configurations", "123", "org-uuid", "our-uuid"
+        )
+
+        assert count == 1
+        call_kwargs = _mock_client(processor).create_attachment.call_args[1]
+        assert call_kwargs["sha256"] == hashlib.sha256(b"PDF").hexdigest()
+        _mock_client(processor).upload_file_to_presigned_url.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_upload_entity_attachments_skips_empty_files(
         self, processor: DocumentProcessor, temp_dir: Path